@@ -21,6 +21,7 @@ from dataclasses import dataclass, asdict
 from core.config import get_settings 
 from core.logging import get_logger, LoggerMixin, PerformanceLogger
 from core.cache import cache_manager
+from core.priority import FairQueue
 
 
 class AgentStatus(Enum):
@@ -32,6 +33,14 @@ class AgentStatus(Enum):
     STOPPED = "stopped"
 
 
+# MCP error code for requests the agent could not admit (queue full or wait timed out)
+AGENT_BUSY_ERROR_CODE = -32000
+
+
+class AgentBusyError(Exception):
+    """Raised by process_request when the agent's request queue rejected the call."""
+
+
 class MessageType(Enum):
     """MCP message types recommended for inter-agent RPC."""
     REQUEST = "request"
@@ -139,6 +148,21 @@ class AgentContract:
         }
 
 
+class AgentRequestQueue(FairQueue):
+    """
+    Admission for an agent's requests: weighted fair across priority lanes,
+    FIFO within a lane (see core.priority.FairQueue).
+
+    Up to `capacity` requests run at once (None = no limit); the rest wait,
+    at most `max_depth` per lane (0 = no limit). A finishing request hands
+    its slot directly to the next waiter, so there is no polling and no
+    barging. Waiting longer than `timeout_s` or arriving at a full lane
+    raises AgentBusyError.
+    """
+
+    busy_error = AgentBusyError
+
+
 class BaseAgent(LoggerMixin, ABC):
     """
     Abstract base for all TBCV agents (MCP-compliant).
@@ -149,8 +173,15 @@ class BaseAgent(LoggerMixin, ABC):
       - Cache helpers (get/put/clear)
       - Checkpoints (create/restore stubs)
       - Logging context via LoggerMixin
+      - Bounded, lane-aware request queue sized by `max_concurrency`
+
+    Subclasses whose handlers keep no per-request instance state set
+    `max_concurrency = None` to run every request concurrently.
     """
 
+    # Requests handled at once; None = unbounded
+    max_concurrency: Optional[int] = 1
+
     def __init__(self, agent_id: Optional[str] = None):
         super().__init__()
 
@@ -173,6 +204,15 @@ class BaseAgent(LoggerMixin, ABC):
         self.message_handlers = {}  # method -> async function
         self.pending_requests = {}  # request id -> future (optional)
 
+        # Admission queue; status READY/BUSY only reflects whether it is saturated
+        perf = getattr(self.settings, "performance", None)
+        self.request_queue = AgentRequestQueue(
+            capacity=self.max_concurrency,
+            name=f"agent.{self.agent_id}",
+            max_depth=getattr(perf, "agent_queue_depth", 0),
+            timeout_s=getattr(perf, "agent_queue_timeout_seconds", None),
+        )
+
         # Ensure logs carry an agent_id for correlation
         self.set_log_context(agent_id=self.agent_id)
 
@@ -218,16 +258,37 @@ class BaseAgent(LoggerMixin, ABC):
         Route an incoming MCP message to its handler.
         Returns a RESPONSE message for REQUESTs; None for NOTIFICATIONs.
         """
-        if self.status != AgentStatus.READY:
+        if self.status not in (AgentStatus.READY, AgentStatus.BUSY):
             return MCPMessage(
                 type=MessageType.RESPONSE,
                 id=message.id,
                 error={"code": -32603, "message": f"Agent not ready (status: {self.status.value})"}
             )
 
+        try:
+            await self.request_queue.acquire()
+        except AgentBusyError as e:
+            self._update_statistics(0, success=False)
+            return MCPMessage(
+                type=MessageType.RESPONSE,
+                id=message.id,
+                error={"code": AGENT_BUSY_ERROR_CODE, "message": f"Agent busy: {e}"}
+            )
+        self._refresh_status()
+        try:
+            return await self._dispatch(message)
+        finally:
+            self.request_queue.release()
+            self._refresh_status()
+
+    def _refresh_status(self):
+        """READY/BUSY mirror queue saturation; other states are left alone."""
+        if self.status in (AgentStatus.READY, AgentStatus.BUSY):
+            self.status = AgentStatus.BUSY if self.request_queue.saturated else AgentStatus.READY
+
+    async def _dispatch(self, message: MCPMessage) -> MCPMessage:
         with PerformanceLogger(self.logger, f"handle_message_{message.method}") as perf:
             try:
-                self.status = AgentStatus.BUSY
                 start_time = datetime.now(timezone.utc)
 
                 if message.method in self.message_handlers:
@@ -249,11 +310,9 @@ class BaseAgent(LoggerMixin, ABC):
                     self._update_statistics(0, success=False)
                     perf.add_context(success=False, error="method_not_found")
 
-                self.status = AgentStatus.READY
                 return response
 
             except Exception as e:
-                self.status = AgentStatus.READY
                 self.logger.exception("Message handling failed")
                 self._update_statistics(0, success=False)
                 perf.add_context(success=False, error=str(e))
@@ -441,6 +500,8 @@ class BaseAgent(LoggerMixin, ABC):
         message = MCPMessage(type=MessageType.REQUEST, method=method, params=params)
         response = await self.handle_message(message)
         if response.error:
+            if response.error.get("code") == AGENT_BUSY_ERROR_CODE:
+                raise AgentBusyError(f"Agent error: {response.error['message']}")
             raise Exception(f"Agent error: {response.error['message']}")
         return response.result
 
@@ -455,6 +516,7 @@ class BaseAgent(LoggerMixin, ABC):
             "status": self.status.value,
             "last_heartbeat": self.last_heartbeat.isoformat(),
             "statistics": self.statistics.copy(),
+            "request_queue": self.request_queue.snapshot(),
         }
 
     async def shutdown(self):
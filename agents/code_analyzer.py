@@ -27,6 +27,7 @@ from dataclasses import dataclass
 # --- Project imports (absolute) ---
 from agents.base import BaseAgent, AgentContract, AgentCapability
 from core.logging import PerformanceLogger
+from core.document_model import get_document_model
 
 
 # ======================================================
@@ -689,9 +690,9 @@ class CodeAnalyzerAgent(BaseAgent):
         """
         Extract (lang, code) pairs from fenced code blocks in Markdown.
         """
-        matches = re.findall(r"```(\w+)?\s*\n(.*?)\n```", content, re.DOTALL | re.MULTILINE)
         blocks: List[Tuple[str, str]] = []
-        for lang, code in matches:
+        for block in get_document_model(content).fenced_blocks:
+            lang, code = block.language, block.body
             if code.strip():
                 blocks.append(((lang or "text").lower(), code.strip()))
         return blocks
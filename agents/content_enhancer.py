@@ -18,10 +18,12 @@ try:
     from agents.base import BaseAgent, AgentContract, AgentCapability
     from core.logging import PerformanceLogger
     from core.validation_store import list_validation_results
+    from core.document_model import get_document_model
 except ImportError:
     from agents.base import BaseAgent, AgentContract, AgentCapability
     from core.logging import PerformanceLogger
     from core.validation_store import list_validation_results
+    from core.document_model import get_document_model
 
 
 @dataclass
@@ -634,11 +636,7 @@ class ContentEnhancerAgent(BaseAgent):
         Return a list of (start_index, end_index, body_text) for fenced code blocks.
         Fences are parsed using the common triple-backtick pattern.
         """
-        blocks: List[Tuple[int, int, str]] = []
-        pattern = r"```(\w+)?\s*\n([\s\S]*?)\n```"
-        for m in re.finditer(pattern, content):
-            blocks.append((m.start(), m.end(), m.group(2)))
-        return blocks
+        return [(b.start, b.end, b.body) for b in get_document_model(content).fenced_blocks]
 
     def _find_containing_code_block(self, position: int, blocks: List[Tuple[int, int, str]]):
         """Return the block tuple that contains `position`, if any."""
@@ -109,6 +109,8 @@ class ContentValidatorAgent(BaseAgent):
     See docs/migration/content_validator_migration.md for migration instructions.
     """
 
+    max_concurrency = None
+
     def __init__(self, agent_id: Optional[str] = None):
         warnings.warn(
             "ContentValidatorAgent is deprecated and will be removed in version 2.0.0 (2026-01-01). "
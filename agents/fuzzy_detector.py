@@ -14,23 +14,14 @@ from typing import Dict, Any, List, Optional, Tuple, Set
 from dataclasses import dataclass
 from pathlib import Path
 
-try:
-    import textdistance
-except ImportError:
-    textdistance = None
-
-try:
-    from fuzzywuzzy import fuzz, process
-except ImportError:
-    fuzz = None
-    process = None
-
 from agents.base import BaseAgent, AgentContract, AgentCapability, agent_registry
 from agents.validators.base_validator import ValidationResult, ValidationIssue
+from core.alias_matcher import AliasMatcher, normalize_alias, similarity_scores
 from core.config import load_config_from_yaml
-import difflib
 from core.logging import PerformanceLogger
+from core.pattern_set import PatternSet, compile_pattern_set
 from core.rule_manager import rule_manager  # normalized import
+from core.shared_results import PluginDetections, shared_results_from_context
 
 
 @dataclass
@@ -62,11 +53,18 @@ class PluginDetection:
 class FuzzyDetectorAgent(BaseAgent):
     """Agent that detects plugin usage via patterns loaded from rule system."""
 
+    # Per-family caches are filled idempotently; requests may overlap
+    max_concurrency = None
+
     def __init__(self, agent_id: Optional[str] = None):
         self.compiled_patterns: Dict[str, List[Dict[str, Any]]] = {}
         self.family_cache: Dict[str, bool] = {}
+        # Single-pass scanner per family, with the "api" list its ids index into
+        self.pattern_sets: Dict[str, Tuple[List[Dict[str, Any]], PatternSet]] = {}
         # Cache of plugin alias data per family
         self.alias_cache: Dict[str, Dict[str, Any]] = {}
+        # Compiled alias matchers per family (built from alias_cache)
+        self.alias_matchers: Dict[str, AliasMatcher] = {}
         # Determine project root based on file location (two levels up: /project)
         try:
             self.project_root = Path(__file__).resolve().parents[1]
@@ -106,6 +104,8 @@ class FuzzyDetectorAgent(BaseAgent):
         self.weight_exact: float = 1.0
         self.weight_fuzzy: float = 0.8
         self.weight_context: float = 0.1
+        # Use the compiled alias matcher instead of scoring every alias/token pair
+        self.use_alias_matcher: bool = True
 
         try:
             # Attempt to load from project root config directory
@@ -122,6 +122,7 @@ class FuzzyDetectorAgent(BaseAgent):
             if isinstance(algos, list):
                 # Normalize algorithm names
                 self.fuzzy_algorithms = [str(a).lower() for a in algos]
+            self.use_alias_matcher = bool(fuzzy_cfg.get("alias_matcher", self.use_alias_matcher))
 
             # Confidence weights
             weights = truth_cfg.get("confidence_weights", {}) if isinstance(truth_cfg, dict) else {}
@@ -134,7 +135,7 @@ class FuzzyDetectorAgent(BaseAgent):
 
     def _normalize(self, s: str) -> str:
         """Normalize strings by removing non-alphanumeric characters and lowering case."""
-        return re.sub(r"[^a-zA-Z0-9]", "", s or "").lower()
+        return normalize_alias(s)
 
     def _get_truth_plugins(self, family: str) -> List[Dict[str, Any]]:
         """
@@ -289,12 +290,25 @@ class FuzzyDetectorAgent(BaseAgent):
                         self.logger.warning("Invalid regex pattern", pattern=pattern_str, error=str(e))
 
             self.compiled_patterns[family] = family_compiled
+            self._pattern_set_for(family)
             self.family_cache[family] = True
 
         except Exception as e:
             self.logger.error(f"Failed to compile patterns for {family}: {e}")
             self.family_cache[family] = False
 
+    def _pattern_set_for(self, family: str) -> Tuple[List[Dict[str, Any]], PatternSet]:
+        """The family's "api" patterns and their single-pass scanner."""
+        api_patterns = self.compiled_patterns.get(family, {}).get("api", [])
+        cached = self.pattern_sets.get(family)
+        if cached is None or cached[0] is not api_patterns:
+            # Memoized by ruleset content: unchanged rules share one compiled set
+            pattern_set = compile_pattern_set(
+                [(i, data["pattern"]) for i, data in enumerate(api_patterns)], re.IGNORECASE
+            )
+            cached = self.pattern_sets[family] = (api_patterns, pattern_set)
+        return cached
+
     def _load_truth_plugins(self, family: str) -> Dict[str, Any]:
         """Load actual plugin definitions from truth data."""
         try:
@@ -343,52 +357,48 @@ class FuzzyDetectorAgent(BaseAgent):
             "plugin_name": plugin_name
         }
 
-    async def handle_detect_plugins(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Detect plugins using rule-driven patterns."""
-        text = params.get("text", "")
-        family = params.get("family", "words")
-        confidence_threshold = params.get("confidence_threshold", 0.6)
-
-        # Ensure patterns are loaded for this family
-        if family not in self.compiled_patterns:
-            self._compile_family_patterns(family)
-
-        all_detections: List[PluginDetection] = []
-
-        # ------------------------------------------------------------------
-        # 1. Regex-based detection using compiled API patterns from rules
-        # ------------------------------------------------------------------
-        family_patterns = self.compiled_patterns.get(family, {})
-        for pattern_type in ["api"]:
-            for pattern_data in family_patterns.get(pattern_type, []):
-                compiled_pattern = pattern_data["compiled"]
-
-                for match in compiled_pattern.finditer(text):
-                    # Assign confidence using fuzzy weight
-                    detection_conf = self.weight_fuzzy
-                    detection = PluginDetection(
-                        plugin_id=pattern_data["plugin_id"],
-                        plugin_name=pattern_data["plugin_name"],
-                        confidence=detection_conf,
-                        detection_type="regex",
-                        matched_text=match.group(),
-                        context=text[max(0, match.start()-self.context_window_chars): match.end()+self.context_window_chars],
-                        position=match.start(),
-                        family=family
-                    )
-                    all_detections.append(detection)
-
-        # ------------------------------------------------------------------
-        # 2. Alias-based detection using fuzzy algorithms and similarity ratios
-        # ------------------------------------------------------------------
-        # Load alias data for the family if not cached
-        if family not in self.alias_cache:
-            try:
-                self.alias_cache[family] = self._build_family_aliases(family)
-            except Exception:
-                self.alias_cache[family] = {}
-        alias_data = self.alias_cache.get(family, {})
+    def _get_alias_matcher(self, family: str, alias_data: Dict[str, Any]) -> AliasMatcher:
+        """Return the compiled alias matcher for a family, rebuilding it if settings changed."""
+        matcher = self.alias_matchers.get(family)
+        if matcher is None or matcher.alias_map is not alias_data or not matcher.matches_settings(
+            self.fuzzy_algorithms, self.similarity_threshold, self.weight_exact, self.weight_fuzzy
+        ):
+            matcher = AliasMatcher(
+                alias_data,
+                algorithms=self.fuzzy_algorithms,
+                similarity_threshold=self.similarity_threshold,
+                weight_exact=self.weight_exact,
+                weight_fuzzy=self.weight_fuzzy,
+            )
+            self.alias_matchers[family] = matcher
+        return matcher
+
+    def _detect_aliases_compiled(self, text: str, family: str, alias_data: Dict[str, Any]) -> List[PluginDetection]:
+        """Alias detection through the family's compiled AliasMatcher."""
+        matcher = self._get_alias_matcher(family, alias_data)
+        detections: List[PluginDetection] = []
+        for token, start_idx, end_idx, hits in matcher.iter_token_hits(text):
+            context = text[max(0, start_idx - self.context_window_chars): min(len(text), end_idx + self.context_window_chars)]
+            for plugin_id, conf, detection_type in hits:
+                detections.append(PluginDetection(
+                    plugin_id=plugin_id,
+                    plugin_name=matcher.plugin_names[plugin_id],
+                    confidence=conf,
+                    detection_type=detection_type,
+                    matched_text=token,
+                    context=context,
+                    position=start_idx,
+                    family=family
+                ))
+        return detections
+
+    def _detect_aliases_exhaustive(self, text: str, family: str, alias_data: Dict[str, Any]) -> List[PluginDetection]:
+        """
+        Reference alias detection: score every alias against every token.
 
+        Kept for benchmarking and as a fallback (agents.fuzzy_detector.alias_matcher: false).
+        """
+        detections: List[PluginDetection] = []
         # Precompute tokens and their positions in the text
         token_matches = list(re.finditer(r"\b\w+\b", text))
         tokens = []  # list of (token, start_idx, end_idx)
@@ -413,24 +423,7 @@ class FuzzyDetectorAgent(BaseAgent):
                         matched_text = token
                     else:
                         # Calculate similarity scores using selected algorithms
-                        scores: List[float] = []
-                        for algo in self.fuzzy_algorithms:
-                            try:
-                                if algo == "levenshtein" and textdistance and hasattr(textdistance, "levenshtein"):
-                                    # Normalized Levenshtein similarity
-                                    distance = textdistance.levenshtein.distance(alias_norm, token_norm)
-                                    max_len = max(len(alias_norm), len(token_norm)) or 1
-                                    score = 1.0 - (distance / max_len)
-                                elif algo == "jaro_winkler" and textdistance and hasattr(textdistance, "jaro_winkler"):
-                                    score = textdistance.jaro_winkler.normalized_similarity(alias_norm, token_norm)
-                                elif algo == "fuzzy" and fuzz:
-                                    score = fuzz.ratio(alias_norm, token_norm) / 100.0
-                                else:
-                                    # Fallback: SequenceMatcher ratio
-                                    score = difflib.SequenceMatcher(None, alias_norm, token_norm).ratio()
-                                scores.append(score)
-                            except Exception:
-                                continue
+                        scores = similarity_scores(alias_norm, token_norm, self.fuzzy_algorithms)
                         if not scores:
                             continue
                         best_score = max(scores)
@@ -451,7 +444,57 @@ class FuzzyDetectorAgent(BaseAgent):
                         position=start_idx,
                         family=family
                     )
-                    all_detections.append(detection)
+                    detections.append(detection)
+        return detections
+
+    async def handle_detect_plugins(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Detect plugins using rule-driven patterns."""
+        text = params.get("text", "")
+        family = params.get("family", "words")
+        confidence_threshold = params.get("confidence_threshold", 0.6)
+
+        # Ensure patterns are loaded for this family
+        if family not in self.compiled_patterns:
+            self._compile_family_patterns(family)
+
+        all_detections: List[PluginDetection] = []
+
+        # ------------------------------------------------------------------
+        # 1. Regex-based detection using compiled API patterns from rules
+        # ------------------------------------------------------------------
+        api_patterns, pattern_set = self._pattern_set_for(family)
+        # One pass over the text for all patterns; hits come back in per-pattern order
+        for hit in pattern_set.scan(text):
+            pattern_data = api_patterns[hit.pattern_id]
+            # Assign confidence using fuzzy weight
+            detection_conf = self.weight_fuzzy
+            detection = PluginDetection(
+                plugin_id=pattern_data["plugin_id"],
+                plugin_name=pattern_data["plugin_name"],
+                confidence=detection_conf,
+                detection_type="regex",
+                matched_text=text[hit.start:hit.end],
+                context=text[max(0, hit.start-self.context_window_chars): hit.end+self.context_window_chars],
+                position=hit.start,
+                family=family
+            )
+            all_detections.append(detection)
+
+        # ------------------------------------------------------------------
+        # 2. Alias-based detection using fuzzy algorithms and similarity ratios
+        # ------------------------------------------------------------------
+        # Load alias data for the family if not cached
+        if family not in self.alias_cache:
+            try:
+                self.alias_cache[family] = self._build_family_aliases(family)
+            except Exception:
+                self.alias_cache[family] = {}
+        alias_data = self.alias_cache.get(family, {})
+
+        if self.use_alias_matcher:
+            all_detections.extend(self._detect_aliases_compiled(text, family, alias_data))
+        else:
+            all_detections.extend(self._detect_aliases_exhaustive(text, family, alias_data))
 
         # ------------------------------------------------------------------
         # 3. Deduplicate detections: keep highest-confidence detection per plugin at each position
@@ -533,12 +576,20 @@ class FuzzyDetectorAgent(BaseAgent):
         family = context.get("family", "words")
         confidence_threshold = context.get("confidence_threshold", 0.6)
 
-        # Run plugin detection
-        detection_result = await self.handle_detect_plugins({
-            "text": content,
-            "family": family,
-            "confidence_threshold": confidence_threshold
-        })
+        # Run plugin detection once per document: reuse detections already
+        # published upstream (e.g. by the orchestrator), publish our own for
+        # downstream validators (Truth, llm)
+        shared = shared_results_from_context(content, context)
+        published = shared.detections(family, confidence_threshold)
+        if published is not None:
+            detection_result = published.result
+        else:
+            detection_result = await self.handle_detect_plugins({
+                "text": content,
+                "family": family,
+                "confidence_threshold": confidence_threshold
+            })
+            shared.publish_detections(PluginDetections(family, confidence_threshold, detection_result))
 
         # Convert detections to validation issues
         issues: List[ValidationIssue] = []
@@ -104,7 +104,8 @@ class LLMValidatorAgent(BaseAgent):
                             "content": {"type": "string"},
                             "fuzzy_detections": {"type": "array"},
                             "family": {"type": "string", "default": "words"},
-                            "profile": {"type": "string", "default": "default"}
+                            "profile": {"type": "string", "default": "default"},
+                            "truth_data": {"type": "object"}
                         },
                         "required": ["content", "fuzzy_detections"]
                     },
@@ -127,10 +128,10 @@ class LLMValidatorAgent(BaseAgent):
         profile = params.get("profile", self._config.profile)
 
         # Get active rules
-        active_rules = self._config_loader.get_rules("llm", profile=profile, family=family)
-        active_rule_ids = {r.id for r in active_rules}
-        rule_levels = {r.id: r.level for r in active_rules}
-        rule_params = {r.id: r.params for r in active_rules}
+        ruleset = self._config_loader.get_ruleset("llm", profile=profile, family=family)
+        active_rule_ids = ruleset.active_rule_ids
+        rule_levels = ruleset.rule_levels
+        rule_params = ruleset.rule_params
 
         # Check if validation is enabled
         if not active_rule_ids:
@@ -160,7 +161,7 @@ class LLMValidatorAgent(BaseAgent):
 
         try:
             # Try to connect to Ollama
-            ollama.list_models()
+            await ollama.async_list_models()
         except Exception as e:
             error_msg = str(e)
             availability = self._config.get("availability", {})
@@ -190,8 +191,8 @@ class LLMValidatorAgent(BaseAgent):
                     "profile": profile
                 }
 
-        # Load truth data for plugin definitions
-        truth_data = self._load_truth_data(family)
+        # Truth data for plugin definitions: the upstream truth context, if passed
+        truth_data = params.get("truth_data") or self._load_truth_data(family)
         core_rules = truth_data.get("core_rules", [])
         plugins = truth_data.get("plugins", [])
 
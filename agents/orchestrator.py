@@ -9,29 +9,58 @@ Includes:
 - structured logger via get_logger
 - fuzzy detection optional (respects disabled/unregistered)
 - plugin_aliases/api_patterns derived from TruthManager
-- PER-AGENT CONCURRENCY GATES to avoid 'busy'
-- WAIT-UNTIL-READY with timeout + exponential backoff
+- PER-AGENT CONCURRENCY GATES bounding the fan-out to each agent
+- FIFO admission by each agent's request queue (no busy polling)
+- PRIORITY LANES: single-file validations run interactive, directories batch; gates admit weighted-fair
 - TWO-STAGE GATING PIPELINE with mode switching (two_stage, heuristic_only, llm_only)
+- INCREMENTAL directory validation (manifest of mtime/size/hash + truth/rule versions)
+- STREAMING directory validation (bounded queue + worker pool, results persisted/published per file)
+- SINGLE-FLIGHT pipeline runs (identical concurrent validations of a file share one run)
 """
 
 from __future__ import annotations
 import asyncio
+import base64
 import glob
+import hashlib
+import io
+import itertools
+import json
 import os
 import time
+import uuid
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 
 from core.config import get_settings
-from agents.base import BaseAgent, AgentContract, AgentCapability, agent_registry, AgentStatus
+from agents.base import BaseAgent, AgentContract, AgentCapability, AgentBusyError, agent_registry
 from core.logging import PerformanceLogger, get_logger
 from core.language_utils import is_english_content, validate_english_content_batch, log_language_rejection
 from agents.validators.router import ValidatorRouter
 from core.access_guard import guarded_operation
+from core.priority import BATCH, INTERACTIVE, LANES, FairQueue, current_lane, priority_lane
+from core.database import ResultWriteBuffer, db_manager
+from core.shared_results import PluginDetections, TruthContext, shared_results_from_context
+from core.single_flight import group as single_flight_group
+from core.validation_manifest import (
+    ValidationManifest,
+    ManifestEntry,
+    FileChange,
+    directory_fingerprint,
+    file_content_hash,
+    run_fingerprint,
+)
 
 logger = get_logger(__name__)
 
+# Streaming mode keeps only the first N error messages; the rest are counted
+_MAX_STREAM_ERRORS = 100
+
+# Concurrent pipeline runs for the same file, content and options share one run
+pipeline_flights = single_flight_group("pipeline")
+
 
 @dataclass
 class WorkflowResult:
@@ -43,6 +72,8 @@ class WorkflowResult:
     files_failed: int = 0
     errors: List[str] = None
     results: List[Dict[str, Any]] = None
+    files_reused: int = 0
+    files_rejected: int = 0
 
     def __post_init__(self):
         if self.errors is None:
@@ -51,13 +82,48 @@ class WorkflowResult:
             self.results = []
 
 
+def _result_status(result: Dict[str, Any]) -> Tuple[str, str]:
+    """(status, severity) of a pipeline result, from the levels of its issues."""
+    issues = result.get("final_issues") or (result.get("content_validation") or {}).get("issues", [])
+    levels = {str(issue.get("level", "")).lower() for issue in issues}
+    if "critical" in levels:
+        return "fail", "critical"
+    if "error" in levels:
+        return "fail", "high"
+    if "warning" in levels:
+        return "warning", "medium"
+    return "pass", "info"
+
+
+def _encode_results_cursor(run_id: str, last_row: Any = None) -> str:
+    """Opaque cursor over the stored results of a run (keyset on created_at, id)."""
+    after = [last_row.created_at.isoformat(), last_row.id] if last_row is not None else None
+    blob = json.dumps({"run_id": run_id, "after": after}).encode()
+    return base64.urlsafe_b64encode(blob).decode()
+
+
+def _decode_results_cursor(cursor: str) -> Tuple[str, Optional[Tuple[datetime, str]]]:
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        after = data.get("after")
+        if after:
+            after = (datetime.fromisoformat(after[0]), after[1])
+        return data["run_id"], after
+    except Exception:
+        raise ValueError(f"Invalid results cursor: {cursor!r}")
+
+
 class OrchestratorAgent(BaseAgent):
     """Agent that coordinates workflows across multiple agents."""
 
+    # Workflows are tracked per id; per-agent gates below bound the fan-out
+    max_concurrency = None
+
     def __init__(self, agent_id: Optional[str] = None):
         self.active_workflows: Dict[str, WorkflowResult] = {}
-        # Per-agent semaphores to limit concurrency (configurable)
-        self._agent_semaphores: Dict[str, asyncio.Semaphore] = {}
+        # Per-agent gates to limit concurrency (configurable), admitted weighted-fair by lane
+        self._agent_semaphores: Dict[str, FairQueue] = {}
+        self._validation_manifest: Optional[ValidationManifest] = None
         super().__init__(agent_id)
         self._init_concurrency_controls()
         # Initialize ValidatorRouter for new validator architecture
@@ -70,9 +136,6 @@ class OrchestratorAgent(BaseAgent):
 
         orchestrator:
           max_file_workers: 4
-          retry_timeout_s: 120
-          retry_backoff_base: 0.5
-          retry_backoff_cap: 8
           agent_limits:
             llm_validator: 1
             content_validator: 2
@@ -107,63 +170,49 @@ class OrchestratorAgent(BaseAgent):
             return default
 
         for agent_name, default in defaults.items():
-            self._agent_semaphores[agent_name] = asyncio.Semaphore(_get_limit(agent_name, default))
+            self._agent_semaphores[agent_name] = FairQueue(_get_limit(agent_name, default),
+                                                           name=f"orchestrator.{agent_name}")
 
     async def _call_agent_gated(self, agent_id: str, method: str, params: dict):
         """
-        Queue calls per agent to avoid 'busy'. Within the gate, we also wait-until-ready with timeout.
+        Bound the number of concurrent calls this orchestrator makes to an agent.
+
+        Waiting calls are admitted by priority lane, so an interactive file
+        does not queue behind a directory's worth of batch calls.
         """
         sem = self._agent_semaphores.get(agent_id)
         if sem is None:
             # Default to single-worker if agent not preconfigured
-            sem = self._agent_semaphores[agent_id] = asyncio.Semaphore(1)
+            sem = self._agent_semaphores[agent_id] = FairQueue(1, name=f"orchestrator.{agent_id}")
 
         async with sem:
             return await self._call_agent_with_wait(agent_id, method, params)
 
     async def _call_agent_with_wait(self, agent_id: str, method: str, params: dict):
         """
-        Wait for the agent to become READY and handle 'busy' responses with backoff until timeout.
-        """
-        settings = get_settings()
-        timeout_s = float(getattr(settings.orchestrator, "retry_timeout_s", 120.0))
-        backoff_base = float(getattr(settings.orchestrator, "retry_backoff_base", 0.5))
-        backoff_cap = float(getattr(settings.orchestrator, "retry_backoff_cap", 8.0))
+        Call an agent; its request queue admits the call in lane order.
 
+        The queue bounds the wait (performance.agent_queue_timeout_seconds) and
+        its depth; a rejected call surfaces as TimeoutError.
+        """
         agent = agent_registry.get_agent(agent_id)
         if agent is None:
             raise RuntimeError(f"Agent '{agent_id}' not registered")
 
-        deadline = time.monotonic() + max(1.0, timeout_s)
-        delay = max(0.05, backoff_base)
-
-        while True:
-            # If agent exposes status, prefer to wait for READY before calling
-            status = getattr(agent, "status", None)
-            if status == AgentStatus.READY or status is None:
-                try:
-                    return await agent.process_request(method, params)
-                except Exception as e:
-                    msg = str(e)
-                    # Only treat explicit 'busy' as retryable
-                    if "Agent not ready (status: busy)" not in msg:
-                        raise
-                    # fall through to sleep/backoff
-            else:
-                # Status indicates not ready; will wait below
-                pass
-
-            # Check timeout
-            now = time.monotonic()
-            if now >= deadline:
-                raise TimeoutError(
-                    f"Timed out waiting for agent '{agent_id}' to become READY "
-                    f"or accept requests within {timeout_s:.1f}s."
-                )
+        try:
+            return await agent.process_request(method, params)
+        except AgentBusyError as e:
+            raise TimeoutError(f"Timed out waiting for agent '{agent_id}' to accept requests: {e}") from e
+        except Exception as e:
+            # Agents outside BaseAgent may still report 'busy' as a plain error
+            if "status: busy" not in str(e):
+                raise
+            raise TimeoutError(f"Timed out waiting for agent '{agent_id}' to accept requests: {e}") from e
 
-            # Sleep with capped exponential backoff
-            await asyncio.sleep(delay)
-            delay = min(delay * 2.0, backoff_cap)
+    def get_status(self) -> Dict[str, Any]:
+        status = super().get_status()
+        status["agent_gates"] = {name: gate.snapshot() for name, gate in self._agent_semaphores.items()}
+        return status
 
     def _register_message_handlers(self):
         self.register_handler("ping", self.handle_ping)
@@ -171,6 +220,7 @@ class OrchestratorAgent(BaseAgent):
         self.register_handler("get_contract", self.get_contract)
         self.register_handler("validate_file", self.handle_validate_file)
         self.register_handler("validate_directory", self.handle_validate_directory)
+        self.register_handler("get_directory_results", self.handle_get_directory_results)
         self.register_handler("get_workflow_status", self.handle_get_workflow_status)
         self.register_handler("list_workflows", self.handle_list_workflows)
 
@@ -187,7 +237,8 @@ class OrchestratorAgent(BaseAgent):
                         "type": "object",
                         "properties": {
                             "file_path": {"type": "string"},
-                            "family": {"type": "string", "default": "words"}
+                            "family": {"type": "string", "default": "words"},
+                            "priority": {"type": "string", "enum": list(LANES), "default": INTERACTIVE}
                         },
                         "required": ["file_path"]
                     },
@@ -202,12 +253,28 @@ class OrchestratorAgent(BaseAgent):
                         "properties": {
                             "directory_path": {"type": "string"},
                             "pattern": {"type": "string", "default": "**/*.md"},
-                            "family": {"type": "string", "default": "words"}
+                            "family": {"type": "string", "default": "words"},
+                            "streaming": {"type": "boolean", "default": False},
+                            "priority": {"type": "string", "enum": list(LANES), "default": BATCH}
                         },
                         "required": ["directory_path"]
                     },
                     output_schema={"type": "object"},
                     side_effects=["read", "network"]
+                ),
+                AgentCapability(
+                    name="get_directory_results",
+                    description="Page through the stored results of a streaming directory validation",
+                    input_schema={
+                        "type": "object",
+                        "properties": {
+                            "cursor": {"type": "string"},
+                            "limit": {"type": "integer", "default": 100}
+                        },
+                        "required": ["cursor"]
+                    },
+                    output_schema={"type": "object"},
+                    side_effects=["read"]
                 )
             ],
             max_runtime_s=600,
@@ -219,7 +286,8 @@ class OrchestratorAgent(BaseAgent):
 
     @guarded_operation
     async def handle_validate_file(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        with PerformanceLogger(self.logger, "validate_file"):
+        lane = priority_lane(params.get("priority"), current_lane(INTERACTIVE))
+        with PerformanceLogger(self.logger, "validate_file"), lane:
             file_path = params.get("file_path")
             family = params.get("family", "words")
             validation_types = params.get("validation_types", None)
@@ -253,7 +321,8 @@ class OrchestratorAgent(BaseAgent):
 
     @guarded_operation
     async def handle_validate_directory(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        with PerformanceLogger(self.logger, "validate_directory"):
+        lane = priority_lane(params.get("priority"), current_lane(BATCH))
+        with PerformanceLogger(self.logger, "validate_directory"), lane:
             # Accept both 'directory_path' and 'directory' for compatibility
             directory_path = params.get("directory_path") or params.get("directory")
             pattern = params.get("pattern", "**/*.md")
@@ -264,15 +333,40 @@ class OrchestratorAgent(BaseAgent):
             if not directory_path or not os.path.isdir(directory_path):
                 return {"status": "error", "message": f"Directory not found: {directory_path}"}
 
+            incremental = bool(params.get("incremental", getattr(self.settings.orchestrator, "incremental", False)))
+            if params.get("streaming", getattr(self.settings.orchestrator, "streaming", False)):
+                return await self._validate_directory_streaming(
+                    directory_path, pattern, family, validation_types, max_workers, incremental,
+                    persist=bool(params.get("persist", True)),
+                )
+
             # Generate job ID
             job_id = f"batch_{int(time.time())}"
 
             # Find files matching pattern
             all_files = list(Path(directory_path).glob(pattern))
+            file_paths_str = [str(f) for f in all_files]
+
+            # Incremental mode: only changed files go through the pipeline
+            fingerprint: Optional[str] = None
+            reused_entries: List[ManifestEntry] = []
+            changes: Dict[str, FileChange] = {}
+            if incremental:
+                fingerprint = await self._validation_fingerprint(family, validation_types)
+                manifest = self._get_validation_manifest()
+                reused_entries, changed = await asyncio.to_thread(manifest.partition, file_paths_str, fingerprint)
+                changes = {c.path: c for c in changed}
+                file_paths_str = [c.path for c in changed]
+                self.logger.info(
+                    f"Incremental validation: {len(changed)} changed, {len(reused_entries)} unchanged "
+                    f"of {len(all_files)} files"
+                )
 
             # Filter for English content only
-            file_paths_str = [str(f) for f in all_files]
             english_file_paths, rejected_files = validate_english_content_batch(file_paths_str)
+            new_rejections = list(rejected_files)
+            rejected_files = rejected_files + [(e.path, e.reason) for e in reused_entries if e.status == "rejected"]
+            reused_results = [e for e in reused_entries if e.status == "validated"]
 
             # Log rejected files
             if rejected_files:
@@ -289,7 +383,7 @@ class OrchestratorAgent(BaseAgent):
                 job_id=job_id,
                 workflow_type="validate_directory",
                 status="running",
-                files_total=len(files)
+                files_total=len(files) + len(reused_results)
             )
             self.active_workflows[job_id] = workflow_result
 
@@ -302,6 +396,15 @@ class OrchestratorAgent(BaseAgent):
                 if len(rejected_files) > 5:
                     workflow_result.errors.append(f"... and {len(rejected_files) - 5} more non-English files skipped")
 
+            # Reuse stored results of unchanged files
+            for entry in reused_results:
+                result = dict(entry.result or {})
+                result["reused"] = True
+                workflow_result.results.append(result)
+            workflow_result.files_reused = len(reused_results)
+
+            manifest_updates: List[ManifestEntry] = []
+
             try:
                 # Process files with limited concurrency
                 sem = asyncio.Semaphore(max_workers)
@@ -309,11 +412,21 @@ class OrchestratorAgent(BaseAgent):
                 async def process_file(file_path: Path):
                     async with sem:
                         try:
-                            with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                                content = f.read()
+                            change = changes.get(str(file_path))
+                            content = self._read_for_validation(file_path, change)
                             result = await self._run_validation_pipeline(content, str(file_path), family, validation_types)
                             workflow_result.files_validated += 1
                             workflow_result.results.append(result)
+                            if change is not None and "error" not in result:
+                                manifest_updates.append(ManifestEntry(
+                                    path=change.path,
+                                    mtime_ns=change.mtime_ns,
+                                    size=change.size,
+                                    content_hash=change.content_hash,
+                                    fingerprint=fingerprint,
+                                    status="validated",
+                                    result=result,
+                                ))
                         except Exception as e:
                             workflow_result.files_failed += 1
                             workflow_result.errors.append(f"{file_path}: {str(e)}")
@@ -322,12 +435,34 @@ class OrchestratorAgent(BaseAgent):
                 # Run all file processing tasks
                 await asyncio.gather(*[process_file(f) for f in files])
 
+                if incremental:
+                    for file_path, reason in new_rejections:
+                        change = changes.get(file_path)
+                        if change is None:
+                            continue
+                        try:
+                            content_hash = change.content_hash or file_content_hash(file_path)
+                        except OSError:
+                            continue
+                        manifest_updates.append(ManifestEntry(
+                            path=change.path,
+                            mtime_ns=change.mtime_ns,
+                            size=change.size,
+                            content_hash=content_hash,
+                            fingerprint=fingerprint,
+                            status="rejected",
+                            reason=reason,
+                        ))
+                    await asyncio.to_thread(self._get_validation_manifest().record_many, manifest_updates)
+
                 workflow_result.status = "completed"
                 return {
                     "status": "success",
                     "job_id": job_id,
+                    "incremental": incremental,
                     "files_total": workflow_result.files_total,
                     "files_validated": workflow_result.files_validated,
+                    "files_reused": workflow_result.files_reused,
                     "files_failed": workflow_result.files_failed,
                     "results": workflow_result.results
                 }
@@ -338,7 +473,327 @@ class OrchestratorAgent(BaseAgent):
                 self.logger.exception("Directory validation failed")
                 return {"status": "error", "message": str(e), "job_id": job_id}
 
+    @staticmethod
+    def _read_for_validation(file_path: Path, change: Optional[FileChange]) -> str:
+        """Read a file for the pipeline; files tracked by the manifest are hashed from the same read."""
+        if change is None:
+            with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
+                return f.read()
+        # Read once: hash the bytes, decode like text mode would
+        with open(file_path, "rb") as f:
+            raw = f.read()
+        change.content_hash = hashlib.sha256(raw).hexdigest()
+        return io.TextIOWrapper(io.BytesIO(raw), encoding="utf-8", errors="ignore").read()
+
+    async def _validate_directory_streaming(
+        self,
+        directory_path: str,
+        pattern: str,
+        family: str,
+        validation_types: Optional[List[str]],
+        max_workers: int,
+        incremental: bool,
+        persist: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Streaming directory validation.
+
+        A producer walks the tree lazily in chunks and feeds a bounded queue
+        that a fixed pool of workers drains. Each result is published on the
+        live bus as soon as it is ready and stored (run_id = job_id) through a
+        write-behind buffer, together with its recommendations; only counters
+        are kept, so memory does not grow with the tree. The response is a
+        summary plus a cursor for get_directory_results.
+        """
+        orchestrator_settings = self.settings.orchestrator
+        workers = max(1, int(max_workers))
+        queue_size = int(getattr(orchestrator_settings, "stream_queue_size", 0) or 0) or workers * 2
+        chunk_size = max(1, int(getattr(orchestrator_settings, "stream_chunk_size", 256)))
+
+        job_id = f"batch_{int(time.time())}_{uuid.uuid4().hex[:8]}"
+        workflow_result = WorkflowResult(job_id=job_id, workflow_type="validate_directory", status="running")
+        self.active_workflows[job_id] = workflow_result
+        writer = db_manager.write_buffer() if persist else None
+        errors_dropped = 0
+
+        def note_error(message: str) -> None:
+            nonlocal errors_dropped
+            if len(workflow_result.errors) < _MAX_STREAM_ERRORS:
+                workflow_result.errors.append(message)
+            else:
+                errors_dropped += 1
+
+        fingerprint: Optional[str] = None
+        manifest: Optional[ValidationManifest] = None
+        manifest_updates: List[ManifestEntry] = []
+        if incremental:
+            fingerprint = await self._validation_fingerprint(family, validation_types)
+            manifest = self._get_validation_manifest()
+
+        async def flush_manifest(force: bool = False) -> None:
+            if manifest is None or not manifest_updates or (not force and len(manifest_updates) < chunk_size):
+                return
+            pending = list(manifest_updates)
+            manifest_updates.clear()
+            await asyncio.to_thread(manifest.record_many, pending)
+
+        # (path, FileChange or None, reused ManifestEntry or None); None stops a worker
+        queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+        async def produce() -> None:
+            paths = Path(directory_path).glob(pattern)
+            while True:
+                chunk = await asyncio.to_thread(lambda: [str(p) for p in itertools.islice(paths, chunk_size)])
+                if not chunk:
+                    break
+                changes: Dict[str, FileChange] = {}
+                if manifest is not None:
+                    reused, changed = await asyncio.to_thread(manifest.partition, chunk, fingerprint)
+                    changes = {c.path: c for c in changed}
+                    chunk = [c.path for c in changed]
+                    for entry in reused:
+                        if entry.status == "rejected":
+                            workflow_result.files_rejected += 1
+                        else:
+                            workflow_result.files_total += 1
+                            await queue.put((entry.path, None, entry))
+
+                english, rejected = validate_english_content_batch(chunk)
+                workflow_result.files_rejected += len(rejected)
+                for file_path, reason in rejected:
+                    change = changes.get(file_path)
+                    if change is None:
+                        continue
+                    try:
+                        content_hash = change.content_hash or file_content_hash(file_path)
+                    except OSError:
+                        continue
+                    manifest_updates.append(ManifestEntry(
+                        path=change.path,
+                        mtime_ns=change.mtime_ns,
+                        size=change.size,
+                        content_hash=content_hash,
+                        fingerprint=fingerprint,
+                        status="rejected",
+                        reason=reason,
+                    ))
+                workflow_result.files_total += len(english)
+                for file_path in english:
+                    await queue.put((file_path, changes.get(file_path), None))
+
+        async def process(file_path: str, change: Optional[FileChange], reused: Optional[ManifestEntry]) -> None:
+            if reused is not None:
+                result = dict(reused.result or {})
+                result["reused"] = True
+                workflow_result.files_reused += 1
+            else:
+                content = await asyncio.to_thread(self._read_for_validation, Path(file_path), change)
+                result = await self._run_validation_pipeline(content, file_path, family, validation_types)
+                workflow_result.files_validated += 1
+                if change is not None and "error" not in result:
+                    manifest_updates.append(ManifestEntry(
+                        path=change.path,
+                        mtime_ns=change.mtime_ns,
+                        size=change.size,
+                        content_hash=change.content_hash,
+                        fingerprint=fingerprint,
+                        status="validated",
+                        result=result,
+                    ))
+                    await flush_manifest()
+            await self._emit_file_result(job_id, result, validation_types, writer)
+
+        async def work() -> None:
+            while True:
+                item = await queue.get()
+                try:
+                    if item is None:
+                        return
+                    file_path = item[0]
+                    try:
+                        await process(*item)
+                    except Exception as e:
+                        workflow_result.files_failed += 1
+                        note_error(f"{file_path}: {str(e)}")
+                        self.logger.warning(f"Failed to validate {file_path}: {e}")
+                finally:
+                    queue.task_done()
+
+        worker_tasks = [asyncio.create_task(work()) for _ in range(workers)]
+        try:
+            try:
+                await produce()
+            finally:
+                for _ in worker_tasks:
+                    await queue.put(None)
+            await asyncio.gather(*worker_tasks)
+            await flush_manifest(force=True)
+            if writer is not None:
+                await asyncio.to_thread(writer.close)
+        except Exception as e:
+            if writer is not None:
+                await asyncio.to_thread(writer.close)
+            for task in worker_tasks:
+                task.cancel()
+            await asyncio.gather(*worker_tasks, return_exceptions=True)
+            workflow_result.status = "failed"
+            workflow_result.errors.append(str(e))
+            self.logger.exception("Streaming directory validation failed")
+            return {"status": "error", "message": str(e), "job_id": job_id}
+
+        if workflow_result.files_rejected:
+            self.logger.info(f"Filtered out {workflow_result.files_rejected} non-English files from directory validation")
+        if errors_dropped:
+            workflow_result.errors.append(f"... and {errors_dropped} more errors")
+        workflow_result.status = "completed"
+        return {
+            "status": "success",
+            "job_id": job_id,
+            "streaming": True,
+            "incremental": incremental,
+            "files_total": workflow_result.files_total,
+            "files_validated": workflow_result.files_validated,
+            "files_reused": workflow_result.files_reused,
+            "files_failed": workflow_result.files_failed,
+            "files_rejected": workflow_result.files_rejected,
+            "errors": workflow_result.errors,
+            "cursor": _encode_results_cursor(job_id) if persist else None,
+        }
+
+    async def validate_and_store(self, file_path: str, family: str, validation_types: Optional[List[str]],
+                                 run_id: str, writer: Optional[ResultWriteBuffer],
+                                 workflow_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Validate one file and queue its result for storage under run_id.
+
+        Item handler of WorkflowManager's directory workflows. Non-English
+        files come back with status "rejected" and are not stored.
+        """
+        is_english, reason = await asyncio.to_thread(is_english_content, file_path)
+        if not is_english:
+            log_language_rejection(file_path, reason, self.logger)
+            return {"status": "rejected", "file_path": file_path, "reason": reason}
+
+        content = await asyncio.to_thread(self._read_for_validation, Path(file_path), None)
+        result = await self._run_validation_pipeline(content, file_path, family, validation_types)
+        await self._emit_file_result(run_id, result, validation_types, writer, workflow_id=workflow_id)
+        result["status"] = "success"
+        return result
+
+    async def _emit_file_result(self, job_id: str, result: Dict[str, Any],
+                                validation_types: Optional[List[str]], writer: Optional[ResultWriteBuffer],
+                                workflow_id: Optional[str] = None) -> None:
+        """Queue one streamed result (and its recommendations) for storage and publish it on the live bus."""
+        validation_id = None
+        if writer is not None:
+            status, severity = _result_status(result)
+            try:
+                validation_id = writer.add_validation(
+                    file_path=result.get("file_path", ""),
+                    rules_applied=validation_types,
+                    validation_results=result,
+                    notes=f"Directory validation {job_id}",
+                    severity=severity,
+                    status=status,
+                    run_id=job_id,
+                    workflow_id=workflow_id,
+                    validation_types=validation_types,
+                )
+                from api.services.recommendation_consolidator import build_recommendation_rows
+                for rec in build_recommendation_rows(validation_id, result.get("file_path"), result):
+                    writer.add_recommendation(**rec)
+                if writer.backlogged:
+                    # Backpressure: the writer thread is behind; wait for it without blocking the loop
+                    await asyncio.to_thread(writer.flush)
+            except Exception as e:
+                self.logger.warning(f"Failed to store result for {result.get('file_path')}: {e}")
+
+        try:
+            from api.services.live_bus import get_live_bus
+            await get_live_bus().publish_workflow_update(job_id, "file_validated", {
+                "file_path": result.get("file_path"),
+                "validation_id": validation_id,
+                "overall_confidence": result.get("overall_confidence"),
+                "issues": len(result.get("final_issues") or []),
+                "reused": bool(result.get("reused")),
+            })
+        except Exception as e:
+            self.logger.debug(f"Failed to publish file result: {e}")
+
+    async def handle_get_directory_results(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Page through the stored results of a streaming directory validation."""
+        try:
+            run_id, after = _decode_results_cursor(params.get("cursor", ""))
+        except ValueError as e:
+            return {"status": "error", "message": str(e)}
+        limit = max(1, min(int(params.get("limit", 100)), 1000))
+
+        rows = await asyncio.to_thread(db_manager.list_validation_results_page, run_id=run_id, after=after, limit=limit)
+        results = []
+        for row in rows:
+            result = dict(row.validation_results or {})
+            result["validation_id"] = row.id
+            results.append(result)
+        next_cursor = _encode_results_cursor(run_id, rows[-1]) if len(rows) == limit else None
+        return {"status": "success", "job_id": run_id, "results": results, "next_cursor": next_cursor}
+
+    def _get_validation_manifest(self) -> ValidationManifest:
+        """Manifest used by incremental directory validation (opened on first use)."""
+        if self._validation_manifest is None:
+            path = getattr(self.settings.orchestrator, "manifest_path", "./data/cache/validation_manifest.db")
+            self._validation_manifest = ValidationManifest(path)
+        return self._validation_manifest
+
+    async def _validation_fingerprint(self, family: str, validation_types: Optional[List[str]]) -> str:
+        """
+        Fingerprint of everything besides file content that affects a result:
+        truth index version_hash, truth/rule/config/prompt file versions and
+        pipeline settings. Any change invalidates every manifest entry.
+        """
+        settings = get_settings()
+        truth_version = None
+        if agent_registry.get_agent("truth_manager"):
+            try:
+                truth_result = await self._call_agent_gated("truth_manager", "load_truth_data", {"family": family})
+                truth_version = truth_result.get("version_hash")
+            except Exception as e:
+                logger.warning(f"Failed to read truth version for incremental validation: {e}")
+
+        def _dump(section: Any) -> Any:
+            return section.model_dump() if hasattr(section, "model_dump") else str(section)
+
+        truth_dirs = list(getattr(settings.truth_manager, "truth_directories", None) or ["./truth"])
+        return run_fingerprint(
+            family=family,
+            validation_types=sorted(validation_types) if validation_types is not None else None,
+            truth_version=truth_version,
+            sources=await asyncio.to_thread(
+                directory_fingerprint, truth_dirs + ["./config", "./rules", "./prompts"]
+            ),
+            validation=_dump(settings.validation),
+            llm=_dump(settings.llm),
+            validators=_dump(settings.validators),
+        )
+
     async def _run_validation_pipeline(self, content: str, file_path: str, family: str, validation_types: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Run the validation pipeline, joining an identical run already in flight.
+
+        Runs are keyed on ValidationCache.validation_cache_key (content hash,
+        validation types, mode, family), the file path and the priority lane,
+        so an interactive caller never waits on a run admitted in the batch
+        lane; every caller gets its own copy of the shared result.
+        """
+        from core.cache import validation_cache
+
+        mode = getattr(get_settings().validation, "mode", "two_stage")
+        key = f"{validation_cache.validation_cache_key(content, validation_types, mode, family)}:{file_path}:{current_lane()}"
+        result = await pipeline_flights.do(
+            key, lambda: self._execute_validation_pipeline(content, file_path, family, validation_types)
+        )
+        return dict(result)
+
+    async def _execute_validation_pipeline(self, content: str, file_path: str, family: str, validation_types: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Run validation pipeline based on configured mode:
         - two_stage (default): run heuristic validation (stage 1), then LLM validation (stage 2) with gating
@@ -379,6 +834,10 @@ class OrchestratorAgent(BaseAgent):
             pipeline_result["validation_mode"] = effective_mode
             pipeline_result["llm_enabled"] = llm_enabled
 
+            # Upstream results (truth context, detections) shared with the router's validators
+            router_context: Dict[str, Any] = {"file_path": file_path, "family": family}
+            shared = shared_results_from_context(content, router_context)
+
             # Load plugin context from TruthManager
             truth_manager = agent_registry.get_agent("truth_manager")
             plugin_aliases: List[str] = []
@@ -392,6 +851,7 @@ class OrchestratorAgent(BaseAgent):
                     )
                     plugin_aliases = truth_result.get("plugin_aliases", [])
                     api_patterns = truth_result.get("api_patterns", [])
+                    shared.publish_truth(TruthContext.from_result(family, truth_result))
                 except Exception as e:
                     logger.warning(f"Failed to load truth data: {e}")
 
@@ -420,6 +880,7 @@ class OrchestratorAgent(BaseAgent):
                         )
                         pipeline_result["plugin_detection"] = fuzzy_result
                         fuzzy_detections = fuzzy_result.get("detections", [])
+                        shared.publish_detections(PluginDetections(family, 0.6, fuzzy_result))
                         try:
                             heuristics_confidence = float(fuzzy_result.get("confidence", 0.0))
                         except Exception:
@@ -452,7 +913,7 @@ class OrchestratorAgent(BaseAgent):
                 router_result = await self.validator_router.execute(
                     validation_types=validation_types_to_run,
                     content=content,
-                    context={"file_path": file_path, "family": family},
+                    context=router_context,
                     ui_override=False
                 )
 
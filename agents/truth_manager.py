@@ -13,7 +13,7 @@ Purpose:
 Highlights:
     [OK] Absolute imports (no relative paths)
     [OK] Full BaseAgent compliance (implements get_contract + async handlers)
-    [OK] Uses cache_result decorator for efficient repeat lookups
+    [OK] Resident per-family index registry, rebuilt only when sources change
     [OK] Generic JSON structure handling with safe fallbacks
     [OK] Family-agnostic truth data loading
     [OK] RAG (Retrieval-Augmented Generation) support for semantic search
@@ -22,15 +22,16 @@ Highlights:
 import json
 import hashlib
 import asyncio
+import threading
+import time
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from datetime import datetime, timezone
 from dataclasses import dataclass
 
 # ---------- Project Imports (absolute) ----------
 from agents.base import BaseAgent, AgentContract, AgentCapability
 from core.logging import PerformanceLogger
-from core.cache import cache_result
 from core.rule_manager import rule_manager
 from core.config_loader import get_config_loader
 
@@ -97,9 +98,13 @@ class CombinationRule:
         }
 
 
-@dataclass
+@dataclass(frozen=True)
 class TruthDataIndex:
-    """In-memory structure for all loaded truths for fast lookup."""
+    """
+    In-memory structure for all loaded truths for fast lookup.
+
+    An index is built once and never modified; a reload builds a new one.
+    """
     # Primary plugin lookups
     by_id: Dict[str, PluginInfo]
     by_slug: Dict[str, PluginInfo]
@@ -312,6 +317,135 @@ class TruthDataAdapter:
         return []
 
 
+# =======================================================
+# Resident Index Registry
+# =======================================================
+
+SourceStamp = Tuple[str, int, int]  # (path, mtime_ns, size); (path, -1, -1) when missing
+
+
+def _stamp_sources(paths: List[str]) -> Tuple[SourceStamp, ...]:
+    stamps = []
+    for path in paths:
+        try:
+            st = Path(path).stat()
+            stamps.append((path, st.st_mtime_ns, st.st_size))
+        except OSError:
+            stamps.append((path, -1, -1))
+    return tuple(stamps)
+
+
+def _hash_sources(stamps: Tuple[SourceStamp, ...]) -> str:
+    digest = hashlib.sha256()
+    for path, _, size in stamps:
+        digest.update(f"{path}:{size}\n".encode())
+        if size < 0:
+            continue
+        try:
+            digest.update(Path(path).read_bytes())
+        except OSError:
+            digest.update(b"<unreadable>")
+    return digest.hexdigest()
+
+
+@dataclass
+class _FamilySnapshot:
+    index: TruthDataIndex
+    stamps: Tuple[SourceStamp, ...]
+    content_hash: str
+    checked_at: float
+
+
+class TruthIndexRegistry:
+    """
+    Resident truth indexes for every family that has been requested.
+
+    Each family maps to an immutable TruthDataIndex plus the stat stamps and
+    content hash of the files it was built from (every candidate path, so a
+    newly created higher-priority file is noticed too). Lookups inside the
+    check interval are a dict read. After that the sources are stat'ed; a
+    changed stamp with unchanged bytes only refreshes the stamps, anything
+    else rebuilds the index under that family's lock and swaps it in.
+    Families never share state, so rebuilding one leaves the others alone.
+    """
+
+    def __init__(
+        self,
+        builder: Callable[[str, bool], TruthDataIndex],
+        sources: Callable[[str], List[str]],
+        check_interval_seconds: float = 2.0,
+        auto_reload: bool = True,
+    ):
+        self._builder = builder
+        self._sources = sources
+        self.check_interval_seconds = check_interval_seconds
+        self.auto_reload = auto_reload
+        self._snapshots: Dict[str, _FamilySnapshot] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self.stats = {"hits": 0, "checks": 0, "builds": 0}
+
+    def _lock_for(self, family: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(family, threading.Lock())
+
+    def _fresh(self, snapshot: Optional[_FamilySnapshot]) -> bool:
+        if snapshot is None:
+            return False
+        if not self.auto_reload:
+            return True
+        return time.monotonic() - snapshot.checked_at < self.check_interval_seconds
+
+    def peek(self, family: str) -> Optional[TruthDataIndex]:
+        """The resident index for a family, without checking its sources."""
+        snapshot = self._snapshots.get(family)
+        return snapshot.index if snapshot else None
+
+    def get(self, family: str, force: bool = False) -> TruthDataIndex:
+        """Return the current index for a family, rebuilding it if its sources changed."""
+        snapshot = self._snapshots.get(family)
+        if not force and self._fresh(snapshot):
+            self.stats["hits"] += 1
+            return snapshot.index
+
+        with self._lock_for(family):
+            snapshot = self._snapshots.get(family)
+            if not force and self._fresh(snapshot):
+                self.stats["hits"] += 1
+                return snapshot.index
+
+            self.stats["checks"] += 1
+            stamps = _stamp_sources(self._sources(family))
+            now = time.monotonic()
+            if snapshot is not None and not force:
+                if stamps == snapshot.stamps:
+                    snapshot.checked_at = now
+                    return snapshot.index
+                content_hash = _hash_sources(stamps)
+                if content_hash == snapshot.content_hash:
+                    # Touched or copied but identical: keep the index
+                    self._snapshots[family] = _FamilySnapshot(snapshot.index, stamps, content_hash, now)
+                    return snapshot.index
+            else:
+                content_hash = _hash_sources(stamps)
+
+            index = self._builder(family, snapshot is not None)
+            self.stats["builds"] += 1
+            self._snapshots[family] = _FamilySnapshot(index, stamps, content_hash, now)
+            return index
+
+    def invalidate(self, family: Optional[str] = None) -> None:
+        """Drop one family's snapshot (or all); the next get() rebuilds it."""
+        if family is None:
+            self._snapshots.clear()
+        else:
+            self._snapshots.pop(family, None)
+
+    def families(self) -> Dict[str, str]:
+        """Resident families and their version hashes."""
+        return {family: snap.index.version_hash for family, snap in list(self._snapshots.items())}
+
+
 # =======================================================
 # Main Agent
 # =======================================================
@@ -319,8 +453,13 @@ class TruthDataAdapter:
 class TruthManagerAgent(BaseAgent):
     """Agent responsible for loading, caching, and serving truth data."""
 
+    # Indexes are immutable per-family snapshots; lookups may overlap
+    max_concurrency = None
+
     def __init__(self, agent_id: Optional[str] = None):
+        # Most recently loaded index; family-aware handlers read the registry
         self.truth_index: Optional[TruthDataIndex] = None
+        self.truth_registry: Optional[TruthIndexRegistry] = None
         self.truth_directories: List[Path] = []
         self.validation_issues: List[str] = []
         self.supported_families = ["words"]  # Can be extended
@@ -439,44 +578,71 @@ class TruthManagerAgent(BaseAgent):
             self.truth_directories.append(p)
             if not p.exists():
                 self.logger.warning("Truth directory missing", path=str(p))
+        self.truth_registry = TruthIndexRegistry(
+            builder=self._build_family_index,
+            sources=self._truth_sources,
+            check_interval_seconds=cfg.index_check_interval_seconds,
+            auto_reload=cfg.auto_reload,
+        )
         # auto-load once on startup
         self._load_truth_data()
 
     # ===================================================
     # Core Logic (Generic and family-agnostic)
     # ===================================================
-    def _load_truth_data(self, family: str = "words") -> bool:
-        """Internal synchronous loader for truth JSON files."""
+    def _load_truth_data(self, family: str = "words", force: bool = False) -> bool:
+        """Make a family's resident index current (building it if needed)."""
         try:
-            plugins = {}
-            combination_rules = []
-
-            # Load plugins for the specified family
-            family_plugins = self._load_family_truth_data(family)
-            plugins.update(family_plugins)
-
-            # Load combination rules
-            combination_rules.extend(self._load_combination_rules(family))
-
-            self.truth_index = self._build_index(plugins, combination_rules)
-            self.logger.info(
-                "Truth data loaded successfully",
-                family=family,
-                plugins_count=len(plugins),
-                combination_rules_count=len(combination_rules),
-                version_hash=self.truth_index.version_hash,
-            )
+            self.truth_index = self.truth_registry.get(family, force=force)
             return True
         except Exception as e:
             self.logger.error("Truth load failed", family=family, error=str(e))
             self.validation_issues.append(str(e))
             return False
 
-    def _load_family_truth_data(self, family: str) -> Dict[str, PluginInfo]:
-        """Load truth data for a specific family."""
-        plugins = {}
-        adapter = TruthDataAdapter(family)
-        
+    def _build_family_index(self, family: str, rebuild: bool = False) -> TruthDataIndex:
+        """Registry builder: read a family's truth and combination files into a new index."""
+        if rebuild:
+            # Alias overrides come from the family rules file, which may have changed too
+            rule_manager.reload_rules(family)
+        plugins = self._load_family_truth_data(family)
+        combination_rules = self._load_combination_rules(family)
+        index = self._build_index(plugins, combination_rules)
+        self.logger.info(
+            "Truth data loaded successfully",
+            family=family,
+            plugins_count=len(plugins),
+            combination_rules_count=len(combination_rules),
+            version_hash=index.version_hash,
+        )
+        return index
+
+    def _truth_sources(self, family: str) -> List[str]:
+        """Every file a family's index depends on, existing or not."""
+        return (
+            self._truth_file_candidates(family)
+            + self._combination_file_candidates(family)
+            + [str(rule_manager.rules_directory / f"{family}.json")]
+        )
+
+    def _index_for(self, params: Dict[str, Any]) -> Optional[TruthDataIndex]:
+        """
+        The current index of the requested family (loaded on first use), or the
+        most recently loaded one when no family was requested.
+        """
+        family = params.get("family")
+        if not family:
+            return self.truth_index
+        if not self.truth_registry:
+            return None
+        try:
+            return self.truth_registry.get(family)
+        except Exception as e:
+            self.logger.error("Truth load failed", family=family, error=str(e))
+            return None
+
+    def _truth_file_candidates(self, family: str) -> List[str]:
+        """Candidate truth files for a family, in priority order."""
         # Determine candidate truth files. Prefer the Aspose-specific truth definitions located
         # within the /truth directory, as those contain the canonical plugin IDs used by
         # combination rules. Fallback to generic family truth files if no Aspose file exists.
@@ -501,9 +667,15 @@ class TruthManagerAgent(BaseAgent):
 
         # 5) Generic family plugins truth at root
         truth_file_candidates.append(f"{family}_plugins_truth.json")
+        return truth_file_candidates
+
+    def _load_family_truth_data(self, family: str) -> Dict[str, PluginInfo]:
+        """Load truth data for a specific family."""
+        plugins = {}
+        adapter = TruthDataAdapter(family)
 
         truth_file: Optional[str] = None
-        for candidate in truth_file_candidates:
+        for candidate in self._truth_file_candidates(family):
             if candidate and Path(candidate).exists():
                 truth_file = candidate
                 break
@@ -525,10 +697,8 @@ class TruthManagerAgent(BaseAgent):
 
         return plugins
 
-    def _load_combination_rules(self, family: str) -> List[CombinationRule]:
-        """Load combination rules for a family."""
-        rules = []
-        
+    def _combination_file_candidates(self, family: str) -> List[str]:
+        """Candidate combination files for a family, in priority order."""
         # Determine candidate combination files. Prefer Aspose-specific combinations within
         # the truth directory, which correspond to the detailed plugin definitions.
         combo_file_candidates: List[str] = []
@@ -552,9 +722,14 @@ class TruthManagerAgent(BaseAgent):
 
         # 5) Generic family plugins combinations at root
         combo_file_candidates.append(f"{family}_plugins_combinations.json")
+        return combo_file_candidates
+
+    def _load_combination_rules(self, family: str) -> List[CombinationRule]:
+        """Load combination rules for a family."""
+        rules = []
 
         combo_file: Optional[str] = None
-        for candidate in combo_file_candidates:
+        for candidate in self._combination_file_candidates(family):
             if candidate and Path(candidate).exists():
                 combo_file = candidate
                 break
@@ -727,28 +902,29 @@ class TruthManagerAgent(BaseAgent):
     # Public async handlers (MCP API)
     # ===================================================
 
-    @cache_result(ttl_seconds=3600)
     async def handle_load_truth_data(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Reload truth data on demand (used by orchestrator)."""
+        """Return the family's resident index summary, rebuilding it only if its files changed."""
         family = params.get("family", "words")
         success = self._load_truth_data(family)
+        index = self._index_for({"family": family})
         return {
             "success": success,
             "family": family,
-            "plugins_count": len(self.truth_index.by_id) if self.truth_index else 0,
-            "combination_rules_count": len(self.truth_index.combination_rules) if self.truth_index else 0,
-            "version_hash": getattr(self.truth_index, "version_hash", None),
+            "plugins_count": len(index.by_id) if index else 0,
+            "combination_rules_count": len(index.combination_rules) if index else 0,
+            "version_hash": getattr(index, "version_hash", None),
         }
 
     async def handle_get_plugin_info(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Fetch plugin info by id or slug."""
+        index = self._index_for(params)
         pid = params.get("plugin_id")
         slug = params.get("slug")
         name = params.get("name")
         query = None
         plugin = None
         # If truth index is not loaded, return not found
-        if not self.truth_index:
+        if not index:
             return {"found": False, "plugin": None}
 
         # Normalize queries
@@ -761,16 +937,16 @@ class TruthManagerAgent(BaseAgent):
 
         if query:
             # Direct lookups by id, slug, or name
-            if query in self.truth_index.by_id:
-                plugin = self.truth_index.by_id.get(query)
-            elif query in self.truth_index.by_slug:
-                plugin = self.truth_index.by_slug.get(query)
-            elif query.lower() in self.truth_index.by_name:
-                plugin = self.truth_index.by_name.get(query.lower())
+            if query in index.by_id:
+                plugin = index.by_id.get(query)
+            elif query in index.by_slug:
+                plugin = index.by_slug.get(query)
+            elif query.lower() in index.by_name:
+                plugin = index.by_name.get(query.lower())
             else:
                 # Fallback to alias lookup: normalize query by removing separators
                 alias_norm = query.lower().replace(" ", "").replace("-", "").replace("_", "")
-                matches = self.truth_index.by_alias.get(alias_norm, [])
+                matches = index.by_alias.get(alias_norm, [])
                 # If multiple matches, select the one with exact id match or first
                 if matches:
                     plugin = matches[0]
@@ -782,12 +958,13 @@ class TruthManagerAgent(BaseAgent):
         # Normalise query and family
         query_raw = params.get("query", "") or ""
         family = params.get("family", "words")
+        index = self._index_for({"family": family})
         # Early exit if truth index is not loaded
-        if not self.truth_index:
+        if not index:
             return {"results": [], "matches_count": 0}
         # If no query, return all plugins for the family
         if not query_raw:
-            family_plugins = self.truth_index.by_family.get(family, [])
+            family_plugins = index.by_family.get(family, [])
             # Sort results by plugin name for stable ordering
             results = [p.to_dict() for p in sorted(family_plugins, key=lambda x: x.name.lower())]
             return {"results": results, "matches_count": len(results)}
@@ -799,14 +976,14 @@ class TruthManagerAgent(BaseAgent):
         matched_plugins: Dict[str, PluginInfo] = {}
 
         # Search by id, name and slug
-        for plugin in self.truth_index.by_id.values():
+        for plugin in index.by_id.values():
             if plugin.family != family:
                 continue
             if query_lower in plugin.id.lower() or query_lower in plugin.name.lower() or query_lower in plugin.slug.lower():
                 matched_plugins[plugin.id] = plugin
 
         # Search by alias map
-        for alias_key, plugin_list in self.truth_index.by_alias.items():
+        for alias_key, plugin_list in index.by_alias.items():
             if query_norm in alias_key:
                 for plugin in plugin_list:
                     if plugin.family == family:
@@ -818,39 +995,43 @@ class TruthManagerAgent(BaseAgent):
 
     async def handle_get_combination_rules(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Return all loaded combination rules."""
-        if not self.truth_index:
+        index = self._index_for(params)
+        if not index:
             return {"rules": []}
-        return {"rules": [r.to_dict() for r in self.truth_index.combination_rules]}
+        return {"rules": [r.to_dict() for r in index.combination_rules]}
 
     async def handle_validate_truth_data(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Simple structural validation of truth index."""
+        index = self._index_for(params)
         issues = []
-        if not self.truth_index:
+        if not index:
             issues.append("Truth data not loaded")
         else:
-            for plugin in self.truth_index.by_id.values():
+            for plugin in index.by_id.values():
                 if not plugin.patterns:
                     issues.append(f"Plugin {plugin.id} missing patterns")
         return {"issues": issues, "valid": len(issues) == 0}
 
     async def handle_get_truth_statistics(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Provide statistics and metadata."""
-        if not self.truth_index:
+        index = self._index_for(params)
+        if not index:
             return {"loaded": False}
         return {
             "loaded": True,
-            "plugins_count": len(self.truth_index.by_id),
-            "families_count": len(self.truth_index.by_family),
-            "rules_count": len(self.truth_index.combination_rules),
-            "version_hash": self.truth_index.version_hash,
-            "supported_families": self.supported_families
+            "plugins_count": len(index.by_id),
+            "families_count": len(index.by_family),
+            "rules_count": len(index.combination_rules),
+            "version_hash": index.version_hash,
+            "supported_families": self.supported_families,
+            "resident_families": self.truth_registry.families() if self.truth_registry else {},
         }
 
     async def handle_reload_truth_data(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Forces a reload bypassing cache."""
         family = params.get("family", "words")
         self.clear_cache()
-        success = self._load_truth_data(family)
+        success = self._load_truth_data(family, force=True)
         return {"success": success, "reloaded": True, "family": family}
 
     async def handle_check_plugin_combination(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -868,7 +1049,8 @@ class TruthManagerAgent(BaseAgent):
                 "unknown_plugins": List[str]  # any plugin IDs that were not found in the truth index
             }
         """
-        if not self.truth_index:
+        index = self._index_for(params)
+        if not index:
             return {"valid": False, "rules": [], "unknown_plugins": []}
 
         plugin_ids_raw = params.get("plugins", []) or []
@@ -886,16 +1068,16 @@ class TruthManagerAgent(BaseAgent):
             key = str(item)
             found_plugin: Optional[PluginInfo] = None
             # Check by id, slug, name
-            if key in self.truth_index.by_id:
-                found_plugin = self.truth_index.by_id[key]
-            elif key in self.truth_index.by_slug:
-                found_plugin = self.truth_index.by_slug[key]
-            elif key.lower() in self.truth_index.by_name:
-                found_plugin = self.truth_index.by_name[key.lower()]
+            if key in index.by_id:
+                found_plugin = index.by_id[key]
+            elif key in index.by_slug:
+                found_plugin = index.by_slug[key]
+            elif key.lower() in index.by_name:
+                found_plugin = index.by_name[key.lower()]
             else:
                 # Alias lookup
                 alias_norm = key.lower().replace(" ", "").replace("-", "").replace("_", "")
-                matches = self.truth_index.by_alias.get(alias_norm)
+                matches = index.by_alias.get(alias_norm)
                 if matches:
                     found_plugin = matches[0]
             if found_plugin:
@@ -915,8 +1097,8 @@ class TruthManagerAgent(BaseAgent):
         # Sort plugin IDs for combination index lookup
         sorted_ids = tuple(sorted(resolved_ids))
         rules = []
-        if sorted_ids in self.truth_index.combination_index:
-            rules = [r.name for r in self.truth_index.combination_index[sorted_ids]]
+        if sorted_ids in index.combination_index:
+            rules = [r.name for r in index.combination_index[sorted_ids]]
         return {"valid": bool(rules), "rules": rules, "unknown_plugins": []}
 
     # ===================================================
@@ -960,10 +1142,11 @@ class TruthManagerAgent(BaseAgent):
             }
 
         # Ensure truth data is loaded
-        if not self.truth_index:
+        if not self.truth_registry or not self.truth_registry.peek(family):
             self._load_truth_data(family)
+        index = self._index_for({"family": family})
 
-        if not self.truth_index:
+        if not index:
             return {
                 "success": False,
                 "family": family,
@@ -972,7 +1155,7 @@ class TruthManagerAgent(BaseAgent):
             }
 
         # Prepare truth documents for indexing
-        family_plugins = self.truth_index.by_family.get(family, [])
+        family_plugins = index.by_family.get(family, [])
         if not family_plugins:
             return {
                 "success": True,
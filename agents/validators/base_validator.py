@@ -215,6 +215,9 @@ class BaseValidatorAgent(BaseAgent):
     Provides common validation infrastructure and interface.
     """
 
+    # Validators keep no per-request state
+    max_concurrency = None
+
     @abstractmethod
     def get_validation_type(self) -> str:
         """Return the validation type identifier (e.g., 'yaml', 'markdown', 'seo')."""
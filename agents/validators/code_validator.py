@@ -5,7 +5,6 @@ Uses ConfigLoader for configuration-driven validation.
 """
 
 from __future__ import annotations
-import re
 from typing import Dict, Any, List, Optional, Tuple
 
 from agents.validators.base_validator import (
@@ -14,6 +13,7 @@ from agents.validators.base_validator import (
     ValidationResult
 )
 from core.config_loader import ConfigLoader, get_config_loader
+from core.document_model import DocumentModel, document_from_context
 from core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -34,20 +34,20 @@ class CodeValidatorAgent(BaseValidatorAgent):
         """Validate code blocks and inline code."""
         issues: List[ValidationIssue] = []
         auto_fixable = 0
-        lines = content.split('\n')
+        document = document_from_context(content, context)
 
         # Get profile and family from context
         profile = context.get("profile", self._config.profile)
         family = context.get("family")
 
         # Get active rules for this profile/family
-        active_rules = self._config_loader.get_rules("code", profile=profile, family=family)
-        active_rule_ids = {r.id for r in active_rules}
-        rule_levels = {r.id: r.level for r in active_rules}
-        rule_params = {r.id: r.params for r in active_rules}
+        ruleset = self._config_loader.get_ruleset("code", profile=profile, family=family)
+        active_rule_ids = ruleset.active_rule_ids
+        rule_levels = ruleset.rule_levels
+        rule_params = ruleset.rule_params
 
         # Extract code blocks
-        code_blocks = self._extract_code_blocks(lines)
+        code_blocks = self._extract_code_blocks(document)
 
         # Validate code blocks
         for block in code_blocks:
@@ -58,7 +58,7 @@ class CodeValidatorAgent(BaseValidatorAgent):
         if "inline_code_too_long" in active_rule_ids:
             max_chars = rule_params.get("inline_code_too_long", {}).get("max_chars", 50)
             level = rule_levels.get("inline_code_too_long", "info")
-            inline_issues = self._check_inline_code(lines, max_chars, level)
+            inline_issues = self._check_inline_code(document, max_chars, level)
             issues.extend(inline_issues)
 
         confidence = max(0.6, 1.0 - (len(issues) * 0.1))
@@ -75,33 +75,9 @@ class CodeValidatorAgent(BaseValidatorAgent):
             }
         )
 
-    def _extract_code_blocks(self, lines: List[str]) -> List[Dict[str, Any]]:
-        """Extract all code blocks from content."""
-        code_blocks = []
-        in_code_block = False
-        current_block = None
-
-        for i, line in enumerate(lines):
-            if line.strip().startswith('```'):
-                if in_code_block:
-                    # End of code block
-                    current_block['end_line'] = i + 1
-                    code_blocks.append(current_block)
-                    current_block = None
-                    in_code_block = False
-                else:
-                    # Start of code block
-                    language = line.strip()[3:].strip()
-                    current_block = {
-                        'start_line': i + 1,
-                        'language': language,
-                        'lines': []
-                    }
-                    in_code_block = True
-            elif in_code_block and current_block is not None:
-                current_block['lines'].append(line)
-
-        return code_blocks
+    def _extract_code_blocks(self, document: DocumentModel) -> List[Dict[str, Any]]:
+        """All closed ``` code blocks from the parsed document."""
+        return [block.to_dict() for block in document.code_blocks]
 
     def _validate_code_block(
         self,
@@ -167,27 +143,20 @@ class CodeValidatorAgent(BaseValidatorAgent):
 
         return issues
 
-    def _check_inline_code(self, lines: List[str], max_chars: int, level: str) -> List[ValidationIssue]:
+    def _check_inline_code(self, document: DocumentModel, max_chars: int, level: str) -> List[ValidationIssue]:
         """Check for inline code issues."""
         issues = []
-        # Match inline code: `code`
-        inline_pattern = re.compile(r'`([^`]+)`')
-
-        for i, line in enumerate(lines):
-            # Skip lines that are in code blocks
-            if line.strip().startswith('```'):
-                continue
-
-            matches = inline_pattern.findall(line)
-            for code_text in matches:
-                # Check for very long inline code
-                if len(code_text) > max_chars:
-                    issues.append(ValidationIssue(
-                        level=level,
-                        category="code_inline_too_long",
-                        message=f"Long inline code ({len(code_text)} chars) at line {i + 1}",
-                        line_number=i + 1,
-                        suggestion="Consider using a code block instead"
-                    ))
+
+        # Inline `code` spans (fence lines are skipped by the document model)
+        for line_number, code_text in document.inline_code:
+            # Check for very long inline code
+            if len(code_text) > max_chars:
+                issues.append(ValidationIssue(
+                    level=level,
+                    category="code_inline_too_long",
+                    message=f"Long inline code ({len(code_text)} chars) at line {line_number}",
+                    line_number=line_number,
+                    suggestion="Consider using a code block instead"
+                ))
 
         return issues
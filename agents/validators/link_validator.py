@@ -5,7 +5,6 @@ Uses ConfigLoader for configuration-driven validation.
 """
 
 from __future__ import annotations
-import re
 from typing import Dict, Any, List, Optional
 from urllib.parse import urlparse
 
@@ -15,6 +14,7 @@ from agents.validators.base_validator import (
     ValidationResult
 )
 from core.config_loader import ConfigLoader, get_config_loader
+from core.document_model import DocumentModel, document_from_context
 from core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -35,20 +35,20 @@ class LinkValidatorAgent(BaseValidatorAgent):
         """Validate links in content."""
         issues: List[ValidationIssue] = []
         auto_fixable = 0
-        lines = content.split('\n')
+        document = document_from_context(content, context)
 
         # Get profile and family from context
         profile = context.get("profile", self._config.profile)
         family = context.get("family")
 
         # Get active rules for this profile/family
-        active_rules = self._config_loader.get_rules("links", profile=profile, family=family)
-        active_rule_ids = {r.id for r in active_rules}
-        rule_levels = {r.id: r.level for r in active_rules}
-        rule_params = {r.id: r.params for r in active_rules}
+        ruleset = self._config_loader.get_ruleset("links", profile=profile, family=family)
+        active_rule_ids = ruleset.active_rule_ids
+        rule_levels = ruleset.rule_levels
+        rule_params = ruleset.rule_params
 
         # Extract all links
-        links = self._extract_links(lines)
+        links = self._extract_links(document)
 
         # Validate each link
         for link in links:
@@ -69,26 +69,9 @@ class LinkValidatorAgent(BaseValidatorAgent):
             }
         )
 
-    def _extract_links(self, lines: List[str]) -> List[Dict[str, Any]]:
-        """Extract all links from content."""
-        links = []
-        # Match markdown links: [text](url) and images: ![alt](url)
-        link_pattern = re.compile(r'!?\[([^\]]*)\]\(([^)]*)\)')
-
-        for i, line in enumerate(lines):
-            matches = link_pattern.finditer(line)
-            for match in matches:
-                is_image = match.group(0).startswith('!')
-                text = match.group(1)
-                url = match.group(2)
-                links.append({
-                    'line': i + 1,
-                    'text': text,
-                    'url': url,
-                    'is_image': is_image
-                })
-
-        return links
+    def _extract_links(self, document: DocumentModel) -> List[Dict[str, Any]]:
+        """All markdown links [text](url) and images ![alt](url) from the parsed document."""
+        return [link.to_dict() for link in document.links]
 
     def _validate_link(
         self,
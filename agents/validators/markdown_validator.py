@@ -5,7 +5,6 @@ Uses ConfigLoader for configuration-driven validation.
 """
 
 from __future__ import annotations
-import re
 from typing import Dict, Any, List, Optional
 
 from agents.validators.base_validator import (
@@ -14,6 +13,7 @@ from agents.validators.base_validator import (
     ValidationResult
 )
 from core.config_loader import ConfigLoader, get_config_loader
+from core.document_model import DocumentModel, document_from_context
 from core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -34,29 +34,30 @@ class MarkdownValidatorAgent(BaseValidatorAgent):
         """Validate Markdown syntax."""
         issues: List[ValidationIssue] = []
         auto_fixable = 0
-        lines = content.split('\n')
+        document = document_from_context(content, context)
+        lines = document.lines
 
         # Get profile and family from context
         profile = context.get("profile", self._config.profile)
         family = context.get("family")
 
         # Get active rules for this profile/family
-        active_rules = self._config_loader.get_rules("markdown", profile=profile, family=family)
-        active_rule_ids = {r.id for r in active_rules}
-        rule_levels = {r.id: r.level for r in active_rules}
+        ruleset = self._config_loader.get_ruleset("markdown", profile=profile, family=family)
+        active_rule_ids = ruleset.active_rule_ids
+        rule_levels = ruleset.rule_levels
 
         # Check for unclosed code blocks
         if "unclosed_code_block" in active_rule_ids:
             level = rule_levels.get("unclosed_code_block", "error")
-            code_block_issues = self._check_code_blocks(lines, level)
+            code_block_issues = self._check_code_blocks(document, level)
             issues.extend(code_block_issues)
 
         # Check for invalid link syntax
-        link_issues = self._check_links(lines, active_rule_ids, rule_levels)
+        link_issues = self._check_links(document, active_rule_ids, rule_levels)
         issues.extend(link_issues)
 
         # Check for missing alt text in images
-        image_issues = self._check_images(lines, active_rule_ids, rule_levels)
+        image_issues = self._check_images(document, active_rule_ids, rule_levels)
         issues.extend(image_issues)
 
         # Check for common formatting issues
@@ -77,21 +78,13 @@ class MarkdownValidatorAgent(BaseValidatorAgent):
             }
         )
 
-    def _check_code_blocks(self, lines: List[str], level: str = "error") -> List[ValidationIssue]:
+    def _check_code_blocks(self, document: DocumentModel, level: str = "error") -> List[ValidationIssue]:
         """Check for unclosed code blocks."""
         issues = []
-        in_code_block = False
-        code_block_start_line = 0
+        unclosed = document.unclosed_fence
 
-        for i, line in enumerate(lines):
-            if line.strip().startswith('```'):
-                if in_code_block:
-                    in_code_block = False
-                else:
-                    in_code_block = True
-                    code_block_start_line = i + 1
-
-        if in_code_block:
+        if unclosed is not None:
+            code_block_start_line = unclosed.start_line
             issues.append(ValidationIssue(
                 level=level,
                 category="markdown_unclosed_code_block",
@@ -102,70 +95,64 @@ class MarkdownValidatorAgent(BaseValidatorAgent):
 
         return issues
 
-    def _check_links(self, lines: List[str], active_rule_ids: set, rule_levels: Dict[str, str]) -> List[ValidationIssue]:
+    def _check_links(self, document: DocumentModel, active_rule_ids: set, rule_levels: Dict[str, str]) -> List[ValidationIssue]:
         """Check for invalid link syntax."""
         issues = []
-        # Match markdown links: [text](url)
-        link_pattern = re.compile(r'\[([^\]]*)\]\(([^)]*)\)')
 
-        for i, line in enumerate(lines):
-            # Find all links in line
-            matches = link_pattern.findall(line)
-            for text, url in matches:
-                # Check for empty link text
-                if "empty_link_text" in active_rule_ids and not text.strip():
-                    level = rule_levels.get("empty_link_text", "warning")
-                    issues.append(ValidationIssue(
-                        level=level,
-                        category="markdown_empty_link_text",
-                        message=f"Empty link text at line {i + 1}",
-                        line_number=i + 1,
-                        suggestion="Add descriptive text between [brackets]"
-                    ))
-
-                # Check for empty URL
-                if "empty_link_url" in active_rule_ids and not url.strip():
-                    level = rule_levels.get("empty_link_url", "error")
-                    issues.append(ValidationIssue(
-                        level=level,
-                        category="markdown_empty_link_url",
-                        message=f"Empty link URL at line {i + 1}",
-                        line_number=i + 1,
-                        suggestion="Add URL between (parentheses)"
-                    ))
+        # Every [text](url), including the [alt](url) part of images
+        for link in document.links:
+            line_number = link.line
+
+            # Check for empty link text
+            if "empty_link_text" in active_rule_ids and not link.text.strip():
+                level = rule_levels.get("empty_link_text", "warning")
+                issues.append(ValidationIssue(
+                    level=level,
+                    category="markdown_empty_link_text",
+                    message=f"Empty link text at line {line_number}",
+                    line_number=line_number,
+                    suggestion="Add descriptive text between [brackets]"
+                ))
+
+            # Check for empty URL
+            if "empty_link_url" in active_rule_ids and not link.url.strip():
+                level = rule_levels.get("empty_link_url", "error")
+                issues.append(ValidationIssue(
+                    level=level,
+                    category="markdown_empty_link_url",
+                    message=f"Empty link URL at line {line_number}",
+                    line_number=line_number,
+                    suggestion="Add URL between (parentheses)"
+                ))
 
         return issues
 
-    def _check_images(self, lines: List[str], active_rule_ids: set, rule_levels: Dict[str, str]) -> List[ValidationIssue]:
+    def _check_images(self, document: DocumentModel, active_rule_ids: set, rule_levels: Dict[str, str]) -> List[ValidationIssue]:
         """Check for images without alt text."""
         issues = []
-        # Match markdown images: ![alt](url)
-        image_pattern = re.compile(r'!\[([^\]]*)\]\(([^)]*)\)')
 
-        for i, line in enumerate(lines):
-            matches = image_pattern.findall(line)
-            for alt, url in matches:
-                # Check for missing alt text
-                if "missing_alt_text" in active_rule_ids and not alt.strip():
-                    level = rule_levels.get("missing_alt_text", "warning")
-                    issues.append(ValidationIssue(
-                        level=level,
-                        category="markdown_missing_alt_text",
-                        message=f"Image missing alt text at line {i + 1}",
-                        line_number=i + 1,
-                        suggestion="Add descriptive alt text: ![description](url)"
-                    ))
-
-                # Check for empty URL
-                if "empty_image_url" in active_rule_ids and not url.strip():
-                    level = rule_levels.get("empty_image_url", "error")
-                    issues.append(ValidationIssue(
-                        level=level,
-                        category="markdown_empty_image_url",
-                        message=f"Image missing URL at line {i + 1}",
-                        line_number=i + 1,
-                        suggestion="Add image URL between (parentheses)"
-                    ))
+        for line_number, alt, url in document.images:
+            # Check for missing alt text
+            if "missing_alt_text" in active_rule_ids and not alt.strip():
+                level = rule_levels.get("missing_alt_text", "warning")
+                issues.append(ValidationIssue(
+                    level=level,
+                    category="markdown_missing_alt_text",
+                    message=f"Image missing alt text at line {line_number}",
+                    line_number=line_number,
+                    suggestion="Add descriptive alt text: ![description](url)"
+                ))
+
+            # Check for empty URL
+            if "empty_image_url" in active_rule_ids and not url.strip():
+                level = rule_levels.get("empty_image_url", "error")
+                issues.append(ValidationIssue(
+                    level=level,
+                    category="markdown_empty_image_url",
+                    message=f"Image missing URL at line {line_number}",
+                    line_number=line_number,
+                    suggestion="Add image URL between (parentheses)"
+                ))
 
         return issues
 
@@ -2,11 +2,30 @@
 """
 ValidatorRouter - Routes validation requests to appropriate validator agents.
 Provides fallback to legacy ContentValidator when new validators are unavailable.
+
+With ``executor.mode: process`` in validation_flow.yaml, the CPU-bound rule
+validators of a request run in the warm validator process pool (one round
+trip per document, see core.validator_router); the rest run in order on the
+event loop.
 """
 
 from __future__ import annotations
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+from core.config_loader import get_config_loader
+from core.document_model import document_from_context
+from core.shared_results import shared_results_from_context
 from core.logging import get_logger
+from core.validator_router import (
+    DEFAULT_CPU_BOUND_VALIDATORS,
+    EXECUTOR_INLINE,
+    EXECUTOR_PROCESS,
+    ValidatorProcessPool,
+    ValidatorSpec,
+    executor_settings,
+    process_pool_for,
+    run_in_pool,
+    validator_spec,
+)
 
 logger = get_logger(__name__)
 
@@ -14,17 +33,56 @@ logger = get_logger(__name__)
 class ValidatorRouter:
     """Routes validation requests to appropriate validators with fallback support."""
 
-    def __init__(self, agent_registry, feature_flags=None):
+    def __init__(self, agent_registry, feature_flags=None, executor_mode: Optional[str] = None,
+                 process_pool: Optional[ValidatorProcessPool] = None):
         """
         Initialize the validator router.
 
         Args:
             agent_registry: The agent registry to look up validators
             feature_flags: Optional feature flags for gradual rollout (not used if None)
+            executor_mode: "inline" or "process" (overrides executor.mode in validation_flow.yaml)
+            process_pool: Optional pool for process mode (uses the shared pool if not provided)
         """
         self.agent_registry = agent_registry
         self.feature_flags = feature_flags
         self.validator_map = self._build_validator_map()
+        self._executor_mode_override = executor_mode
+        self._process_pool = process_pool
+
+    def _get_executor_config(self) -> Dict[str, Any]:
+        """Executor settings from validation_flow.yaml (read per request, so reloads apply)."""
+        try:
+            config = get_config_loader().load("validation_flow")
+        except Exception:
+            config = {}
+        return executor_settings(config, self._executor_mode_override)
+
+    def _pooled_jobs(self, validation_types: List[str], executor: Dict[str, Any]) -> List[Tuple[str, ValidatorSpec]]:
+        """CPU-bound validation types that can run in the process pool."""
+        if executor.get("mode", EXECUTOR_INLINE) != EXECUTOR_PROCESS:
+            return []
+        cpu_bound = set(executor.get("cpu_bound_validators", DEFAULT_CPU_BOUND_VALIDATORS))
+        jobs = []
+        for val_type in dict.fromkeys(validation_types):
+            agent_id = self.validator_map.get(val_type)
+            if val_type in cpu_bound and agent_id:
+                spec = validator_spec(self.agent_registry.get_agent(agent_id))
+                if spec is not None:
+                    jobs.append((val_type, spec))
+        return jobs
+
+    async def _run_pooled(self, jobs: List[Tuple[str, ValidatorSpec]], content: str,
+                          context: Dict[str, Any], executor: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Results of the pooled validators; empty (run them inline) if the pool is unavailable."""
+        if self._process_pool is None:
+            self._process_pool = process_pool_for(executor)
+        try:
+            return await run_in_pool(self._process_pool, jobs, content, context, timeout=None)
+        except Exception as e:
+            # Unpicklable context, crashed worker, ...: keep validating in-process
+            logger.warning(f"Process pool unavailable, running validators inline: {e}")
+            return {}
 
     def _build_validator_map(self) -> Dict[str, str]:
         """Map validation types to agent IDs."""
@@ -70,6 +128,16 @@ class ValidatorRouter:
             "routing_info": {}
         }
 
+        # Parse the document once; every validator reads the shared model, and
+        # later validators read earlier results from the shared channel
+        context = dict(context or {})
+        document_from_context(content, context)
+        shared = shared_results_from_context(content, context)
+
+        executor = self._get_executor_config()
+        jobs = self._pooled_jobs(validation_types, executor)
+        pooled = await self._run_pooled(jobs, content, context, executor) if jobs else {}
+
         for val_type in validation_types:
             try:
                 # Get agent ID for this validation type
@@ -83,7 +151,18 @@ class ValidatorRouter:
                 # Check if new validator is available
                 agent = self.agent_registry.get_agent(agent_id)
 
-                if agent:
+                if val_type in pooled:
+                    result = pooled[val_type]
+                    results["validation_results"][f"{val_type}_validation"] = {
+                        "confidence": result["confidence"],
+                        "issues": result["issues"],
+                        "metrics": result.get("metrics", {}),
+                        "used_legacy": False,
+                        **({"error": result["error"]} if "error" in result else {})
+                    }
+                    shared.record(val_type, results["validation_results"][f"{val_type}_validation"])
+                    results["routing_info"][val_type] = "process_pool"
+                elif agent:
                     # Use new validator agent
                     logger.debug(f"Using new validator agent for {val_type}: {agent_id}")
 
@@ -99,6 +178,7 @@ class ValidatorRouter:
                         "metrics": validation_result.metrics,
                         "used_legacy": False
                     }
+                    shared.record(val_type, results["validation_results"][f"{val_type}_validation"])
                     results["routing_info"][val_type] = "new_validator"
                 else:
                     # Fallback to legacy ContentValidator
@@ -115,6 +195,7 @@ class ValidatorRouter:
                 }
                 results["routing_info"][val_type] = "error"
 
+        results["profile"] = shared.profile()
         return results
 
     async def _use_legacy_validator(
@@ -6,7 +6,6 @@ Uses ConfigLoader for configuration-driven validation.
 """
 
 from __future__ import annotations
-import re
 from typing import Dict, Any, List, Optional
 
 from agents.validators.base_validator import (
@@ -15,6 +14,7 @@ from agents.validators.base_validator import (
     ValidationResult
 )
 from core.config_loader import ConfigLoader, get_config_loader
+from core.document_model import DocumentModel, document_from_context
 from core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -62,12 +62,12 @@ class SeoValidatorAgent(BaseValidatorAgent):
         validation_mode = context.get("mode", context.get("validation_type", "seo"))
 
         # Get active rules
-        active_rules = self._config_loader.get_rules("seo", profile=profile, family=family)
-        active_rule_ids = {r.id for r in active_rules}
-        rule_levels = {r.id: r.level for r in active_rules}
+        ruleset = self._config_loader.get_ruleset("seo", profile=profile, family=family)
+        active_rule_ids = ruleset.active_rule_ids
+        rule_levels = ruleset.rule_levels
 
         # Extract headings
-        headings = self._extract_headings(content)
+        headings = self._extract_headings(document_from_context(content, context))
 
         if not headings:
             return ValidationResult(
@@ -250,21 +250,6 @@ class SeoValidatorAgent(BaseValidatorAgent):
 
         return issues
 
-    def _extract_headings(self, content: str) -> List[Dict[str, Any]]:
-        """Extract headings from markdown content."""
-        headings = []
-        lines = content.split('\n')
-
-        for i, line in enumerate(lines):
-            # Match markdown headings: # Heading, ## Heading, etc.
-            match = re.match(r'^(#{1,6})\s+(.+)$', line.strip())
-            if match:
-                level = len(match.group(1))
-                text = match.group(2).strip()
-                headings.append({
-                    "level": level,
-                    "text": text,
-                    "line": i + 1
-                })
-
-        return headings
+    def _extract_headings(self, document: DocumentModel) -> List[Dict[str, Any]]:
+        """Markdown headings (# Heading, ## Heading, ...) from the parsed document."""
+        return [heading.to_dict() for heading in document.headings]
@@ -5,7 +5,6 @@ Uses ConfigLoader for configuration-driven validation.
 """
 
 from __future__ import annotations
-import re
 from typing import Dict, Any, List, Optional
 
 from agents.validators.base_validator import (
@@ -14,6 +13,7 @@ from agents.validators.base_validator import (
     ValidationResult
 )
 from core.config_loader import ConfigLoader, get_config_loader
+from core.document_model import DocumentModel, document_from_context
 from core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -34,28 +34,29 @@ class StructureValidatorAgent(BaseValidatorAgent):
         """Validate document structure."""
         issues: List[ValidationIssue] = []
         auto_fixable = 0
-        lines = content.split('\n')
+        document = document_from_context(content, context)
+        lines = document.lines
 
         # Get profile and family from context
         profile = context.get("profile", self._config.profile)
         family = context.get("family")
 
         # Get active rules for this profile/family
-        active_rules = self._config_loader.get_rules("structure", profile=profile, family=family)
-        active_rule_ids = {r.id for r in active_rules}
-        rule_levels = {r.id: r.level for r in active_rules}
-        rule_params = {r.id: r.params for r in active_rules}
+        ruleset = self._config_loader.get_ruleset("structure", profile=profile, family=family)
+        active_rule_ids = ruleset.active_rule_ids
+        rule_levels = ruleset.rule_levels
+        rule_params = ruleset.rule_params
 
         # Check content length
-        length_issues = self._check_content_length(content, active_rule_ids, rule_levels, rule_params)
+        length_issues = self._check_content_length(document, active_rule_ids, rule_levels, rule_params)
         issues.extend(length_issues)
 
         # Check heading structure
-        heading_issues = self._check_heading_structure(lines, active_rule_ids, rule_levels, rule_params)
+        heading_issues = self._check_heading_structure(document, active_rule_ids, rule_levels, rule_params)
         issues.extend(heading_issues)
 
         # Check for common structural problems
-        structure_issues = self._check_structure_issues(lines, active_rule_ids, rule_levels, rule_params)
+        structure_issues = self._check_structure_issues(document, active_rule_ids, rule_levels, rule_params)
         issues.extend(structure_issues)
 
         confidence = max(0.6, 1.0 - (len(issues) * 0.1))
@@ -75,15 +76,15 @@ class StructureValidatorAgent(BaseValidatorAgent):
 
     def _check_content_length(
         self,
-        content: str,
+        document: DocumentModel,
         active_rule_ids: set,
         rule_levels: Dict[str, str],
         rule_params: Dict[str, Dict]
     ) -> List[ValidationIssue]:
         """Check if content length is appropriate."""
         issues = []
-        char_count = len(content)
-        word_count = len(content.split())
+        char_count = len(document.content)
+        word_count = document.word_count
 
         # Check for very short content
         if "content_too_short" in active_rule_ids:
@@ -115,26 +116,14 @@ class StructureValidatorAgent(BaseValidatorAgent):
 
     def _check_heading_structure(
         self,
-        lines: List[str],
+        document: DocumentModel,
         active_rule_ids: set,
         rule_levels: Dict[str, str],
         rule_params: Dict[str, Dict]
     ) -> List[ValidationIssue]:
         """Check heading organization."""
         issues = []
-        headings = []
-
-        # Extract headings
-        for i, line in enumerate(lines):
-            match = re.match(r'^(#{1,6})\s+(.+)$', line.strip())
-            if match:
-                level = len(match.group(1))
-                text = match.group(2).strip()
-                headings.append({
-                    'line': i + 1,
-                    'level': level,
-                    'text': text
-                })
+        headings = [heading.to_dict() for heading in document.headings]
 
         # Check for documents without headings
         if "no_headings" in active_rule_ids and not headings:
@@ -186,21 +175,19 @@ class StructureValidatorAgent(BaseValidatorAgent):
 
     def _check_structure_issues(
         self,
-        lines: List[str],
+        document: DocumentModel,
         active_rule_ids: set,
         rule_levels: Dict[str, str],
         rule_params: Dict[str, Dict]
     ) -> List[ValidationIssue]:
         """Check for common structural issues."""
         issues = []
+        lines = document.lines
+        heading_indexes = document.heading_line_indexes
 
         # Check for content before first heading
         if "long_preamble" in active_rule_ids:
-            first_heading_line = None
-            for i, line in enumerate(lines):
-                if re.match(r'^#{1,6}\s+.+$', line.strip()):
-                    first_heading_line = i
-                    break
+            first_heading_line = heading_indexes[0] if heading_indexes else None
 
             if first_heading_line is not None and first_heading_line > 0:
                 # Check if there's substantive content before first heading
@@ -218,11 +205,8 @@ class StructureValidatorAgent(BaseValidatorAgent):
 
         # Check for consecutive headings (no content between)
         if "consecutive_headings" in active_rule_ids:
-            prev_was_heading = False
-            for i, line in enumerate(lines):
-                is_heading = bool(re.match(r'^#{1,6}\s+.+$', line.strip()))
-
-                if is_heading and prev_was_heading:
+            for prev, i in zip(heading_indexes, heading_indexes[1:]):
+                if i == prev + 1:
                     level = rule_levels.get("consecutive_headings", "warning")
                     issues.append(ValidationIssue(
                         level=level,
@@ -232,6 +216,4 @@ class StructureValidatorAgent(BaseValidatorAgent):
                         suggestion="Add content between headings or merge them"
                     ))
 
-                prev_was_heading = is_heading
-
         return issues
@@ -6,11 +6,14 @@ Implements 3-phase validation:
   Phase 2: LLM enhancement (optional)
   Phase 3: Merge and deduplicate results
 Uses ConfigLoader for configuration-driven validation.
+Reads FuzzyLogic detections and the truth context from the shared results
+on the validation context instead of recomputing them.
 """
 
 from __future__ import annotations
 from typing import Dict, Any, List, Optional, Set
 import asyncio
+import re
 
 from agents.validators.base_validator import (
     BaseValidatorAgent,
@@ -20,6 +23,8 @@ from agents.validators.base_validator import (
 from agents.base import agent_registry
 from core.config_loader import ConfigLoader, get_config_loader
 from core.logging import get_logger
+from core.pattern_set import literal_pattern_set
+from core.shared_results import DETECTION_STAGE, TruthContext, shared_results_from_context
 
 logger = get_logger(__name__)
 
@@ -91,9 +96,9 @@ class TruthValidatorAgent(BaseValidatorAgent):
         profile = context.get("profile", self._config.profile)
 
         # Get active rules
-        active_rules = self._config_loader.get_rules("truth", profile=profile, family=family)
-        active_rule_ids = {r.id for r in active_rules}
-        rule_levels = {r.id: r.level for r in active_rules}
+        ruleset = self._config_loader.get_ruleset("truth", profile=profile, family=family)
+        active_rule_ids = ruleset.active_rule_ids
+        rule_levels = ruleset.rule_levels
 
         # Get settings
         rule_based_settings = self._get_rule_based_settings()
@@ -174,11 +179,16 @@ class TruthValidatorAgent(BaseValidatorAgent):
             )], metrics
 
         try:
-            # Load truth data
-            truth_result = await truth_manager.handle_load_truth_data({"family": family})
-            plugin_aliases = truth_result.get("plugin_aliases", [])
-            api_patterns = truth_result.get("api_patterns", [])
-            truth_data = truth_result.get("truth_data", {})
+            # Load truth data (once per document; later readers share it)
+            shared = shared_results_from_context(content, context)
+            truth = shared.truth(family)
+            if truth is None:
+                truth_result = await truth_manager.handle_load_truth_data({"family": family})
+                truth = TruthContext.from_result(family, truth_result)
+                shared.publish_truth(truth)
+            plugin_aliases = truth.plugin_aliases
+            api_patterns = truth.api_patterns
+            truth_data = truth.truth_data
 
             metrics["truth_data_loaded"] = True
             metrics["known_plugins"] = len(plugin_aliases)
@@ -254,21 +264,31 @@ class TruthValidatorAgent(BaseValidatorAgent):
             return issues, metrics
 
         try:
-            # Build fuzzy detections from content (simplified extraction)
-            fuzzy_detections = self._extract_fuzzy_detections(content)
+            # Upstream FuzzyLogic detections and truth context
+            shared = shared_results_from_context(content, context)
+            fuzzy_detections = self._upstream_fuzzy_detections(content, context)
+            truth = shared.truth(family)
+
+            request = {
+                "content": content,
+                "fuzzy_detections": fuzzy_detections,
+                "family": family,
+                "profile": context.get("profile", "default"),
+                "truth_data": truth.truth_data if truth else {}
+            }
+
+            async def validate_plugins():
+                # Take the LLM slot like any other caller, in the caller's priority lane
+                queue = getattr(llm_validator, "request_queue", None)
+                if queue is None:
+                    return await llm_validator.handle_validate_plugins(request)
+                async with queue:
+                    return await llm_validator.handle_validate_plugins(request)
 
-            # Call LLM validator with timeout
+            # Call LLM validator with timeout (waiting for the slot included)
             timeout = settings.get("timeout_seconds", 30)
             try:
-                result = await asyncio.wait_for(
-                    llm_validator.handle_validate_plugins({
-                        "content": content,
-                        "fuzzy_detections": fuzzy_detections,
-                        "family": family,
-                        "profile": context.get("profile", "default")
-                    }),
-                    timeout=timeout
-                )
+                result = await asyncio.wait_for(validate_plugins(), timeout=timeout)
             except asyncio.TimeoutError:
                 if not settings.get("fallback_on_timeout", True):
                     issues.append(ValidationIssue(
@@ -500,6 +520,9 @@ class TruthValidatorAgent(BaseValidatorAgent):
     ) -> List[ValidationIssue]:
         """Validate API patterns mentioned in content."""
         issues = []
+        if not api_patterns:
+            return issues
+        pattern_set = literal_pattern_set(api_patterns)
         lines = content.split('\n')
         in_code_block = False
 
@@ -509,10 +532,9 @@ class TruthValidatorAgent(BaseValidatorAgent):
                 continue
 
             if in_code_block:
-                # Check for API patterns
-                for pattern in api_patterns:
-                    if pattern in line:
-                        logger.debug(f"Found API pattern: {pattern} at line {i+1}")
+                # Check for API patterns (all patterns in one pass over the line)
+                for pattern in pattern_set.matched_ids(line):
+                    logger.debug(f"Found API pattern: {pattern} at line {i+1}")
 
         return issues
 
@@ -530,20 +552,28 @@ class TruthValidatorAgent(BaseValidatorAgent):
         if not patterns:
             patterns = ["deprecated_api", "insecure_method", "obsolete_function"]
 
-        content_lower = content.lower()
-        for pattern in patterns:
-            if pattern.lower() in content_lower:
-                level = rule_levels.get("check_forbidden_patterns", "error")
-                issues.append(ValidationIssue(
-                    level=level,
-                    category="forbidden_pattern",
-                    message=f"Forbidden pattern detected: {pattern}",
-                    suggestion=f"Remove or replace '{pattern}' usage",
-                    source="truth"  # Changed from "rule_based" to "truth"
-                ))
+        # One case-insensitive pass finds every forbidden pattern present
+        for pattern in literal_pattern_set(patterns, re.IGNORECASE).matched_ids(content):
+            level = rule_levels.get("check_forbidden_patterns", "error")
+            issues.append(ValidationIssue(
+                level=level,
+                category="forbidden_pattern",
+                message=f"Forbidden pattern detected: {pattern}",
+                suggestion=f"Remove or replace '{pattern}' usage",
+                source="truth"  # Changed from "rule_based" to "truth"
+            ))
 
         return issues
 
+    def _upstream_fuzzy_detections(self, content: str, context: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """FuzzyLogic detections for this document; keyword extraction if FuzzyLogic did not run."""
+        shared = shared_results_from_context(content, context)
+        published = shared.detections(context.get("family", "words"))
+        if published is not None:
+            return published.detections
+        shared.count_run(DETECTION_STAGE)
+        return self._extract_fuzzy_detections(content)
+
     def _extract_fuzzy_detections(self, content: str) -> List[Dict[str, Any]]:
         """Extract potential plugin mentions for LLM validation."""
         detections = []
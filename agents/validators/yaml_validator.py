@@ -5,8 +5,6 @@ Uses ConfigLoader for configuration-driven validation.
 """
 
 from __future__ import annotations
-import yaml
-import frontmatter
 from typing import Dict, Any, List, Optional
 
 from agents.validators.base_validator import (
@@ -15,6 +13,7 @@ from agents.validators.base_validator import (
     ValidationResult
 )
 from core.config_loader import ConfigLoader, get_config_loader
+from core.document_model import document_from_context
 from core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -41,22 +40,23 @@ class YamlValidatorAgent(BaseValidatorAgent):
         family = context.get("family")
 
         # Get active rules for this profile/family
-        active_rules = self._config_loader.get_rules("frontmatter", profile=profile, family=family)
-        active_rule_ids = {r.id for r in active_rules}
-        rule_levels = {r.id: r.level for r in active_rules}
-
-        # Extract YAML frontmatter
-        try:
-            post = frontmatter.loads(content)
-            metadata = post.metadata
-        except Exception as e:
+        ruleset = self._config_loader.get_ruleset("frontmatter", profile=profile, family=family)
+        active_rules = ruleset.rules
+        active_rule_ids = ruleset.active_rule_ids
+        rule_levels = ruleset.rule_levels
+
+        # Extract YAML frontmatter (parsed once per document)
+        document = document_from_context(content, context)
+        metadata = document.frontmatter
+        parse_error = document.frontmatter_error
+        if parse_error is not None:
             level = rule_levels.get("yaml_parse_error", "error")
             return ValidationResult(
                 confidence=0.0,
                 issues=[ValidationIssue(
                     level=level,
                     category="yaml_parse_error",
-                    message=f"Failed to parse YAML frontmatter: {str(e)}",
+                    message=f"Failed to parse YAML frontmatter: {str(parse_error)}",
                     suggestion="Check YAML syntax (indentation, quotes, colons)"
                 )],
                 metrics={"yaml_valid": False}
@@ -15,7 +15,7 @@ New Features:
 from __future__ import annotations
 
 import asyncio
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Literal, Optional
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from importlib import resources as ilres
@@ -69,16 +69,24 @@ try:
     from core.config import get_settings
     from core.logging import setup_logging, get_logger
     from core.database import db_manager, WorkflowState, RecommendationStatus, ValidationResult
-    from core.cache import cache_manager
+    from core.cache import cache_manager, validation_cache
+    from core.single_flight import group as single_flight_group, single_flight_stats
+    from core.metrics import metrics_registry
+    from core.priority import lane_stats
     from core.language_utils import validate_english_content_batch, is_english_content, log_language_rejection
     from core.error_formatter import ErrorFormatter
+    from core.workflow_manager import WorkflowManager
 except ImportError:
     from core.config import get_settings
     from core.logging import setup_logging, get_logger
     from core.database import db_manager, WorkflowState, RecommendationStatus, ValidationResult
-    from core.cache import cache_manager
+    from core.cache import cache_manager, validation_cache
+    from core.single_flight import group as single_flight_group, single_flight_stats
+    from core.metrics import metrics_registry
+    from core.priority import lane_stats
     from core.language_utils import validate_english_content_batch, is_english_content, log_language_rejection
     from core.error_formatter import ErrorFormatter
+    from core.workflow_manager import WorkflowManager
 
 logger = get_logger(__name__)
 
@@ -90,20 +98,28 @@ import time
 SERVER_START_TIME = time.time()
 MAINTENANCE_MODE = False
 
+# Identical concurrent /api/validate requests share one pipeline run and result
+validate_flights = single_flight_group("api_validate")
+
 # =============================================================================
 # Pydantic Models for API
 # =============================================================================
 
+# Admission lane of a request's agent calls (see core.priority)
+PriorityLane = Literal["interactive", "batch", "background"]
+
 class ContentValidationRequest(BaseModel):
     content: str
     file_path: str = "unknown"
     family: str = "words"
     validation_types: List[str] = ["yaml", "markdown", "code", "links", "structure", "Truth", "FuzzyLogic"]
+    priority: PriorityLane = "interactive"
 
 class FileValidationRequest(BaseModel):
     file_path: str
     family: str = "words"
     validation_types: List[str] = ["yaml", "markdown", "code", "links", "structure", "Truth", "FuzzyLogic"]
+    priority: PriorityLane = "interactive"
 
 class DirectoryValidationRequest(BaseModel):
     directory_path: str
@@ -111,6 +127,7 @@ class DirectoryValidationRequest(BaseModel):
     workflow_type: str = "validate_file"
     max_workers: int = 4
     family: str = "words"
+    priority: PriorityLane = "batch"
 
 class FileContent(BaseModel):
     file_path: str
@@ -166,6 +183,19 @@ class WorkflowStatus(BaseModel):
 # Global workflow status tracking
 workflow_jobs: Dict[str, WorkflowStatus] = {}
 
+# Executes workflow rows (validate_directory, batch_enhance, ...) on the server loop
+_workflow_manager: Optional[WorkflowManager] = None
+
+
+def get_workflow_manager() -> WorkflowManager:
+    """Workflow manager bound to the running server loop (created on first use)."""
+    global _workflow_manager
+    loop = asyncio.get_running_loop()
+    if _workflow_manager is None:
+        _workflow_manager = WorkflowManager(db_manager, agent_registry, loop=loop)
+    _workflow_manager.loop = loop
+    return _workflow_manager
+
 # =============================================================================
 # Application Lifecycle
 # =============================================================================
@@ -191,6 +221,14 @@ async def lifespan(app: FastAPI):
     # Register agents
     await register_agents()
 
+    # Pick up workflows interrupted by the previous shutdown
+    try:
+        resumed = get_workflow_manager().resume_interrupted_workflows()
+        if resumed:
+            logger.info(f"Resumed {len(resumed)} interrupted workflows")
+    except Exception:
+        logger.exception("Failed to resume interrupted workflows")
+
     try:
         yield
     finally:
@@ -756,6 +794,15 @@ async def health_check(response: Response):
     }
 
 
+@app.get("/metrics")
+async def prometheus_metrics():
+    """Operation latency histograms and error counters in Prometheus text format."""
+    return Response(
+        content=metrics_registry.render_prometheus(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
 @app.get("/health/live")
 async def health_live():
     """Kubernetes liveness probe - is the application running?"""
@@ -1153,6 +1200,15 @@ async def validate_content_api(request: ContentValidationRequest):
         logger.warning("Orchestrator not available, falling back to content_validator only")
         return await validate_content(request)
 
+    # A burst of identical requests (same content, types, family, path and lane) runs once
+    key = validation_cache.validation_cache_key(request.content, request.validation_types, None, request.family)
+    return await validate_flights.do(
+        f"{key}:{request.file_path}:{request.priority}", lambda: _run_content_validation(orchestrator, request)
+    )
+
+
+async def _run_content_validation(orchestrator, request: ContentValidationRequest) -> Dict[str, Any]:
+    """Orchestrator pipeline, persistence and publish for one /api/validate request."""
     try:
         # Save content to temporary file for orchestrator
         import tempfile
@@ -1168,7 +1224,8 @@ async def validate_content_api(request: ContentValidationRequest):
             result = await orchestrator.process_request("validate_file", {
                 "file_path": tmp_path,
                 "family": request.family,
-                "validation_types": request.validation_types
+                "validation_types": request.validation_types,
+                "priority": request.priority
             })
 
             # Determine the path to store in database
@@ -1267,7 +1324,8 @@ async def validate_file_api(request: FileValidationRequest):
         result = await orchestrator.process_request("validate_file", {
             "file_path": str(file_path.resolve()),
             "family": request.family,
-            "validation_types": request.validation_types
+            "validation_types": request.validation_types,
+            "priority": request.priority
         })
 
         # Store validation result with original file path
@@ -2993,49 +3051,35 @@ async def auto_apply_high_confidence_recommendations(
 # =============================================================================
 
 @app.post("/workflows/validate-directory")
-async def validate_directory_workflow(request: DirectoryValidationRequest, background_tasks: BackgroundTasks):
+async def validate_directory_workflow(request: DirectoryValidationRequest):
     """Start directory validation workflow."""
     orchestrator = agent_registry.get_agent("orchestrator")
     if not orchestrator:
         raise HTTPException(status_code=500, detail="Orchestrator agent not available")
 
     try:
-        import uuid
-        job_id = str(uuid.uuid4())
-        
-        # Create workflow in database
+        # Create workflow in database; the workflow manager runs it
         workflow = db_manager.create_workflow(
-            workflow_type=request.workflow_type,
+            workflow_type="validate_directory",
             input_params={
                 "directory_path": request.directory_path,
                 "file_pattern": request.file_pattern,
                 "max_workers": request.max_workers,
-                "family": request.family
+                "family": request.family,
+                "priority": request.priority
             },
             metadata={
                 "source": "web_ui",
+                "requested_type": request.workflow_type,
                 "directory_path": request.directory_path,
                 "file_pattern": request.file_pattern
             }
         )
 
-        # Initialize job status
-        workflow_jobs[job_id] = WorkflowStatus(
-            job_id=job_id,
-            status="started"
-        )
-
-        # Start workflow in background
-        background_tasks.add_task(
-            run_directory_validation_workflow,
-            job_id,
-            workflow.id,
-            request,
-            orchestrator
-        )
+        get_workflow_manager().start_workflow(workflow.id)
 
         return {
-            "job_id": job_id,
+            "job_id": workflow.id,
             "workflow_id": workflow.id,
             "status": "started",
             "message": "Directory validation workflow started"
@@ -3357,14 +3401,9 @@ async def admin_clear_cache():
             logger.info("L1 cache cleared", entries=l1_size)
 
         # Clear L2 cache
-        from core.database import CacheEntry
-        with db_manager.get_session() as session:
-            l2_count = session.query(CacheEntry).count()
-            session.query(CacheEntry).delete()
-            session.commit()
-            cleared["l2"] = True
-            cleared["l2_entries"] = l2_count
-            logger.info("L2 cache cleared", entries=l2_count)
+        l2_count = cache_manager.clear_l2()
+        cleared["l2"] = True
+        cleared["l2_entries"] = l2_count
 
         return {
             "message": "Cache cleared successfully",
@@ -3410,10 +3449,7 @@ async def admin_rebuild_cache():
         if cache_manager.l1_cache:
             cache_manager.l1_cache.clear()
 
-        from core.database import CacheEntry
-        with db_manager.get_session() as session:
-            session.query(CacheEntry).delete()
-            session.commit()
+        cache_manager.clear_l2()
 
         logger.info("Cache rebuild: all caches cleared, will repopulate on demand")
 
@@ -3490,6 +3526,11 @@ async def admin_performance_report(days: int = Query(7, le=90)):
                 "success_rate": round(success_rate, 4),
                 "cache_hit_rate_l1": round(l1_hit_rate, 4)
             },
+            "single_flight": single_flight_stats(),
+            # Process lifetime, not the requested period: p50/p95/p99 per timed operation
+            "latency": metrics_registry.summary(),
+            # Admission wait per priority lane (interactive / batch / background)
+            "lanes": lane_stats(),
             "period": {
                 "start": cutoff_date.isoformat(),
                 "end": datetime.now(timezone.utc).isoformat()
@@ -3747,8 +3788,8 @@ async def admin_reset_system(reset_request: SystemResetRequest):
                 # Clear L1 cache
                 if cache_manager.l1_cache:
                     cache_manager.l1_cache.clear()
-                # Clear L2 cache from database
-                db_manager.cleanup_expired_cache()
+                # Clear L2 cache
+                cache_manager.clear_l2()
                 cache_cleared = True
                 logger.info("Cache cleared after system reset")
             except Exception as e:
@@ -3802,45 +3843,6 @@ async def list_audit_logs(
 # Background Tasks
 # =============================================================================
 
-async def run_directory_validation_workflow(job_id: str, workflow_id: str, request: DirectoryValidationRequest, orchestrator):
-    """Run the directory validation workflow."""
-    try:
-        # Update status
-        workflow_jobs[job_id].status = "running"
-        db_manager.update_workflow(workflow_id, state="running")
-
-        # Execute workflow
-        result = await orchestrator.process_request("validate_directory", {
-            "directory_path": request.directory_path,
-            "file_pattern": request.file_pattern,
-            "max_workers": request.max_workers,
-            "family": request.family
-        })
-
-        # Update final status
-        workflow_jobs[job_id].status = "completed"
-        workflow_jobs[job_id].files_total = result.get("files_total", 0)
-        workflow_jobs[job_id].files_validated = result.get("files_validated", 0)
-        workflow_jobs[job_id].files_failed = result.get("files_failed", 0)
-        workflow_jobs[job_id].errors = result.get("errors", [])
-        
-        db_manager.update_workflow(
-            workflow_id,
-            state="completed",
-            progress_percent=100,
-            completed_at=datetime.now(timezone.utc)
-        )
-
-    except Exception as e:
-        logger.exception("Workflow execution failed for job_id=%s", job_id)
-        workflow_jobs[job_id].status = "failed"
-        workflow_jobs[job_id].errors = [str(e)]
-        db_manager.update_workflow(
-            workflow_id,
-            state="failed",
-            error_message=str(e)
-        )
-
 async def run_batch_validation(job_id: str, workflow_id: str, request: BatchValidationRequest):
     """Run batch validation workflow with automatic recommendation generation."""
     validator = agent_registry.get_agent("content_validator")
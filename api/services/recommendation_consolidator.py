@@ -82,6 +82,119 @@ def _extract_original_content(validation_results: Dict[str, Any], location: Dict
     return location.get('context', '')
 
 
+def build_recommendation_rows(
+    validation_id: str,
+    file_path: Optional[str],
+    validation_results: Any,
+) -> List[Dict[str, Any]]:
+    """
+    Build deduplicated recommendation fields (create_recommendation arguments)
+    from validation results, without touching the database.
+
+    Args:
+        validation_id: ID of the validation the recommendations belong to
+        file_path: Path of the validated file (recommendation target)
+        validation_results: Stored validation results
+
+    Returns:
+        List of recommendation dictionaries
+    """
+    rows = []
+    seen_hashes = set()
+
+    # Parse validation results to extract issues
+    issues = []
+    if isinstance(validation_results, dict):
+        # Extract issues from different validation types
+        for validator_name, validator_results in validation_results.items():
+            if isinstance(validator_results, dict):
+                validator_issues = validator_results.get('issues', [])
+                if isinstance(validator_issues, list):
+                    for issue in validator_issues:
+                        issue['validator'] = validator_name
+                        issues.append(issue)
+
+    logger.debug(f"Extracted {len(issues)} issues from validation results for {validation_id}")
+
+    if not issues:
+        logger.debug(f"No issues found in validation results for {validation_id}. Validation results structure: {list(validation_results.keys()) if isinstance(validation_results, dict) else type(validation_results)}")
+
+    # Convert issues to recommendations
+    for issue in issues:
+        rule_id = issue.get('rule_id', issue.get('type', issue.get('category', 'unknown')))
+        location = issue.get('location', {})
+        # Check all possible suggestion field names
+        suggestion = (
+            issue.get('suggestion') or
+            issue.get('fix') or
+            issue.get('fix_suggestion') or
+            ''
+        )
+
+        if not suggestion:
+            continue  # Skip issues without suggestions
+
+        # Generate deduplication hash
+        loc_hash = _location_hash(location)
+        dedup_key = f"{rule_id}:{loc_hash}:{suggestion[:50]}"
+        dedup_hash = hashlib.md5(dedup_key.encode()).hexdigest()
+
+        if dedup_hash in seen_hashes:
+            continue  # Skip duplicates
+
+        seen_hashes.add(dedup_hash)
+
+        # Determine recommendation type
+        validator_name = issue.get('validator', '')
+        rec_type = _determine_type(rule_id, suggestion, validator_name)
+
+        # Build target selector
+        selector = _determine_selector(location)
+
+        # Extract original content
+        original = _extract_original_content(validation_results, location)
+
+        # Determine severity/priority from various field names
+        severity = (
+            issue.get('severity') or
+            issue.get('level') or
+            issue.get('priority') or
+            'medium'
+        )
+
+        # Build recommendation
+        rows.append({
+            "validation_id": validation_id,
+            "type": rec_type,
+            "title": issue.get('message', f"Fix {rule_id}"),
+            "description": issue.get('description', issue.get('message', '')),
+            "original_content": original,
+            "proposed_content": suggestion,
+            "diff": f"- {original}\n+ {suggestion}" if original else f"+ {suggestion}",
+            "confidence": float(issue.get('confidence', issue.get('severity_score', 0.5))),
+            "priority": severity,
+            "status": RecommendationStatus.PENDING,
+            "metadata": {
+                "source": {
+                    "validation_id": validation_id,
+                    "item_id": issue.get('id', ''),
+                    "rule_id": rule_id,
+                    "validator": validator_name,
+                    "category": issue.get('category', ''),
+                },
+                "target": {
+                    "path": file_path,
+                    "selector": selector,
+                },
+                "rationale": issue.get('rationale', issue.get('reason', issue.get('reasoning', ''))),
+                "location": location,
+                "auto_fixable": issue.get('auto_fixable', False),
+            }
+        })
+
+    return rows
+
+
 def consolidate_recommendations(validation_id: str) -> List[Dict[str, Any]]:
     """
     Consolidate all validation items into structured recommendations.
@@ -108,100 +221,9 @@ def consolidate_recommendations(validation_id: str) -> List[Dict[str, Any]]:
             logger.info(f"Found {len(existing_recs)} existing recommendations for validation {validation_id}")
             return [rec.to_dict() for rec in existing_recs]
         
-        # Build recommendations from validation results
         recommendations = []
-        seen_hashes = set()
-        
-        # Parse validation results to extract issues
-        issues = []
-        if isinstance(validation_results, dict):
-            # Extract issues from different validation types
-            for validator_name, validator_results in validation_results.items():
-                if isinstance(validator_results, dict):
-                    validator_issues = validator_results.get('issues', [])
-                    if isinstance(validator_issues, list):
-                        for issue in validator_issues:
-                            issue['validator'] = validator_name
-                            issues.append(issue)
-        
-        logger.info(f"Extracted {len(issues)} issues from validation results for {validation_id}")
-        
-        if not issues:
-            logger.warning(f"No issues found in validation results for {validation_id}. Validation results structure: {list(validation_results.keys()) if isinstance(validation_results, dict) else type(validation_results)}")
-        
-        # Convert issues to recommendations
-        for issue in issues:
-            rule_id = issue.get('rule_id', issue.get('type', issue.get('category', 'unknown')))
-            location = issue.get('location', {})
-            # Check all possible suggestion field names
-            suggestion = (
-                issue.get('suggestion') or
-                issue.get('fix') or
-                issue.get('fix_suggestion') or
-                ''
-            )
-
-            if not suggestion:
-                continue  # Skip issues without suggestions
-            
-            # Generate deduplication hash
-            loc_hash = _location_hash(location)
-            dedup_key = f"{rule_id}:{loc_hash}:{suggestion[:50]}"
-            dedup_hash = hashlib.md5(dedup_key.encode()).hexdigest()
-            
-            if dedup_hash in seen_hashes:
-                continue  # Skip duplicates
-            
-            seen_hashes.add(dedup_hash)
-            
-            # Determine recommendation type
-            validator_name = issue.get('validator', '')
-            rec_type = _determine_type(rule_id, suggestion, validator_name)
-            
-            # Build target selector
-            selector = _determine_selector(location)
-            
-            # Extract original content
-            original = _extract_original_content(validation_results, location)
-            
-            # Determine severity/priority from various field names
-            severity = (
-                issue.get('severity') or
-                issue.get('level') or
-                issue.get('priority') or
-                'medium'
-            )
-
-            # Build recommendation
-            rec_data = {
-                "validation_id": validation_id,
-                "type": rec_type,
-                "title": issue.get('message', f"Fix {rule_id}"),
-                "description": issue.get('description', issue.get('message', '')),
-                "original_content": original,
-                "proposed_content": suggestion,
-                "diff": f"- {original}\n+ {suggestion}" if original else f"+ {suggestion}",
-                "confidence": float(issue.get('confidence', issue.get('severity_score', 0.5))),
-                "priority": severity,
-                "status": RecommendationStatus.PENDING,
-                "metadata": {
-                    "source": {
-                        "validation_id": validation_id,
-                        "item_id": issue.get('id', ''),
-                        "rule_id": rule_id,
-                        "validator": validator_name,
-                        "category": issue.get('category', ''),
-                    },
-                    "target": {
-                        "path": validation.file_path,
-                        "selector": selector,
-                    },
-                    "rationale": issue.get('rationale', issue.get('reason', issue.get('reasoning', ''))),
-                    "location": location,
-                    "auto_fixable": issue.get('auto_fixable', False),
-                }
-            }
-            
+        rows = build_recommendation_rows(validation_id, validation.file_path, validation_results)
+        for rec_data in rows:
             # Save recommendation
             try:
                 recommendation = db_manager.create_recommendation(**rec_data)
@@ -212,6 +234,11 @@ def consolidate_recommendations(validation_id: str) -> List[Dict[str, Any]]:
                 continue
         
         if not recommendations:
+            issues = [
+                issue
+                for results in validation_results.values() if isinstance(results, dict)
+                for issue in (results.get('issues') or []) if isinstance(issue, dict)
+            ] if isinstance(validation_results, dict) else []
             logger.warning(f"No recommendations could be generated for validation {validation_id}. Total issues: {len(issues)}, Issues with suggestions: {sum(1 for i in issues if i.get('suggestion') or i.get('fix'))}")
         
         logger.info(f"Consolidated {len(recommendations)} recommendations for validation {validation_id}")
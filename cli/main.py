@@ -966,6 +966,305 @@ async def _show_status(ctx):
     console.print(table)
 
 
+# ---------------------------
+# worker command
+# ---------------------------
+@cli.command()
+@click.option('--processes', '-n', default=1, type=int, help='Worker processes to start on this host')
+@click.option('--concurrency', '-w', default=None, type=int,
+              help='Tasks run at once per process (default: orchestrator.max_file_workers)')
+@click.option('--lease-seconds', default=None, type=float,
+              help='Task lease length (default: orchestrator.task_lease_seconds)')
+@click.option('--poll-interval', default=1.0, type=float, help='Seconds between polls of an empty queue')
+@click.option('--max-tasks', default=None, type=int, help='Exit after this many tasks (per process)')
+@click.option('--exit-when-idle', is_flag=True, help='Exit once the queue has nothing runnable')
+@click.pass_context
+def worker(ctx, processes: int, concurrency: Optional[int], lease_seconds: Optional[float],
+           poll_interval: float, max_tasks: Optional[int], exit_when_idle: bool):
+    """Run workflow tasks from the durable task queue.
+
+    Workflows started with the "queue" executor (orchestrator.workflow_executor
+    or {"executor": "queue"}) store one task per file in the database. Workers
+    on any host that shares the database lease those tasks, run them through
+    the local agents and store the results. A worker that dies loses its
+    leases after --lease-seconds; failed tasks are retried with backoff and
+    dead-lettered after orchestrator.task_max_attempts.
+
+    EXAMPLES:
+        # One worker process
+        tbcv worker
+
+        # Four processes with 8 tasks in flight each
+        tbcv worker -n 4 -w 8
+
+        # Drain the queue and exit (CI)
+        tbcv worker --exit-when-idle
+
+    Ctrl+C / SIGTERM stop leasing and let the tasks in flight finish."""
+    options = {
+        "concurrency": concurrency,
+        "lease_seconds": lease_seconds,
+        "poll_interval": poll_interval,
+        "max_tasks": max_tasks,
+        "exit_when_idle": exit_when_idle,
+    }
+    if processes <= 1:
+        stats = _run_worker_process(options)
+        console.print(f"[green]Worker stopped:[/green] {stats}")
+        return
+
+    import multiprocessing
+    procs = [
+        multiprocessing.Process(target=_run_worker_process, args=(options,), name=f"tbcv-worker-{i}")
+        for i in range(processes)
+    ]
+    for proc in procs:
+        proc.start()
+    console.print(f"[blue]Started {processes} worker processes[/blue]")
+    try:
+        for proc in procs:
+            proc.join()
+    except KeyboardInterrupt:
+        # The workers got the same SIGINT and are finishing their tasks
+        console.print("[yellow]Stopping workers...[/yellow]")
+        for proc in procs:
+            proc.join()
+    failed = [proc.name for proc in procs if proc.exitcode]
+    if failed:
+        console.print(f"[red]Workers exited with errors: {', '.join(failed)}[/red]")
+        sys.exit(1)
+
+
+def _run_worker_process(options: dict) -> dict:
+    """Entry point of one worker process."""
+    return asyncio.run(_work_task_queue(options))
+
+
+async def _work_task_queue(options: dict) -> dict:
+    """Register the agents, then work the queue until stopped."""
+    import signal
+    from core.database import db_manager
+    from core.task_queue import TaskWorker
+
+    await setup_agents()
+    task_worker = TaskWorker(
+        db_manager,
+        concurrency=options.get("concurrency"),
+        lease_seconds=options.get("lease_seconds"),
+        poll_interval=options.get("poll_interval", 1.0),
+    )
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, task_worker.stop)
+        except (NotImplementedError, RuntimeError):
+            pass  # Windows: Ctrl+C raises KeyboardInterrupt instead
+    return await task_worker.run(
+        max_tasks=options.get("max_tasks"),
+        exit_when_idle=bool(options.get("exit_when_idle")),
+    )
+
+
+# ---------------------------
+# bench command group
+# ---------------------------
+def _corpus_options(fn):
+    """Options shared by the commands that generate a synthetic corpus."""
+    options = [
+        click.option('--files', default=50, type=int, help='Documents in the corpus'),
+        click.option('--words', default=600, type=int, help='Prose words per document'),
+        click.option('--plugin-density', default=2.0, type=float, help='Plugin mentions per 100 words'),
+        click.option('--code-ratio', default=0.3, type=float, help='Fraction of sections with a code block'),
+        click.option('--links', default=5, type=int, help='Links per document'),
+        click.option('--family', default='words', help='Truth family the plugin vocabulary comes from'),
+        click.option('--seed', default=42, type=int, help='Generator seed'),
+    ]
+    for option in reversed(options):
+        fn = option(fn)
+    return fn
+
+
+def _corpus_spec(files, words, plugin_density, code_ratio, links, family, seed):
+    from core.benchmark import CorpusSpec
+    return CorpusSpec(files=files, words_per_file=words, plugin_density=plugin_density,
+                      code_block_ratio=code_ratio, links_per_file=links, family=family, seed=seed)
+
+
+def _stub_options(fn):
+    """Latency model options of the stub Ollama server."""
+    options = [
+        click.option('--ttft-ms', default=150.0, type=float, help='Stub: fixed time to first token (ms)'),
+        click.option('--prompt-tokens-per-sec', default=400.0, type=float, help='Stub: prompt evaluation rate (0 = free)'),
+        click.option('--tokens-per-sec', default=20.0, type=float, help='Stub: generation rate (0 = instant)'),
+        click.option('--parallel', default=1, type=int, help='Stub: requests evaluated at once'),
+        click.option('--max-queue', default=512, type=int, help='Stub: waiting requests before 503'),
+        click.option('--jitter', default=0.0, type=float, help='Stub: +/- fraction applied to every delay'),
+    ]
+    for option in reversed(options):
+        fn = option(fn)
+    return fn
+
+
+def _stub_profile(ttft_ms, prompt_tokens_per_sec, tokens_per_sec, parallel, max_queue, jitter):
+    from core.ollama_stub import StubProfile
+    return StubProfile(ttft_ms=ttft_ms, prompt_tokens_per_sec=prompt_tokens_per_sec, tokens_per_sec=tokens_per_sec,
+                       max_concurrent=parallel, max_queue=max_queue, jitter=jitter,
+                       model=os.getenv('OLLAMA_MODEL', 'mistral'))
+
+
+@cli.group()
+@click.pass_context
+def bench(ctx):
+    """Offline benchmarks of validators, tiers, cache, database and pipeline.
+
+    Runs against a synthetic corpus, a scratch database and a scratch cache,
+    with LLM calls disabled, so results are comparable between runs and
+    machines. Reports are JSON and can gate CI against a saved baseline.
+
+    EXAMPLES:
+        # Generate a corpus, benchmark it and save the report
+        tbcv bench run --files 200 --output bench.json
+
+        # Fail when p95 latency or throughput regress by more than 15%
+        tbcv bench run --baseline baseline.json --threshold 0.15
+
+        # LLM paths against a stub model: 300 ms to first token, 15 tokens/s
+        tbcv bench run -s llm --ttft-ms 300 --tokens-per-sec 15
+
+        # Serve the stub for the API server or other tools
+        tbcv bench ollama-stub --port 11500
+    """
+    pass
+
+
+@bench.command('corpus')
+@click.argument('output_dir', type=click.Path(file_okay=False))
+@_corpus_options
+def bench_corpus(output_dir, files, words, plugin_density, code_ratio, links, family, seed):
+    """Write a reproducible synthetic markdown corpus to OUTPUT_DIR."""
+    from core.benchmark import generate_corpus
+
+    paths = generate_corpus(_corpus_spec(files, words, plugin_density, code_ratio, links, family, seed), output_dir)
+    console.print(f"[green]Wrote {len(paths)} documents to {output_dir}[/green]")
+
+
+@bench.command('run')
+@click.option('--corpus', 'corpus_dir', type=click.Path(exists=True, file_okay=False),
+              help='Existing corpus directory (default: generate one from the corpus options)')
+@_corpus_options
+@click.option('--suite', '-s', 'suites', multiple=True,
+              type=click.Choice(['validators', 'tiers', 'fuzzy', 'cache', 'db', 'pipeline', 'llm']),
+              help='Suites to run (default: all but llm)')
+@click.option('--iterations', '-i', default=1, type=int, help='Passes over the corpus per benchmark')
+@click.option('--output', '-o', type=click.Path(dir_okay=False), help='Write the JSON report here')
+@click.option('--baseline', type=click.Path(exists=True, dir_okay=False), help='Baseline report to compare against')
+@click.option('--threshold', default=0.10, type=float, help='Allowed regression as a fraction (0.10 = 10%)')
+@click.option('--llm-url', help='Ollama server for the llm suite (default: an in-process stub)')
+@click.option('--llm-concurrency', default=4, type=int, help='Calls in flight in the concurrent llm benchmark')
+@_stub_options
+def bench_run(corpus_dir, files, words, plugin_density, code_ratio, links, family, seed,
+              suites, iterations, output, baseline, threshold, llm_url, llm_concurrency,
+              ttft_ms, prompt_tokens_per_sec, tokens_per_sec, parallel, max_queue, jitter):
+    """Run the benchmark suites and report throughput and latency percentiles.
+
+    Exits with status 1 when --baseline is given and any benchmark regresses
+    by more than --threshold."""
+    import tempfile
+    from core.benchmark import SUITES, generate_corpus, run_benchmarks
+
+    # Offline: LLM calls would dominate and vary between runs. The llm
+    # suite points the client at its own server.
+    os.environ["OLLAMA_ENABLED"] = "false"
+
+    with tempfile.TemporaryDirectory(prefix="tbcv-corpus-") as generated:
+        if not corpus_dir:
+            generate_corpus(_corpus_spec(files, words, plugin_density, code_ratio, links, family, seed), generated)
+            corpus_dir = generated
+        report = run_benchmarks(
+            corpus_dir, suites=suites or SUITES, iterations=iterations, family=family,
+            llm_url=llm_url, llm_concurrency=llm_concurrency,
+            llm_profile=_stub_profile(ttft_ms, prompt_tokens_per_sec, tokens_per_sec, parallel, max_queue, jitter),
+        )
+
+    table = Table(title="Benchmarks")
+    for column in ("Benchmark", "Count", "Errors", "Items/s", "p50 ms", "p95 ms", "p99 ms"):
+        table.add_column(column, justify="left" if column == "Benchmark" else "right")
+    for name, stats in report["benchmarks"].items():
+        table.add_row(name, str(stats["count"]), str(stats["errors"]), f"{stats['throughput_per_s']:.1f}",
+                      f"{stats['p50_ms']:.2f}", f"{stats['p95_ms']:.2f}", f"{stats['p99_ms']:.2f}")
+    console.print(table)
+
+    if output:
+        Path(output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        console.print(f"[green]Report written to {output}[/green]")
+
+    if baseline:
+        _gate_on_baseline(report, json.loads(Path(baseline).read_text(encoding="utf-8")), threshold)
+
+
+@bench.command('ollama-stub')
+@click.option('--host', default='127.0.0.1', help='Interface to bind')
+@click.option('--port', default=11434, type=int, help='Port to bind')
+@click.option('--responses', type=click.Path(exists=True, dir_okay=False),
+              help='JSON file of {"regex": "response"} checked before the built-in responses')
+@_stub_options
+def bench_ollama_stub(host, port, responses, ttft_ms, prompt_tokens_per_sec, tokens_per_sec,
+                      parallel, max_queue, jitter):
+    """Serve a stub Ollama API with simulated model latency.
+
+    Answers /api/generate, /api/chat and /api/embed deterministically
+    (JSON prompts get a filled-in copy of the JSON they ask for). Point
+    OLLAMA_BASE_URL at it to load-test the LLM paths without a model."""
+    from core.ollama_stub import OllamaStubServer, load_canned_responses
+
+    profile = _stub_profile(ttft_ms, prompt_tokens_per_sec, tokens_per_sec, parallel, max_queue, jitter)
+    canned = load_canned_responses(responses) if responses else None
+    stub = OllamaStubServer(profile, host=host, port=port, canned=canned)
+    console.print(f"[green]Ollama stub listening on {stub.url}[/green]")
+    console.print(f"Use it with: OLLAMA_BASE_URL={stub.url} OLLAMA_ENABLED=true")
+    try:
+        stub.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stats = stub.stats()
+        stub.stop()
+        console.print(f"Served {sum(stats['requests'].values())} requests, rejected {stats['rejected']}, "
+                      f"max waiting {stats['max_waiting']}")
+
+
+@bench.command('compare')
+@click.argument('report_file', type=click.Path(exists=True, dir_okay=False))
+@click.argument('baseline_file', type=click.Path(exists=True, dir_okay=False))
+@click.option('--threshold', default=0.10, type=float, help='Allowed regression as a fraction (0.10 = 10%)')
+def bench_compare(report_file, baseline_file, threshold):
+    """Compare REPORT_FILE with BASELINE_FILE; exit 1 on regressions."""
+    report = json.loads(Path(report_file).read_text(encoding="utf-8"))
+    baseline = json.loads(Path(baseline_file).read_text(encoding="utf-8"))
+    _gate_on_baseline(report, baseline, threshold)
+
+
+def _gate_on_baseline(report: dict, baseline: dict, threshold: float) -> None:
+    """Print the comparison with a baseline and exit 1 if anything regressed."""
+    from core.benchmark import compare_reports
+
+    comparison = compare_reports(report, baseline, threshold)
+    if not comparison["corpus_matches"]:
+        console.print("[yellow]Warning: report and baseline were run on different corpora[/yellow]")
+    for name in comparison["missing"]:
+        console.print(f"[yellow]Not in report: {name}[/yellow]")
+    for entry in comparison["improvements"]:
+        console.print(f"[green]Improved {entry['benchmark']} {entry['metric']}: "
+                      f"{entry['baseline']} -> {entry['current']} ({entry['change']:+.1%})[/green]")
+    for entry in comparison["regressions"]:
+        console.print(f"[red]Regressed {entry['benchmark']} {entry['metric']}: "
+                      f"{entry['baseline']} -> {entry['current']} ({entry['change']:+.1%})[/red]")
+    if comparison["regressions"]:
+        console.print(f"[red]{len(comparison['regressions'])} regression(s) beyond {threshold:.0%}[/red]")
+        sys.exit(1)
+    console.print(f"[green]No regressions beyond {threshold:.0%}[/green]")
+
+
 # ---------------------------
 # recommendations command group
 # ---------------------------
@@ -9,7 +9,7 @@ Key concepts:
 - EnforcementMode: Control the level of enforcement (disabled, warn, block)
 - AccessGuardError: Exception raised when access is blocked
 - @guarded_operation: Decorator to protect business logic functions
-- Stack inspection: Verify caller context at runtime
+- Stack inspection: Verify caller context at runtime (raw frames, cached per call site)
 
 Allowed callers:
 - svc/mcp_server.py (MCP layer)
@@ -49,10 +49,11 @@ Configuration:
 from __future__ import annotations
 
 import functools
-import inspect
 import os
+import sys
 from enum import Enum
 from pathlib import Path
+from types import CodeType, FrameType
 from typing import Callable, Optional, Tuple, Any, Dict
 from datetime import datetime, timezone
 
@@ -109,7 +110,8 @@ class AccessGuardError(Exception):
 
 
 # Global enforcement mode
-_enforcement_mode: EnforcementMode = EnforcementMode.DISABLED
+_DISABLED = EnforcementMode.DISABLED
+_enforcement_mode: EnforcementMode = _DISABLED
 
 # Statistics tracking
 _violation_count: int = 0
@@ -165,11 +167,80 @@ def get_statistics() -> Dict[str, Any]:
     }
 
 
+# Verdict of a code object's file: (allowed, "<label>: <file>"), or _NEUTRAL
+# when the file says nothing about the caller (core, agents, ...). Filenames
+# never change for a code object, so verdicts are computed once per code.
+_NEUTRAL: Tuple[bool, str] = (True, "")
+_code_verdicts: Dict[CodeType, Tuple[bool, str]] = {}
+
+# Decision per (code object, caller code object) of the two innermost
+# inspected frames: the index (0 or 1) of the frame that decided, or None
+# when both are neutral and the walk has to continue further up.
+_call_site_decisions: Dict[Tuple[CodeType, Optional[CodeType]], Optional[int]] = {}
+
+
+def _classify_filename(filename: str) -> Tuple[bool, str]:
+    """Verdict for one source file (see the allowed/blocked callers above)."""
+    # Normalize path separators for cross-platform compatibility
+    filename_normalized = Path(filename).as_posix().replace('\\', '/')
+
+    # Allow MCP layer
+    if "/svc/mcp_server.py" in filename_normalized:
+        return True, "MCP server"
+
+    if "/svc/mcp_methods/" in filename_normalized:
+        return True, "MCP method"
+
+    # Allow MCP client (it's a wrapper, not direct access)
+    if "/svc/mcp_client.py" in filename_normalized:
+        return True, "MCP client"
+
+    # Allow tests
+    if "/tests/" in filename_normalized:
+        return True, "Test code"
+
+    # Block API endpoints (not just any path containing 'api')
+    if "/api/server.py" in filename_normalized or "/api/dashboard.py" in filename_normalized or "/api/export_endpoints.py" in filename_normalized:
+        return False, "API endpoint"
+
+    # Block CLI commands
+    if "/cli/main.py" in filename_normalized:
+        return False, "CLI command"
+
+    return _NEUTRAL
+
+
+def _verdict(code: CodeType) -> Tuple[bool, str]:
+    verdict = _code_verdicts.get(code)
+    if verdict is None:
+        allowed, label = verdict = _classify_filename(code.co_filename)
+        if verdict is not _NEUTRAL:
+            # Keep "<label>: <file>" so describing a frame is one format call
+            verdict = (allowed, f"{label}: {Path(code.co_filename).as_posix()}")
+        _code_verdicts[code] = verdict
+    return verdict
+
+
+def _describe(frame: FrameType, verdict: Tuple[bool, str]) -> Tuple[bool, str]:
+    return verdict[0], f"{verdict[1]}:{frame.f_lineno} ({frame.f_code.co_name})"
+
+
+def clear_decision_cache() -> None:
+    """Forget cached per-code verdicts and call-site decisions."""
+    _code_verdicts.clear()
+    _call_site_decisions.clear()
+
+
 def check_caller_allowed(frame_depth: int = 5) -> Tuple[bool, str]:
     """Check if caller is allowed via stack inspection.
 
-    Inspects the call stack to determine if the caller is from an allowed context
-    (MCP layer or tests) or a blocked context (API/CLI).
+    Walks the raw call stack (``sys._getframe``) up to frame_depth frames to
+    determine if the caller is from an allowed context (MCP layer or tests)
+    or a blocked context (API/CLI). Frames are visited lazily and the walk
+    stops at the first frame whose file decides; no FrameInfo objects are
+    built and no source lines are read. The decision is cached per (code
+    object, caller code object), so a hot call site costs two frame lookups
+    and one dict lookup.
 
     Args:
         frame_depth: Maximum depth to inspect in the call stack
@@ -184,46 +255,37 @@ def check_caller_allowed(frame_depth: int = 5) -> Tuple[bool, str]:
         if not allowed:
             logger.warning(f"Blocked access: {info}")
     """
-    stack = inspect.stack()
-
-    # Start from frame 1 to skip check_caller_allowed itself
-    # Go up to frame_depth+1 to inspect enough frames
-    for frame_info in stack[1:min(frame_depth + 1, len(stack))]:
-        filename = Path(frame_info.filename).as_posix()
-        function_name = frame_info.function
-        lineno = frame_info.lineno
-
-        # Normalize path separators for cross-platform compatibility
-        filename_normalized = filename.replace('\\', '/')
-
-        # Allow MCP layer
-        if "/svc/mcp_server.py" in filename_normalized:
-            return True, f"MCP server: {filename}:{lineno} ({function_name})"
-
-        if "/svc/mcp_methods/" in filename_normalized:
-            return True, f"MCP method: {filename}:{lineno} ({function_name})"
-
-        # Allow MCP client (it's a wrapper, not direct access)
-        if "/svc/mcp_client.py" in filename_normalized:
-            return True, f"MCP client: {filename}:{lineno} ({function_name})"
-
-        # Allow tests
-        if "/tests/" in filename_normalized or "\\tests\\" in filename:
-            return True, f"Test code: {filename}:{lineno} ({function_name})"
-
-        # Block API endpoints
-        if "/api/" in filename_normalized and "/api/" in filename_normalized:
-            # Additional check: make sure it's not just a path containing 'api'
-            if "/api/server.py" in filename_normalized or "/api/dashboard.py" in filename_normalized or "/api/export_endpoints.py" in filename_normalized:
-                return False, f"API endpoint: {filename}:{lineno} ({function_name})"
-
-        # Block CLI commands
-        if "/cli/" in filename_normalized and "/cli/main.py" in filename_normalized:
-            return False, f"CLI command: {filename}:{lineno} ({function_name})"
+    # Frame 1 is whoever asked (the guard wrapper), frame 2 its caller
+    frame = sys._getframe(1)
+    caller = frame.f_back if frame_depth > 1 else None
+    key = (frame.f_code, caller.f_code if caller is not None else None)
+
+    decided = _call_site_decisions.get(key, -1)
+    if decided == -1:
+        decided = None
+        for index, candidate in enumerate((frame, caller)):
+            if candidate is not None and _verdict(candidate.f_code) is not _NEUTRAL:
+                decided = index
+                break
+        _call_site_decisions[key] = decided
+
+    if decided is not None:
+        candidate = frame if decided == 0 else caller
+        return _describe(candidate, _verdict(candidate.f_code))
+
+    # Both neutral (e.g. agent code calling agent code): keep walking
+    inspected = 2 if caller is not None else 1
+    frame = caller.f_back if caller is not None else None
+    while frame is not None and inspected < frame_depth:
+        verdict = _verdict(frame.f_code)
+        if verdict is not _NEUTRAL:
+            return _describe(frame, verdict)
+        frame = frame.f_back
+        inspected += 1
 
     # If we couldn't determine, allow by default (could be internal call)
     # This handles cases like direct imports in __init__.py or core modules
-    return True, f"Internal call (depth {len(stack)})"
+    return True, f"Internal call (depth {inspected})"
 
 
 def log_violation(
@@ -306,10 +368,8 @@ def guarded_operation(func: Callable) -> Callable:
 
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        global _enforcement_mode
-
-        # If disabled, just run the function
-        if _enforcement_mode == EnforcementMode.DISABLED:
+        # If disabled, just run the function (one global lookup and identity check)
+        if _enforcement_mode is _DISABLED:
             return func(*args, **kwargs)
 
         # Check if caller is allowed
@@ -0,0 +1,292 @@
+# file: tbcv/core/alias_matcher.py
+"""
+Compiled alias matcher for fuzzy plugin detection.
+
+FuzzyDetectorAgent compares every plugin alias against every token of a
+document. This module compiles a family's alias map once into:
+
+- an exact-hit table (normalized alias -> plugins), which is the token-level
+  equivalent of an Aho-Corasick pass since detection only ever matches whole
+  ``\\w+`` tokens;
+- a length-bucketed character n-gram index used to compute, for every alias,
+  an upper bound on the similarity each configured algorithm can return.
+  Only aliases whose bound reaches the similarity threshold are handed to the
+  real (expensive) scorers.
+
+The bounds are exact supersets of what the scorers can produce, so the
+compiled path reports the same detections as the exhaustive scan.
+"""
+
+import re
+import difflib
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import textdistance
+except ImportError:
+    textdistance = None
+
+try:
+    from fuzzywuzzy import fuzz
+except ImportError:
+    fuzz = None
+
+
+# Slack added to every bound: absorbs float noise and fuzz.ratio() rounding
+# to whole percentages (at most 0.005).
+_BOUND_SLACK = 0.01
+
+# Winkler prefix boost used by textdistance / rapidfuzz / jellyfish.
+_JW_PREFIX_WEIGHT = 0.1
+_JW_MAX_PREFIX = 4
+_JW_BOOST_THRESHOLD = 0.7
+
+_NON_ALNUM = re.compile(r"[^a-zA-Z0-9]")
+_TOKEN_PATTERN = re.compile(r"\b\w+\b")
+
+# (plugin_id, confidence, detection_type)
+AliasHit = Tuple[str, float, str]
+
+
+def normalize_alias(s: str) -> str:
+    """Normalize strings by removing non-alphanumeric characters and lowering case."""
+    return _NON_ALNUM.sub("", s or "").lower()
+
+
+def similarity_scores(alias_norm: str, token_norm: str, algorithms: Sequence[str]) -> List[float]:
+    """
+    Score a normalized alias against a normalized token with each algorithm.
+
+    Unknown algorithms (or algorithms whose library is missing) fall back to
+    difflib.SequenceMatcher. Algorithms that raise are skipped.
+    """
+    scores: List[float] = []
+    for algo in algorithms:
+        try:
+            if algo == "levenshtein" and textdistance and hasattr(textdistance, "levenshtein"):
+                # Normalized Levenshtein similarity
+                distance = textdistance.levenshtein.distance(alias_norm, token_norm)
+                max_len = max(len(alias_norm), len(token_norm)) or 1
+                score = 1.0 - (distance / max_len)
+            elif algo == "jaro_winkler" and textdistance and hasattr(textdistance, "jaro_winkler"):
+                score = textdistance.jaro_winkler.normalized_similarity(alias_norm, token_norm)
+            elif algo == "fuzzy" and fuzz:
+                score = fuzz.ratio(alias_norm, token_norm) / 100.0
+            else:
+                # Fallback: SequenceMatcher ratio
+                score = difflib.SequenceMatcher(None, alias_norm, token_norm).ratio()
+            scores.append(score)
+        except Exception:
+            continue
+    return scores
+
+
+def _resolve_algorithm(algo: str) -> str:
+    """Map a configured algorithm name to the scorer similarity_scores() will actually run."""
+    if algo == "levenshtein" and textdistance and hasattr(textdistance, "levenshtein"):
+        return "levenshtein"
+    if algo == "jaro_winkler" and textdistance and hasattr(textdistance, "jaro_winkler"):
+        return "jaro_winkler"
+    # fuzz.ratio and the SequenceMatcher fallback share the same bound
+    return "ratio"
+
+
+def similarity_upper_bound(alias_len: int, token_len: int, common: int, prefix: int,
+                           scorers: Iterable[str]) -> float:
+    """
+    Upper bound on max(similarity_scores()) for a pair of strings.
+
+    Args:
+        alias_len: Length of the normalized alias
+        token_len: Length of the normalized token
+        common: Size of the character multiset intersection of both strings
+        prefix: Common prefix length (only used by Jaro-Winkler)
+        scorers: Resolved scorer names (see _resolve_algorithm)
+    """
+    best = -1.0
+    if common <= 0:
+        return 0.0
+    for scorer in scorers:
+        if scorer == "levenshtein":
+            # Bag distance is a lower bound of edit distance:
+            # d >= max(len) - common  =>  1 - d/max(len) <= common/max(len)
+            bound = common / max(alias_len, token_len)
+        elif scorer == "jaro_winkler":
+            # Matching characters m <= common, transpositions >= 0
+            jaro = (common / alias_len + common / token_len + 1.0) / 3.0
+            if jaro > _JW_BOOST_THRESHOLD:
+                jaro += min(prefix, _JW_MAX_PREFIX) * _JW_PREFIX_WEIGHT * (1.0 - jaro)
+            bound = jaro
+        else:
+            # SequenceMatcher / Indel ratio: 2M / (la + lt) with M <= common
+            bound = 2.0 * common / (alias_len + token_len)
+        if bound > best:
+            best = bound
+    return min(best, 1.0) + _BOUND_SLACK
+
+
+class AliasMatcher:
+    """
+    Per-family compiled alias matcher.
+
+    Built from the alias map returned by FuzzyDetectorAgent._build_family_aliases
+    (plugin_id -> {"name": str, "aliases": [normalized aliases]}). Token results
+    are memoized, so repeated words across a page (and across pages of the same
+    family) are resolved with a single dict lookup.
+    """
+
+    def __init__(
+        self,
+        alias_map: Dict[str, Any],
+        algorithms: Sequence[str],
+        similarity_threshold: float,
+        weight_exact: float,
+        weight_fuzzy: float,
+        memo_size: int = 50000,
+    ):
+        self.alias_map = alias_map
+        self.algorithms: Tuple[str, ...] = tuple(algorithms)
+        self.similarity_threshold = similarity_threshold
+        self.weight_exact = weight_exact
+        self.weight_fuzzy = weight_fuzzy
+        self.memo_size = memo_size
+        self._scorers: Tuple[str, ...] = tuple(dict.fromkeys(_resolve_algorithm(a) for a in self.algorithms))
+
+        # Plugin order is significant: detections are emitted in alias-map order
+        self.plugin_ids: List[str] = list(alias_map.keys())
+        self.plugin_names: Dict[str, str] = {}
+
+        # alias -> list of (plugin_rank, alias_rank) that own it
+        self._alias_owners: Dict[str, List[Tuple[int, int]]] = {}
+        for p_rank, plugin_id in enumerate(self.plugin_ids):
+            info = alias_map.get(plugin_id) or {}
+            self.plugin_names[plugin_id] = info.get("name", plugin_id)
+            for a_rank, alias in enumerate(info.get("aliases", [])):
+                if alias:
+                    self._alias_owners.setdefault(alias, []).append((p_rank, a_rank))
+
+        # Index structures over distinct aliases
+        self._aliases: List[str] = list(self._alias_owners.keys())
+        self._alias_lengths: List[int] = [len(a) for a in self._aliases]
+        self._length_buckets: Dict[int, List[int]] = {}
+        self._char_postings: Dict[str, List[Tuple[int, int]]] = {}
+        for idx, alias in enumerate(self._aliases):
+            self._length_buckets.setdefault(len(alias), []).append(idx)
+            for ch, count in Counter(alias).items():
+                self._char_postings.setdefault(ch, []).append((idx, count))
+
+        self._feasible_lengths: Dict[int, frozenset] = {}
+        self._memo: Dict[str, Tuple[AliasHit, ...]] = {}
+        self.stats = {"tokens": 0, "memo_hits": 0, "candidates": 0}
+
+    def matches_settings(self, algorithms: Sequence[str], similarity_threshold: float,
+                         weight_exact: float, weight_fuzzy: float) -> bool:
+        """Whether this matcher was compiled with the given detector settings."""
+        return (
+            self.algorithms == tuple(algorithms)
+            and self.similarity_threshold == similarity_threshold
+            and self.weight_exact == weight_exact
+            and self.weight_fuzzy == weight_fuzzy
+        )
+
+    # ------------------------------------------------------------------
+    # Matching
+    # ------------------------------------------------------------------
+    def match_token(self, token: str) -> Tuple[AliasHit, ...]:
+        """
+        Return the best hit per plugin for a raw token, in plugin order.
+
+        For each plugin the highest confidence over its aliases wins; ties go
+        to the alias that sorts first, matching the exhaustive scan.
+        """
+        self.stats["tokens"] += 1
+        cached = self._memo.get(token)
+        if cached is not None:
+            self.stats["memo_hits"] += 1
+            return cached
+
+        hits = self._match_uncached(normalize_alias(token))
+        if len(self._memo) >= self.memo_size:
+            self._memo.clear()
+        self._memo[token] = hits
+        return hits
+
+    def _match_uncached(self, token_norm: str) -> Tuple[AliasHit, ...]:
+        if not token_norm:
+            return ()
+
+        # plugin_rank -> (confidence, alias_rank, detection_type)
+        best: Dict[int, Tuple[float, int, str]] = {}
+
+        def offer(p_rank: int, a_rank: int, conf: float, detection_type: str) -> None:
+            current = best.get(p_rank)
+            if current is None or conf > current[0] or (conf == current[0] and a_rank < current[1]):
+                best[p_rank] = (conf, a_rank, detection_type)
+
+        for p_rank, a_rank in self._alias_owners.get(token_norm, ()):
+            offer(p_rank, a_rank, self.weight_exact, "exact")
+
+        if self._scorers:
+            for idx in self._fuzzy_candidates(token_norm):
+                alias = self._aliases[idx]
+                scores = similarity_scores(alias, token_norm, self.algorithms)
+                if not scores:
+                    continue
+                best_score = max(scores)
+                if best_score < self.similarity_threshold:
+                    continue
+                conf = best_score * self.weight_fuzzy
+                for p_rank, a_rank in self._alias_owners[alias]:
+                    offer(p_rank, a_rank, conf, "fuzzy")
+
+        return tuple(
+            (self.plugin_ids[p_rank], conf, detection_type)
+            for p_rank, (conf, _, detection_type) in sorted(best.items())
+        )
+
+    def _fuzzy_candidates(self, token_norm: str) -> List[int]:
+        """Aliases (other than the token itself) whose similarity bound reaches the threshold."""
+        token_len = len(token_norm)
+        feasible = self._feasible_lengths.get(token_len)
+        if feasible is None:
+            feasible = frozenset(
+                alias_len for alias_len in self._length_buckets
+                if similarity_upper_bound(alias_len, token_len, min(alias_len, token_len),
+                                          _JW_MAX_PREFIX, self._scorers) >= self.similarity_threshold
+            )
+            self._feasible_lengths[token_len] = feasible
+        if not feasible:
+            return []
+
+        # Character n-gram (q=1) index: multiset intersection size per alias
+        common: Dict[int, int] = {}
+        lengths = self._alias_lengths
+        for ch, count in Counter(token_norm).items():
+            for idx, alias_count in self._char_postings.get(ch, ()):
+                if lengths[idx] in feasible:
+                    common[idx] = common.get(idx, 0) + (count if count < alias_count else alias_count)
+
+        candidates: List[int] = []
+        threshold = self.similarity_threshold
+        for idx, shared in common.items():
+            alias = self._aliases[idx]
+            if alias == token_norm:
+                continue
+            prefix = 0
+            limit = min(len(alias), token_len, _JW_MAX_PREFIX)
+            while prefix < limit and alias[prefix] == token_norm[prefix]:
+                prefix += 1
+            if similarity_upper_bound(lengths[idx], token_len, shared, prefix, self._scorers) >= threshold:
+                candidates.append(idx)
+        self.stats["candidates"] += len(candidates)
+        return candidates
+
+    def iter_token_hits(self, text: str, token_pattern: Optional["re.Pattern[str]"] = None):
+        """Yield (token, start, end, hits) for every token in text with at least one hit."""
+        pattern = token_pattern or _TOKEN_PATTERN
+        match_token = self.match_token
+        for m in pattern.finditer(text):
+            hits = match_token(m.group())
+            if hits:
+                yield m.group(), m.start(), m.end(), hits
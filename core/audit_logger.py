@@ -1,11 +1,11 @@
 """Audit logging infrastructure for TBCV MCP operations."""
 
-import json
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone
 
 from core.logging import get_logger
+from core.segmented_log import SegmentedLog
 
 logger = get_logger(__name__)
 
@@ -17,11 +17,19 @@ class AuditLogger:
         """
         Initialize audit logger.
 
+        Entries are stored as hourly segments in a directory named after
+        log_file (without its suffix), indexed by operation, user and
+        status; an existing log_file is imported into it once.
+
         Args:
-            log_file: Path to audit log file (JSONL format)
+            log_file: Path to the legacy audit log file (JSONL format)
         """
         self.log_file = Path(log_file)
-        self.log_file.touch(exist_ok=True)
+        self.log = SegmentedLog(
+            str(self.log_file.with_suffix("")),
+            index_fields=("operation", "user", "status"),
+            legacy_file=str(self.log_file),
+        )
 
     def log_operation(
         self,
@@ -48,8 +56,7 @@ class AuditLogger:
         }
 
         try:
-            with open(self.log_file, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(log_entry) + '\n')
+            self.log.append(log_entry)
         except Exception as e:
             logger.error(f"Failed to write audit log: {e}")
 
@@ -78,39 +85,16 @@ class AuditLogger:
         Returns:
             List of audit log entries
         """
-        logs = []
-
-        if not self.log_file.exists():
-            return []
-
         try:
-            with open(self.log_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    try:
-                        entry = json.loads(line.strip())
-
-                        # Apply filters
-                        if operation and entry.get("operation") != operation:
-                            continue
-                        if user and entry.get("user") != user:
-                            continue
-                        if status and entry.get("status") != status:
-                            continue
-                        if start_date and entry.get("timestamp", "") < start_date:
-                            continue
-                        if end_date and entry.get("timestamp", "") > end_date:
-                            continue
-
-                        logs.append(entry)
-
-                    except json.JSONDecodeError:
-                        continue
-
-            # Apply pagination
-            logs = logs[offset:offset + limit]
-
-            return logs
-
+            return list(self.log.query(
+                start=start_date,
+                end=end_date,
+                offset=offset,
+                limit=limit,
+                operation=operation,
+                user=user,
+                status=status,
+            ))
         except Exception as e:
             logger.error(f"Failed to read audit logs: {e}")
             return []
@@ -121,14 +105,12 @@ class AuditLogger:
         user: Optional[str] = None,
         status: Optional[str] = None
     ) -> int:
-        """Count audit logs matching filters."""
-        logs = self.get_logs(
-            limit=999999,
-            operation=operation,
-            user=user,
-            status=status
-        )
-        return len(logs)
+        """Count audit logs matching filters (from the segment indexes where possible)."""
+        try:
+            return self.log.count(operation=operation, user=user, status=status)
+        except Exception as e:
+            logger.error(f"Failed to count audit logs: {e}")
+            return 0
 
 
 # Global audit logger instance
@@ -0,0 +1,686 @@
+# file: tbcv/core/benchmark.py
+"""
+Offline benchmark suite behind ``tbcv bench``.
+
+- ``generate_corpus`` writes a reproducible synthetic markdown corpus: the
+  same CorpusSpec (size, plugin density, code-block ratio, links, family,
+  seed) always produces byte-identical files. Plugin names, class names,
+  methods and formats come from the family's truth files, so the fuzzy
+  detector and truth validator have real work to do.
+- ``BenchmarkRunner`` times, per corpus document: every validator agent in
+  agents/validators, every router tier, the fuzzy detector, the cache
+  (put, L1 get, L2 get), the database write paths (single insert and
+  buffered batch), and the full orchestrator pipeline (cold, then warm).
+  It works on a scratch database and L2 cache, never the configured ones.
+- The report is JSON: per benchmark, sample count, errors, throughput
+  (items per second of wall time) and latency p50/p95/p99/mean/max in ms.
+  ``compare_reports`` checks it against a saved baseline and lists every
+  benchmark whose p95 latency rose, or throughput fell, by more than the
+  threshold.
+- The ``llm`` suite is opt-in. It times the LLM paths (LLM plugin
+  validation, truth validation with its LLM phase, recommendation
+  critique and refinement, recommendation enhancement) against an Ollama
+  server, by default an in-process core.ollama_stub server with a
+  configurable latency model, so scheduling, caching and gating overhead
+  can be measured without a real model.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import importlib
+import json
+import math
+import os
+import platform
+import random
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence
+
+from core.logging import get_logger
+
+logger = get_logger(__name__)
+
+REPORT_VERSION = 1
+SUITES = ("validators", "tiers", "fuzzy", "cache", "db", "pipeline")
+# Suites that only run when asked for by name
+OPTIONAL_SUITES = ("llm",)
+ALL_SUITES = SUITES + OPTIONAL_SUITES
+
+# Validator agents in agents/validators, by agent id
+VALIDATOR_AGENTS = {
+    "seo_validator": ("agents.validators.seo_validator", "SeoValidatorAgent"),
+    "yaml_validator": ("agents.validators.yaml_validator", "YamlValidatorAgent"),
+    "markdown_validator": ("agents.validators.markdown_validator", "MarkdownValidatorAgent"),
+    "code_validator": ("agents.validators.code_validator", "CodeValidatorAgent"),
+    "link_validator": ("agents.validators.link_validator", "LinkValidatorAgent"),
+    "structure_validator": ("agents.validators.structure_validator", "StructureValidatorAgent"),
+    "truth_validator": ("agents.validators.truth_validator", "TruthValidatorAgent"),
+}
+
+_FILLER = (
+    "the document is loaded and saved with the options described below before the output "
+    "is rendered to the target format this section explains how each setting affects layout "
+    "fonts tables images headers footers and fields when converting between formats you can "
+    "also control compliance levels encryption and metadata for every page in the file"
+).split()
+
+_LANGUAGES = ("csharp", "java", "python")
+
+
+# =============================================================================
+# Corpus generation
+# =============================================================================
+
+@dataclass
+class CorpusSpec:
+    """Shape of a synthetic corpus; the same spec always yields the same files."""
+    files: int = 50
+    words_per_file: int = 600
+    plugin_density: float = 2.0      # plugin mentions per 100 words of prose
+    code_block_ratio: float = 0.3    # fraction of sections carrying a code block
+    links_per_file: int = 5
+    family: str = "words"
+    seed: int = 42
+
+
+def load_family_vocabulary(family: str, truth_dir: str = "truth") -> List[Dict[str, Any]]:
+    """
+    Plugins of a family from its truth files: name, class names, methods and
+    formats of each (merged by plugin id across the files that exist).
+    """
+    root = Path(truth_dir)
+    candidates = [
+        root / f"{family}.json",
+        root / f"aspose_{family}_plugins_truth.json",
+        root / family / f"{family}.json",
+        root / family / f"aspose_{family}_plugins_truth.json",
+    ]
+    plugins: Dict[str, Dict[str, Any]] = {}
+    for path in candidates:
+        if not path.exists():
+            continue
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Skipping truth file {path}: {e}")
+            continue
+        for plugin in data.get("plugins", []):
+            plugin_id = plugin.get("id") or plugin.get("slug") or plugin.get("name")
+            if not plugin_id or plugin_id in plugins:
+                continue
+            patterns = plugin.get("patterns") or {}
+            classes = list(patterns.get("classNames") or [])
+            if not classes:
+                classes = [plugin.get("name", "Document").split(".")[-1].replace(" ", "")]
+            methods = list(patterns.get("methods") or patterns.get("method") or ["Save"])
+            formats = sorted(set(plugin.get("load_formats") or []) | set(plugin.get("save_formats") or [])) or ["DOCX", "PDF"]
+            plugins[plugin_id] = {
+                "id": plugin_id,
+                "name": plugin.get("name", plugin_id),
+                "classes": classes,
+                "methods": methods,
+                "formats": formats,
+            }
+    if not plugins:
+        raise ValueError(f"No truth data found for family '{family}' under {root}")
+    return [plugins[k] for k in sorted(plugins)]
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    text = " ".join(rng.choice(_FILLER) for _ in range(max(3, words)))
+    return text[0].upper() + text[1:] + "."
+
+
+def _code_block(rng: random.Random, plugin: Dict[str, Any]) -> str:
+    language = rng.choice(_LANGUAGES)
+    cls = rng.choice(plugin["classes"])
+    source = rng.choice(plugin["formats"]).lower()
+    target = rng.choice(plugin["formats"]).lower()
+    calls = [f"doc.{rng.choice(plugin['methods'])}(\"output.{target}\")" for _ in range(rng.randint(1, 3))]
+    if language == "python":
+        body = [f"doc = {cls}(\"input.{source}\")"] + calls
+    else:
+        body = [f"var doc = new {cls}(\"input.{source}\");"] + [c + ";" for c in calls]
+    return f"```{language}\n" + "\n".join(body) + "\n```"
+
+
+def generate_document(spec: CorpusSpec, vocabulary: List[Dict[str, Any]], index: int) -> str:
+    """Markdown for document ``index`` of the corpus described by spec."""
+    rng = random.Random(spec.seed * 1_000_003 + index)
+    primary = vocabulary[index % len(vocabulary)]
+    title = f"Convert {rng.choice(primary['formats'])} files with {primary['name']} ({index})"
+    sections = max(2, spec.words_per_file // 120)
+    words_per_section = max(10, spec.words_per_file // sections)
+
+    # Spread the links over the sections
+    link_slots = [rng.randrange(sections) for _ in range(spec.links_per_file)]
+
+    lines = [
+        "---",
+        f'title: "{title}"',
+        f'description: "How to work with {primary["name"]} in document {index} of the benchmark corpus."',
+        f"weight: {index}",
+        "---",
+        "",
+        f"# {title}",
+        "",
+    ]
+    for s in range(sections):
+        lines.append(f"## Section {s + 1}")
+        lines.append("")
+        remaining = words_per_section
+        paragraph: List[str] = []
+        while remaining > 0:
+            n = min(remaining, rng.randint(8, 20))
+            sentence = _sentence(rng, n)
+            # plugin_density mentions per 100 words
+            if rng.random() < spec.plugin_density * n / 100.0:
+                plugin = rng.choice(vocabulary)
+                sentence = sentence[:-1] + f" using {plugin['name']} and the {rng.choice(plugin['classes'])} class."
+            paragraph.append(sentence)
+            remaining -= n
+        for slot in link_slots:
+            if slot != s:
+                continue
+            kind = rng.random()
+            if kind < 0.4:
+                target = rng.randrange(max(1, spec.files))
+                paragraph.append(f"See [related guide {target}](./doc_{target:05d}.md).")
+            elif kind < 0.7:
+                paragraph.append(f"Jump to [section {rng.randint(1, sections)}](#section-{rng.randint(1, sections)}).")
+            else:
+                paragraph.append(f"Read the [API reference](https://reference.example.com/{primary['id']}/{rng.randint(1, 999)}).")
+        lines.append(" ".join(paragraph))
+        lines.append("")
+        if rng.random() < spec.code_block_ratio:
+            lines.append(_code_block(rng, rng.choice(vocabulary)))
+            lines.append("")
+    return "\n".join(lines)
+
+
+def generate_corpus(spec: CorpusSpec, directory: str, truth_dir: str = "truth") -> List[Path]:
+    """
+    Write the corpus to directory (doc_00000.md ...) plus corpus.json holding
+    the spec and a digest of the files.
+    """
+    out = Path(directory)
+    out.mkdir(parents=True, exist_ok=True)
+    vocabulary = load_family_vocabulary(spec.family, truth_dir)
+    digest = hashlib.sha256()
+    paths = []
+    for i in range(spec.files):
+        content = generate_document(spec, vocabulary, i)
+        path = out / f"doc_{i:05d}.md"
+        path.write_text(content, encoding="utf-8")
+        digest.update(content.encode("utf-8"))
+        paths.append(path)
+    manifest = {"spec": asdict(spec), "files": [p.name for p in paths], "digest": digest.hexdigest()}
+    (out / "corpus.json").write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return paths
+
+
+def load_corpus(directory: str) -> Dict[str, Any]:
+    """Manifest and paths of a generated corpus (or of any directory of .md files)."""
+    root = Path(directory)
+    manifest_path = root / "corpus.json"
+    if manifest_path.exists():
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        manifest["paths"] = [root / name for name in manifest["files"]]
+        return manifest
+    paths = sorted(root.rglob("*.md"))
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(path.read_bytes())
+    return {"spec": None, "files": [str(p.relative_to(root)) for p in paths], "digest": digest.hexdigest(), "paths": paths}
+
+
+# =============================================================================
+# Measurement
+# =============================================================================
+
+def percentile(sorted_samples: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile of already sorted samples."""
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, min(len(sorted_samples), math.ceil(q * len(sorted_samples))))
+    return sorted_samples[rank - 1]
+
+
+@dataclass
+class BenchmarkResult:
+    """Latency samples and wall time of one benchmark."""
+    name: str
+    samples_ms: List[float] = field(default_factory=list)
+    wall_seconds: float = 0.0
+    errors: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        samples = sorted(self.samples_ms)
+        count = len(samples)
+        return {
+            "count": count,
+            "errors": self.errors,
+            "throughput_per_s": round(count / self.wall_seconds, 3) if self.wall_seconds > 0 else 0.0,
+            "mean_ms": round(sum(samples) / count, 3) if count else 0.0,
+            "p50_ms": round(percentile(samples, 0.50), 3),
+            "p95_ms": round(percentile(samples, 0.95), 3),
+            "p99_ms": round(percentile(samples, 0.99), 3),
+            "max_ms": round(samples[-1], 3) if count else 0.0,
+        }
+
+
+async def _measure(name: str, items: Iterable[Any], fn: Callable[[Any], Awaitable[Any]]) -> BenchmarkResult:
+    """Time fn(item) for every item, sequentially."""
+    result = BenchmarkResult(name)
+    wall_start = time.perf_counter()
+    for item in items:
+        start = time.perf_counter()
+        try:
+            await fn(item)
+        except Exception as e:
+            result.errors += 1
+            logger.debug(f"Benchmark {name} item failed: {e}")
+        result.samples_ms.append((time.perf_counter() - start) * 1000.0)
+    result.wall_seconds = time.perf_counter() - wall_start
+    return result
+
+
+async def _measure_concurrent(name: str, items: Iterable[Any], fn: Callable[[Any], Awaitable[Any]],
+                              concurrency: int) -> BenchmarkResult:
+    """Time fn(item) for every item with up to ``concurrency`` calls in flight."""
+    result = BenchmarkResult(name)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def one(item: Any) -> None:
+        # Latency includes the wait for a slot, as a queued caller sees it
+        start = time.perf_counter()
+        async with semaphore:
+            try:
+                await fn(item)
+            except Exception as e:
+                result.errors += 1
+                logger.debug(f"Benchmark {name} item failed: {e}")
+        result.samples_ms.append((time.perf_counter() - start) * 1000.0)
+
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(one(item) for item in items))
+    result.wall_seconds = time.perf_counter() - wall_start
+    return result
+
+
+def _ensure_agents() -> None:
+    """Register the agents the suites need, as the API server does."""
+    from agents.base import agent_registry
+    from agents.fuzzy_detector import FuzzyDetectorAgent
+    from agents.truth_manager import TruthManagerAgent
+    from agents.content_validator import ContentValidatorAgent
+    from agents.llm_validator import LLMValidatorAgent
+    from agents.orchestrator import OrchestratorAgent
+
+    factories: Dict[str, Callable[[str], Any]] = {
+        "truth_manager": TruthManagerAgent,
+        "fuzzy_detector": FuzzyDetectorAgent,
+        "content_validator": ContentValidatorAgent,
+        "llm_validator": LLMValidatorAgent,
+    }
+    for agent_id, (module, cls) in VALIDATOR_AGENTS.items():
+        factories[agent_id] = getattr(importlib.import_module(module), cls)
+    factories["orchestrator"] = OrchestratorAgent
+    for agent_id, factory in factories.items():
+        if agent_registry.get_agent(agent_id) is None:
+            agent_registry.register_agent(factory(agent_id))
+
+
+class BenchmarkRunner:
+    """Runs benchmark suites over a corpus on a scratch database and cache."""
+
+    def __init__(self, paths: Sequence[Path], family: str = "words", iterations: int = 1,
+                 workdir: Optional[str] = None, llm_url: Optional[str] = None,
+                 llm_profile: Optional[Any] = None, llm_concurrency: int = 4):
+        """
+        Args:
+            paths: Corpus documents
+            family: Product family passed to the agents
+            iterations: Passes over the corpus per benchmark
+            workdir: Scratch directory for the database and L2 cache (default: a temp dir)
+            llm_url: Ollama server for the llm suite (default: start a stub server)
+            llm_profile: StubProfile of the stub server started by the llm suite
+            llm_concurrency: Calls in flight in the concurrent llm benchmark
+        """
+        self.paths = list(paths)
+        self.family = family
+        self.iterations = max(1, iterations)
+        self.workdir = Path(workdir or tempfile.mkdtemp(prefix="tbcv-bench-"))
+        self.documents = [(str(p), p.read_text(encoding="utf-8")) for p in self.paths]
+        self.llm_url = llm_url
+        self.llm_profile = llm_profile
+        self.llm_concurrency = llm_concurrency
+        self.results: List[BenchmarkResult] = []
+        # Report sections beyond the benchmark table (e.g. stub server stats)
+        self.extras: Dict[str, Any] = {}
+        self._db = None
+
+    def _items(self) -> List[tuple]:
+        return self.documents * self.iterations
+
+    def _context(self, file_path: str) -> Dict[str, Any]:
+        return {"file_path": file_path, "family": self.family}
+
+    async def run(self, suites: Sequence[str] = SUITES) -> List[BenchmarkResult]:
+        unknown = set(suites) - set(ALL_SUITES)
+        if unknown:
+            raise ValueError(f"Unknown benchmark suites: {', '.join(sorted(unknown))}")
+        from core.cache import cache_manager
+        from core.cache_store import KVStore
+
+        _ensure_agents()
+        # Keep the configured L2 cache out of the measurements (and unpolluted)
+        saved_l2 = cache_manager.l2_store
+        cache_manager.l2_store = KVStore(str(self.workdir / "pipeline_cache.db"))
+        cache_manager.clear_l1()
+        try:
+            for suite in ALL_SUITES:
+                if suite in suites:
+                    logger.info(f"Running benchmark suite {suite}")
+                    await getattr(self, f"_bench_{suite}")()
+        finally:
+            cache_manager.l2_store.close()
+            cache_manager.l2_store = saved_l2
+            cache_manager.clear_l1()
+        return self.results
+
+    def _scratch_db(self):
+        if self._db is None:
+            from core.database import DatabaseManager
+
+            previous = os.environ.get("DATABASE_URL")
+            os.environ["DATABASE_URL"] = f"sqlite:///{(self.workdir / 'bench.db').as_posix()}"
+            try:
+                self._db = DatabaseManager()
+                self._db.init_database()
+            finally:
+                if previous is None:
+                    os.environ.pop("DATABASE_URL", None)
+                else:
+                    os.environ["DATABASE_URL"] = previous
+        return self._db
+
+    async def _bench_validators(self) -> None:
+        from agents.base import agent_registry
+
+        for agent_id in VALIDATOR_AGENTS:
+            agent = agent_registry.get_agent(agent_id)
+            self.results.append(await _measure(
+                f"validator.{agent_id}", self._items(),
+                lambda doc, agent=agent: agent.validate(doc[1], self._context(doc[0]))
+            ))
+
+    async def _bench_tiers(self) -> None:
+        from agents.base import agent_registry
+        from agents.validators.router import ValidatorRouter
+        from core.validator_router import ValidatorRouter as TieredRouter
+
+        # The router the orchestrator and /api/validate use, over each tier's validators
+        router = ValidatorRouter(agent_registry)
+        for tier in TieredRouter(agent_registry).get_tier_info():
+            self.results.append(await _measure(
+                f"tier.{tier['key']}", self._items(),
+                lambda doc, tier=tier: router.execute(tier["validators"], doc[1], self._context(doc[0]))
+            ))
+
+    async def _bench_fuzzy(self) -> None:
+        from agents.base import agent_registry
+
+        detector = agent_registry.get_agent("fuzzy_detector")
+        self.results.append(await _measure(
+            "fuzzy.detect_plugins", self._items(),
+            lambda doc: detector.process_request("detect_plugins", {"text": doc[1], "family": self.family})
+        ))
+
+    async def _bench_cache(self) -> None:
+        from core.cache import CacheManager
+        from core.cache_store import KVStore
+
+        cache = CacheManager()
+        cache.l2_store = KVStore(str(self.workdir / "cache.db"))
+        payloads = {path: {"file_path": path, "issues": [{"line": i, "message": content[:80]} for i in range(20)]}
+                    for path, content in self.documents}
+
+        async def put(doc):
+            cache.put("bench", "validate", {"path": doc[0]}, payloads[doc[0]])
+
+        async def get(doc):
+            if cache.get("bench", "validate", {"path": doc[0]}) is None:
+                raise LookupError(doc[0])
+
+        try:
+            self.results.append(await _measure("cache.put", self._items(), put))
+            self.results.append(await _measure("cache.get_l1", self._items(), get))
+            cache.l2_store.flush()
+            cache.clear_l1()
+            # Items re-enter L1 on an L2 hit, so time one pass only
+            self.results.append(await _measure("cache.get_l2", self.documents, get))
+        finally:
+            cache.l2_store.close()
+
+    async def _bench_db(self) -> None:
+        db = self._scratch_db()
+
+        def row(doc, run_id):
+            return dict(
+                file_path=doc[0], rules_applied={"bench": True}, validation_results={"issues": []},
+                notes="benchmark", severity="info", status="pass", content=doc[1], run_id=run_id,
+            )
+
+        async def single(doc):
+            db.create_validation_result(**row(doc, "bench-single"))
+
+        self.results.append(await _measure("db.create_validation_result", self._items(), single))
+
+        writer = db.write_buffer()
+
+        async def buffered(doc):
+            writer.add_validation(**row(doc, "bench-batch"))
+
+        result = await _measure("db.write_buffer", self._items(), buffered)
+        start = time.perf_counter()
+        writer.close()
+        # The final flush is part of the batch path's cost
+        result.wall_seconds += time.perf_counter() - start
+        self.results.append(result)
+
+    async def _bench_pipeline(self) -> None:
+        from agents.base import agent_registry
+
+        orchestrator = agent_registry.get_agent("orchestrator")
+        writer = self._scratch_db().write_buffer()
+
+        async def validate(doc):
+            result = await orchestrator.validate_and_store(doc[0], self.family, None, run_id="bench", writer=writer)
+            if "error" in result:
+                raise RuntimeError(result["error"])
+
+        try:
+            self.results.append(await _measure("pipeline.cold", self.documents, validate))
+            self.results.append(await _measure("pipeline.warm", self._items(), validate))
+        finally:
+            writer.close()
+
+    async def _bench_llm(self) -> None:
+        from agents import recommendation_enhancer
+        from core import ollama as ollama_module
+        from core.ollama_stub import OllamaStubServer
+
+        stub = None
+        url = self.llm_url
+        if url is None:
+            stub = OllamaStubServer(self.llm_profile).start()
+            url = stub.url
+        # Point the shared clients at the benchmark server for the duration
+        client = ollama_module.ollama
+        saved = (client.base_url, client.enabled, recommendation_enhancer._ollama_client)
+        client.base_url = url.rstrip("/") + "/"
+        client.enabled = True
+        recommendation_enhancer._ollama_client = ollama_module.Ollama(base_url=url, enabled=True)
+        try:
+            await self._bench_llm_paths()
+        finally:
+            self.extras["llm"] = {
+                "server": url,
+                "transport": client.get_transport_metrics(),
+                "stub": stub.stats() if stub else None,
+            }
+            await client.aclose()
+            client.base_url, client.enabled, recommendation_enhancer._ollama_client = saved
+            if stub is not None:
+                stub.stop()
+
+    async def _bench_llm_paths(self) -> None:
+        from agents.base import agent_registry
+        from agents.recommendation_critic import RecommendationCriticAgent
+        from agents.recommendation_enhancer import PreservationRules, RecommendationEnhancer
+
+        llm_validator = agent_registry.get_agent("llm_validator")
+        truth_validator = agent_registry.get_agent("truth_validator")
+
+        async def validate_plugins(doc):
+            await llm_validator.handle_validate_plugins(
+                {"content": doc[1], "fuzzy_detections": [], "family": self.family}
+            )
+
+        self.results.append(await _measure("llm.validate_plugins", self._items(), validate_plugins))
+        self.results.append(await _measure_concurrent(
+            "llm.validate_plugins.concurrent", self._items(), validate_plugins, self.llm_concurrency
+        ))
+        self.results.append(await _measure(
+            "llm.truth_validator", self._items(),
+            lambda doc: truth_validator.validate(doc[1], self._context(doc[0]))
+        ))
+
+        # The critic only asks the model when refinement.use_llm is on
+        critic = RecommendationCriticAgent("bench_recommendation_critic")
+        reflection = dict(critic.config)
+        reflection["refinement"] = {**reflection.get("refinement", {}), "use_llm": True}
+        critic._config = {**critic._config, "reflection": reflection}
+
+        def recommendation(doc) -> Dict[str, Any]:
+            lines = doc[1].splitlines()
+            heading = next((i for i, line in enumerate(lines) if line.startswith("# ")), 0)
+            return {
+                "id": f"bench-{Path(doc[0]).stem}",
+                "type": "missing_plugin",
+                "instruction": f"Name the required plugin in the introduction of {Path(doc[0]).name}",
+                "scope": "global",
+                "severity": "medium",
+                "rationale": "The conversion described in the article needs a plugin it does not mention",
+                "confidence": 0.8,
+                "line_start": heading,
+                "line_end": heading,
+                "plugin_name": "Document Converter",
+                "suggested_addition": "This example requires the Document Converter plugin.",
+            }
+
+        def issue(doc) -> Dict[str, Any]:
+            return {"file_path": doc[0], "family": self.family, "issue_type": "missing_plugin",
+                    "issue_message": "Required plugin is not mentioned"}
+
+        self.results.append(await _measure(
+            "llm.critique", self._items(), lambda doc: critic.critique(recommendation(doc), issue(doc))
+        ))
+
+        async def refine(doc):
+            critique = (await critic.critique(recommendation(doc), issue(doc))).to_dict()
+            await critic.refine(recommendation(doc), {**critique, **issue(doc)})
+
+        self.results.append(await _measure("llm.refine", self._items(), refine))
+
+        enhancer = RecommendationEnhancer()
+        self.results.append(await _measure(
+            "llm.enhance", self._items(),
+            lambda doc: enhancer.enhance_from_recommendations(
+                doc[1], [recommendation(doc)], PreservationRules(), file_path=doc[0]
+            )
+        ))
+
+
+# =============================================================================
+# Reports and regression gates
+# =============================================================================
+
+def build_report(results: Sequence[BenchmarkResult], corpus: Dict[str, Any], iterations: int,
+                 extras: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """JSON-serializable benchmark report."""
+    report = {
+        "version": REPORT_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "corpus": {"spec": corpus.get("spec"), "files": len(corpus.get("files", [])), "digest": corpus.get("digest")},
+        "iterations": iterations,
+        "benchmarks": {r.name: r.to_dict() for r in results},
+    }
+    report.update(extras or {})
+    return report
+
+
+def compare_reports(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float = 0.10) -> Dict[str, Any]:
+    """
+    Compare a report with a baseline.
+
+    A benchmark regresses when its p95 latency is more than ``threshold``
+    (a fraction) above the baseline, or its throughput more than
+    ``threshold`` below it.
+
+    Returns:
+        {"regressions": [...], "improvements": [...], "missing": [...],
+         "corpus_matches": bool}
+    """
+    regressions, improvements, missing = [], [], []
+    base_benchmarks = baseline.get("benchmarks", {})
+    for name, base in sorted(base_benchmarks.items()):
+        cur = current.get("benchmarks", {}).get(name)
+        if cur is None:
+            missing.append(name)
+            continue
+        for metric, higher_is_worse in (("p95_ms", True), ("throughput_per_s", False)):
+            before, after = base.get(metric, 0.0), cur.get(metric, 0.0)
+            if not before:
+                continue
+            change = (after - before) / before
+            entry = {"benchmark": name, "metric": metric, "baseline": before, "current": after,
+                     "change": round(change, 4)}
+            worse = change > threshold if higher_is_worse else change < -threshold
+            better = change < -threshold if higher_is_worse else change > threshold
+            if worse:
+                regressions.append(entry)
+            elif better:
+                improvements.append(entry)
+    return {
+        "threshold": threshold,
+        "regressions": regressions,
+        "improvements": improvements,
+        "missing": missing,
+        "corpus_matches": current.get("corpus", {}).get("digest") == baseline.get("corpus", {}).get("digest"),
+    }
+
+
+def run_benchmarks(corpus_dir: str, suites: Sequence[str] = SUITES, iterations: int = 1,
+                   family: Optional[str] = None, **runner_options: Any) -> Dict[str, Any]:
+    """Run the suites over a corpus directory and return the report.
+
+    ``runner_options`` are passed to BenchmarkRunner (llm_url, llm_profile,
+    llm_concurrency)."""
+    corpus = load_corpus(corpus_dir)
+    family = family or (corpus.get("spec") or {}).get("family") or "words"
+    runner = BenchmarkRunner(corpus["paths"], family=family, iterations=iterations, **runner_options)
+    results = asyncio.run(runner.run(suites))
+    return build_report(results, corpus, iterations, runner.extras)
@@ -2,7 +2,10 @@
 """
 Two-level caching system for TBCV.
 L1: In-memory LRU cache for fast access
-L2: Persistent SQLite cache for longer-term storage
+L2: Persistent SQLite key-value store (core.cache_store) for longer-term storage
+
+Cache keys come from a canonical streaming hash of the input (dict order
+does not matter; large strings are hashed once and their digest reused).
 
 WHAT CHANGED (important):
 - All reads of `settings.cache.l1.*` and `settings.cache.l2.*` now tolerate
@@ -17,13 +20,12 @@ import hashlib
 import pickle
 import asyncio
 import time
-from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional, Tuple
 from collections import OrderedDict
 import threading
 
+from .cache_store import CODEC_GZIP_PICKLE, CODEC_PICKLE, KVStore
 from .config import get_settings
-from .database import db_manager
 from .logging import get_logger, PerformanceLogger
 
 logger = get_logger(__name__)
@@ -47,6 +49,90 @@ def _ensure_bool(x: Any) -> bool:
     """Coerce truthy/falsy to a real bool."""
     return bool(x)
 
+# ---------- canonical hashing ----------
+
+# Strings at least this long are hashed once and their digest reused
+_DIGEST_MEMO_MIN_CHARS = 4096
+_DIGEST_MEMO_SIZE = 256
+
+_digest_memo: "OrderedDict[str, bytes]" = OrderedDict()
+_digest_memo_lock = threading.Lock()
+
+
+def content_digest(text: str) -> bytes:
+    """SHA-256 of the text's UTF-8 bytes; memoized for large strings."""
+    if len(text) < _DIGEST_MEMO_MIN_CHARS:
+        return hashlib.sha256(text.encode("utf-8", "surrogatepass")).digest()
+    with _digest_memo_lock:
+        digest = _digest_memo.get(text)
+        if digest is not None:
+            _digest_memo.move_to_end(text)
+            return digest
+    digest = hashlib.sha256(text.encode("utf-8", "surrogatepass")).digest()
+    with _digest_memo_lock:
+        _digest_memo[text] = digest
+        while len(_digest_memo) > _DIGEST_MEMO_SIZE:
+            _digest_memo.popitem(last=False)
+    return digest
+
+
+def _feed(h: Any, obj: Any) -> None:
+    """Feed a type-tagged, order-independent (for dicts/sets) encoding of obj into h."""
+    if obj is None:
+        h.update(b"N")
+    elif obj is True or obj is False:
+        h.update(b"T" if obj else b"F")
+    elif isinstance(obj, int):
+        h.update(b"i%d;" % obj)
+    elif isinstance(obj, float):
+        h.update(b"f" + repr(obj).encode() + b";")
+    elif isinstance(obj, str):
+        if len(obj) >= _DIGEST_MEMO_MIN_CHARS:
+            h.update(b"S")
+            h.update(content_digest(obj))
+        else:
+            data = obj.encode("utf-8", "surrogatepass")
+            h.update(b"s%d:" % len(data))
+            h.update(data)
+    elif isinstance(obj, (bytes, bytearray, memoryview)):
+        data = bytes(obj)
+        h.update(b"b%d:" % len(data))
+        h.update(data)
+    elif isinstance(obj, dict):
+        h.update(b"d%d{" % len(obj))
+        if all(type(k) is str for k in obj):
+            for k in sorted(obj):
+                _feed(h, k)
+                _feed(h, obj[k])
+        else:
+            for _, k, v in sorted(((canonical_hash(k), k, v) for k, v in obj.items()), key=lambda e: e[0]):
+                _feed(h, k)
+                _feed(h, v)
+        h.update(b"}")
+    elif isinstance(obj, (list, tuple)):
+        h.update(b"l%d[" % len(obj))
+        for item in obj:
+            _feed(h, item)
+        h.update(b"]")
+    elif isinstance(obj, (set, frozenset)):
+        h.update(b"e%d{" % len(obj))
+        for digest in sorted(canonical_hash(item) for item in obj):
+            h.update(digest)
+        h.update(b"}")
+    else:
+        h.update(b"r")
+        _feed(h, f"{type(obj).__qualname__}:{obj!r}")
+
+
+def canonical_hash(obj: Any) -> bytes:
+    """
+    SHA-256 of a canonical encoding of obj, fed incrementally (no giant
+    intermediate string). Equal dicts hash equally whatever their order.
+    """
+    h = hashlib.sha256()
+    _feed(h, obj)
+    return h.digest()
+
 # ------------------------------------------------------------
 
 class LRUCache:
@@ -160,38 +246,38 @@ class CacheManager:
             self.l1_cache = None
             logger.info("L1 cache disabled")
 
-        # L2 persistent cache (DB-backed)
+        # L2 persistent key-value store (opened on first use)
         if _ensure_bool(_gx(l2_cfg, "enabled", True)):
+            self.l2_store = KVStore(
+                _gx(l2_cfg, "database_path", "./data/cache/tbcv_cache.db"),
+                flush_interval_ms=int(_gx(l2_cfg, "flush_interval_ms", 100)),
+                max_pending=int(_gx(l2_cfg, "max_pending_writes", 256)),
+            )
             logger.info("L2 cache initialized", database_path=_gx(l2_cfg, "database_path", "./data/cache/tbcv_cache.db"))
         else:
+            self.l2_store = None
             logger.info("L2 cache disabled")
 
     def _generate_cache_key(self, agent_id: str, method: str, input_data: Any) -> str:
-        """Stable key from agent+method+normalized input."""
-        if isinstance(input_data, dict):
-            normalized = str(sorted(input_data.items()))
-        else:
-            normalized = str(input_data)
-        input_hash = hashlib.sha256(normalized.encode()).hexdigest()[:16]
-        return f"{agent_id}:{method}:{input_hash}"
+        """Stable key from agent+method+canonical hash of the input."""
+        return f"{agent_id}:{method}:{canonical_hash(input_data).hex()[:16]}"
 
-    def _serialize_data(self, data: Any) -> bytes:
-        """Pickle + optional gzip based on L2 settings."""
-        serialized = pickle.dumps(data)
+    def _serialize_data(self, data: Any) -> Tuple[int, bytes]:
+        """Pickle + optional gzip based on L2 settings; returns (codec, bytes)."""
+        serialized = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
         l2_cfg = _gx(self.settings.cache, "l2", {})
         if _ensure_bool(_gx(l2_cfg, "compression_enabled", True)) and len(serialized) > int(
             _gx(l2_cfg, "compression_threshold_bytes", 1024)
         ):
-            serialized = gzip.compress(serialized)
-        return serialized
+            return CODEC_GZIP_PICKLE, gzip.compress(serialized, compresslevel=1)
+        return CODEC_PICKLE, serialized
 
-    def _deserialize_data(self, data: bytes) -> Any:
-        """Unpickle (auto-try gzip)."""
+    def _deserialize_data(self, codec: int, data: bytes) -> Any:
+        """Decode a stored value by its codec."""
         try:
-            try:
-                return pickle.loads(gzip.decompress(data))
-            except gzip.BadGzipFile:
-                return pickle.loads(data)
+            if codec == CODEC_GZIP_PICKLE:
+                data = gzip.decompress(data)
+            return pickle.loads(data)
         except Exception as e:
             logger.error("Failed to deserialize cache data", error=str(e))
             return None
@@ -209,16 +295,18 @@ class CacheManager:
                     return result
 
             # L2
-            l2_cfg = _gx(self.settings.cache, "l2", {})
-            if _ensure_bool(_gx(l2_cfg, "enabled", True)):
-                cache_entry = db_manager.get_cache_entry(cache_key)
-                if cache_entry:
-                    result = self._deserialize_data(cache_entry.result_data)
+            if self.l2_store is not None:
+                try:
+                    stored = self.l2_store.get(cache_key)
+                except Exception as e:
+                    logger.error("Failed to read L2 cache", cache_key=cache_key, error=str(e))
+                    stored = None
+                if stored is not None:
+                    result = self._deserialize_data(*stored)
                     if result is not None and self.l1_cache:
                         self.l1_cache.put(cache_key, result)
-                    perf.add_context(cache_level="L2", cache_hit=bool(cache_entry))
-                    if cache_entry:
-                        logger.debug("L2 cache hit", cache_key=cache_key, agent_id=agent_id, method=method)
+                    perf.add_context(cache_level="L2", cache_hit=True)
+                    logger.debug("L2 cache hit", cache_key=cache_key, agent_id=agent_id, method=method)
                     return result
 
             perf.add_context(cache_hit=False)
@@ -233,30 +321,23 @@ class CacheManager:
                 self.l1_cache.put(cache_key, result)
                 perf.add_context(l1_stored=True)
 
-            l2_cfg = _gx(self.settings.cache, "l2", {})
-            if _ensure_bool(_gx(l2_cfg, "enabled", True)):
+            if self.l2_store is not None:
                 try:
-                    serialized = self._serialize_data(result)
-                    size_bytes = len(serialized)
+                    codec, serialized = self._serialize_data(result)
                     if ttl_seconds is None:
                         ttl_seconds = self._get_default_ttl(method)
-                    expires_at = datetime.now(timezone.utc) + timedelta(seconds=int(ttl_seconds))
-                    input_hash = hashlib.sha256(str(input_data).encode()).hexdigest()
-
-                    db_manager.store_cache_entry(
-                        cache_key=cache_key,
-                        agent_id=agent_id,
-                        method_name=method,
-                        input_hash=input_hash,
-                        result_data=serialized,
-                        expires_at=expires_at,
-                        size_bytes=size_bytes,
-                    )
-                    perf.add_context(l2_stored=True, size_bytes=size_bytes)
-                    logger.debug("Cache stored", cache_key=cache_key, agent_id=agent_id, method=method, size_bytes=size_bytes)
+                    self.l2_store.put(cache_key, agent_id, method, codec, serialized, int(ttl_seconds))
+                    perf.add_context(l2_stored=True, size_bytes=len(serialized))
+                    logger.debug("Cache stored", cache_key=cache_key, agent_id=agent_id, method=method, size_bytes=len(serialized))
                 except Exception as e:
                     logger.error("Failed to store in L2 cache", cache_key=cache_key, error=str(e))
 
+    def flush(self) -> int:
+        """Write pending L2 writes now; returns the rows written."""
+        if self.l2_store is None:
+            return 0
+        return self.l2_store.flush()
+
     def _get_default_ttl(self, method: str) -> int:
         """Return an appropriate TTL; default falls back to L1 ttl or 3600."""
         ttl_map = {
@@ -281,14 +362,9 @@ class CacheManager:
         if self.l1_cache:
             deleted |= self.l1_cache.delete(cache_key)
 
-        l2_cfg = _gx(self.settings.cache, "l2", {})
-        if _ensure_bool(_gx(l2_cfg, "enabled", True)):
+        if self.l2_store is not None:
             try:
-                from .database import CacheEntry
-                with db_manager.get_session() as session:
-                    result = session.query(CacheEntry).filter(CacheEntry.cache_key == cache_key).delete()
-                    session.commit()
-                    deleted |= (result > 0)
+                deleted |= self.l2_store.delete(cache_key)
             except Exception as e:
                 logger.error("Failed to delete from L2 cache", cache_key=cache_key, error=str(e))
 
@@ -307,14 +383,10 @@ class CacheManager:
             for key in keys_to_delete:
                 self.l1_cache.delete(key)
 
-        l2_cfg = _gx(self.settings.cache, "l2", {})
-        if _ensure_bool(_gx(l2_cfg, "enabled", True)):
+        if self.l2_store is not None:
             try:
-                from .database import CacheEntry
-                with db_manager.get_session() as session:
-                    deleted = session.query(CacheEntry).filter(CacheEntry.agent_id == agent_id).delete()
-                    session.commit()
-                    logger.info("Agent cache cleared", agent_id=agent_id, entries_deleted=deleted)
+                deleted = self.l2_store.delete_agent(agent_id)
+                logger.info("Agent cache cleared", agent_id=agent_id, entries_deleted=deleted)
             except Exception as e:
                 logger.error("Failed to clear agent cache", agent_id=agent_id, error=str(e))
 
@@ -329,15 +401,11 @@ class CacheManager:
 
     def clear_l2(self) -> int:
         """Clear all L2 cache entries. Returns number of entries cleared."""
-        l2_cfg = _gx(self.settings.cache, "l2", {})
-        if _ensure_bool(_gx(l2_cfg, "enabled", True)):
+        if self.l2_store is not None:
             try:
-                from .database import CacheEntry
-                with db_manager.get_session() as session:
-                    deleted = session.query(CacheEntry).delete()
-                    session.commit()
-                    logger.info("L2 cache cleared", entries_cleared=deleted)
-                    return deleted
+                deleted = self.l2_store.clear()
+                logger.info("L2 cache cleared", entries_cleared=deleted)
+                return deleted
             except Exception as e:
                 logger.error("Failed to clear L2 cache", error=str(e))
                 return 0
@@ -367,9 +435,11 @@ class CacheManager:
                 self.l1_cache.delete(key)
                 result["l1_cleaned"] += 1
 
-        l2_cfg = _gx(self.settings.cache, "l2", {})
-        if _ensure_bool(_gx(l2_cfg, "enabled", True)):
-            result["l2_cleaned"] = db_manager.cleanup_expired_cache()
+        if self.l2_store is not None:
+            try:
+                result["l2_cleaned"] = self.l2_store.cleanup_expired()
+            except Exception as e:
+                logger.error("Failed to clean up expired L2 entries", error=str(e))
 
         logger.info("Cache cleanup completed", **result)
         return result
@@ -382,19 +452,19 @@ class CacheManager:
             stats["l1"] = {"enabled": True, **self.l1_cache.stats()}
 
         l2_cfg = _gx(self.settings.cache, "l2", {})
-        if _ensure_bool(_gx(l2_cfg, "enabled", True)):
+        if self.l2_store is not None:
             try:
-                from .database import CacheEntry
-                with db_manager.get_session() as session:
-                    total_entries = session.query(CacheEntry).count()
-                    sizes = session.query(CacheEntry.size_bytes).all()
-                    total_size_bytes = sum(s[0] or 0 for s in sizes)
+                summary = self.l2_store.summary()
+                total_size_bytes = summary["total_size_bytes"]
                 stats["l2"] = {
                     "enabled": True,
-                    "total_entries": total_entries,
+                    "total_entries": summary["total_entries"],
                     "total_size_bytes": total_size_bytes,
                     "total_size_mb": round(total_size_bytes / (1024 * 1024), 2),
                     "database_path": _gx(l2_cfg, "database_path", "./data/cache/tbcv_cache.db"),
+                    "hits": self.l2_store.stats["hits"],
+                    "misses": self.l2_store.stats["misses"],
+                    "pending_writes": self.l2_store.pending,
                 }
             except Exception as e:
                 logger.error("Failed to get L2 cache statistics", error=str(e))
@@ -416,8 +486,6 @@ class CacheManager:
         Returns:
             Number of entries cleaned
         """
-        from datetime import timedelta
-
         result = {"l1_cleaned": 0, "l2_cleaned": 0}
         max_age_seconds = max_age_hours * 3600
 
@@ -434,17 +502,9 @@ class CacheManager:
                 result["l1_cleaned"] += 1
 
         # Clean L2 based on age
-        l2_cfg = _gx(self.settings.cache, "l2", {})
-        if _ensure_bool(_gx(l2_cfg, "enabled", True)):
+        if self.l2_store is not None:
             try:
-                from .database import CacheEntry
-                cutoff_time = datetime.now(timezone.utc) - timedelta(hours=max_age_hours)
-                with db_manager.get_session() as session:
-                    deleted = session.query(CacheEntry).filter(
-                        CacheEntry.created_at < cutoff_time
-                    ).delete()
-                    session.commit()
-                    result["l2_cleaned"] = deleted
+                result["l2_cleaned"] = self.l2_store.cleanup_older_than(time.time() - max_age_seconds)
             except Exception as e:
                 logger.error("Failed to clean L2 cache by age", error=str(e))
 
@@ -594,7 +654,7 @@ class ValidationCache:
             content = content + str(sorted(metadata.items()))
 
         if algorithm == "sha256":
-            full_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
+            full_hash = content_digest(content).hex()
         elif algorithm == "md5":
             full_hash = hashlib.md5(content.encode('utf-8')).hexdigest()
         else:
@@ -0,0 +1,278 @@
+# file: tbcv/core/cache_store.py
+"""
+SQLite key-value store for the L2 cache.
+
+The L2 cache used to go through the SQLAlchemy ``CacheEntry`` ORM on every
+get and put (session, query, row object, commit per put). KVStore is a
+purpose-built table in its own database file (``cache.l2.database_path``):
+
+- one ``WITHOUT ROWID`` table keyed by cache key, values stored as raw
+  bytes with a small codec flag (no try-gunzip-then-unpickle on reads);
+- reads run a single cached prepared statement on a per-thread connection
+  (WAL lets them proceed while the writer commits);
+- writes are write-behind: they land in a pending map that readers see
+  immediately and are written by a background thread with ``executemany``
+  in one transaction, once max_pending rows are waiting or the oldest is
+  flush_interval_ms old (and on flush()/close()/exit).
+
+Deletes and clears take the flush lock, so a batch being written can never
+resurrect a key deleted while it was in flight.
+"""
+
+import atexit
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from core.logging import get_logger
+
+logger = get_logger(__name__)
+
+CODEC_PICKLE = 0
+CODEC_GZIP_PICKLE = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS kv (
+    key TEXT PRIMARY KEY,
+    agent_id TEXT NOT NULL,
+    method TEXT NOT NULL,
+    codec INTEGER NOT NULL,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+) WITHOUT ROWID
+"""
+
+_GET = "SELECT codec, value, expires_at FROM kv WHERE key = ?"
+_PUT = (
+    "INSERT OR REPLACE INTO kv (key, agent_id, method, codec, value, size, created_at, expires_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+class KVRow(NamedTuple):
+    key: str
+    agent_id: str
+    method: str
+    codec: int
+    value: bytes
+    size: int
+    created_at: float
+    expires_at: float
+
+
+class KVStore:
+    """Write-behind SQLite key-value table for cache values stored as bytes."""
+
+    def __init__(self, path: str, flush_interval_ms: int = 100, max_pending: int = 256):
+        self.path = Path(path)
+        self.flush_interval = max(0, int(flush_interval_ms)) / 1000.0
+        self.max_pending = max(1, int(max_pending))
+        self._pending: Dict[str, KVRow] = {}
+        self._in_flight: Dict[str, KVRow] = {}
+        self._oldest: Optional[float] = None
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._local = threading.local()
+        self._writer: Optional[sqlite3.Connection] = None
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._schema_ready = False
+        self.stats = {"hits": 0, "misses": 0, "rows_written": 0, "flushes": 0, "errors": 0}
+
+    # ------------------------------------------------------------------
+    # Connections
+    # ------------------------------------------------------------------
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None,
+                               cached_statements=64)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        if not self._schema_ready:
+            with self._lock:
+                conn.execute(_SCHEMA)
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_kv_agent ON kv(agent_id)")
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_kv_expires ON kv(expires_at)")
+                self._schema_ready = True
+        return conn
+
+    def _reader(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None or getattr(self._local, "pid", None) != os.getpid():
+            conn = self._local.conn = self._connect()
+            self._local.pid = os.getpid()
+        return conn
+
+    def _write_conn(self) -> sqlite3.Connection:
+        # Callers hold _flush_lock
+        if self._writer is None:
+            self._writer = self._connect()
+        return self._writer
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    def get(self, key: str) -> Optional[Tuple[int, bytes]]:
+        """(codec, value) for an unexpired key, else None."""
+        now = time.time()
+        with self._lock:
+            row = self._pending.get(key) or self._in_flight.get(key)
+        if row is not None:
+            found: Optional[Tuple[int, bytes, float]] = (row.codec, row.value, row.expires_at)
+        else:
+            found = self._reader().execute(_GET, (key,)).fetchone()
+        if found is None or found[2] <= now:
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        return found[0], found[1]
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+    def put(self, key: str, agent_id: str, method: str, codec: int, value: bytes, ttl_seconds: float) -> None:
+        if self._closed:
+            raise RuntimeError("KVStore is closed")
+        now = time.time()
+        row = KVRow(key, agent_id, method, codec, bytes(value), len(value), now, now + ttl_seconds)
+        with self._lock:
+            self._pending[key] = row
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+            pending = len(self._pending)
+        if self.flush_interval <= 0:
+            self.flush()
+            return
+        self._ensure_thread()
+        if pending >= 2 * self.max_pending:
+            # Backpressure: the writer thread is behind, write on the caller
+            self.flush()
+        elif pending >= self.max_pending:
+            self._wake.set()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending) + len(self._in_flight)
+
+    def flush(self) -> int:
+        """Write every pending row in one transaction; returns the rows written."""
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return 0
+                self._in_flight = self._pending
+                self._pending = {}
+                self._oldest = None
+            rows = list(self._in_flight.values())
+            try:
+                conn = self._write_conn()
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    conn.executemany(_PUT, rows)
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+            except Exception:
+                self.stats["errors"] += 1
+                with self._lock:
+                    # Keep the rows (newer puts win) for the next flush
+                    self._pending = {**self._in_flight, **self._pending}
+                    self._oldest = self._oldest or time.monotonic()
+                raise
+            finally:
+                with self._lock:
+                    self._in_flight = {}
+            self.stats["rows_written"] += len(rows)
+            self.stats["flushes"] += 1
+            return len(rows)
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="cache-l2-writer", daemon=True)
+                    self._thread.start()
+                    atexit.register(self.close)
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            oldest = self._oldest
+            if oldest is None:
+                continue
+            if len(self._pending) >= self.max_pending or time.monotonic() - oldest >= self.flush_interval:
+                try:
+                    self.flush()
+                except Exception as e:
+                    logger.error(f"L2 cache write-behind flush failed: {e}")
+
+    # ------------------------------------------------------------------
+    # Deletes and maintenance
+    # ------------------------------------------------------------------
+    def _drop_pending(self, keep) -> int:
+        with self._lock:
+            before = len(self._pending)
+            self._pending = {k: row for k, row in self._pending.items() if keep(row)}
+            if not self._pending:
+                self._oldest = None
+            return before - len(self._pending)
+
+    def _execute(self, sql: str, params: Tuple = ()) -> int:
+        # Callers hold _flush_lock
+        return self._write_conn().execute(sql, params).rowcount
+
+    def delete(self, key: str) -> bool:
+        with self._flush_lock:
+            dropped = self._drop_pending(lambda row: row.key != key)
+            return bool(dropped) | (self._execute("DELETE FROM kv WHERE key = ?", (key,)) > 0)
+
+    def delete_agent(self, agent_id: str) -> int:
+        with self._flush_lock:
+            dropped = self._drop_pending(lambda row: row.agent_id != agent_id)
+            return dropped + self._execute("DELETE FROM kv WHERE agent_id = ?", (agent_id,))
+
+    def clear(self) -> int:
+        with self._flush_lock:
+            dropped = self._drop_pending(lambda row: False)
+            return dropped + self._execute("DELETE FROM kv")
+
+    def cleanup_expired(self) -> int:
+        now = time.time()
+        with self._flush_lock:
+            dropped = self._drop_pending(lambda row: row.expires_at > now)
+            return dropped + self._execute("DELETE FROM kv WHERE expires_at <= ?", (now,))
+
+    def cleanup_older_than(self, cutoff: float) -> int:
+        """Delete rows created before cutoff (epoch seconds)."""
+        self.flush()
+        with self._flush_lock:
+            return self._execute("DELETE FROM kv WHERE created_at < ?", (cutoff,))
+
+    def summary(self) -> Dict[str, int]:
+        """Row count and total value bytes (pending rows included)."""
+        self.flush()
+        count, size = self._reader().execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM kv").fetchone()
+        return {"total_entries": count, "total_size_bytes": size}
+
+    def close(self) -> int:
+        """Stop the writer thread and flush what is left."""
+        if self._closed:
+            return 0
+        self._closed = True
+        self._wake.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        try:
+            return self.flush()
+        except Exception as e:
+            logger.error(f"L2 cache final flush failed: {e}")
+            return 0
@@ -87,15 +87,35 @@ class OrchestratorConfig(AgentConfig):
     checkpoint_interval_seconds: int = 30
     retry_attempts: int = 3
     retry_backoff_base: float = 1.0
+    # Incremental directory validation: reuse results of unchanged files
+    incremental: bool = False
+    manifest_path: str = "./data/cache/validation_manifest.db"
+    # Streaming directory validation: bounded queue + worker pool, per-file persistence
+    max_file_workers: int = 4
+    streaming: bool = False
+    stream_queue_size: int = 0  # 0 = 2 x max_file_workers
+    stream_chunk_size: int = 256
+    # WorkflowManager item engine: progress/resume checkpoint every N items
+    workflow_checkpoint_interval: int = 50
+    # Durable task queue executor (workflow_tasks + `tbcv worker`)
+    workflow_executor: str = "local"  # local | queue
+    task_lease_seconds: int = 60
+    task_batch_size: int = 16
+    task_max_attempts: int = 3
+    task_retry_backoff_base: float = 2.0
+    # Priority lanes: relative share of contended agent slots (see core.priority)
+    lane_weights: Dict[str, float] = {"interactive": 16.0, "batch": 4.0, "background": 1.0}
 
 class TruthManagerConfig(AgentConfig):
     auto_reload: bool = True
     validation_strict: bool = False
     cache_ttl_seconds: int = 604800  # 7 days
     truth_directories: List[str] = ["./truth"]
+    # How often a resident family index re-stats its source files
+    index_check_interval_seconds: float = 2.0
 
 class CacheConfig(BaseSettings):
-    """Two-level cache settings: L1 (memory) and L2 (persistent DB)."""
+    """Two-level cache settings: L1 (memory) and L2 (persistent key-value store)."""
 
     class L1Config(BaseSettings):
         enabled: bool = True
@@ -112,6 +132,8 @@ class CacheConfig(BaseSettings):
         cleanup_interval_hours: int = 24
         compression_enabled: bool = True
         compression_threshold_bytes: int = 1024
+        flush_interval_ms: int = 100
+        max_pending_writes: int = 256
 
     # Use Field with default_factory to avoid Pydantic 2.11 nested model validation issues
     l1: L1Config = Field(default_factory=L1Config)
@@ -144,6 +166,11 @@ class PerformanceConfig(BaseSettings):
     cpu_limit_percent: int = 80
     file_size_limits: Dict[str, int] = {"small_kb": 5, "medium_kb": 50, "large_kb": 1000}
     response_time_targets: Dict[str, int] = {"small_file_ms": 300, "medium_file_ms": 1000, "large_file_ms": 3000}
+    # Per-agent request queue: max waiting requests (0 = unbounded) and admission timeout
+    agent_queue_depth: int = 1000
+    agent_queue_timeout_seconds: float = 120.0
+    # Fraction of PerformanceLogger calls that also write start/completion logs
+    log_sample_rate: float = 0.0
 
 class ValidationLLMThresholds(BaseSettings):
     """
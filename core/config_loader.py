@@ -4,13 +4,23 @@ Generic Configuration Loader for TBCV Validators.
 
 Provides a unified way to load, parse, and access validator configurations
 with support for rules, profiles, and family-specific overrides.
+
+Every validator asks for its rules on every document, so resolved rulesets
+(profile and family overrides applied, plus the id/level/params maps the
+validators use) are frozen and memoized per (validator, profile, family,
+config generation). A validator's generation moves on reload() or when the
+background watcher sees its YAML file change; get_rules() itself never
+touches the filesystem once the config is loaded.
 """
 
 from __future__ import annotations
 import os
+import threading
+import weakref
 import yaml
-from dataclasses import dataclass, field
-from typing import Dict, Any, List, Optional
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
+from typing import Dict, Any, FrozenSet, List, Mapping, Optional, Tuple
 from pathlib import Path
 from functools import lru_cache
 
@@ -19,14 +29,14 @@ from core.logging import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True)
 class Rule:
     """Represents a single validation rule."""
     id: str
     enabled: bool = True
     level: str = "warning"  # error, warning, info
     message: str = ""
-    params: Dict[str, Any] = field(default_factory=dict)
+    params: Mapping[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -34,10 +44,48 @@ class Rule:
             "enabled": self.enabled,
             "level": self.level,
             "message": self.message,
-            "params": self.params
+            "params": dict(self.params)
         }
 
 
+def _freeze(value: Any) -> Any:
+    """Read-only view of a params value: dicts become proxies, lists tuples."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
+@dataclass(frozen=True)
+class ResolvedRuleset:
+    """Active rules of a validator for one profile and family (shared, read-only)."""
+    validator: str
+    profile: str
+    family: Optional[str]
+    generation: int
+    rules: Tuple[Rule, ...]
+    active_rule_ids: FrozenSet[str]
+    rule_levels: Mapping[str, str]
+    rule_params: Mapping[str, Mapping[str, Any]]
+
+    @classmethod
+    def build(cls, validator: str, profile: str, family: Optional[str],
+              generation: int, rules: List[Rule]) -> "ResolvedRuleset":
+        return cls(
+            validator=validator,
+            profile=profile,
+            family=family,
+            generation=generation,
+            rules=tuple(rules),
+            active_rule_ids=frozenset(r.id for r in rules),
+            rule_levels=MappingProxyType({r.id: r.level for r in rules}),
+            rule_params=MappingProxyType({r.id: r.params for r in rules}),
+        )
+
+
 @dataclass
 class ProfileConfig:
     """Represents a validation profile configuration."""
@@ -100,24 +148,46 @@ class ConfigLoader:
         loader = ConfigLoader()
         config = loader.load("seo")
         rules = loader.get_rules("seo", profile="strict")
+        ruleset = loader.get_ruleset("seo", profile="strict", family="words")
         override = loader.get_family_override("seo", "words")
     """
 
-    def __init__(self, config_dir: str = "./config"):
+    def __init__(self, config_dir: str = "./config", watch_interval_seconds: float = 2.0):
         """
         Initialize the configuration loader.
 
         Args:
             config_dir: Path to the configuration directory.
+            watch_interval_seconds: How often the background watcher checks the
+                loaded YAML files for changes (0 = only explicit reload()).
         """
         self.config_dir = Path(config_dir)
+        self.watch_interval_seconds = watch_interval_seconds
         self._cache: Dict[str, ValidatorConfig] = {}
-        self._file_mtimes: Dict[str, float] = {}
+        self._file_mtimes: Dict[str, Optional[float]] = {}
+        self._generations: Dict[str, int] = {}
+        self._rulesets: Dict[Tuple[str, str, Optional[str], int], ResolvedRuleset] = {}
+        self._lock = threading.Lock()
+        self._watch_stop = threading.Event()
+        self._watcher: Optional[threading.Thread] = None
+        self.stats = {"ruleset_hits": 0, "ruleset_builds": 0, "file_changes": 0}
+
+    def _config_path(self, validator_name: str) -> Path:
+        return self.config_dir / f"{validator_name}.yaml"
+
+    def _mtime(self, validator_name: str) -> Optional[float]:
+        try:
+            return self._config_path(validator_name).stat().st_mtime
+        except OSError:
+            return None
 
     def load(self, validator_name: str, force_reload: bool = False) -> ValidatorConfig:
         """
         Load configuration for a validator.
 
+        Cached configs are returned without touching the filesystem; the
+        watcher (or reload()) drops them when the file changes.
+
         Args:
             validator_name: Name of the validator (e.g., 'seo', 'yaml', 'markdown')
             force_reload: Force reload from disk even if cached
@@ -125,16 +195,15 @@ class ConfigLoader:
         Returns:
             ValidatorConfig instance with parsed rules, profiles, and overrides
         """
-        config_path = self.config_dir / f"{validator_name}.yaml"
+        if not force_reload:
+            config = self._cache.get(validator_name)
+            if config is not None:
+                return config
+        else:
+            self._bump_generation(validator_name)
 
-        # Check cache
-        if not force_reload and validator_name in self._cache:
-            # Check if file has been modified
-            if config_path.exists():
-                current_mtime = config_path.stat().st_mtime
-                cached_mtime = self._file_mtimes.get(validator_name, 0)
-                if current_mtime <= cached_mtime:
-                    return self._cache[validator_name]
+        config_path = self._config_path(validator_name)
+        mtime = self._mtime(validator_name)
 
         # Load from file
         raw_config = self._load_yaml(config_path)
@@ -143,12 +212,62 @@ class ConfigLoader:
         config = self._parse_config(validator_name, raw_config)
 
         # Cache
-        self._cache[validator_name] = config
-        if config_path.exists():
-            self._file_mtimes[validator_name] = config_path.stat().st_mtime
+        with self._lock:
+            self._cache[validator_name] = config
+            self._file_mtimes[validator_name] = mtime
+        self._ensure_watcher()
 
         return config
 
+    def generation(self, validator_name: str) -> int:
+        """Config generation of a validator (moves on reload or file change)."""
+        return self._generations.get(validator_name, 0)
+
+    def _bump_generation(self, validator_name: str) -> None:
+        with self._lock:
+            self._generations[validator_name] = self._generations.get(validator_name, 0) + 1
+            # Rulesets of older generations can never be hit again
+            for key in [key for key in self._rulesets if key[0] == validator_name]:
+                del self._rulesets[key]
+
+    def get_ruleset(
+        self,
+        validator_name: str,
+        profile: str = "default",
+        family: Optional[str] = None
+    ) -> ResolvedRuleset:
+        """
+        Get the resolved, read-only ruleset for a validator, profile and family.
+
+        Memoized per (validator, profile, family, config generation); the
+        result is shared, so callers must not mutate it.
+
+        Args:
+            validator_name: Name of the validator
+            profile: Profile name (default, strict, relaxed)
+            family: Optional family for family-specific overrides
+
+        Returns:
+            ResolvedRuleset with the active rules and their id/level/params maps
+        """
+        # Generation first: a reload that lands before load() then leaves
+        # the key stale, and the check below keeps the result out of the memo
+        key = (validator_name, profile, family, self.generation(validator_name))
+        config = self.load(validator_name)
+        ruleset = self._rulesets.get(key)
+        if ruleset is not None:
+            self.stats["ruleset_hits"] += 1
+            return ruleset
+
+        ruleset = ResolvedRuleset.build(
+            validator_name, profile, family, key[3], self._resolve_rules(config, profile, family)
+        )
+        with self._lock:
+            if self.generation(validator_name) == key[3]:
+                self._rulesets[key] = ruleset
+        self.stats["ruleset_builds"] += 1
+        return ruleset
+
     def get_rules(
         self,
         validator_name: str,
@@ -166,8 +285,10 @@ class ConfigLoader:
         Returns:
             List of active Rule objects
         """
-        config = self.load(validator_name)
+        return list(self.get_ruleset(validator_name, profile, family).rules)
 
+    def _resolve_rules(self, config: ValidatorConfig, profile: str, family: Optional[str]) -> List[Rule]:
+        """Apply profile and family overrides to the config's rules."""
         # Check for family override on profile
         effective_profile = profile
         if family and family in config.family_overrides:
@@ -197,23 +318,14 @@ class ConfigLoader:
             if not base_rule.enabled:
                 continue
 
-            # Apply profile overrides
-            rule = Rule(
-                id=base_rule.id,
-                enabled=base_rule.enabled,
-                level=base_rule.level,
-                message=base_rule.message,
-                params=dict(base_rule.params)
-            )
+            level, enabled, params = base_rule.level, base_rule.enabled, dict(base_rule.params)
 
+            # Apply profile overrides
             if profile_config and rule_id in profile_config.overrides:
                 overrides = profile_config.overrides[rule_id]
-                if "level" in overrides:
-                    rule.level = overrides["level"]
-                if "enabled" in overrides:
-                    rule.enabled = overrides["enabled"]
-                if "params" in overrides:
-                    rule.params.update(overrides["params"])
+                level = overrides.get("level", level)
+                enabled = overrides.get("enabled", enabled)
+                params.update(overrides.get("params", {}))
 
             # Apply family overrides
             if family and family in config.family_overrides:
@@ -221,15 +333,12 @@ class ConfigLoader:
                 family_rules = family_cfg.get("rules", {})
                 if rule_id in family_rules:
                     family_rule_cfg = family_rules[rule_id]
-                    if "level" in family_rule_cfg:
-                        rule.level = family_rule_cfg["level"]
-                    if "enabled" in family_rule_cfg:
-                        rule.enabled = family_rule_cfg["enabled"]
-                    if "params" in family_rule_cfg:
-                        rule.params.update(family_rule_cfg["params"])
+                    level = family_rule_cfg.get("level", level)
+                    enabled = family_rule_cfg.get("enabled", enabled)
+                    params.update(family_rule_cfg.get("params", {}))
 
-            if rule.enabled:
-                result.append(rule)
+            if enabled:
+                result.append(replace(base_rule, level=level, enabled=enabled, params=_freeze(params)))
 
         return result
 
@@ -272,14 +381,45 @@ class ConfigLoader:
         Args:
             validator_name: Specific validator to reload, or None to clear all cache
         """
-        if validator_name:
-            if validator_name in self._cache:
-                del self._cache[validator_name]
-            if validator_name in self._file_mtimes:
-                del self._file_mtimes[validator_name]
-        else:
-            self._cache.clear()
-            self._file_mtimes.clear()
+        names = [validator_name] if validator_name else list(self._cache)
+        with self._lock:
+            for name in names:
+                self._cache.pop(name, None)
+                self._file_mtimes.pop(name, None)
+        for name in names:
+            self._bump_generation(name)
+
+    # ------------------------------------------------------------------
+    # File watcher
+    # ------------------------------------------------------------------
+    def _ensure_watcher(self) -> None:
+        if self.watch_interval_seconds <= 0 or self._watcher is not None:
+            return
+        with self._lock:
+            if self._watcher is None:
+                self._watcher = threading.Thread(
+                    target=_watch_config_files,
+                    args=(weakref.ref(self), self._watch_stop, self.watch_interval_seconds),
+                    name="config-loader-watcher",
+                    daemon=True,
+                )
+                self._watcher.start()
+
+    def check_for_changes(self) -> List[str]:
+        """Stat the loaded config files once and reload the ones that changed."""
+        changed = [
+            name for name, mtime in list(self._file_mtimes.items())
+            if self._mtime(name) != mtime
+        ]
+        for name in changed:
+            logger.info(f"Config file changed, reloading: {self._config_path(name)}")
+            self.reload(name)
+        self.stats["file_changes"] += len(changed)
+        return changed
+
+    def stop_watching(self) -> None:
+        """Stop the background watcher (explicit reload() keeps working)."""
+        self._watch_stop.set()
 
     def list_validators(self) -> List[str]:
         """
@@ -390,4 +530,19 @@ def get_config_loader(config_dir: str = "./config") -> ConfigLoader:
 def reset_config_loader() -> None:
     """Reset the default ConfigLoader instance (useful for testing)."""
     global _default_loader
+    if _default_loader is not None:
+        _default_loader.stop_watching()
     _default_loader = None
+
+
+def _watch_config_files(loader_ref: "weakref.ref[ConfigLoader]", stop: threading.Event, interval: float) -> None:
+    """Watcher loop; holds the loader weakly so it ends with the loader."""
+    while not stop.wait(interval):
+        loader = loader_ref()
+        if loader is None:
+            return
+        try:
+            loader.check_for_changes()
+        except Exception as e:
+            logger.warning(f"Config watcher check failed: {e}")
+        del loader
@@ -8,15 +8,20 @@ Features:
 - Audit logging for all changes
 - Enhanced validation result tracking
 - Workflow state management
+- Batched persistence: bulk inserts and a write-behind buffer (ResultWriteBuffer)
+- Durable workflow task queue with leases, retry backoff and dead-lettering
 """
 
 from __future__ import annotations
 
+import asyncio
 import os
 import uuid
 import json
 import hashlib
-from datetime import datetime, timezone
+import threading
+import time
+from datetime import datetime, timezone, timedelta
 from typing import Dict, Any, Optional, List
 from threading import Lock
 from pathlib import Path
@@ -30,7 +35,8 @@ SQLALCHEMY_AVAILABLE = True
 try:
     from sqlalchemy import (
         create_engine, Column, String, Integer, DateTime, Text,
-        Enum as SQLEnum, ForeignKey, LargeBinary, Boolean, Float, Index, text
+        Enum as SQLEnum, ForeignKey, LargeBinary, Boolean, Float, Index, text,
+        and_, or_, event, insert, func
     )
     from sqlalchemy.orm import declarative_base, sessionmaker, relationship, Session
     from sqlalchemy.types import TypeDecorator, TEXT
@@ -49,6 +55,7 @@ except ImportError:
     String = Integer = DateTime = Text = LargeBinary = Boolean = Float = _Dummy
     SQLEnum = _Dummy
     ForeignKey = Index = _Dummy
+    and_ = or_ = event = insert = func = _Dummy()
     relationship = _Dummy
     class TEXT: pass  # noqa: N801
     class TypeDecorator: impl = TEXT; cache_ok = True
@@ -88,6 +95,14 @@ class WorkflowState(enum.Enum):
     CANCELLED = "cancelled"
 
 
+class TaskState(enum.Enum):
+    PENDING = "pending"
+    LEASED = "leased"
+    DONE = "done"
+    DEAD = "dead"
+    CANCELLED = "cancelled"
+
+
 # ---------------------------
 # SQLAlchemy custom JSON type
 # ---------------------------
@@ -178,6 +193,52 @@ class Checkpoint(Base):
         }
 
 
+# ---------------- ORM: WorkflowTask ----------------
+class WorkflowTask(Base):
+    """One unit of workflow work (e.g. one file) on the durable task queue."""
+    __tablename__ = "workflow_tasks"
+
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    workflow_id = Column(String(36), ForeignKey('workflows.id'), nullable=False, index=True)
+    kind = Column(String(50), nullable=False)
+    payload = Column(JSONField)
+    state = Column(SQLEnum(TaskState), nullable=False, default=TaskState.PENDING)
+    outcome = Column(String(20))
+    result = Column(JSONField)
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=3)
+    available_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    lease_owner = Column(String(100))
+    lease_token = Column(String(32), index=True)
+    lease_expires_at = Column(DateTime)
+    last_error = Column(Text)
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+
+    __table_args__ = (
+        Index('idx_workflow_tasks_state_available', 'state', 'available_at'),
+        Index('idx_workflow_tasks_workflow_state', 'workflow_id', 'state'),
+    )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "workflow_id": self.workflow_id,
+            "kind": self.kind,
+            "payload": self.payload,
+            "state": self.state.value if isinstance(self.state, TaskState) else self.state,
+            "outcome": self.outcome,
+            "result": self.result,
+            "attempts": self.attempts,
+            "max_attempts": self.max_attempts,
+            "lease_owner": self.lease_owner,
+            "lease_expires_at": self.lease_expires_at.isoformat() if self.lease_expires_at else None,
+            "last_error": self.last_error,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
+
+
 # ---------------- ORM: CacheEntry ----------------
 class CacheEntry(Base):
     __tablename__ = "cache_entries"
@@ -415,6 +476,27 @@ class AuditLog(Base):
 
 
 # ------------------- Database Management -------------------
+# Applied to every SQLite connection. WAL lets readers run during a write and
+# makes commits an append to the log instead of a rollback-journal fsync dance.
+_SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-16000",
+)
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        # In-memory databases cannot use WAL (the pragma reports "memory")
+        cursor.execute("PRAGMA journal_mode=WAL")
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
 class DatabaseManager:
     def __init__(self):
         self._lock = Lock()
@@ -426,6 +508,8 @@ class DatabaseManager:
                 db_path = db_url.replace('sqlite:///', '')
                 Path(db_path).parent.mkdir(parents=True, exist_ok=True)
             self.engine = create_engine(db_url, connect_args={"check_same_thread": False} if db_url.startswith('sqlite') else {})
+            if db_url.startswith('sqlite'):
+                event.listen(self.engine, "connect", _apply_sqlite_pragmas)
             self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
             self.create_tables()
         else:
@@ -619,6 +703,225 @@ class DatabaseManager:
                 q = q.filter(Workflow.state == WorkflowState(state))
             return q.order_by(Workflow.created_at.desc()).limit(limit).all()
 
+    # ---- Task queue helpers ----
+    def enqueue_tasks(self, workflow_id: str, kind: str, payloads: List[Dict[str, Any]],
+                      max_attempts: int = 3) -> int:
+        """Add one task per payload to the queue in a single transaction; returns the count."""
+        if not payloads:
+            return 0
+        now = datetime.now(timezone.utc)
+        rows = [{
+            "id": str(uuid.uuid4()),
+            "workflow_id": workflow_id,
+            "kind": kind,
+            "payload": payload,
+            "state": TaskState.PENDING,
+            "attempts": 0,
+            "max_attempts": max(1, int(max_attempts)),
+            "available_at": now,
+            "created_at": now,
+            "updated_at": now,
+        } for payload in payloads]
+        with self.get_session() as session:
+            try:
+                session.execute(insert(WorkflowTask), rows)
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+        return len(rows)
+
+    def lease_tasks(self, worker_id: str, limit: int = 1, lease_seconds: float = 60.0,
+                    kinds: Optional[List[str]] = None) -> List[WorkflowTask]:
+        """
+        Claim up to limit runnable tasks for worker_id.
+
+        Runnable tasks are pending ones whose backoff has elapsed and leased
+        ones whose lease expired (their worker died), belonging to running
+        workflows. Each claim counts as an attempt. The claim is a single
+        conditional UPDATE, so concurrent workers (in any process) never hold
+        the same task. Expired tasks without attempts left are dead-lettered.
+        """
+        now = datetime.now(timezone.utc)
+        token = uuid.uuid4().hex
+        expired = and_(WorkflowTask.state == TaskState.LEASED, WorkflowTask.lease_expires_at < now)
+        claimable = or_(
+            and_(WorkflowTask.state == TaskState.PENDING, WorkflowTask.available_at <= now),
+            and_(expired, WorkflowTask.attempts < WorkflowTask.max_attempts),
+        )
+        with self.get_session() as session:
+            try:
+                session.query(WorkflowTask).filter(
+                    expired, WorkflowTask.attempts >= WorkflowTask.max_attempts
+                ).update({
+                    WorkflowTask.state: TaskState.DEAD,
+                    WorkflowTask.last_error: "Lease expired on the last attempt",
+                    WorkflowTask.updated_at: now,
+                }, synchronize_session=False)
+
+                q = session.query(WorkflowTask.id).join(
+                    Workflow, Workflow.id == WorkflowTask.workflow_id
+                ).filter(claimable, Workflow.state == WorkflowState.RUNNING)
+                if kinds:
+                    q = q.filter(WorkflowTask.kind.in_(kinds))
+                ids = [row.id for row in q.order_by(WorkflowTask.available_at.asc()).limit(max(1, int(limit)))]
+                if ids:
+                    session.query(WorkflowTask).filter(WorkflowTask.id.in_(ids), claimable).update({
+                        WorkflowTask.state: TaskState.LEASED,
+                        WorkflowTask.lease_owner: worker_id,
+                        WorkflowTask.lease_token: token,
+                        WorkflowTask.lease_expires_at: now + timedelta(seconds=lease_seconds),
+                        WorkflowTask.attempts: WorkflowTask.attempts + 1,
+                        WorkflowTask.updated_at: now,
+                    }, synchronize_session=False)
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+            if not ids:
+                return []
+            return session.query(WorkflowTask).filter(WorkflowTask.lease_token == token).all()
+
+    def heartbeat_tasks(self, worker_id: str, task_ids: List[str], lease_seconds: float = 60.0) -> int:
+        """Extend the leases worker_id still holds; returns how many it still holds."""
+        if not task_ids:
+            return 0
+        now = datetime.now(timezone.utc)
+        with self.get_session() as session:
+            count = session.query(WorkflowTask).filter(
+                WorkflowTask.id.in_(task_ids),
+                WorkflowTask.state == TaskState.LEASED,
+                WorkflowTask.lease_owner == worker_id,
+            ).update({
+                WorkflowTask.lease_expires_at: now + timedelta(seconds=lease_seconds),
+                WorkflowTask.updated_at: now,
+            }, synchronize_session=False)
+            session.commit()
+            return count
+
+    def complete_tasks(self, worker_id: str, completions: List[Dict[str, Any]]) -> int:
+        """
+        Mark tasks done in one transaction.
+
+        Args:
+            worker_id: Worker that holds the leases; tasks it lost are left alone
+            completions: {"id", "outcome", "result"} per task
+
+        Returns:
+            Number of tasks marked done
+        """
+        if not completions:
+            return 0
+        now = datetime.now(timezone.utc)
+        done = 0
+        with self.get_session() as session:
+            try:
+                for completion in completions:
+                    done += session.query(WorkflowTask).filter(
+                        WorkflowTask.id == completion["id"],
+                        WorkflowTask.state == TaskState.LEASED,
+                        WorkflowTask.lease_owner == worker_id,
+                    ).update({
+                        WorkflowTask.state: TaskState.DONE,
+                        WorkflowTask.outcome: completion.get("outcome"),
+                        WorkflowTask.result: completion.get("result"),
+                        WorkflowTask.lease_expires_at: None,
+                        WorkflowTask.updated_at: now,
+                    }, synchronize_session=False)
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+        return done
+
+    def fail_task(self, worker_id: str, task_id: str, error: str, backoff_base: float = 1.0) -> Optional[TaskState]:
+        """
+        Record a failed attempt.
+
+        The task goes back to pending after backoff_base * 2^(attempts-1)
+        seconds, or to the dead-letter state once it has used max_attempts.
+
+        Returns:
+            The new state, or None if worker_id no longer holds the task
+        """
+        now = datetime.now(timezone.utc)
+        with self.get_session() as session:
+            task = session.query(WorkflowTask).filter(
+                WorkflowTask.id == task_id,
+                WorkflowTask.state == TaskState.LEASED,
+                WorkflowTask.lease_owner == worker_id,
+            ).first()
+            if task is None:
+                return None
+            task.last_error = error
+            task.lease_owner = None
+            task.lease_expires_at = None
+            task.updated_at = now
+            if task.attempts >= task.max_attempts:
+                task.state = TaskState.DEAD
+            else:
+                task.state = TaskState.PENDING
+                task.available_at = now + timedelta(seconds=backoff_base * (2 ** max(0, task.attempts - 1)))
+            state = task.state
+            session.commit()
+            return state
+
+    def cancel_tasks(self, workflow_id: str) -> int:
+        """Cancel the pending and leased tasks of a workflow."""
+        with self.get_session() as session:
+            count = session.query(WorkflowTask).filter(
+                WorkflowTask.workflow_id == workflow_id,
+                WorkflowTask.state.in_([TaskState.PENDING, TaskState.LEASED]),
+            ).update({
+                WorkflowTask.state: TaskState.CANCELLED,
+                WorkflowTask.updated_at: datetime.now(timezone.utc),
+            }, synchronize_session=False)
+            session.commit()
+            return count
+
+    def count_tasks(self, workflow_id: str) -> Dict[str, int]:
+        """
+        Task counts of a workflow: pending, leased, dead and cancelled by
+        state; done tasks by outcome (ok, skipped, failed).
+        """
+        counts = {"pending": 0, "leased": 0, "ok": 0, "skipped": 0, "failed": 0, "dead": 0, "cancelled": 0}
+        with self.get_session() as session:
+            rows = session.query(
+                WorkflowTask.state, WorkflowTask.outcome, func.count(WorkflowTask.id)
+            ).filter(WorkflowTask.workflow_id == workflow_id).group_by(
+                WorkflowTask.state, WorkflowTask.outcome
+            ).all()
+        for state, outcome, count in rows:
+            key = (outcome or "ok") if state == TaskState.DONE else state.value
+            counts[key] = counts.get(key, 0) + count
+        return counts
+
+    def list_dead_tasks(self, workflow_id: Optional[str] = None, limit: int = 100) -> List[WorkflowTask]:
+        """Dead-lettered tasks, newest first."""
+        with self.get_session() as session:
+            q = session.query(WorkflowTask).filter(WorkflowTask.state == TaskState.DEAD)
+            if workflow_id:
+                q = q.filter(WorkflowTask.workflow_id == workflow_id)
+            return q.order_by(WorkflowTask.updated_at.desc()).limit(limit).all()
+
+    def requeue_dead_tasks(self, workflow_id: Optional[str] = None) -> int:
+        """Give dead-lettered tasks a fresh set of attempts."""
+        now = datetime.now(timezone.utc)
+        with self.get_session() as session:
+            q = session.query(WorkflowTask).filter(WorkflowTask.state == TaskState.DEAD)
+            if workflow_id:
+                q = q.filter(WorkflowTask.workflow_id == workflow_id)
+            count = q.update({
+                WorkflowTask.state: TaskState.PENDING,
+                WorkflowTask.attempts: 0,
+                WorkflowTask.available_at: now,
+                WorkflowTask.lease_owner: None,
+                WorkflowTask.lease_expires_at: None,
+                WorkflowTask.updated_at: now,
+            }, synchronize_session=False)
+            session.commit()
+            return count
+
     # ---- Cache helpers ----
     def get_cache_entry(self, cache_key: str) -> Optional[CacheEntry]:
         with self.get_session() as session:
@@ -670,7 +973,7 @@ class DatabaseManager:
     def _sha256(content: str) -> str:
         return hashlib.sha256(content.encode("utf-8")).hexdigest()
 
-    def create_validation_result(
+    def _validation_values(
         self,
         *,
         file_path: str,
@@ -684,7 +987,8 @@ class DatabaseManager:
         run_id: Optional[str] = None,
         workflow_id: Optional[str] = None,
         validation_types: Optional[List[str]] = None,
-    ) -> ValidationResult:
+    ) -> Dict[str, Any]:
+        """Column values of a new ValidationResult (shared by the single and bulk paths)."""
         # Normalize file path to ensure it's absolute and valid
         try:
             from core.file_utils import normalize_file_path
@@ -702,7 +1006,7 @@ class DatabaseManager:
         if isinstance(status, str):
             status = ValidationStatus(status)
 
-        vr = ValidationResult(
+        return dict(
             workflow_id=workflow_id,
             file_path=normalized_file_path,
             rules_applied=rules_applied,
@@ -715,6 +1019,36 @@ class DatabaseManager:
             ast_hash=ast_hash,
             run_id=run_id,
         )
+
+    def create_validation_result(
+        self,
+        *,
+        file_path: str,
+        rules_applied: Any,
+        validation_results: Any,
+        notes: str,
+        severity: str,
+        status: str,
+        content: Optional[str] = None,
+        ast_hash: Optional[str] = None,
+        run_id: Optional[str] = None,
+        workflow_id: Optional[str] = None,
+        validation_types: Optional[List[str]] = None,
+    ) -> ValidationResult:
+        vr = ValidationResult(**self._validation_values(
+            file_path=file_path,
+            rules_applied=rules_applied,
+            validation_results=validation_results,
+            notes=notes,
+            severity=severity,
+            status=status,
+            content=content,
+            ast_hash=ast_hash,
+            run_id=run_id,
+            workflow_id=workflow_id,
+            validation_types=validation_types,
+        ))
+        normalized_file_path = vr.file_path
         with self.get_session() as session:
             session.add(vr)
             session.commit()
@@ -774,6 +1108,32 @@ class DatabaseManager:
             q = q.order_by(ValidationResult.created_at.desc() if newest_first else ValidationResult.created_at.asc())
             return q.limit(limit).all()
 
+    def list_validation_results_page(
+        self,
+        *,
+        run_id: str,
+        after: Optional[tuple] = None,
+        limit: int = 100,
+    ) -> List[ValidationResult]:
+        """
+        Keyset page of the results of one run, oldest first.
+
+        Args:
+            run_id: Run whose results to list
+            after: (created_at, id) of the last row of the previous page
+            limit: Maximum rows to return
+        """
+        with self.get_session() as session:
+            q = session.query(ValidationResult).filter(ValidationResult.run_id == run_id)
+            if after:
+                created_at, last_id = after
+                q = q.filter(or_(
+                    ValidationResult.created_at > created_at,
+                    and_(ValidationResult.created_at == created_at, ValidationResult.id > last_id),
+                ))
+            q = q.order_by(ValidationResult.created_at.asc(), ValidationResult.id.asc())
+            return q.limit(limit).all()
+
     def get_validation_result(self, validation_id: str) -> Optional[ValidationResult]:
         with self.get_session() as session:
             return session.query(ValidationResult).filter(ValidationResult.id == validation_id).first()
@@ -996,8 +1356,8 @@ class DatabaseManager:
             return "degrading"
 
     # ---- Recommendation helpers ----
-    def create_recommendation(
-        self,
+    @staticmethod
+    def _recommendation_values(
         *,
         validation_id: str,
         type: str,
@@ -1014,8 +1374,9 @@ class DatabaseManager:
         priority: str = "medium",
         status: str = "pending",
         metadata: Optional[Dict[str, Any]] = None,
-    ) -> Recommendation:
-        rec = Recommendation(
+    ) -> Dict[str, Any]:
+        """Column values of a new Recommendation (shared by the single and bulk paths)."""
+        return dict(
             validation_id=validation_id,
             type=type,
             title=title,
@@ -1032,6 +1393,43 @@ class DatabaseManager:
             status=RecommendationStatus(status) if isinstance(status, str) else status,
             recommendation_metadata=metadata or {},
         )
+
+    def create_recommendation(
+        self,
+        *,
+        validation_id: str,
+        type: str,
+        title: str,
+        description: str,
+        scope: Optional[str] = None,
+        instruction: Optional[str] = None,
+        rationale: Optional[str] = None,
+        severity: Optional[str] = None,
+        original_content: Optional[str] = None,
+        proposed_content: Optional[str] = None,
+        diff: Optional[str] = None,
+        confidence: float = 0.0,
+        priority: str = "medium",
+        status: str = "pending",
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Recommendation:
+        rec = Recommendation(**self._recommendation_values(
+            validation_id=validation_id,
+            type=type,
+            title=title,
+            description=description,
+            scope=scope,
+            instruction=instruction,
+            rationale=rationale,
+            severity=severity,
+            original_content=original_content,
+            proposed_content=proposed_content,
+            diff=diff,
+            confidence=confidence,
+            priority=priority,
+            status=status,
+            metadata=metadata,
+        ))
         with self.get_session() as session:
             session.add(rec)
             session.commit()
@@ -1335,6 +1733,32 @@ class DatabaseManager:
             return rec
 
     # ---- AuditLog helpers ----
+    @staticmethod
+    def _audit_values(
+        *,
+        recommendation_id: Optional[str] = None,
+        action: str,
+        actor: Optional[str] = None,
+        actor_type: str = "system",
+        before_state: Optional[Dict[str, Any]] = None,
+        after_state: Optional[Dict[str, Any]] = None,
+        changes: Optional[Dict[str, Any]] = None,
+        notes: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Column values of a new AuditLog (shared by the single and bulk paths)."""
+        return dict(
+            recommendation_id=recommendation_id,
+            action=action,
+            actor=actor,
+            actor_type=actor_type,
+            before_state=before_state,
+            after_state=after_state,
+            changes=changes,
+            notes=notes,
+            audit_metadata=metadata or {},
+        )
+
     def create_audit_log(
         self,
         *,
@@ -1348,7 +1772,7 @@ class DatabaseManager:
         notes: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
     ) -> AuditLog:
-        log = AuditLog(
+        log = AuditLog(**self._audit_values(
             recommendation_id=recommendation_id,
             action=action,
             actor=actor,
@@ -1357,14 +1781,54 @@ class DatabaseManager:
             after_state=after_state,
             changes=changes,
             notes=notes,
-            audit_metadata=metadata or {},
-        )
+            metadata=metadata,
+        ))
         with self.get_session() as session:
             session.add(log)
             session.commit()
             session.refresh(log)
         return log
 
+    # ---- Bulk persistence ----
+    def bulk_insert(
+        self,
+        *,
+        validations: Optional[List[Dict[str, Any]]] = None,
+        recommendations: Optional[List[Dict[str, Any]]] = None,
+        audit_logs: Optional[List[Dict[str, Any]]] = None,
+    ) -> Dict[str, int]:
+        """
+        Insert prepared rows (column values, see the _*_values helpers) in a
+        single transaction, with one executemany per table. Parents are
+        inserted before the rows that reference them.
+        """
+        counts = {
+            "validations": len(validations or []),
+            "recommendations": len(recommendations or []),
+            "audit_logs": len(audit_logs or []),
+        }
+        if not any(counts.values()):
+            return counts
+        with self.get_session() as session:
+            try:
+                if validations:
+                    session.execute(insert(ValidationResult), validations)
+                if recommendations:
+                    session.execute(insert(Recommendation), recommendations)
+                if audit_logs:
+                    session.execute(insert(AuditLog), audit_logs)
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+        return counts
+
+    def write_buffer(self, max_rows: int = 500, flush_interval_ms: int = 250,
+                     max_attempts: int = 5) -> "ResultWriteBuffer":
+        """Write-behind buffer that persists rows through bulk_insert."""
+        return ResultWriteBuffer(self, max_rows=max_rows, flush_interval_ms=flush_interval_ms,
+                                 max_attempts=max_attempts)
+
     def list_audit_logs(
         self,
         *,
@@ -1999,5 +2463,200 @@ class DatabaseManager:
         return results
 
 
+def _on_event_loop() -> bool:
+    """True when called from a thread that is running an asyncio event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+class ResultWriteBuffer:
+    """
+    Write-behind buffer for validation results, recommendations and audit logs.
+
+    Rows get their ids and timestamps when they are added, so callers can link
+    and publish them right away. Pending rows are written with
+    DatabaseManager.bulk_insert (one transaction) by a background thread once
+    max_rows are pending or the oldest row is flush_interval_ms old, and by
+    flush()/close(). With flush_interval_ms=0 there is no thread and the
+    caller flushes every max_rows rows.
+
+    A batch whose insert fails (e.g. database locked) goes back in front of
+    the pending rows and is retried by the next flush; it is only dropped,
+    with an error log, after max_attempts consecutive failures. Code running
+    on an event loop never flushes inline: adding rows there only wakes the
+    writer thread, and callers apply backpressure with
+    ``if writer.backlogged: await asyncio.to_thread(writer.flush)``.
+    """
+
+    TABLES = ("validations", "recommendations", "audit_logs")
+
+    def __init__(self, manager: DatabaseManager, max_rows: int = 500, flush_interval_ms: int = 250,
+                 max_attempts: int = 5):
+        self.manager = manager
+        self.max_rows = max(1, int(max_rows))
+        self.flush_interval = max(0, int(flush_interval_ms)) / 1000.0
+        self.max_attempts = max(1, int(max_attempts))
+        self._failed_attempts = 0
+        self._pending: Dict[str, List[Dict[str, Any]]] = {table: [] for table in self.TABLES}
+        self._pending_rows = 0
+        self._oldest: Optional[float] = None
+        self._lock = Lock()
+        self._flush_lock = Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self.stats = {"rows_written": 0, "flushes": 0, "errors": 0, "rows_dropped": 0}
+
+    # ------------------------------------------------------------------
+    # Adding rows
+    # ------------------------------------------------------------------
+    def add_validation(self, **kwargs) -> str:
+        """Queue a validation result (create_validation_result arguments); returns its id."""
+        row = self.manager._validation_values(**kwargs)
+        return self._add("validations", row)
+
+    def add_recommendation(self, *, audit: bool = True, **kwargs) -> str:
+        """
+        Queue a recommendation (create_recommendation arguments); returns its id.
+        Like create_recommendation, also queues the 'created' audit entry.
+        """
+        row = self.manager._recommendation_values(**kwargs)
+        rec_id = self._add("recommendations", row)
+        if audit:
+            self.add_audit_log(
+                recommendation_id=rec_id,
+                action="created",
+                actor="system",
+                actor_type="system",
+                after_state=Recommendation(**row).to_dict(),
+            )
+        return rec_id
+
+    def add_audit_log(self, **kwargs) -> str:
+        """Queue an audit entry (create_audit_log arguments); returns its id."""
+        return self._add("audit_logs", self.manager._audit_values(**kwargs))
+
+    def _add(self, table: str, row: Dict[str, Any]) -> str:
+        if self._closed:
+            raise RuntimeError("ResultWriteBuffer is closed")
+        row.setdefault("id", str(uuid.uuid4()))
+        row.setdefault("created_at", datetime.now(timezone.utc))
+        with self._lock:
+            self._pending[table].append(row)
+            self._pending_rows += 1
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+            pending = self._pending_rows
+        on_loop = _on_event_loop()
+        if self.flush_interval <= 0:
+            if pending >= self.max_rows and not on_loop:
+                self.flush()
+            return row["id"]
+        self._ensure_thread()
+        if pending >= 2 * self.max_rows and not on_loop:
+            # Backpressure: the writer thread is behind, write on the caller
+            self.flush()
+        elif pending >= self.max_rows:
+            self._wake.set()
+        return row["id"]
+
+    # ------------------------------------------------------------------
+    # Flushing
+    # ------------------------------------------------------------------
+    @property
+    def pending(self) -> int:
+        return self._pending_rows
+
+    @property
+    def backlogged(self) -> bool:
+        """True when a caller should wait for a flush before adding more rows."""
+        limit = self.max_rows if self.flush_interval <= 0 else 2 * self.max_rows
+        return self._pending_rows >= limit
+
+    def flush(self) -> int:
+        """Write every pending row in one transaction; returns the rows written."""
+        with self._flush_lock:
+            with self._lock:
+                batch = self._pending
+                written = self._pending_rows
+                self._pending = {table: [] for table in self.TABLES}
+                self._pending_rows = 0
+                self._oldest = None
+            if not written:
+                return 0
+            try:
+                self.manager.bulk_insert(**batch)
+            except Exception as e:
+                self.stats["errors"] += 1
+                self._failed_attempts += 1
+                if self._failed_attempts >= self.max_attempts:
+                    self._failed_attempts = 0
+                    self.stats["rows_dropped"] += written
+                    logger.error(
+                        f"Write-behind buffer dropped {written} rows "
+                        f"({', '.join(f'{len(rows)} {table}' for table, rows in batch.items() if rows)}) "
+                        f"after {self.max_attempts} failed attempts: {e}"
+                    )
+                    raise
+                with self._lock:
+                    # Keep the batch, in order, in front of rows added meanwhile
+                    for table in self.TABLES:
+                        self._pending[table] = batch[table] + self._pending[table]
+                    self._pending_rows += written
+                    self._oldest = time.monotonic()
+                raise
+            self._failed_attempts = 0
+            self.stats["rows_written"] += written
+            self.stats["flushes"] += 1
+            return written
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="result-write-buffer", daemon=True)
+                    self._thread.start()
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            oldest = self._oldest
+            if oldest is None:
+                continue
+            if self._pending_rows >= self.max_rows or time.monotonic() - oldest >= self.flush_interval:
+                try:
+                    self.flush()
+                except Exception as e:
+                    if self._failed_attempts:  # 0 once the batch was dropped (logged by flush)
+                        logger.warning(f"Write-behind flush failed, retrying "
+                                       f"(attempt {self._failed_attempts}/{self.max_attempts}): {e}")
+
+    def close(self) -> int:
+        """Stop the writer thread and flush what is left (retrying a failed batch)."""
+        self._closed = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+        attempt = 0
+        while True:
+            try:
+                return self.flush()
+            except Exception:
+                if not self._pending_rows:
+                    raise  # dropped after max_attempts
+                time.sleep(min(0.05 * 2 ** attempt, 1.0))
+                attempt += 1
+
+    def __enter__(self) -> "ResultWriteBuffer":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
 # Singleton
 db_manager = DatabaseManager()
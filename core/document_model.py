@@ -0,0 +1,356 @@
+# file: tbcv/core/document_model.py
+"""
+Shared parsed view of a markdown document.
+
+Validators used to re-split and re-scan the same content independently.
+DocumentModel parses a document once - lines and line offsets, headings,
+links, images, inline code and code fences in a single pass over the lines,
+frontmatter and regex-delimited fenced blocks on first access - and every
+consumer reads the precomputed spans.
+
+The routers attach the model to the validation context under the
+``"document"`` key; ``document_from_context()`` returns it (or builds one).
+Models are memoized by content hash, so validators that receive a context
+without a model, or run in another process, still parse each document once.
+Views are shared between readers and must be treated as read-only.
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import frontmatter
+except ImportError:
+    frontmatter = None
+
+import yaml
+
+CONTEXT_KEY = "document"
+
+_HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.+)$')
+_LINK_PATTERN = re.compile(r'!?\[([^\]]*)\]\(([^)]*)\)')
+_IMAGE_PATTERN = re.compile(r'!\[([^\]]*)\]\(([^)]*)\)')
+_INLINE_CODE_PATTERN = re.compile(r'`([^`]+)`')
+_FENCED_BLOCK_PATTERN = re.compile(r"```(\w+)?\s*\n([\s\S]*?)\n```")
+
+
+@dataclass(frozen=True)
+class Heading:
+    level: int
+    text: str
+    line: int  # 1-based
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"level": self.level, "text": self.text, "line": self.line}
+
+
+@dataclass(frozen=True)
+class Link:
+    line: int  # 1-based
+    text: str
+    url: str
+    is_image: bool
+    start: int  # absolute offsets into the content
+    end: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"line": self.line, "text": self.text, "url": self.url, "is_image": self.is_image}
+
+
+@dataclass
+class CodeFence:
+    """A ``` fence pair found line by line (an unclosed fence has end_line None)."""
+    start_line: int  # 1-based line of the opening fence
+    language: str
+    lines: List[str] = field(default_factory=list)
+    end_line: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"start_line": self.start_line, "end_line": self.end_line,
+                "language": self.language, "lines": list(self.lines)}
+
+
+@dataclass(frozen=True)
+class FencedBlock:
+    """A fenced block matched by ```lang\\n...\\n``` over the whole text."""
+    start: int
+    end: int
+    language: str
+    body: str
+
+
+class DocumentModel:
+    """
+    Parsed markdown document. Every view is computed at most once.
+
+    Semantics match the validators' original line-based scans: headings are
+    any stripped line matching ``#{1,6} text``, links are ``[text](url)`` (with
+    ``!`` marking images), and fences toggle on lines starting with ```.
+    """
+
+    def __init__(self, content: str, content_hash: Optional[str] = None):
+        self.content = content
+        self.content_hash = content_hash or content_digest(content)
+        self._lock = threading.Lock()
+        self._scanned = False
+
+    # ------------------------------------------------------------------
+    # Lines
+    # ------------------------------------------------------------------
+    @cached_property
+    def lines(self) -> List[str]:
+        return self.content.split('\n')
+
+    @cached_property
+    def line_offsets(self) -> List[int]:
+        """Absolute offset of the first character of each line."""
+        offsets = [0]
+        for line in self.lines[:-1]:
+            offsets.append(offsets[-1] + len(line) + 1)
+        return offsets
+
+    def line_of(self, offset: int) -> int:
+        """1-based line number containing an absolute offset."""
+        return bisect.bisect_right(self.line_offsets, offset)
+
+    @cached_property
+    def word_count(self) -> int:
+        return len(self.content.split())
+
+    # ------------------------------------------------------------------
+    # Single pass over lines
+    # ------------------------------------------------------------------
+    def _scan(self) -> None:
+        with self._lock:
+            if self._scanned:
+                return
+            headings: List[Heading] = []
+            heading_lines: List[int] = []
+            links: List[Link] = []
+            images: List[Tuple[int, str, str]] = []
+            inline_code: List[Tuple[int, str]] = []
+            fences: List[CodeFence] = []
+            current: Optional[CodeFence] = None
+
+            offsets = self.line_offsets
+            for i, line in enumerate(self.lines):
+                stripped = line.strip()
+                line_no = i + 1
+
+                is_fence = stripped.startswith('```')
+                if is_fence:
+                    if current is not None:
+                        current.end_line = line_no
+                        current = None
+                    else:
+                        current = CodeFence(start_line=line_no, language=stripped[3:].strip())
+                        fences.append(current)
+                elif current is not None:
+                    current.lines.append(line)
+
+                if stripped.startswith('#'):
+                    m = _HEADING_PATTERN.match(stripped)
+                    if m:
+                        headings.append(Heading(len(m.group(1)), m.group(2).strip(), line_no))
+                        heading_lines.append(i)
+
+                if '](' in line:
+                    base = offsets[i]
+                    for m in _LINK_PATTERN.finditer(line):
+                        links.append(Link(
+                            line=line_no,
+                            text=m.group(1),
+                            url=m.group(2),
+                            is_image=m.group(0).startswith('!'),
+                            start=base + m.start(),
+                            end=base + m.end(),
+                        ))
+                    if '![' in line:
+                        for alt, url in _IMAGE_PATTERN.findall(line):
+                            images.append((line_no, alt, url))
+
+                if not is_fence and '`' in line:
+                    for code_text in _INLINE_CODE_PATTERN.findall(line):
+                        inline_code.append((line_no, code_text))
+
+            self._headings = headings
+            self._heading_lines = heading_lines
+            self._links = links
+            self._images = images
+            self._inline_code = inline_code
+            self._fences = fences
+            self._scanned = True
+
+    @property
+    def headings(self) -> List[Heading]:
+        self._scan()
+        return self._headings
+
+    @property
+    def heading_line_indexes(self) -> List[int]:
+        """0-based indexes of heading lines."""
+        self._scan()
+        return self._heading_lines
+
+    @property
+    def links(self) -> List[Link]:
+        """All [text](url) and ![alt](url) occurrences, in document order."""
+        self._scan()
+        return self._links
+
+    @property
+    def images(self) -> List[Tuple[int, str, str]]:
+        """(line, alt, url) for every ![alt](url)."""
+        self._scan()
+        return self._images
+
+    @property
+    def inline_code(self) -> List[Tuple[int, str]]:
+        """(line, code) for every `code` span outside fence lines."""
+        self._scan()
+        return self._inline_code
+
+    @property
+    def fences(self) -> List[CodeFence]:
+        """Line-based fences, including a trailing unclosed one."""
+        self._scan()
+        return self._fences
+
+    @property
+    def code_blocks(self) -> List[CodeFence]:
+        """Closed line-based fences."""
+        return [f for f in self.fences if f.end_line is not None]
+
+    @property
+    def unclosed_fence(self) -> Optional[CodeFence]:
+        fences = self.fences
+        if fences and fences[-1].end_line is None:
+            return fences[-1]
+        return None
+
+    # ------------------------------------------------------------------
+    # Whole-text views
+    # ------------------------------------------------------------------
+    @cached_property
+    def fenced_blocks(self) -> List[FencedBlock]:
+        """Fenced blocks matched as ```lang\\n...\\n``` over the whole text."""
+        return [
+            FencedBlock(m.start(), m.end(), m.group(1) or "", m.group(2))
+            for m in _FENCED_BLOCK_PATTERN.finditer(self.content)
+        ]
+
+    @cached_property
+    def _frontmatter(self) -> Tuple[Dict[str, Any], str, Optional[Exception]]:
+        if frontmatter is None:
+            return {}, self.content, ImportError("python-frontmatter is not installed")
+        try:
+            post = frontmatter.loads(self.content)
+            return post.metadata, post.content, None
+        except Exception as e:
+            return {}, self.content, e
+
+    @property
+    def frontmatter(self) -> Dict[str, Any]:
+        """Frontmatter metadata (empty when missing or invalid)."""
+        return self._frontmatter[0]
+
+    @property
+    def body(self) -> str:
+        """Content without the frontmatter block."""
+        return self._frontmatter[1]
+
+    @property
+    def frontmatter_error(self) -> Optional[Exception]:
+        """The parse error, if the frontmatter could not be parsed."""
+        return self._frontmatter[2]
+
+    @cached_property
+    def yaml_split(self) -> Tuple[Optional[Dict[str, Any]], str]:
+        """
+        (yaml_data, markdown) using the plain '---' split of the ingestion
+        pipeline: the original content is kept when the YAML is invalid.
+        """
+        content = self.content
+        if content.startswith("---"):
+            parts = content.split("---", 2)
+            if len(parts) >= 3:
+                try:
+                    yaml_content = parts[1].strip()
+                    yaml_data = yaml.safe_load(yaml_content) if yaml_content else None
+                    return yaml_data, parts[2].lstrip()
+                except yaml.YAMLError:
+                    pass
+        return None, content
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Ship only the text across processes; views are rebuilt on demand
+        return {"content": self.content, "content_hash": self.content_hash}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state["content"], state["content_hash"])
+
+
+def content_digest(content: str) -> str:
+    """Hash used to memoize document models."""
+    return hashlib.sha256(content.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+class DocumentModelCache:
+    """Small LRU of document models keyed by content hash."""
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, DocumentModel]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, content: str) -> DocumentModel:
+        digest = content_digest(content)
+        with self._lock:
+            model = self._entries.get(digest)
+            if model is not None:
+                self._entries.move_to_end(digest)
+                self.hits += 1
+                return model
+            self.misses += 1
+            model = DocumentModel(content, digest)
+            self._entries[digest] = model
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return model
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_cache = DocumentModelCache()
+
+
+def get_document_model(content: str) -> DocumentModel:
+    """Get the (memoized) document model for content."""
+    return _cache.get(content)
+
+
+def document_from_context(content: str, context: Optional[Dict[str, Any]]) -> DocumentModel:
+    """
+    Return the document model attached to a validation context, building and
+    attaching it when missing or when it belongs to different content.
+    """
+    if context is not None:
+        model = context.get(CONTEXT_KEY)
+        if isinstance(model, DocumentModel) and (model.content is content or model.content == content):
+            return model
+    model = get_document_model(content)
+    if context is not None:
+        context[CONTEXT_KEY] = model
+    return model
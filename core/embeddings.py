@@ -10,7 +10,15 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
-from typing import List, Optional, Dict, Any
+import mmap
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
@@ -33,13 +41,333 @@ class EmbeddingResult:
     latency_ms: float = 0.0
 
 
+class PersistentEmbeddingCache:
+    """
+    On-disk embedding cache that survives restarts.
+
+    Vectors live in memory-mapped float32 slot files (one per dimension);
+    a SQLite index maps the (model, text hash) key to its slot. Lookups are
+    primary-key reads, eviction is true LRU on an access counter, and
+    evicted slots are recycled.
+
+    Each slot also carries a 64-bit tag of the key it holds (a parallel tag
+    file). Another process may evict and reuse a slot between our index read
+    and the vector read, and no SQLite transaction covers the mmap, so
+    writers clear the tag, write the vector and then set the new tag, and
+    readers accept a vector only if the tag matches before and after it.
+    """
+
+    _GROW_SLOTS = 1024
+    _TOUCH_FLUSH = 256
+
+    def __init__(self, path: str, max_entries: int = 200000, ttl_seconds: int = 0):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.path / "index.sqlite3"), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS embeddings (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                dim INTEGER NOT NULL,
+                slot INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_access INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_embeddings_lru ON embeddings(last_access);
+            CREATE INDEX IF NOT EXISTS idx_embeddings_slot ON embeddings(dim, slot);
+            CREATE TABLE IF NOT EXISTS free_slots (
+                dim INTEGER NOT NULL,
+                slot INTEGER NOT NULL,
+                PRIMARY KEY (dim, slot)
+            );
+        """)
+        self._conn.commit()
+
+        row = self._conn.execute("SELECT MAX(last_access), COUNT(*) FROM embeddings").fetchone()
+        self._clock = row[0] or 0
+        self._count = row[1] or 0
+        self._pending_touches: Dict[str, int] = {}
+        self._files: Dict[int, Tuple[Any, mmap.mmap, int]] = {}  # dim -> (file, mmap, slot capacity)
+        self._tag_files: Dict[int, Tuple[Any, mmap.mmap, int]] = {}
+        self._hits = 0
+        self._misses = 0
+
+    # -- slot files -----------------------------------------------------
+    def _slot_file(self, dim: int, min_slots: int = 0) -> mmap.mmap:
+        """Return the mmap for a dimension, growing the file to hold min_slots."""
+        return self._mapped(self._files, dim, self.path / f"vectors_{dim}.f32", dim * 4, min_slots)
+
+    def _tag_file(self, dim: int, min_slots: int = 0) -> mmap.mmap:
+        """Return the slot tag mmap for a dimension (8 bytes per slot)."""
+        return self._mapped(self._tag_files, dim, self.path / f"tags_{dim}.u64", 8, min_slots)
+
+    def _mapped(self, files: Dict[int, Tuple[Any, mmap.mmap, int]], dim: int, file_path: Path,
+                slot_bytes: int, min_slots: int) -> mmap.mmap:
+        entry = files.get(dim)
+        if entry is not None and entry[2] >= min_slots:
+            return entry[1]
+
+        if entry is None:
+            fh = open(file_path, "a+b")
+        else:
+            fh, mm, _ = entry
+            mm.close()
+        size = os.fstat(fh.fileno()).st_size
+        capacity = size // slot_bytes
+        if capacity < max(min_slots, 1):
+            capacity = max(min_slots, capacity) + self._GROW_SLOTS
+            fh.truncate(capacity * slot_bytes)
+        mm = mmap.mmap(fh.fileno(), capacity * slot_bytes)
+        files[dim] = (fh, mm, capacity)
+        return mm
+
+    @staticmethod
+    def _key_tag(key: str) -> bytes:
+        """Non-zero 8-byte tag of a key (all zeros marks a slot being written)."""
+        return hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest().replace(b"\0", b"\1")
+
+    def _read(self, dim: int, slot: int, key: str) -> Optional[List[float]]:
+        """Read one vector from its slot; None if the slot no longer holds key."""
+        mm = self._slot_file(dim, slot + 1)
+        tags = self._tag_file(dim, slot + 1)
+        tag = self._key_tag(key)
+        if tags[slot * 8:slot * 8 + 8] != tag:
+            return None
+        offset = slot * dim * 4
+        vector = array("f")
+        vector.frombytes(mm[offset:offset + dim * 4])
+        if tags[slot * 8:slot * 8 + 8] != tag:
+            return None
+        return vector.tolist()
+
+    def _write(self, dim: int, slot: int, key: str, embedding: List[float]) -> None:
+        """Write one vector into its slot and tag the slot with its key."""
+        mm = self._slot_file(dim, slot + 1)
+        tags = self._tag_file(dim, slot + 1)
+        tags[slot * 8:slot * 8 + 8] = bytes(8)
+        offset = slot * dim * 4
+        mm[offset:offset + dim * 4] = array("f", embedding).tobytes()
+        tags[slot * 8:slot * 8 + 8] = self._key_tag(key)
+
+    def _allocate_slot(self, dim: int) -> int:
+        """
+        Reuse a freed slot or take the next unused one.
+
+        Runs inside put_many's write transaction and reads the high-water
+        mark from the index every time: worker processes share the cache
+        directory, and a per-process counter would hand two of them the
+        same slot.
+        """
+        row = self._conn.execute("SELECT slot FROM free_slots WHERE dim = ? LIMIT 1", (dim,)).fetchone()
+        if row is not None:
+            self._conn.execute("DELETE FROM free_slots WHERE dim = ? AND slot = ?", (dim, row[0]))
+            return row[0]
+        used = self._conn.execute(
+            "SELECT MAX(COALESCE((SELECT MAX(slot) FROM embeddings WHERE dim = ?), -1), "
+            "COALESCE((SELECT MAX(slot) FROM free_slots WHERE dim = ?), -1))",
+            (dim, dim)
+        ).fetchone()[0]
+        return used + 1
+
+    # -- public API -----------------------------------------------------
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        """Bulk lookup; returns only the keys that were found."""
+        found: Dict[str, List[float]] = {}
+        if not keys:
+            return found
+        now = time.time()
+        with self._lock:
+            expired: List[str] = []
+            for chunk_start in range(0, len(keys), 500):
+                chunk = keys[chunk_start:chunk_start + 500]
+                rows = self._conn.execute(
+                    f"SELECT key, dim, slot, created_at FROM embeddings WHERE key IN ({','.join('?' * len(chunk))})",
+                    chunk
+                ).fetchall()
+                for key, dim, slot, created_at in rows:
+                    if self.ttl_seconds and now - created_at >= self.ttl_seconds:
+                        expired.append(key)
+                        continue
+                    vector = self._read(dim, slot, key)
+                    if vector is None:
+                        continue  # slot reused by another process since the index read
+                    found[key] = vector
+                    self._clock += 1
+                    self._pending_touches[key] = self._clock
+            if expired:
+                self._delete(expired)
+                self._conn.commit()
+            self._hits += len(found)
+            self._misses += len(set(keys)) - len(found)
+            if len(self._pending_touches) >= self._TOUCH_FLUSH:
+                self._flush_touches()
+                self._conn.commit()
+        return found
+
+    def get(self, key: str) -> Optional[List[float]]:
+        """Single-key lookup."""
+        return self.get_many([key]).get(key)
+
+    def put_many(self, items: List[Tuple[str, str, List[float]]]) -> None:
+        """
+        Store (key, model, embedding) items in one transaction.
+
+        The transaction is BEGIN IMMEDIATE, so it holds the database write
+        lock while slots are allocated and vectors written: no other process
+        can take the same slot, and a row only becomes visible (at commit)
+        after its vector is in place.
+        """
+        if not items:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.commit()
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Other processes may have added, evicted or touched entries
+                self._count, clock = self._conn.execute(
+                    "SELECT COUNT(*), COALESCE(MAX(last_access), 0) FROM embeddings"
+                ).fetchone()
+                self._clock = max(self._clock, clock)
+                self._flush_touches()
+                for key, model, embedding in items:
+                    dim = len(embedding)
+                    if not dim:
+                        continue
+                    row = self._conn.execute("SELECT dim, slot FROM embeddings WHERE key = ?", (key,)).fetchone()
+                    if row is not None and row[0] == dim:
+                        slot = row[1]
+                    else:
+                        if row is not None:
+                            self._delete([key])
+                        # Evict before allocating so the freed slot is reused
+                        self._evict_lru(reserve=1)
+                        slot = self._allocate_slot(dim)
+                    self._write(dim, slot, key, embedding)
+                    if row is None or row[0] != dim:
+                        self._count += 1
+                    self._clock += 1
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO embeddings (key, model, dim, slot, created_at, last_access) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (key, model, dim, slot, now, self._clock)
+                    )
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+
+    def put(self, key: str, model: str, embedding: List[float]) -> None:
+        """Store a single embedding."""
+        self.put_many([(key, model, embedding)])
+
+    def _flush_touches(self) -> None:
+        """Write buffered LRU access updates."""
+        if self._pending_touches:
+            self._conn.executemany(
+                "UPDATE embeddings SET last_access = ? WHERE key = ?",
+                [(clock, key) for key, clock in self._pending_touches.items()]
+            )
+            self._pending_touches.clear()
+
+    def _delete(self, keys: List[str]) -> None:
+        """Delete entries and release their slots."""
+        for key in keys:
+            row = self._conn.execute("SELECT dim, slot FROM embeddings WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                continue
+            self._conn.execute("DELETE FROM embeddings WHERE key = ?", (key,))
+            self._conn.execute("INSERT OR IGNORE INTO free_slots (dim, slot) VALUES (?, ?)", row)
+            self._pending_touches.pop(key, None)
+            self._count -= 1
+
+    def _evict_lru(self, reserve: int = 0) -> None:
+        """Drop least recently used entries so that reserve more fit under max_entries."""
+        overflow = self._count + reserve - self.max_entries
+        if overflow > 0:
+            victims = self._conn.execute(
+                "SELECT key FROM embeddings ORDER BY last_access LIMIT ?", (overflow,)
+            ).fetchall()
+            self._delete([v[0] for v in victims])
+
+    def count(self) -> int:
+        """Number of cached embeddings."""
+        return self._count
+
+    def flush(self) -> None:
+        """Persist pending LRU updates and dirty vector pages."""
+        with self._lock:
+            self._flush_touches()
+            self._conn.commit()
+            for _, mm, _ in list(self._files.values()) + list(self._tag_files.values()):
+                mm.flush()
+
+    def clear(self) -> None:
+        """Remove all cached embeddings and truncate the slot files."""
+        with self._lock:
+            self._conn.execute("DELETE FROM embeddings")
+            self._conn.execute("DELETE FROM free_slots")
+            self._conn.commit()
+            self._pending_touches.clear()
+            self._count = 0
+            for fh, mm, _ in list(self._files.values()) + list(self._tag_files.values()):
+                mm.close()
+                fh.truncate(0)
+                fh.close()
+            self._files.clear()
+            self._tag_files.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def close(self) -> None:
+        """Flush and release file handles."""
+        with self._lock:
+            self.flush()
+            for fh, mm, _ in list(self._files.values()) + list(self._tag_files.values()):
+                mm.close()
+                fh.close()
+            self._files.clear()
+            self._tag_files.clear()
+            self._conn.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        total = self._hits + self._misses
+        return {
+            "entries": self.count(),
+            "max_entries": self.max_entries,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / total if total > 0 else 0.0,
+            "path": str(self.path)
+        }
+
+
 class EmbeddingCache:
-    """In-memory cache for embeddings."""
+    """
+    In-memory LRU cache for embeddings.
+
+    Optionally backed by a PersistentEmbeddingCache: memory misses fall
+    through to disk and disk hits are promoted into memory.
+    """
 
-    def __init__(self, max_entries: int = 10000, ttl_seconds: int = 86400):
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        ttl_seconds: int = 86400,
+        persistent: Optional[PersistentEmbeddingCache] = None
+    ):
         self.max_entries = max_entries
         self.ttl_seconds = ttl_seconds
-        self._cache: Dict[str, tuple] = {}  # hash -> (embedding, timestamp)
+        self.persistent = persistent
+        self._cache: "OrderedDict[str, tuple]" = OrderedDict()  # hash -> (embedding, timestamp)
+        self._lock = threading.Lock()  # memory tier is used from worker threads
         self._hits = 0
         self._misses = 0
 
@@ -48,54 +376,99 @@ class EmbeddingCache:
         content = f"{model}:{text}"
         return hashlib.sha256(content.encode()).hexdigest()[:32]
 
+    def _get_memory(self, key: str) -> Optional[List[float]]:
+        """Memory-tier lookup; refreshes LRU position on hit."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        embedding, timestamp = entry
+        if datetime.now() - timestamp < timedelta(seconds=self.ttl_seconds):
+            self._cache.move_to_end(key)
+            return embedding
+        del self._cache[key]
+        return None
+
+    def _put_memory(self, key: str, embedding: List[float]):
+        """Insert into the memory tier, evicting the least recently used entries."""
+        if key in self._cache:
+            self._cache.move_to_end(key)
+        self._cache[key] = (embedding, datetime.now())
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
     def get(self, text: str, model: str) -> Optional[List[float]]:
         """Get cached embedding if exists and not expired."""
-        key = self._hash_text(text, model)
-        if key in self._cache:
-            embedding, timestamp = self._cache[key]
-            if datetime.now() - timestamp < timedelta(seconds=self.ttl_seconds):
-                self._hits += 1
-                return embedding
-            else:
-                del self._cache[key]
-        self._misses += 1
-        return None
+        return self.get_many([text], model)[0]
+
+    def get_many(self, texts: List[str], model: str) -> List[Optional[List[float]]]:
+        """
+        Look up many texts at once.
+
+        Memory is checked first; all memory misses go to the disk tier in a
+        single bulk lookup. Returns embeddings (or None) in input order.
+        """
+        keys = [self._hash_text(text, model) for text in texts]
+        with self._lock:
+            results: List[Optional[List[float]]] = [self._get_memory(key) for key in keys]
+
+        if self.persistent is not None:
+            missing = [key for key, result in zip(keys, results) if result is None]
+            if missing:
+                found = self.persistent.get_many(list(dict.fromkeys(missing)))
+                with self._lock:
+                    for i, key in enumerate(keys):
+                        if results[i] is None and key in found:
+                            results[i] = found[key]
+                            self._put_memory(key, found[key])
+
+        with self._lock:
+            for result in results:
+                if result is None:
+                    self._misses += 1
+                else:
+                    self._hits += 1
+        return results
 
     def put(self, text: str, model: str, embedding: List[float]):
         """Store embedding in cache."""
-        if len(self._cache) >= self.max_entries:
-            self._evict_oldest()
-        key = self._hash_text(text, model)
-        self._cache[key] = (embedding, datetime.now())
-
-    def _evict_oldest(self):
-        """Remove oldest entries to make room."""
-        if not self._cache:
-            return
-        # Remove 10% of oldest entries
-        sorted_keys = sorted(
-            self._cache.keys(),
-            key=lambda k: self._cache[k][1]
-        )
-        for key in sorted_keys[:max(1, len(sorted_keys) // 10)]:
-            del self._cache[key]
+        self.put_many([(text, embedding)], model)
+
+    def put_many(self, items: List[Tuple[str, List[float]]], model: str):
+        """Store (text, embedding) pairs; disk writes share one transaction."""
+        disk_items = []
+        with self._lock:
+            for text, embedding in items:
+                key = self._hash_text(text, model)
+                self._put_memory(key, embedding)
+                disk_items.append((key, model, embedding))
+        if self.persistent is not None:
+            try:
+                self.persistent.put_many(disk_items)
+            except Exception as e:
+                logger.warning(f"Failed to persist embeddings: {e}")
 
     def clear(self):
         """Clear all cached embeddings."""
-        self._cache.clear()
-        self._hits = 0
-        self._misses = 0
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+        if self.persistent is not None:
+            self.persistent.clear()
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
         total = self._hits + self._misses
-        return {
+        stats = {
             "entries": len(self._cache),
             "max_entries": self.max_entries,
             "hits": self._hits,
             "misses": self._misses,
             "hit_rate": self._hits / total if total > 0 else 0.0
         }
+        if self.persistent is not None:
+            stats["persistent"] = self.persistent.get_stats()
+        return stats
 
 
 class EmbeddingService:
@@ -121,13 +494,17 @@ class EmbeddingService:
         self.model = model or embedding_config.get("model", "nomic-embed-text")
         self.base_url = base_url or embedding_config.get("base_url", "http://localhost:11434")
         self.batch_size = embedding_config.get("batch_size", 100)
+        # Batched /api/embed requests allowed in flight at once
+        self.max_concurrent_batches = max(1, int(embedding_config.get("max_concurrent_batches", 2)))
+        self.batch_timeout_seconds = embedding_config.get("batch_timeout_seconds", 120)
 
         # Cache setup
         cache_config = self._config.get("cache", {})
         if cache_enabled and cache_config.get("enabled", True):
             self._cache = EmbeddingCache(
                 max_entries=cache_config.get("max_entries", 10000),
-                ttl_seconds=cache_config.get("ttl_seconds", 86400)
+                ttl_seconds=cache_config.get("ttl_seconds", 86400),
+                persistent=self._init_persistent_cache(cache_config.get("persistent", {}))
             )
         else:
             self._cache = None
@@ -135,6 +512,10 @@ class EmbeddingService:
         self._available: Optional[bool] = None
         self._dimension: Optional[int] = None
 
+        # Keep-alive HTTP session, bound to the event loop that created it
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
     def _load_config(self) -> Dict[str, Any]:
         """Load RAG configuration."""
         try:
@@ -145,6 +526,39 @@ class EmbeddingService:
             logger.warning(f"Failed to load RAG config: {e}")
             return {}
 
+    def _init_persistent_cache(self, persistent_config: Dict[str, Any]) -> Optional[PersistentEmbeddingCache]:
+        """Open the on-disk cache tier if enabled in config."""
+        if not isinstance(persistent_config, dict) or not persistent_config.get("enabled", False):
+            return None
+        try:
+            return PersistentEmbeddingCache(
+                path=persistent_config.get("path", "./data/cache/embeddings"),
+                max_entries=persistent_config.get("max_entries", 200000),
+                ttl_seconds=persistent_config.get("ttl_seconds", 0)
+            )
+        except Exception as e:
+            logger.warning(f"Persistent embedding cache unavailable, using memory only: {e}")
+            return None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared keep-alive session for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrent_batches * 4,
+                keepalive_timeout=60
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._session_loop = loop
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
     async def is_available(self) -> bool:
         """Check if embedding service is reachable."""
         if self._available is not None:
@@ -216,40 +630,40 @@ class EmbeddingService:
             )
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/api/embeddings",
-                    json={"model": self.model, "prompt": text},
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        embedding = data.get("embedding", [])
-
-                        # Cache the result
-                        if use_cache and self._cache and embedding:
-                            self._cache.put(text, self.model, embedding)
-
-                        # Track dimension
-                        if embedding and self._dimension is None:
-                            self._dimension = len(embedding)
-
-                        latency = (datetime.now() - start_time).total_seconds() * 1000
-
-                        return EmbeddingResult(
-                            embedding=embedding,
-                            text=text,
-                            model=self.model,
-                            latency_ms=latency
-                        )
-                    else:
-                        error_text = await resp.text()
-                        return EmbeddingResult(
-                            embedding=None,
-                            text=text,
-                            model=self.model,
-                            error=f"API error {resp.status}: {error_text}"
-                        )
+            session = await self._get_session()
+            async with session.post(
+                f"{self.base_url}/api/embeddings",
+                json={"model": self.model, "prompt": text},
+                timeout=aiohttp.ClientTimeout(total=30)
+            ) as resp:
+                if resp.status == 200:
+                    data = await resp.json()
+                    embedding = data.get("embedding", [])
+
+                    # Cache the result
+                    if use_cache and self._cache and embedding:
+                        self._cache.put(text, self.model, embedding)
+
+                    # Track dimension
+                    if embedding and self._dimension is None:
+                        self._dimension = len(embedding)
+
+                    latency = (datetime.now() - start_time).total_seconds() * 1000
+
+                    return EmbeddingResult(
+                        embedding=embedding,
+                        text=text,
+                        model=self.model,
+                        latency_ms=latency
+                    )
+                else:
+                    error_text = await resp.text()
+                    return EmbeddingResult(
+                        embedding=None,
+                        text=text,
+                        model=self.model,
+                        error=f"API error {resp.status}: {error_text}"
+                    )
 
         except asyncio.TimeoutError:
             return EmbeddingResult(
@@ -282,42 +696,122 @@ class EmbeddingService:
         Returns:
             List of EmbeddingResults in same order as input
         """
-        results: List[EmbeddingResult] = []
+        results: List[Optional[EmbeddingResult]] = [None] * len(texts)
         texts_to_embed: List[tuple] = []  # (index, text)
 
-        # Check cache first for all texts
-        for i, text in enumerate(texts):
-            if use_cache and self._cache:
-                cached = self._cache.get(text, self.model)
-                if cached is not None:
-                    results.append(EmbeddingResult(
-                        embedding=cached,
-                        text=text,
-                        model=self.model,
-                        cached=True
-                    ))
-                    continue
+        # One bulk cache lookup (memory, then disk) for the whole batch
+        cached_embeddings: List[Optional[List[float]]] = [None] * len(texts)
+        if use_cache and self._cache:
+            # SQLite and mmap I/O: keep it off the event loop
+            cached_embeddings = await asyncio.to_thread(self._cache.get_many, texts, self.model)
 
-            texts_to_embed.append((i, text))
-            results.append(None)  # Placeholder
+        for i, (text, cached) in enumerate(zip(texts, cached_embeddings)):
+            if cached is not None:
+                results[i] = EmbeddingResult(
+                    embedding=cached,
+                    text=text,
+                    model=self.model,
+                    cached=True
+                )
+            else:
+                texts_to_embed.append((i, text))
 
         # Generate embeddings for uncached texts
         if texts_to_embed:
-            # Process in batches
-            for batch_start in range(0, len(texts_to_embed), self.batch_size):
-                batch = texts_to_embed[batch_start:batch_start + self.batch_size]
-
-                # Generate embeddings concurrently within batch
-                tasks = [
-                    self.get_embedding(text, use_cache=use_cache)
-                    for _, text in batch
-                ]
-                batch_results = await asyncio.gather(*tasks)
+            if not await self.is_available():
+                for orig_index, text in texts_to_embed:
+                    results[orig_index] = EmbeddingResult(
+                        embedding=None,
+                        text=text,
+                        model=self.model,
+                        error="Embedding service not available"
+                    )
+                return results
+
+            # One /api/embed request per batch, bounded number in flight
+            semaphore = asyncio.Semaphore(self.max_concurrent_batches)
+
+            async def embed_one(text: str) -> EmbeddingResult:
+                async with semaphore:
+                    return await self.get_embedding(text, use_cache=False)
+
+            async def run_batch(batch: List[tuple]):
+                batch_texts = [text for _, text in batch]
+                async with semaphore:
+                    batch_results = await self._embed_batch(batch_texts)
+
+                # Items the batch request missed are retried one by one; the
+                # batch slot is released first and each retry takes a slot of
+                # its own, so fallbacks share the same in-flight bound
+                failed = [i for i, result in enumerate(batch_results) if result is None]
+                if failed:
+                    logger.debug(f"Falling back to per-text embedding for {len(failed)}/{len(batch)} texts")
+                    fallback = await asyncio.gather(*[embed_one(batch_texts[i]) for i in failed])
+                    for i, result in zip(failed, fallback):
+                        batch_results[i] = result
 
                 # Place results in correct positions
                 for (orig_index, _), result in zip(batch, batch_results):
                     results[orig_index] = result
 
+                # Store the whole batch in one cache write
+                if use_cache and self._cache:
+                    await asyncio.to_thread(
+                        self._cache.put_many,
+                        [(r.text, r.embedding) for r in batch_results if r.embedding],
+                        self.model
+                    )
+
+            await asyncio.gather(*[
+                run_batch(texts_to_embed[batch_start:batch_start + self.batch_size])
+                for batch_start in range(0, len(texts_to_embed), self.batch_size)
+            ])
+
+        return results
+
+    async def _embed_batch(self, texts: List[str]) -> List[Optional[EmbeddingResult]]:
+        """
+        Embed a chunk of texts with a single /api/embed request.
+
+        Items missing from the response (or the whole chunk, if the request
+        fails) are None; the caller retries them one by one.
+        """
+        start_time = time.perf_counter()
+        embeddings: List[Any] = []
+        try:
+            session = await self._get_session()
+            async with session.post(
+                f"{self.base_url}/api/embed",
+                json={"model": self.model, "input": texts},
+                timeout=aiohttp.ClientTimeout(total=self.batch_timeout_seconds)
+            ) as resp:
+                if resp.status == 200:
+                    data = await resp.json()
+                    embeddings = data.get("embeddings") or []
+                else:
+                    error_text = await resp.text()
+                    logger.warning(f"Batch embedding API error {resp.status}: {error_text}")
+        except asyncio.TimeoutError:
+            logger.warning(f"Batch embedding request timed out ({len(texts)} texts)")
+        except Exception as e:
+            logger.warning(f"Batch embedding request failed: {e}")
+
+        latency = (time.perf_counter() - start_time) * 1000
+        results: List[Optional[EmbeddingResult]] = []
+        for i, text in enumerate(texts):
+            embedding = embeddings[i] if i < len(embeddings) else None
+            if embedding:
+                if self._dimension is None:
+                    self._dimension = len(embedding)
+                results.append(EmbeddingResult(
+                    embedding=embedding,
+                    text=text,
+                    model=self.model,
+                    latency_ms=latency / len(texts)
+                ))
+            else:
+                results.append(None)
+
         return results
 
     def get_dimension(self) -> Optional[int]:
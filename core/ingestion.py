@@ -4,8 +4,8 @@ Recursive markdown file ingestion and validation for TBCV system.
 Handles discovery, parsing, and validation of markdown files with YAML front-matter.
 """
 
+import copy
 import json
-import yaml
 import re
 import uuid
 from datetime import datetime
@@ -16,6 +16,7 @@ from .io_win import read_text, list_markdown_files
 from .family_detector import family_detector
 from .rule_manager import RuleManager
 from .database import DatabaseManager
+from .document_model import get_document_model
 
 
 class MarkdownIngestion:
@@ -160,22 +161,10 @@ class MarkdownIngestion:
         Returns:
             Tuple of (yaml_data, markdown_content)
         """
-        yaml_data = None
-        markdown_content = content
-        
-        if content.startswith("---"):
-            parts = content.split("---", 2)
-            if len(parts) >= 3:
-                try:
-                    yaml_content = parts[1].strip()
-                    if yaml_content:
-                        yaml_data = yaml.safe_load(yaml_content)
-                    markdown_content = parts[2].lstrip()
-                except yaml.YAMLError:
-                    # Keep original content if YAML parsing fails
-                    pass
-        
-        return yaml_data, markdown_content
+        # Shared document model: keeps the original content if YAML parsing fails.
+        # The parsed YAML is shared with other readers, so hand out a copy.
+        yaml_data, markdown_content = get_document_model(content).yaml_split
+        return copy.deepcopy(yaml_data), markdown_content
     
     def _validate_yaml(self, yaml_data: Dict[str, Any], family: Optional[str]) -> Dict[str, Any]:
         """
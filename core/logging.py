@@ -11,13 +11,16 @@ How to use:
 1) Call setup_logging() once in your program's entry point.
 2) Get a logger with get_logger("module_or_component_name")
 3) Optionally inherit LoggerMixin to auto-wire a structlog logger per class.
-4) Use PerformanceLogger or @log_performance to time critical operations.
+4) Use PerformanceLogger or @log_performance to time critical operations;
+   timings go to the core.metrics registry, per-call logs are sampled.
 """
 
 from __future__ import annotations
 
 import sys
 import json
+import time
+import random
 import logging
 from logging import Handler
 from logging.handlers import RotatingFileHandler
@@ -34,6 +37,7 @@ except ImportError:
 
 # Import settings from our config module
 from .config import get_settings
+from .metrics import metrics_registry
 
 
 # =========================
@@ -384,43 +388,56 @@ class LoggerMixin:
 
 class PerformanceLogger:
     """
-    Context manager that logs start/completion and wall-clock duration in ms.
+    Context manager that times an operation into the metrics registry.
 
     Usage:
         with PerformanceLogger(get_logger("tbcv.workflow"), "validate_content") as perf:
             # ... do work ...
             perf.add_context(files=3, issues=0)
 
-    If an exception occurs, it logs an error with duration and exception metadata.
+    Every call is recorded in core.metrics (latency histogram per operation,
+    error counter). Start/completion log records are only written for a
+    sample of calls (performance.log_sample_rate, 0 by default, or the
+    sample_rate argument); failures are always logged as errors.
     """
 
-    def __init__(self, logger: structlog.BoundLogger, operation: str):
+    __slots__ = ("logger", "operation", "sample_rate", "start_time", "context", "_t0", "_sampled")
+
+    def __init__(self, logger: structlog.BoundLogger, operation: str, sample_rate: Optional[float] = None):
         self.logger = logger
         self.operation = operation
+        self.sample_rate = sample_rate
         self.start_time: Optional[datetime] = None
         self.context: Dict[str, Any] = {}
+        self._t0 = 0.0
+        self._sampled = False
 
     def __enter__(self) -> "PerformanceLogger":
-        self.start_time = datetime.now(timezone.utc)
-        self.logger.info(
-            f"Starting {self.operation}",
-            operation=self.operation,
-            started_at=self.start_time.isoformat(timespec="milliseconds"),
-        )
+        rate = self.sample_rate if self.sample_rate is not None else _perf_log_sample_rate()
+        self._sampled = rate > 0 and (rate >= 1 or random.random() < rate)
+        if self._sampled:
+            self.start_time = datetime.now(timezone.utc)
+            self.logger.info(
+                f"Starting {self.operation}",
+                operation=self.operation,
+                started_at=self.start_time.isoformat(timespec="milliseconds"),
+            )
+        self._t0 = time.perf_counter()
         return self
 
     def __exit__(self, exc_type, exc_val, _exc_tb) -> None:
-        end_time = datetime.now(timezone.utc)
-        duration_ms = (end_time - (self.start_time or end_time)).total_seconds() * 1000.0
+        duration_ms = (time.perf_counter() - self._t0) * 1000.0
+        metrics_registry.observe_operation(self.operation, duration_ms, error=exc_type is not None)
 
         if exc_type is None:
-            self.logger.info(
-                f"Completed {self.operation}",
-                operation=self.operation,
-                duration_ms=round(duration_ms, 2),
-                completed_at=end_time.isoformat(timespec="milliseconds"),
-                **self.context,
-            )
+            if self._sampled:
+                self.logger.info(
+                    f"Completed {self.operation}",
+                    operation=self.operation,
+                    duration_ms=round(duration_ms, 2),
+                    completed_at=datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+                    **self.context,
+                )
         else:
             self.logger.error(
                 f"Failed {self.operation}",
@@ -436,9 +453,16 @@ class PerformanceLogger:
         self.context.update(kwargs)
 
 
+def _perf_log_sample_rate() -> float:
+    try:
+        return float(get_settings().performance.log_sample_rate)
+    except Exception:
+        return 0.0
+
+
 def log_performance(operation: str) -> Callable:
     """
-    Decorator that logs the duration of a function call using PerformanceLogger.
+    Decorator that records the duration of a function call using PerformanceLogger.
 
     Example:
         @log_performance("detect_plugins")
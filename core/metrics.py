@@ -0,0 +1,285 @@
+# file: tbcv/core/metrics.py
+"""
+In-process metrics registry: counters and fixed-bucket latency histograms.
+
+PerformanceLogger used to emit two structlog INFO records per timed call,
+and it wraps every cache get/put and agent message, so timing alone
+produced hundreds of log lines per validated file. Timings now go here
+instead; per-call logs are an opt-in sample (performance.log_sample_rate).
+
+Recording is lock-free on the hot path: each thread increments its own
+shard of a metric (a plain list), and readers merge the shards. The only
+lock is taken when a thread touches a metric for the first time.
+Histograms use fixed buckets (milliseconds), so p50/p95/p99 are estimates
+interpolated within a bucket, and memory stays constant however many
+observations are recorded.
+
+Metrics are keyed by name and labels::
+
+    registry.histogram("operation_duration_ms", operation="cache_get").observe(1.7)
+    registry.counter("operation_errors_total", operation="cache_get").inc()
+
+``registry.summary()`` feeds /admin/reports/performance and
+``registry.render_prometheus()`` the /metrics endpoint.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import weakref
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Upper bounds in milliseconds; observations above the last one land in +Inf
+DEFAULT_BUCKETS_MS: Tuple[float, ...] = (
+    0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500,
+    1000, 2500, 5000, 10000, 30000, 60000,
+)
+
+OPERATION_DURATION = "operation_duration_ms"
+OPERATION_ERRORS = "operation_errors_total"
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class _Sharded:
+    """
+    Per-thread shards; the owning thread is the only writer of its shard.
+
+    A thread that has exited can no longer write, so its shard is folded into
+    a base shard (under the lock) the next time shards are collected or a new
+    one is registered; worker-pool churn does not grow the shard list.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards: List[Tuple[weakref.ref, list]] = []
+        self._base = self._new_shard()
+        self._lock = threading.Lock()
+
+    def _new_shard(self) -> list:
+        raise NotImplementedError
+
+    def _merge(self, into: list, shard: list) -> None:
+        raise NotImplementedError
+
+    def _shard(self) -> list:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._new_shard()
+            self._local.shard = shard
+            with self._lock:
+                self._reclaim()
+                self._shards.append((weakref.ref(threading.current_thread()), shard))
+        return shard
+
+    def _reclaim(self) -> None:
+        """Fold the shards of exited threads into the base shard; caller holds the lock."""
+        live = []
+        for ref, shard in self._shards:
+            thread = ref()
+            if thread is None or not thread.is_alive():
+                self._merge(self._base, shard)
+            else:
+                live.append((ref, shard))
+        self._shards = live
+
+    def _all_shards(self) -> List[list]:
+        with self._lock:
+            self._reclaim()
+            # Copy the base so readers never see it change under them
+            return [list(self._base)] + [shard for _, shard in self._shards]
+
+
+class Counter(_Sharded):
+    """Monotonic counter."""
+
+    def _new_shard(self) -> list:
+        return [0.0]
+
+    def _merge(self, into: list, shard: list) -> None:
+        into[0] += shard[0]
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._shard()[0] += amount
+
+    @property
+    def value(self) -> float:
+        return sum(shard[0] for shard in self._all_shards())
+
+
+class Histogram(_Sharded):
+    """Fixed-bucket histogram of durations in milliseconds."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS_MS):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__()
+
+    def _new_shard(self) -> list:
+        # bucket counts (+Inf last), then sum, then max
+        return [0] * (len(self.buckets) + 1) + [0.0, 0.0]
+
+    def _merge(self, into: list, shard: list) -> None:
+        for i in range(len(into) - 1):
+            into[i] += shard[i]
+        into[-1] = max(into[-1], shard[-1])
+
+    def observe(self, value_ms: float) -> None:
+        shard = self._shard()
+        shard[bisect_left(self.buckets, value_ms)] += 1
+        shard[-2] += value_ms
+        if value_ms > shard[-1]:
+            shard[-1] = value_ms
+
+    def snapshot(self) -> Dict[str, object]:
+        """Merged bucket counts, count, sum and max."""
+        n = len(self.buckets) + 1
+        counts = [0] * n
+        total = 0.0
+        maximum = 0.0
+        for shard in self._all_shards():
+            for i in range(n):
+                counts[i] += shard[i]
+            total += shard[-2]
+            maximum = max(maximum, shard[-1])
+        return {"counts": counts, "count": sum(counts), "sum": total, "max": maximum}
+
+    def quantile(self, q: float, snapshot: Optional[Dict[str, object]] = None) -> float:
+        """Estimate the q-quantile (0..1) by interpolating within its bucket."""
+        snap = snapshot or self.snapshot()
+        count = snap["count"]
+        if not count:
+            return 0.0
+        rank = q * count
+        seen = 0
+        for i, bucket_count in enumerate(snap["counts"]):
+            if bucket_count and seen + bucket_count >= rank:
+                # Never report more than the largest value actually observed
+                upper = min(self.buckets[i] if i < len(self.buckets) else snap["max"], snap["max"])
+                lower = min(self.buckets[i - 1] if i > 0 else 0.0, upper)
+                return lower + (upper - lower) * ((rank - seen) / bucket_count)
+            seen += bucket_count
+        return float(snap["max"])
+
+
+class MetricsRegistry:
+    """Process-wide collection of named, labelled counters and histograms."""
+
+    def __init__(self, prefix: str = "tbcv"):
+        self.prefix = prefix
+        self._counters: Dict[Tuple[str, LabelKey], Counter] = {}
+        self._histograms: Dict[Tuple[str, LabelKey], Histogram] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(name: str, labels: Dict[str, str]) -> Tuple[str, LabelKey]:
+        return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+    def counter(self, name: str, **labels: str) -> Counter:
+        key = self._key(name, labels)
+        metric = self._counters.get(key)
+        if metric is None:
+            with self._lock:
+                metric = self._counters.setdefault(key, Counter())
+        return metric
+
+    def histogram(self, name: str, buckets: Sequence[float] = DEFAULT_BUCKETS_MS, **labels: str) -> Histogram:
+        key = self._key(name, labels)
+        metric = self._histograms.get(key)
+        if metric is None:
+            with self._lock:
+                metric = self._histograms.setdefault(key, Histogram(buckets))
+        return metric
+
+    def observe_operation(self, operation: str, duration_ms: float, error: bool = False) -> None:
+        """Record one timed operation (and its failure, if any)."""
+        self.histogram(OPERATION_DURATION, operation=operation).observe(duration_ms)
+        if error:
+            self.counter(OPERATION_ERRORS, operation=operation).inc()
+
+    def summary(self, name: str = OPERATION_DURATION, label: str = "operation") -> Dict[str, Dict[str, float]]:
+        """
+        Latency summary per label value of one histogram family.
+
+        Returns:
+            {label_value: {count, avg_ms, p50_ms, p95_ms, p99_ms, max_ms, errors}}
+        """
+        with self._lock:
+            histograms = [(dict(k[1]), h) for k, h in self._histograms.items() if k[0] == name]
+            errors = {dict(k[1]).get(label): c for k, c in self._counters.items() if k[0] == OPERATION_ERRORS}
+        result: Dict[str, Dict[str, float]] = {}
+        for labels, histogram in histograms:
+            snap = histogram.snapshot()
+            if not snap["count"]:
+                continue
+            value = labels.get(label, "")
+            error_counter = errors.get(value)
+            result[value] = {
+                "count": snap["count"],
+                "avg_ms": round(snap["sum"] / snap["count"], 3),
+                "p50_ms": round(histogram.quantile(0.50, snap), 3),
+                "p95_ms": round(histogram.quantile(0.95, snap), 3),
+                "p99_ms": round(histogram.quantile(0.99, snap), 3),
+                "max_ms": round(snap["max"], 3),
+                "errors": int(error_counter.value) if error_counter else 0,
+            }
+        return dict(sorted(result.items()))
+
+    def render_prometheus(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted(self._histograms.items(), key=lambda item: item[0])
+
+        lines: List[str] = []
+        typed = set()
+        for (name, labels), counter in counters:
+            full = f"{self.prefix}_{name}"
+            if full not in typed:
+                lines.append(f"# TYPE {full} counter")
+                typed.add(full)
+            lines.append(f"{full}{_format_labels(labels)} {_format_value(counter.value)}")
+
+        for (name, labels), histogram in histograms:
+            full = f"{self.prefix}_{name}"
+            if full not in typed:
+                lines.append(f"# TYPE {full} histogram")
+                typed.add(full)
+            snap = histogram.snapshot()
+            cumulative = 0
+            bounds = [_format_value(b) for b in histogram.buckets] + ["+Inf"]
+            for bound, bucket_count in zip(bounds, snap["counts"]):
+                cumulative += bucket_count
+                lines.append(f"{full}_bucket{_format_labels(labels + (('le', bound),))} {cumulative}")
+            lines.append(f"{full}_sum{_format_labels(labels)} {_format_value(snap['sum'])}")
+            lines.append(f"{full}_count{_format_labels(labels)} {snap['count']}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Drop every metric (tests, admin resets)."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+
+def _format_labels(labels: LabelKey) -> str:
+    if not labels:
+        return ""
+    pairs = []
+    for key, value in labels:
+        value = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        pairs.append(f'{key}="{value}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+# Global registry
+metrics_registry = MetricsRegistry()
@@ -1,8 +1,15 @@
 # file: core/ollama.py
 """
 Unified Ollama LLM integration for all agents.
-Uses only Python standard library (urllib.request) for HTTP calls.
-Provides synchronous and asynchronous interfaces for compatibility.
+Synchronous calls use only the Python standard library (urllib.request).
+Asynchronous calls go through a pooled aiohttp transport (keep-alive
+connections, per-host concurrency limit, streaming, timing metrics) and
+fall back to running the synchronous call in a thread when aiohttp is not
+installed.
+
+Identical concurrent generate/chat calls (same server, model, prompt or
+messages and options) are coalesced through the "llm" single-flight group:
+one request goes to Ollama and every caller receives its response.
 """
 
 import os
@@ -10,14 +17,26 @@ import json
 import time
 import logging
 import asyncio
-from typing import Dict, List, Any, Optional, Union
+import weakref
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Union, AsyncIterator, Tuple
 from urllib.request import Request, urlopen
 from urllib.parse import urljoin
 from urllib.error import URLError, HTTPError
 import threading
 
+from core.single_flight import group as single_flight_group
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
 logger = logging.getLogger(__name__)
 
+# Identical in-flight generate/chat requests share one Ollama call
+llm_flights = single_flight_group("llm")
+
 
 class OllamaError(Exception):
     """Base exception for Ollama-related errors."""
@@ -34,6 +53,191 @@ class OllamaAPIError(OllamaError):
     pass
 
 
+@dataclass
+class EndpointStats:
+    """Timing counters for one API endpoint."""
+    requests: int = 0
+    errors: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    total_wait_ms: float = 0.0
+    first_chunk_ms: float = 0.0  # last observed time-to-first-chunk (streaming)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "avg_ms": round(self.total_ms / self.requests, 2) if self.requests else 0.0,
+            "max_ms": round(self.max_ms, 2),
+            "avg_wait_ms": round(self.total_wait_ms / self.requests, 2) if self.requests else 0.0,
+            "first_chunk_ms": round(self.first_chunk_ms, 2),
+        }
+
+
+class AsyncOllamaTransport:
+    """
+    Pooled async HTTP transport for the Ollama API.
+
+    - One keep-alive aiohttp session per event loop
+    - Per-host concurrency limit (requests beyond it wait their turn)
+    - JSON and NDJSON-streaming requests
+    - Per-endpoint timing metrics (latency, wait time, time-to-first-chunk)
+    """
+
+    def __init__(self, base_url: str, timeout: int = 30, max_connections: int = 8, max_concurrent: int = 4):
+        self.base_url = base_url if base_url.endswith('/') else base_url + '/'
+        self.timeout = timeout
+        self.max_connections = max(1, max_connections)
+        self.max_concurrent = max(1, max_concurrent)
+        self._per_loop: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Tuple[Any, asyncio.Semaphore]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        self._stats: Dict[str, EndpointStats] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def _loop_state(self) -> Tuple[Any, asyncio.Semaphore]:
+        """Session and semaphore bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            state = self._per_loop.get(loop)
+            if state is None or state[0].closed:
+                connector = aiohttp.TCPConnector(
+                    limit=self.max_connections,
+                    limit_per_host=self.max_connections,
+                    keepalive_timeout=60
+                )
+                session = aiohttp.ClientSession(
+                    connector=connector,
+                    timeout=aiohttp.ClientTimeout(total=self.timeout)
+                )
+                state = (session, asyncio.Semaphore(self.max_concurrent))
+                self._per_loop[loop] = state
+            return state
+
+    def _record(self, endpoint: str, elapsed_ms: float, wait_ms: float, error: bool,
+                first_chunk_ms: Optional[float] = None) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(endpoint, EndpointStats())
+            stats.requests += 1
+            stats.total_ms += elapsed_ms
+            stats.total_wait_ms += wait_ms
+            stats.max_ms = max(stats.max_ms, elapsed_ms)
+            if error:
+                stats.errors += 1
+            if first_chunk_ms is not None:
+                stats.first_chunk_ms = first_chunk_ms
+
+    def _enter(self) -> None:
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def _exit(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    @staticmethod
+    def _map_error(url: str, exc: Exception) -> OllamaError:
+        if isinstance(exc, OllamaError):
+            return exc
+        if isinstance(exc, asyncio.TimeoutError):
+            return OllamaConnectionError(f"Timed out calling Ollama at {url}")
+        if isinstance(exc, aiohttp.ClientConnectionError):
+            return OllamaConnectionError(f"Cannot connect to Ollama at {url}: {exc}")
+        if isinstance(exc, (json.JSONDecodeError, aiohttp.ContentTypeError)):
+            return OllamaAPIError(f"Invalid JSON response: {exc}")
+        return OllamaError(f"Unexpected error: {exc}")
+
+    async def request(self, endpoint: str, data: Optional[Dict[str, Any]] = None,
+                      method: str = "POST") -> Dict[str, Any]:
+        """Send one request and return the decoded JSON body."""
+        url = urljoin(self.base_url, endpoint)
+        session, semaphore = self._loop_state()
+        queued = time.perf_counter()
+        async with semaphore:
+            started = time.perf_counter()
+            self._enter()
+            error = True
+            try:
+                if method.upper() == "GET":
+                    ctx = session.get(url, headers={'Accept': 'application/json'})
+                else:
+                    ctx = session.post(url, json=data or {}, headers={'Accept': 'application/json'})
+                async with ctx as response:
+                    body = await response.text()
+                    if response.status >= 400:
+                        logger.warning(f"Ollama HTTP error {response.status}: {response.reason}")
+                        raise OllamaAPIError(f"Ollama API error {response.status}: {response.reason}")
+                    result = json.loads(body)
+                error = False
+                return result
+            except Exception as e:
+                mapped = self._map_error(url, e)
+                if mapped is not e:
+                    logger.warning(f"Ollama request to {endpoint} failed: {e}")
+                raise mapped from e
+            finally:
+                self._exit()
+                now = time.perf_counter()
+                self._record(endpoint, (now - started) * 1000, (started - queued) * 1000, error)
+
+    async def stream(self, endpoint: str, data: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """POST a streaming request and yield each NDJSON chunk as it arrives."""
+        url = urljoin(self.base_url, endpoint)
+        session, semaphore = self._loop_state()
+        queued = time.perf_counter()
+        async with semaphore:
+            started = time.perf_counter()
+            first_chunk_ms: Optional[float] = None
+            self._enter()
+            error = True
+            try:
+                async with session.post(url, json=data, headers={'Accept': 'application/x-ndjson'}) as response:
+                    if response.status >= 400:
+                        logger.warning(f"Ollama HTTP error {response.status}: {response.reason}")
+                        raise OllamaAPIError(f"Ollama API error {response.status}: {response.reason}")
+                    async for raw_line in response.content:
+                        line = raw_line.strip()
+                        if not line:
+                            continue
+                        if first_chunk_ms is None:
+                            first_chunk_ms = (time.perf_counter() - started) * 1000
+                        chunk = json.loads(line)
+                        if chunk.get("error"):
+                            raise OllamaAPIError(f"Ollama stream error: {chunk['error']}")
+                        yield chunk
+                error = False
+            except Exception as e:
+                mapped = self._map_error(url, e)
+                if mapped is not e:
+                    logger.warning(f"Ollama stream from {endpoint} failed: {e}")
+                raise mapped from e
+            finally:
+                self._exit()
+                now = time.perf_counter()
+                self._record(endpoint, (now - started) * 1000, (started - queued) * 1000, error, first_chunk_ms)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Snapshot of request timing metrics."""
+        with self._lock:
+            return {
+                "in_flight": self.in_flight,
+                "max_in_flight": self.max_in_flight,
+                "max_concurrent": self.max_concurrent,
+                "endpoints": {name: stats.to_dict() for name, stats in self._stats.items()},
+            }
+
+    async def close(self) -> None:
+        """Close the session owned by the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            state = self._per_loop.pop(loop, None)
+        if state is not None and not state[0].closed:
+            await state[0].close()
+
+
 class Ollama:
     """
     Unified Ollama integration using only Python standard library.
@@ -49,10 +253,13 @@ class Ollama:
     - OLLAMA_MODEL (default: mistral)
     - OLLAMA_TIMEOUT (default: 30)
     - OLLAMA_ENABLED (default: true)
+    - OLLAMA_MAX_CONNECTIONS (default: 8) - pooled keep-alive connections for async calls
+    - OLLAMA_MAX_CONCURRENT (default: 4) - async requests in flight per host
     """
     
     def __init__(self, base_url: Optional[str] = None, model: Optional[str] = None, 
-                 timeout: Optional[int] = None, enabled: Optional[bool] = None):
+                 timeout: Optional[int] = None, enabled: Optional[bool] = None,
+                 max_connections: Optional[int] = None, max_concurrent: Optional[int] = None):
         """
         Initialize Ollama client.
         
@@ -61,15 +268,22 @@ class Ollama:
             model: Default model name (overrides OLLAMA_MODEL)
             timeout: Request timeout in seconds (overrides OLLAMA_TIMEOUT)
             enabled: Whether Ollama is enabled (overrides OLLAMA_ENABLED)
+            max_connections: Async connection pool size (overrides OLLAMA_MAX_CONNECTIONS)
+            max_concurrent: Async per-host concurrency limit (overrides OLLAMA_MAX_CONCURRENT)
         """
         self.base_url = base_url or os.getenv('OLLAMA_BASE_URL', 'http://127.0.0.1:11434')
         self.model = model or os.getenv('OLLAMA_MODEL', 'mistral')
         self.timeout = timeout or int(os.getenv('OLLAMA_TIMEOUT', '30'))
         self.enabled = enabled if enabled is not None else os.getenv('OLLAMA_ENABLED', 'true').lower() == 'true'
         
+        self.max_connections = max_connections or int(os.getenv('OLLAMA_MAX_CONNECTIONS', '8'))
+        self.max_concurrent = max_concurrent or int(os.getenv('OLLAMA_MAX_CONCURRENT', '4'))
+        
         # Ensure base_url ends with /
         if not self.base_url.endswith('/'):
             self.base_url += '/'
+
+        self._transport: Optional[AsyncOllamaTransport] = None
     
     def _make_request(self, endpoint: str, data: Dict[str, Any], method: str = "POST") -> Dict[str, Any]:
         """
@@ -152,7 +366,8 @@ class Ollama:
             "options": options or {}
         }
         
-        return self._make_request("api/generate", payload)
+        key = self._flight_key("generate", prompt, model, options)
+        return llm_flights.do_sync(key, lambda: self._make_request("api/generate", payload))
     
     def chat(self, model: Optional[str] = None, messages: List[Dict[str, str]] = None,
              stream: bool = False, options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -178,8 +393,22 @@ class Ollama:
             "options": options or {}
         }
         
-        return self._make_request("api/chat", payload)
+        key = self._flight_key("chat", json.dumps(messages, sort_keys=True), model, options)
+        return llm_flights.do_sync(key, lambda: self._make_request("api/chat", payload))
     
+    def _flight_key(self, endpoint: str, prompt: str, model: str, options: Optional[Dict[str, Any]]) -> str:
+        """Single-flight key: ValidationCache.llm_cache_key plus server, priority lane and the remaining options."""
+        from core.cache import canonical_hash, validation_cache
+        from core.priority import current_lane
+
+        options = dict(options or {})
+        temperature = options.pop("temperature", None)
+        key = validation_cache.llm_cache_key(prompt, model, float(temperature if temperature is not None else 0.1))
+        if temperature is None or options:
+            options["temperature"] = temperature
+            key += ":" + canonical_hash(options).hex()[:16]
+        return f"{endpoint}:{self.base_url}:{current_lane()}:{key}"
+
     def embed(self, model: Optional[str] = None, inputs: Union[str, List[str]] = None) -> Dict[str, Any]:
         """
         Generate embeddings using Ollama.
@@ -247,40 +476,169 @@ class Ollama:
             logger.debug(f"Ollama availability check failed: {e}")
             return False
     
-    # Async compatibility methods
+    # Async methods (pooled transport)
+    @property
+    def transport(self) -> Optional[AsyncOllamaTransport]:
+        """Shared async transport, created on first use (None without aiohttp)."""
+        if aiohttp is None:
+            return None
+        if self._transport is None or self._transport.base_url != self.base_url:
+            self._transport = AsyncOllamaTransport(
+                self.base_url, timeout=self.timeout,
+                max_connections=self.max_connections, max_concurrent=self.max_concurrent
+            )
+        return self._transport
+
+    async def _make_async_request(self, endpoint: str, data: Dict[str, Any], method: str = "POST") -> Dict[str, Any]:
+        """Async counterpart of _make_request using the pooled transport."""
+        if not self.enabled:
+            raise OllamaError("Ollama is disabled")
+        transport = self.transport
+        if transport is None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._make_request, endpoint, data, method)
+        return await transport.request(endpoint, data, method)
+
+    async def _stream_async_request(self, endpoint: str, data: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """Yield streamed chunks; without aiohttp the full response is yielded as one chunk."""
+        if not self.enabled:
+            raise OllamaError("Ollama is disabled")
+        transport = self.transport
+        if transport is None:
+            loop = asyncio.get_running_loop()
+            yield await loop.run_in_executor(None, self._make_request, endpoint, {**data, "stream": False}, "POST")
+            return
+        async for chunk in transport.stream(endpoint, data):
+            yield chunk
+
     async def async_generate(self, model: Optional[str] = None, prompt: str = "", 
                             stream: bool = False, options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
-        Async wrapper for generate method.
-        Runs in thread pool to maintain compatibility with async code.
+        Async generate.
+
+        With stream=True the response is streamed over the connection and
+        reassembled, so the final dict has the same shape as a non-streamed one.
+        Concurrent identical calls share one request (see llm_flights).
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.generate, model, prompt, stream, options)
+        model = model or self.model
+        key = self._flight_key("generate", prompt, model, options)
+        return await llm_flights.do(key, lambda: self._async_generate_once(model, prompt, stream, options))
+
+    async def _async_generate_once(self, model: str, prompt: str, stream: bool,
+                                   options: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        if stream:
+            final: Dict[str, Any] = {}
+            parts: List[str] = []
+            async for chunk in self.async_generate_stream(model, prompt, options):
+                parts.append(chunk.get("response", ""))
+                final = chunk
+            return {**final, "response": "".join(parts)}
+
+        payload = {
+            "model": model,
+            "prompt": prompt,
+            "stream": False,
+            "options": options or {}
+        }
+        return await self._make_async_request("api/generate", payload)
+
+    async def async_generate_stream(self, model: Optional[str] = None, prompt: str = "",
+                                    options: Optional[Dict[str, Any]] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Stream generate chunks ({"response": "...", "done": bool}) as they arrive."""
+        payload = {
+            "model": model or self.model,
+            "prompt": prompt,
+            "stream": True,
+            "options": options or {}
+        }
+        async for chunk in self._stream_async_request("api/generate", payload):
+            yield chunk
     
     async def async_chat(self, model: Optional[str] = None, messages: List[Dict[str, str]] = None,
                         stream: bool = False, options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
-        Async wrapper for chat method.
-        Runs in thread pool to maintain compatibility with async code.
+        Async chat.
+
+        With stream=True the message content is streamed and reassembled.
+        Concurrent identical calls share one request (see llm_flights).
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.chat, model, messages, stream, options)
+        model = model or self.model
+        messages = messages or []
+        key = self._flight_key("chat", json.dumps(messages, sort_keys=True), model, options)
+        return await llm_flights.do(key, lambda: self._async_chat_once(model, messages, stream, options))
+
+    async def _async_chat_once(self, model: str, messages: List[Dict[str, str]], stream: bool,
+                               options: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        if stream:
+            final: Dict[str, Any] = {}
+            parts: List[str] = []
+            role = "assistant"
+            async for chunk in self.async_chat_stream(model, messages, options):
+                message = chunk.get("message") or {}
+                role = message.get("role", role)
+                parts.append(message.get("content", ""))
+                final = chunk
+            return {**final, "message": {"role": role, "content": "".join(parts)}}
+
+        payload = {
+            "model": model,
+            "messages": messages,
+            "stream": False,
+            "options": options or {}
+        }
+        return await self._make_async_request("api/chat", payload)
+
+    async def async_chat_stream(self, model: Optional[str] = None, messages: List[Dict[str, str]] = None,
+                                options: Optional[Dict[str, Any]] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Stream chat chunks ({"message": {...}, "done": bool}) as they arrive."""
+        payload = {
+            "model": model or self.model,
+            "messages": messages or [],
+            "stream": True,
+            "options": options or {}
+        }
+        async for chunk in self._stream_async_request("api/chat", payload):
+            yield chunk
     
     async def async_embed(self, model: Optional[str] = None, inputs: Union[str, List[str]] = None) -> Dict[str, Any]:
-        """
-        Async wrapper for embed method.
-        Runs in thread pool to maintain compatibility with async code.
-        """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.embed, model, inputs)
+        """Async embed."""
+        if isinstance(inputs, str):
+            inputs = [inputs]
+        payload = {
+            "model": model or self.model,
+            "input": inputs or []
+        }
+        return await self._make_async_request("api/embed", payload)
     
     async def async_model_info(self, model: Optional[str] = None) -> Dict[str, Any]:
-        """
-        Async wrapper for model_info method.
-        Runs in thread pool to maintain compatibility with async code.
-        """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.model_info, model)
+        """Async model_info."""
+        return await self._make_async_request("api/show", {"name": model or self.model})
+
+    async def async_list_models(self) -> Dict[str, Any]:
+        """Async list_models."""
+        return await self._make_async_request("api/tags", {}, method="GET")
+
+    async def async_is_available(self) -> bool:
+        """Async is_available."""
+        if not self.enabled:
+            return False
+        try:
+            await self.async_list_models()
+            return True
+        except Exception as e:
+            logger.debug(f"Ollama availability check failed: {e}")
+            return False
+
+    def get_transport_metrics(self) -> Dict[str, Any]:
+        """Request timing metrics of the async transport."""
+        if self._transport is None:
+            return {"in_flight": 0, "max_in_flight": 0, "max_concurrent": self.max_concurrent, "endpoints": {}}
+        return self._transport.get_metrics()
+
+    async def aclose(self) -> None:
+        """Close pooled connections owned by the running event loop."""
+        if self._transport is not None:
+            await self._transport.close()
 
 
 # Global instance for backward compatibility
@@ -0,0 +1,577 @@
+# file: tbcv/core/ollama_stub.py
+"""
+Stub Ollama server for benchmarking and load-testing the LLM paths.
+
+Speaks enough of the Ollama HTTP API for core.ollama (sync and async
+clients) to talk to it unchanged: /api/generate and /api/chat (plain and
+NDJSON-streamed), /api/embed (and the older /api/embeddings), /api/tags,
+/api/show, /api/ps and /api/version.
+
+Responses are deterministic, chosen from the prompt by StubResponder:
+
+1. Canned responses: the first (regex, text) pair whose regex matches.
+2. Prompts that end with a JSON example ("Respond with JSON only: {...}")
+   get that example back with its placeholders filled in ("true/false",
+   "0.0-1.0", "high|medium|low"), so every parser in agents/ sees a
+   well-formed answer of the shape it asked for.
+3. Section-edit prompts (RecommendationEnhancer) get the target section
+   back with the suggested addition appended.
+4. Requests with ``format`` (``"json"`` or a JSON schema) get a minimal
+   document valid against it; anything else gets a fixed sentence.
+
+Latency follows a simple model of a local model server (StubProfile):
+time to first token is ``ttft_ms`` plus prompt evaluation at
+``prompt_tokens_per_sec``, then tokens arrive at ``tokens_per_sec``
+(about four characters per token). At most ``max_concurrent`` requests
+are evaluated at once (OLLAMA_NUM_PARALLEL); up to ``max_queue`` more wait
+for a slot (OLLAMA_MAX_QUEUE) and the rest are refused with 503, as
+Ollama does. Embeddings cost ``embed_ms_per_input`` per input.
+
+Usage::
+
+    with OllamaStubServer(StubProfile(ttft_ms=300, tokens_per_sec=15)) as stub:
+        client = Ollama(base_url=stub.url, enabled=True)
+        ...
+        stub.stats()
+
+or ``tbcv bench ollama-stub --port 11434`` and point OLLAMA_BASE_URL at it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from core.logging import get_logger
+
+logger = get_logger(__name__)
+
+STUB_VERSION = "0.0.0-tbcv-stub"
+CHARS_PER_TOKEN = 4
+DEFAULT_RESPONSE = "The content is consistent with the documented plugins and requires no changes."
+
+
+@dataclass
+class StubProfile:
+    """Latency and capacity model of the simulated model server."""
+    ttft_ms: float = 150.0               # fixed cost before the first token
+    prompt_tokens_per_sec: float = 400.0  # prompt evaluation rate (0 = free)
+    tokens_per_sec: float = 20.0         # generation rate (0 = instant)
+    max_concurrent: int = 1              # requests evaluated at once
+    max_queue: int = 512                 # requests waiting for a slot before 503
+    jitter: float = 0.0                  # +/- fraction on every delay, fixed per prompt
+    embed_ms_per_input: float = 5.0
+    embedding_dim: int = 384
+    model: str = "mistral"
+
+
+def count_tokens(text: str) -> int:
+    """Rough token count (about four characters per token)."""
+    return max(1, math.ceil(len(text) / CHARS_PER_TOKEN)) if text else 0
+
+
+def _pieces(text: str) -> List[str]:
+    """Text split into token-sized pieces for streaming."""
+    return [text[i:i + CHARS_PER_TOKEN] for i in range(0, len(text), CHARS_PER_TOKEN)] or [""]
+
+
+# =============================================================================
+# Responses
+# =============================================================================
+
+# Placeholder values in prompt JSON examples, in the order they are replaced
+_PLACEHOLDERS: Tuple[Tuple[re.Pattern, str], ...] = (
+    # "should_discard": true/false -> false; other flags -> true, so the
+    # stubbed model approves what it is shown
+    (re.compile(r'("(?:should|needs|are)_\w+"\s*:\s*)true/false'), r"\1false"),
+    (re.compile(r"true/false"), "true"),
+    # "quality_score": 0.0-1.0 -> upper bound
+    (re.compile(r"(:\s*)-?\d+(?:\.\d+)?\s*-\s*(\d+(?:\.\d+)?)"), r"\1\2"),
+    # "prefer": 1 or 2 (which one ...) -> 1
+    (re.compile(r"(:\s*)(\d+) or \d+[^,\n}]*"), r"\1\2"),
+    # "severity": "high|medium|low" -> "high"
+    (re.compile(r'"([\w\- ]+)(?:\|[\w\- ]+)+"'), r'"\1"'),
+    # Trailing commas
+    (re.compile(r",(\s*[}\]])"), r"\1"),
+)
+
+_SECTION_RE = re.compile(r"Target Section:\n(.*?)\n\nContext After:", re.DOTALL)
+_ADDITION_RE = re.compile(r"(?:Suggested addition: (.+)|Information to Add:\n(.+?)\n\n)", re.DOTALL)
+
+
+def _balanced_object(text: str, start: int) -> Optional[str]:
+    """The {...} block opening at text[start], or None if it never closes."""
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
+
+def json_example_response(prompt: str) -> Optional[str]:
+    """
+    Fill in the JSON example a prompt asks the model to answer with.
+
+    Looks for the first object after the last mention of "JSON" and
+    replaces the usual placeholders with concrete values. Returns None
+    when there is no example or it still isn't valid JSON.
+    """
+    mentions = [m.end() for m in re.finditer(r"json", prompt, re.IGNORECASE)]
+    if not mentions:
+        return None
+    start = prompt.find("{", mentions[-1])
+    if start < 0:
+        return None
+    block = _balanced_object(prompt, start)
+    if block is None:
+        return None
+    for pattern, replacement in _PLACEHOLDERS:
+        block = pattern.sub(replacement, block)
+    try:
+        return json.dumps(json.loads(block), indent=2)
+    except ValueError:
+        return None
+
+
+def example_from_schema(schema: Dict[str, Any]) -> Any:
+    """Smallest value valid against a (simple) JSON schema."""
+    if "enum" in schema:
+        return schema["enum"][0]
+    if "const" in schema:
+        return schema["const"]
+    kind = schema.get("type")
+    if isinstance(kind, list):
+        kind = next((k for k in kind if k != "null"), "null")
+    if kind == "object" or "properties" in schema:
+        props = schema.get("properties", {})
+        required = schema.get("required", list(props))
+        return {name: example_from_schema(props.get(name, {})) for name in required}
+    if kind == "array":
+        count = schema.get("minItems", 0)
+        return [example_from_schema(schema.get("items", {})) for _ in range(count)]
+    if kind == "string":
+        return "x" * schema.get("minLength", 0)
+    if kind in ("number", "integer"):
+        value = schema.get("minimum", 0)
+        return int(value) if kind == "integer" else float(value)
+    if kind == "boolean":
+        return False
+    return None
+
+
+class StubResponder:
+    """Deterministic text for a prompt (see module docstring for the order)."""
+
+    def __init__(self, canned: Optional[Sequence[Tuple[str, str]]] = None):
+        self.canned = [(re.compile(pattern, re.DOTALL), text) for pattern, text in (canned or [])]
+
+    def respond(self, prompt: str, fmt: Any = None) -> str:
+        for pattern, text in self.canned:
+            if pattern.search(prompt):
+                return text
+        example = json_example_response(prompt)
+        if example is not None:
+            return example
+        section = _SECTION_RE.search(prompt)
+        if section:
+            addition = _ADDITION_RE.search(prompt)
+            text = section.group(1)
+            if addition:
+                text += "\n" + (addition.group(1) or addition.group(2)).strip()
+            return text
+        if isinstance(fmt, dict):
+            return json.dumps(example_from_schema(fmt))
+        if fmt == "json":
+            return "{}"
+        return DEFAULT_RESPONSE
+
+
+# =============================================================================
+# Server
+# =============================================================================
+
+class _ServerBusy(Exception):
+    """The wait queue is full."""
+
+
+class _Admission:
+    """Concurrency slots plus a bounded wait queue, with counters."""
+
+    def __init__(self, max_concurrent: int, max_queue: int):
+        self._slots = threading.BoundedSemaphore(max(1, max_concurrent))
+        self._lock = threading.Lock()
+        self.max_queue = max(0, max_queue)
+        self.waiting = 0
+        self.running = 0
+        self.max_waiting = 0
+        self.max_running = 0
+        self.rejected = 0
+        self.total_wait_ms = 0.0
+
+    def acquire(self) -> None:
+        with self._lock:
+            if self._slots.acquire(blocking=False):
+                self._started(0.0)
+                return
+            if self.waiting >= self.max_queue:
+                self.rejected += 1
+                raise _ServerBusy()
+            self.waiting += 1
+            self.max_waiting = max(self.max_waiting, self.waiting)
+        start = time.perf_counter()
+        self._slots.acquire()
+        with self._lock:
+            self.waiting -= 1
+            self._started((time.perf_counter() - start) * 1000.0)
+
+    def _started(self, wait_ms: float) -> None:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        self.total_wait_ms += wait_ms
+
+    def release(self) -> None:
+        with self._lock:
+            self.running -= 1
+        self._slots.release()
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "_StubHTTPServer"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug("ollama stub: " + format % args)
+
+    # --- plumbing ---------------------------------------------------------
+
+    def _read_json(self) -> Dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        return json.loads(self.rfile.read(length).decode("utf-8") or "{}")
+
+    def _send_json(self, payload: Any, status: int = 200) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_stream(self, chunks: Iterator[Dict[str, Any]]) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for chunk in chunks:
+            line = (json.dumps(chunk) + "\n").encode("utf-8")
+            self.wfile.write(f"{len(line):X}\r\n".encode("ascii") + line + b"\r\n")
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+    # --- routing ----------------------------------------------------------
+
+    def do_GET(self) -> None:
+        stub = self.server.stub
+        path = self.path.split("?", 1)[0].rstrip("/")
+        if path == "/api/tags":
+            self._send_json({"models": [stub.model_entry()]})
+        elif path == "/api/ps":
+            self._send_json({"models": [stub.model_entry()] if stub.admission.running else []})
+        elif path == "/api/version":
+            self._send_json({"version": STUB_VERSION})
+        elif path in ("", "/"):
+            body = b"Ollama is running"
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        else:
+            self._send_json({"error": f"404 page not found: {path}"}, 404)
+
+    def do_POST(self) -> None:
+        stub = self.server.stub
+        path = self.path.split("?", 1)[0].rstrip("/")
+        handlers = {
+            "/api/generate": stub.generate,
+            "/api/chat": stub.chat,
+            "/api/embed": stub.embed,
+            "/api/embeddings": stub.embed,
+        }
+        try:
+            request = self._read_json()
+        except ValueError as e:
+            self._send_json({"error": f"invalid JSON: {e}"}, 400)
+            return
+        if path == "/api/show":
+            self._send_json(stub.show())
+            return
+        handler = handlers.get(path)
+        if handler is None:
+            self._send_json({"error": f"404 page not found: {path}"}, 404)
+            return
+
+        stub.count_request(path)
+        try:
+            stub.admission.acquire()
+        except _ServerBusy:
+            self._send_json({"error": "server busy, please try again.  maximum pending requests exceeded"}, 503)
+            return
+        try:
+            if path == "/api/embeddings":
+                self._send_json(handler(request, legacy=True))
+            elif request.get("stream", True) and path != "/api/embed":
+                self._send_stream(handler(request, stream=True))
+            else:
+                self._send_json(handler(request))
+        except (BrokenPipeError, ConnectionResetError):
+            logger.debug("ollama stub: client went away mid-response")
+        finally:
+            stub.admission.release()
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    stub: "OllamaStubServer"
+
+
+class OllamaStubServer:
+    """Threaded HTTP server speaking the Ollama API with simulated latency."""
+
+    def __init__(self, profile: Optional[StubProfile] = None, host: str = "127.0.0.1", port: int = 0,
+                 canned: Optional[Sequence[Tuple[str, str]]] = None):
+        """
+        Args:
+            profile: Latency and capacity model (default: StubProfile())
+            host: Interface to bind
+            port: Port to bind (0 picks a free one; see ``url``)
+            canned: (regex, response) pairs checked before the built-in responses
+        """
+        self.profile = profile or StubProfile()
+        self.responder = StubResponder(canned)
+        self.admission = _Admission(self.profile.max_concurrent, self.profile.max_queue)
+        self._httpd = _StubHTTPServer((host, port), _StubHandler)
+        self._httpd.stub = self
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._requests: Dict[str, int] = {}
+        self._tokens_generated = 0
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    # --- lifecycle --------------------------------------------------------
+
+    def start(self) -> "OllamaStubServer":
+        """Serve on a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._httpd.serve_forever, name="ollama-stub", daemon=True)
+            self._thread.start()
+            logger.info(f"Ollama stub listening on {self.url}")
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve on the calling thread until interrupted."""
+        logger.info(f"Ollama stub listening on {self.url}")
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            # shutdown() waits for a running serve_forever loop to exit
+            self._httpd.shutdown()
+            self._thread.join(timeout=5)
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "OllamaStubServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    # --- accounting -------------------------------------------------------
+
+    def count_request(self, path: str) -> None:
+        with self._lock:
+            self._requests[path] = self._requests.get(path, 0) + 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Requests per endpoint, queueing and capacity counters."""
+        admission = self.admission
+        with self._lock:
+            requests = dict(self._requests)
+            tokens = self._tokens_generated
+        served = sum(requests.values()) - admission.rejected
+        return {
+            "url": self.url,
+            "profile": asdict(self.profile),
+            "requests": requests,
+            "rejected": admission.rejected,
+            "running": admission.running,
+            "waiting": admission.waiting,
+            "max_running": admission.max_running,
+            "max_waiting": admission.max_waiting,
+            "avg_queue_wait_ms": round(admission.total_wait_ms / served, 3) if served > 0 else 0.0,
+            "tokens_generated": tokens,
+        }
+
+    # --- model metadata ---------------------------------------------------
+
+    def model_entry(self) -> Dict[str, Any]:
+        name = self.profile.model if ":" in self.profile.model else f"{self.profile.model}:latest"
+        return {
+            "name": name,
+            "model": name,
+            "modified_at": "2024-01-01T00:00:00Z",
+            "size": 0,
+            "digest": hashlib.sha256(name.encode("utf-8")).hexdigest(),
+            "details": {"format": "gguf", "family": "stub", "parameter_size": "0B", "quantization_level": "none"},
+        }
+
+    def show(self) -> Dict[str, Any]:
+        return {"modelfile": "", "parameters": "", "template": "{{ .Prompt }}",
+                "details": self.model_entry()["details"], "model_info": {}}
+
+    # --- latency model ----------------------------------------------------
+
+    def _scale(self, prompt: str) -> float:
+        """Fixed per-prompt jitter factor, so repeated runs sleep the same."""
+        if not self.profile.jitter:
+            return 1.0
+        seed = int.from_bytes(hashlib.sha256(prompt.encode("utf-8")).digest()[:8], "big")
+        return 1.0 + random.Random(seed).uniform(-self.profile.jitter, self.profile.jitter)
+
+    def _prompt_eval_s(self, prompt_tokens: int) -> float:
+        rate = self.profile.prompt_tokens_per_sec
+        return self.profile.ttft_ms / 1000.0 + (prompt_tokens / rate if rate > 0 else 0.0)
+
+    def _token_s(self) -> float:
+        rate = self.profile.tokens_per_sec
+        return 1.0 / rate if rate > 0 else 0.0
+
+    def _completion(self, prompt: str, request: Dict[str, Any]) -> Tuple[str, str]:
+        """Response text (capped at options.num_predict tokens) and done_reason."""
+        text = self.responder.respond(prompt, request.get("format"))
+        limit = (request.get("options") or {}).get("num_predict")
+        if isinstance(limit, int) and limit >= 0 and count_tokens(text) > limit:
+            return text[:limit * CHARS_PER_TOKEN], "length"
+        return text, "stop"
+
+    def _run(self, prompt: str, request: Dict[str, Any], wrap, stream: bool):
+        """Generate with simulated timing; wrap(piece) builds one chunk body."""
+        model = request.get("model") or self.profile.model
+        text, done_reason = self._completion(prompt, request)
+        scale = self._scale(prompt)
+        prompt_tokens = count_tokens(prompt)
+        pieces = _pieces(text)
+        started = time.perf_counter()
+
+        time.sleep(self._prompt_eval_s(prompt_tokens) * scale)
+        prompt_done = time.perf_counter()
+
+        def final(body: Dict[str, Any]) -> Dict[str, Any]:
+            end = time.perf_counter()
+            with self._lock:
+                self._tokens_generated += len(pieces)
+            return {
+                "model": model,
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                **body,
+                "done": True,
+                "done_reason": done_reason,
+                "total_duration": int((end - started) * 1e9),
+                "load_duration": 0,
+                "prompt_eval_count": prompt_tokens,
+                "prompt_eval_duration": int((prompt_done - started) * 1e9),
+                "eval_count": len(pieces),
+                "eval_duration": int((end - prompt_done) * 1e9),
+            }
+
+        if not stream:
+            time.sleep(max(0, len(pieces) - 1) * self._token_s() * scale)
+            return final(wrap(text))
+
+        def chunks() -> Iterator[Dict[str, Any]]:
+            for i, piece in enumerate(pieces):
+                if i:
+                    time.sleep(self._token_s() * scale)
+                yield {"model": model, "created_at": datetime.now(timezone.utc).isoformat(),
+                       **wrap(piece), "done": False}
+            yield final(wrap(""))
+
+        return chunks()
+
+    # --- endpoints --------------------------------------------------------
+
+    def generate(self, request: Dict[str, Any], stream: bool = False):
+        prompt = request.get("prompt", "")
+        if request.get("system"):
+            prompt = request["system"] + "\n\n" + prompt
+        return self._run(prompt, request, lambda text: {"response": text}, stream)
+
+    def chat(self, request: Dict[str, Any], stream: bool = False):
+        messages = request.get("messages") or []
+        prompt = next((m.get("content", "") for m in reversed(messages) if m.get("role") == "user"), "")
+        return self._run(prompt, request, lambda text: {"message": {"role": "assistant", "content": text}}, stream)
+
+    def embed(self, request: Dict[str, Any], legacy: bool = False) -> Dict[str, Any]:
+        inputs = request.get("prompt", "") if legacy else request.get("input", [])
+        if isinstance(inputs, str):
+            inputs = [inputs]
+        started = time.perf_counter()
+        time.sleep(len(inputs) * self.profile.embed_ms_per_input / 1000.0)
+        vectors = [self._vector(text) for text in inputs]
+        if legacy:
+            return {"embedding": vectors[0] if vectors else []}
+        return {
+            "model": request.get("model") or self.profile.model,
+            "embeddings": vectors,
+            "total_duration": int((time.perf_counter() - started) * 1e9),
+            "load_duration": 0,
+            "prompt_eval_count": sum(count_tokens(text) for text in inputs),
+        }
+
+    def _vector(self, text: str) -> List[float]:
+        """Unit-length vector determined by the text."""
+        seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "big")
+        rng = random.Random(seed)
+        values = [rng.gauss(0.0, 1.0) for _ in range(self.profile.embedding_dim)]
+        norm = math.sqrt(sum(v * v for v in values)) or 1.0
+        return [round(v / norm, 6) for v in values]
+
+
+def load_canned_responses(path: str) -> List[Tuple[str, str]]:
+    """(regex, response) pairs from a JSON file: an object or a list of pairs."""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        return [(str(k), v if isinstance(v, str) else json.dumps(v)) for k, v in data.items()]
+    return [(str(k), v if isinstance(v, str) else json.dumps(v)) for k, v in data]
@@ -0,0 +1,232 @@
+# file: tbcv/core/pattern_set.py
+"""
+Compiled pattern sets: many regexes, one scan.
+
+Rule-driven detectors hold a family's API / forbidden patterns as a list and
+used to run ``finditer`` over the whole document once per pattern. A
+PatternSet is a small multi-pattern engine instead:
+
+- every pattern's literal prefix (the leading literal characters, after any
+  leading anchors) goes into one trie-shaped alternation wrapped in a
+  lookahead, so a single ``finditer`` stops exactly at the positions where
+  some prefix occurs and reports the longest prefix found there;
+- only the patterns whose prefix occurs at that position are then tried,
+  with ``match`` at that position.
+
+The document is scanned once, and each position costs a trie descent rather
+than one attempt per pattern. Hits are exactly what per-pattern ``finditer``
+would return, in the same order (pattern order, then position): a pattern's
+next match is taken at the first candidate position at or after the end of
+its previous match. Patterns without a literal prefix (or with their own
+global inline flags) are scanned on their own.
+
+Compiled sets are memoized by the digest of (flags, patterns), i.e. by
+ruleset version: a changed ruleset compiles a new set, an unchanged one is
+shared by every caller.
+"""
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+try:
+    from re import _parser as _sre_parse  # Python 3.11+
+    from re import _constants as _sre_constants
+except ImportError:
+    import sre_parse as _sre_parse
+    import sre_constants as _sre_constants
+
+_CACHE_SIZE = 64
+_MAX_PREFIX = 32
+
+
+class PatternHit(NamedTuple):
+    """One match of one pattern: the caller's pattern id and the match span."""
+    pattern_id: Hashable
+    start: int
+    end: int
+
+
+def literal_prefix(pattern: str, flags: int = 0) -> str:
+    """
+    Leading literal characters every match of the pattern starts with
+    (ASCII only, lower-cased under IGNORECASE); "" when there are none.
+    """
+    try:
+        parsed = _sre_parse.parse(pattern, flags)
+    except Exception:
+        return ""
+    chars: List[str] = []
+    for op, av in parsed.data:
+        if op is _sre_constants.AT and not chars:
+            continue  # zero-width anchors (^, \b) before the literal
+        if op is not _sre_constants.LITERAL or av > 0x7F or len(chars) >= _MAX_PREFIX:
+            break
+        chars.append(chr(av))
+    prefix = "".join(chars)
+    return prefix.lower() if flags & re.IGNORECASE else prefix
+
+
+def _trie_regex(keys: Iterable[str]) -> str:
+    """Alternation over keys shaped as a trie; greedy, so the longest key wins."""
+    trie: Dict[str, dict] = {}
+    for key in keys:
+        node = trie
+        for ch in key:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        alternation = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{alternation})?" if "" in node else alternation
+
+    return build(trie)
+
+
+class PatternSet:
+    """A list of (pattern_id, regex) pairs compiled for single-pass scanning."""
+
+    def __init__(self, patterns: Iterable[Tuple[Hashable, str]], flags: int = 0):
+        self.flags = flags
+        self.ids: List[Hashable] = []
+        self.invalid: List[Tuple[Hashable, str]] = []  # (pattern_id, error)
+        self._compiled: List["re.Pattern"] = []
+        self._residual: List[int] = []  # indexes scanned on their own
+
+        base_flags = re.compile("", flags).flags
+        by_prefix: Dict[str, List[int]] = {}
+        for pattern_id, pattern in patterns:
+            try:
+                compiled = re.compile(pattern, flags)
+            except re.error as e:
+                self.invalid.append((pattern_id, str(e)))
+                continue
+            index = len(self.ids)
+            self.ids.append(pattern_id)
+            self._compiled.append(compiled)
+            prefix = literal_prefix(pattern, flags) if compiled.flags == base_flags else ""
+            if prefix:
+                by_prefix.setdefault(prefix, []).append(index)
+            else:
+                self._residual.append(index)
+
+        # Longest prefix found at a position -> patterns whose prefix it starts with
+        self._candidates: Dict[str, List[int]] = {}
+        for key in by_prefix:
+            self._candidates[key] = sorted(
+                i for n in range(1, len(key) + 1) for i in by_prefix.get(key[:n], ())
+            )
+        self._prefixed: List[int] = sorted(i for indexes in by_prefix.values() for i in indexes)
+        self._scanner: Optional["re.Pattern"] = None
+        if by_prefix:
+            try:
+                self._scanner = re.compile(f"(?=({_trie_regex(by_prefix)}))", flags)
+            except (re.error, RecursionError, OverflowError):
+                self._residual = sorted(self._residual + self._prefixed)
+                self._prefixed = []
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _scan_prefixed(self, text: str, stop_when_all_found: bool = False) -> List[List[Tuple[int, int]]]:
+        """Per prefixed pattern, the spans per-pattern finditer would return."""
+        spans: List[List[Tuple[int, int]]] = [[] for _ in self.ids]
+        if self._scanner is None:
+            return spans
+        fold = bool(self.flags & re.IGNORECASE)
+        candidates = self._candidates
+        compiled = self._compiled
+        next_pos = [0] * len(self.ids)
+        remaining = len(self._prefixed)
+
+        for m in self._scanner.finditer(text):
+            pos = m.start()
+            found = m.group(1)
+            # Non-ASCII text matched case-insensitively may not fold back to a key
+            for i in candidates.get(found.lower() if fold else found, self._prefixed):
+                if pos < next_pos[i]:
+                    continue
+                hit = compiled[i].match(text, pos)
+                if hit is None:
+                    continue
+                if not spans[i]:
+                    remaining -= 1
+                spans[i].append(hit.span())
+                next_pos[i] = hit.end()
+            if stop_when_all_found and remaining == 0:
+                break
+        return spans
+
+    def scan(self, text: str) -> List[PatternHit]:
+        """All hits, ordered by pattern then position (as per-pattern finditer loops)."""
+        if not text or not self.ids:
+            return []
+        spans = self._scan_prefixed(text)
+        for i in self._residual:
+            spans[i] = [m.span() for m in self._compiled[i].finditer(text)]
+        return [PatternHit(self.ids[i], start, end) for i, found in enumerate(spans) for start, end in found]
+
+    def matched_ids(self, text: str) -> List[Hashable]:
+        """Ids of the patterns that occur in text, in pattern order."""
+        if not text or not self.ids:
+            return []
+        spans = self._scan_prefixed(text, stop_when_all_found=True)
+        found = [bool(s) for s in spans]
+        for i in self._residual:
+            found[i] = self._compiled[i].search(text) is not None
+        return [self.ids[i] for i, hit in enumerate(found) if hit]
+
+
+class PatternSetCache:
+    """LRU of compiled pattern sets keyed by ruleset digest."""
+
+    def __init__(self, max_entries: int = _CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, PatternSet]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def digest(patterns: Sequence[Tuple[Hashable, str]], flags: int) -> str:
+        blob = repr((flags, [(repr(pid), p) for pid, p in patterns]))
+        return hashlib.sha256(blob.encode("utf-8", "surrogatepass")).hexdigest()
+
+    def get(self, patterns: Sequence[Tuple[Hashable, str]], flags: int = 0) -> PatternSet:
+        patterns = list(patterns)
+        key = self.digest(patterns, flags)
+        with self._lock:
+            pattern_set = self._entries.get(key)
+            if pattern_set is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return pattern_set
+            self.misses += 1
+        pattern_set = PatternSet(patterns, flags)
+        with self._lock:
+            self._entries[key] = pattern_set
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return pattern_set
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_cache = PatternSetCache()
+
+
+def compile_pattern_set(patterns: Sequence[Tuple[Hashable, str]], flags: int = 0) -> PatternSet:
+    """Get the (memoized) pattern set for a list of (pattern_id, regex) pairs."""
+    return _cache.get(patterns, flags)
+
+
+def literal_pattern_set(literals: Sequence[str], flags: int = 0) -> PatternSet:
+    """Pattern set matching plain substrings; ids are the literals themselves."""
+    return _cache.get([(literal, re.escape(literal)) for literal in literals], flags)
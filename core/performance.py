@@ -7,6 +7,9 @@ Provides:
 - Validation timing and statistics
 - Optimization utilities
 - Performance monitoring
+
+Timings recorded here also feed the process-wide core.metrics registry, which
+backs /metrics and the latency section of /admin/reports/performance.
 """
 
 from __future__ import annotations
@@ -20,6 +23,7 @@ from collections import defaultdict
 import threading
 
 from core.logging import get_logger
+from core.metrics import Histogram, MetricsRegistry, metrics_registry
 
 logger = get_logger(__name__)
 
@@ -49,9 +53,12 @@ class PerformanceStats:
     max_ms: float = 0.0
     avg_ms: float = 0.0
     last_run: Optional[datetime] = None
+    # Fixed buckets: percentiles without keeping every sample
+    histogram: Histogram = field(default_factory=Histogram, repr=False, compare=False)
 
     def add_timing(self, duration_ms: float):
         """Add a timing measurement."""
+        self.histogram.observe(duration_ms)
         self.count += 1
         self.total_ms += duration_ms
         self.min_ms = min(self.min_ms, duration_ms)
@@ -59,6 +66,14 @@ class PerformanceStats:
         self.avg_ms = self.total_ms / self.count
         self.last_run = datetime.now()
 
+    def percentiles(self) -> Dict[str, float]:
+        """Estimated p50/p95/p99 in milliseconds."""
+        snap = self.histogram.snapshot()
+        return {
+            f"p{int(q * 100)}_ms": round(self.histogram.quantile(q, snap), 2)
+            for q in (0.50, 0.95, 0.99)
+        }
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -68,6 +83,7 @@ class PerformanceStats:
             "min_ms": round(self.min_ms, 2) if self.min_ms != float('inf') else 0,
             "max_ms": round(self.max_ms, 2),
             "avg_ms": round(self.avg_ms, 2),
+            **self.percentiles(),
             "last_run": self.last_run.isoformat() if self.last_run else None
         }
 
@@ -77,9 +93,11 @@ class PerformanceMonitor:
     Monitors and collects performance metrics.
 
     Thread-safe collection of timing data across all validators and operations.
+    Every timing is also observed into the metrics registry.
     """
 
-    def __init__(self):
+    def __init__(self, registry: Optional[MetricsRegistry] = None):
+        self.registry = registry or metrics_registry
         self._stats: Dict[str, PerformanceStats] = defaultdict(lambda: PerformanceStats(""))
         self._lock = threading.RLock()
         self._active_timings: Dict[str, TimingMetric] = {}
@@ -123,8 +141,10 @@ class PerformanceMonitor:
                 if timing.name not in self._stats:
                     self._stats[timing.name] = PerformanceStats(timing.name)
                 self._stats[timing.name].add_timing(timing.duration_ms)
-                return timing.duration_ms
-        return None
+            else:
+                return None
+        self.registry.observe_operation(timing.name, timing.duration_ms)
+        return timing.duration_ms
 
     def record_timing(self, operation: str, duration_ms: float, **metadata):
         """
@@ -139,6 +159,7 @@ class PerformanceMonitor:
             if operation not in self._stats:
                 self._stats[operation] = PerformanceStats(operation)
             self._stats[operation].add_timing(duration_ms)
+        self.registry.observe_operation(operation, duration_ms)
 
     def get_stats(self, operation: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -190,8 +211,10 @@ class ValidationProfiler:
 
     def __init__(self, monitor: Optional[PerformanceMonitor] = None):
         self.monitor = monitor or performance_monitor
-        self._validator_timings: Dict[str, List[float]] = defaultdict(list)
-        self._tier_timings: Dict[str, List[float]] = defaultdict(list)
+        # Running aggregates rather than every sample, so memory stays flat
+        self._validator_timings: Dict[str, PerformanceStats] = {}
+        self._tier_timings: Dict[str, PerformanceStats] = {}
+        self._lock = threading.Lock()
 
     def profile_validator(self, validator_id: str):
         """
@@ -203,43 +226,44 @@ class ValidationProfiler:
         """
         return ValidatorProfileContext(self, validator_id)
 
+    def _record(self, timings: Dict[str, PerformanceStats], name: str, duration_ms: float):
+        with self._lock:
+            if name not in timings:
+                timings[name] = PerformanceStats(name)
+            timings[name].add_timing(duration_ms)
+
     def record_validator_timing(self, validator_id: str, duration_ms: float):
         """Record timing for a specific validator."""
-        self._validator_timings[validator_id].append(duration_ms)
+        self._record(self._validator_timings, validator_id, duration_ms)
         self.monitor.record_timing(f"validator.{validator_id}", duration_ms)
 
     def record_tier_timing(self, tier: str, duration_ms: float):
         """Record timing for a tier execution."""
-        self._tier_timings[tier].append(duration_ms)
+        self._record(self._tier_timings, tier, duration_ms)
         self.monitor.record_timing(f"tier.{tier}", duration_ms)
 
+    def _summarize(self, timings: Dict[str, PerformanceStats]) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            items = list(timings.items())
+        return {
+            name: {
+                "count": stats.count,
+                "total_ms": stats.total_ms,
+                "avg_ms": stats.avg_ms,
+                "min_ms": stats.min_ms,
+                "max_ms": stats.max_ms,
+                **stats.percentiles(),
+            }
+            for name, stats in items if stats.count
+        }
+
     def get_validator_stats(self) -> Dict[str, Dict[str, float]]:
         """Get statistics per validator."""
-        stats = {}
-        for validator_id, timings in self._validator_timings.items():
-            if timings:
-                stats[validator_id] = {
-                    "count": len(timings),
-                    "total_ms": sum(timings),
-                    "avg_ms": sum(timings) / len(timings),
-                    "min_ms": min(timings),
-                    "max_ms": max(timings)
-                }
-        return stats
+        return self._summarize(self._validator_timings)
 
     def get_tier_stats(self) -> Dict[str, Dict[str, float]]:
         """Get statistics per tier."""
-        stats = {}
-        for tier, timings in self._tier_timings.items():
-            if timings:
-                stats[tier] = {
-                    "count": len(timings),
-                    "total_ms": sum(timings),
-                    "avg_ms": sum(timings) / len(timings),
-                    "min_ms": min(timings),
-                    "max_ms": max(timings)
-                }
-        return stats
+        return self._summarize(self._tier_timings)
 
     def get_optimization_suggestions(self) -> List[Dict[str, Any]]:
         """
@@ -296,20 +320,20 @@ class ValidatorProfileContext:
         self.start_time = 0.0
 
     def __enter__(self):
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        duration_ms = (time.time() - self.start_time) * 1000
+        duration_ms = (time.perf_counter() - self.start_time) * 1000
         self.profiler.record_validator_timing(self.validator_id, duration_ms)
         return False
 
     async def __aenter__(self):
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        duration_ms = (time.time() - self.start_time) * 1000
+        duration_ms = (time.perf_counter() - self.start_time) * 1000
         self.profiler.record_validator_timing(self.validator_id, duration_ms)
         return False
 
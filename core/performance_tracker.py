@@ -1,12 +1,12 @@
 """Performance metrics tracking for TBCV MCP operations."""
 
-import json
 from pathlib import Path
 from typing import Dict, Any, Optional
 from datetime import datetime, timezone, timedelta
 from collections import defaultdict
 
 from core.logging import get_logger
+from core.segmented_log import SegmentedLog
 
 logger = get_logger(__name__)
 
@@ -18,11 +18,19 @@ class PerformanceTracker:
         """
         Initialize performance tracker.
 
+        Metrics are stored as hourly segments in a directory named after
+        metrics_file (without its suffix); an existing metrics_file is
+        imported into it once.
+
         Args:
-            metrics_file: Path to metrics file (JSONL format)
+            metrics_file: Path to the legacy metrics file (JSONL format)
         """
         self.metrics_file = Path(metrics_file)
-        self.metrics_file.touch(exist_ok=True)
+        self.log = SegmentedLog(
+            str(self.metrics_file.with_suffix("")),
+            index_fields=("operation",),
+            legacy_file=str(self.metrics_file),
+        )
 
     def record_operation(
         self,
@@ -49,8 +57,7 @@ class PerformanceTracker:
         }
 
         try:
-            with open(self.metrics_file, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(metric_entry) + '\n')
+            self.log.append(metric_entry)
         except Exception as e:
             logger.error(f"Failed to record performance metric: {e}")
 
@@ -81,41 +88,18 @@ class PerformanceTracker:
         total_operations = 0
         failed_operations = 0
 
-        if not self.metrics_file.exists():
-            return {
-                "time_range": time_range,
-                "total_operations": 0,
-                "failed_operations": 0,
-                "success_rate": 0.0,
-                "operations": {}
-            }
-
         try:
-            with open(self.metrics_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    try:
-                        entry = json.loads(line.strip())
-
-                        # Filter by time
-                        if entry.get("timestamp", "") < cutoff_iso:
-                            continue
-
-                        # Filter by operation
-                        if operation and entry.get("operation") != operation:
-                            continue
-
-                        op_name = entry["operation"]
-                        duration = entry["duration_ms"]
-                        success = entry.get("success", True)
-
-                        metrics[op_name].append(duration)
-                        total_operations += 1
-                        if not success:
-                            failed_operations += 1
-
-                    except (json.JSONDecodeError, KeyError):
-                        continue
-
+            # Only the segments overlapping the range are opened
+            for entry in self.log.query(start=cutoff_iso, operation=operation):
+                try:
+                    op_name = entry["operation"]
+                    duration = entry["duration_ms"]
+                except KeyError:
+                    continue
+                metrics[op_name].append(duration)
+                total_operations += 1
+                if not entry.get("success", True):
+                    failed_operations += 1
         except Exception as e:
             logger.error(f"Failed to read performance metrics: {e}")
 
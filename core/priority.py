@@ -0,0 +1,262 @@
+# file: tbcv/core/priority.py
+"""
+Priority lanes and weighted fair admission.
+
+A directory or batch job fans hundreds of files out to the same agent gates
+(and the single LLM slot) that an interactive ``/api/validate`` call needs,
+and FIFO admission put that call behind every queued file. Work now carries
+a lane:
+
+- ``interactive``: single-file validations a person is waiting on
+  (``/api/validate``, ``/api/validate/file`` behind the dashboard's
+  validate action, ``tbcv validations revalidate``)
+- ``batch``: directory validations, batch endpoints, queued workflow tasks
+- ``background``: audits and other work nobody is waiting on
+
+The lane travels in a context variable (``priority_lane("interactive")``),
+so every agent call made under it - including from tasks it spawns - is
+admitted in that lane without threading a parameter through the pipeline.
+
+FairQueue admits waiters by start-time fair queueing over per-lane queues:
+each waiter gets a virtual start tag ``max(V, F[lane])`` and advances its
+lane's finish tag ``F[lane]`` by ``1 / weight``; a released slot goes to the
+waiter with the smallest start tag. A lane that was idle starts at the
+current virtual time, so an interactive request arriving behind a thousand
+queued batch files is served at the next free slot, while under sustained
+contention lanes share slots in proportion to their weights (16:4:1 by
+default, ``orchestrator.lane_weights``) and batch work never starves.
+
+Every admission records its wait in ``queue_wait_ms{queue, lane}`` and
+``lane_wait_ms{lane}``; ``lane_stats()`` summarizes the latter.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import itertools
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, Optional, Tuple
+
+from core.metrics import metrics_registry
+
+INTERACTIVE = "interactive"
+BATCH = "batch"
+BACKGROUND = "background"
+
+# In priority order; the order also breaks ties between equal start tags
+LANES: Tuple[str, ...] = (INTERACTIVE, BATCH, BACKGROUND)
+DEFAULT_LANE = BATCH
+DEFAULT_WEIGHTS: Dict[str, float] = {INTERACTIVE: 16.0, BATCH: 4.0, BACKGROUND: 1.0}
+
+QUEUE_WAIT = "queue_wait_ms"
+LANE_WAIT = "lane_wait_ms"
+LANE_ADMITTED = "lane_admitted_total"
+LANE_REJECTED = "lane_rejected_total"
+
+_current_lane: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("tbcv_priority_lane", default=None)
+
+
+class QueueBusyError(Exception):
+    """A FairQueue could not admit a request (lane queue full or wait timed out)."""
+
+
+def normalize_lane(lane: Optional[str], default: str = DEFAULT_LANE) -> str:
+    """Validate a lane name; None and "" give `default`."""
+    if not lane:
+        return default
+    value = str(lane).strip().lower()
+    if value not in LANES:
+        raise ValueError(f"Unknown priority lane {lane!r}; expected one of {', '.join(LANES)}")
+    return value
+
+
+def current_lane(default: str = DEFAULT_LANE) -> str:
+    """Lane of the running context, or `default` when none was set."""
+    return _current_lane.get() or default
+
+
+@contextmanager
+def priority_lane(lane: Optional[str], default: str = DEFAULT_LANE) -> Iterator[str]:
+    """Run the enclosed block (and tasks created in it) in `lane`."""
+    token = _current_lane.set(normalize_lane(lane, default))
+    try:
+        yield _current_lane.get()
+    finally:
+        _current_lane.reset(token)
+
+
+def lane_weights() -> Dict[str, float]:
+    """Configured lane weights (orchestrator.lane_weights) over the defaults."""
+    try:
+        from core.config import get_settings
+        configured = getattr(get_settings().orchestrator, "lane_weights", None) or {}
+    except Exception:
+        configured = {}
+    weights = {}
+    for lane in LANES:
+        try:
+            weight = float(configured.get(lane, DEFAULT_WEIGHTS[lane]))
+        except (TypeError, ValueError):
+            weight = DEFAULT_WEIGHTS[lane]
+        weights[lane] = weight if weight > 0 else DEFAULT_WEIGHTS[lane]
+    return weights
+
+
+def lane_stats() -> Dict[str, Dict[str, float]]:
+    """Queue-wait summary per lane across every FairQueue in the process."""
+    summary = metrics_registry.summary(LANE_WAIT, "lane")
+    for lane, entry in summary.items():
+        entry["admitted"] = int(metrics_registry.counter(LANE_ADMITTED, lane=lane).value)
+        entry["rejected"] = int(metrics_registry.counter(LANE_REJECTED, lane=lane).value)
+    return summary
+
+
+class FairQueue:
+    """
+    Weighted fair admission across priority lanes, FIFO within a lane.
+
+    Up to `capacity` requests run at once (None = no limit); the rest wait,
+    at most `max_depth` per lane (0 = no limit), so a bulk job filling its
+    lane cannot turn interactive requests away. A finishing request hands
+    its slot directly to the next waiter, so there is no polling and no
+    barging. Waiting longer than `timeout_s` or arriving at a full lane
+    raises `busy_error`.
+
+    Usable as ``async with queue:`` or through acquire()/release(); the lane
+    defaults to the context's (``priority_lane``).
+    """
+
+    busy_error = QueueBusyError
+
+    def __init__(self, capacity: Optional[int] = 1, max_depth: int = 0, timeout_s: Optional[float] = None,
+                 name: str = "queue", weights: Optional[Dict[str, float]] = None):
+        self.capacity = capacity if capacity is None else max(1, int(capacity))
+        self.max_depth = max(0, int(max_depth))
+        self.timeout_s = timeout_s
+        self.name = name
+        self.weights = {**lane_weights(), **(weights or {})}
+        self.in_flight = 0
+        self._lanes: Dict[str, Deque[Tuple[float, int, asyncio.Future]]] = {lane: deque() for lane in LANES}
+        self._finish: Dict[str, float] = {lane: 0.0 for lane in LANES}
+        self._virtual = 0.0
+        self._seq = itertools.count()
+        self.stats = {
+            "admitted": 0,
+            "queued": 0,
+            "rejected": 0,
+            "timed_out": 0,
+            "max_queue_depth": 0,
+            "total_wait_ms": 0.0,
+            "max_wait_ms": 0.0,
+        }
+        self.lane_counts = {lane: {"admitted": 0, "queued": 0, "rejected": 0, "timed_out": 0} for lane in LANES}
+
+    @property
+    def depth(self) -> int:
+        return sum(len(waiters) for waiters in self._lanes.values())
+
+    @property
+    def saturated(self) -> bool:
+        return self.capacity is not None and self.in_flight >= self.capacity
+
+    def _start_tag(self, lane: str) -> float:
+        start = max(self._virtual, self._finish[lane])
+        self._finish[lane] = start + 1.0 / self.weights[lane]
+        return start
+
+    def _record(self, lane: str, wait_ms: float) -> None:
+        self.stats["admitted"] += 1
+        self.lane_counts[lane]["admitted"] += 1
+        if self.capacity is None:
+            return  # nothing to wait for; keep the lane percentiles about real queues
+        metrics_registry.histogram(QUEUE_WAIT, queue=self.name, lane=lane).observe(wait_ms)
+        metrics_registry.histogram(LANE_WAIT, lane=lane).observe(wait_ms)
+        metrics_registry.counter(LANE_ADMITTED, lane=lane).inc()
+
+    def _reject(self, lane: str, reason: str) -> Exception:
+        self.stats[reason] += 1
+        self.lane_counts[lane][reason] += 1
+        metrics_registry.counter(LANE_REJECTED, lane=lane).inc()
+        if reason == "timed_out":
+            return self.busy_error(f"no capacity within {self.timeout_s:.1f}s")
+        return self.busy_error(f"request queue full ({self.max_depth} waiting in lane {lane})")
+
+    async def acquire(self, lane: Optional[str] = None) -> None:
+        lane = normalize_lane(lane, current_lane())
+        if not self.saturated and not self.depth:
+            self._virtual = self._start_tag(lane)
+            self.in_flight += 1
+            self._record(lane, 0.0)
+            return
+        waiters = self._lanes[lane]
+        if self.max_depth and len(waiters) >= self.max_depth:
+            raise self._reject(lane, "rejected")
+
+        waiter = asyncio.get_running_loop().create_future()
+        entry = (self._start_tag(lane), next(self._seq), waiter)
+        waiters.append(entry)
+        self.stats["queued"] += 1
+        self.lane_counts[lane]["queued"] += 1
+        self.stats["max_queue_depth"] = max(self.stats["max_queue_depth"], self.depth)
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self.timeout_s)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over as we gave up; pass it on
+                self.release()
+            else:
+                waiter.cancel()
+                try:
+                    waiters.remove(entry)
+                except ValueError:
+                    pass
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            raise self._reject(lane, "timed_out") from None
+        finally:
+            wait_ms = (time.perf_counter() - start) * 1000
+            self.stats["total_wait_ms"] += wait_ms
+            self.stats["max_wait_ms"] = max(self.stats["max_wait_ms"], wait_ms)
+        self._record(lane, wait_ms)
+
+    def release(self) -> None:
+        head = None
+        for rank, lane in enumerate(LANES):
+            waiters = self._lanes[lane]
+            while waiters and waiters[0][2].done():
+                waiters.popleft()  # cancelled or timed out
+            if waiters and (head is None or (waiters[0][0], rank) < head[0]):
+                head = ((waiters[0][0], rank), waiters)
+        if head is None:
+            self.in_flight -= 1
+            return
+        # Hand the slot over; in_flight stays the same
+        start_tag, _, waiter = head[1].popleft()
+        self._virtual = start_tag
+        waiter.set_result(None)
+
+    async def __aenter__(self) -> "FairQueue":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.release()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Queue metrics for status endpoints."""
+        queued = self.stats["queued"]
+        return {
+            "capacity": self.capacity,
+            "in_flight": self.in_flight,
+            "queue_depth": self.depth,
+            **self.stats,
+            "average_wait_ms": self.stats["total_wait_ms"] / queued if queued else 0.0,
+            "lanes": {
+                lane: {**counts, "queue_depth": len(self._lanes[lane]), "weight": self.weights[lane]}
+                for lane, counts in self.lane_counts.items()
+            },
+        }
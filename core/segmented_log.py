@@ -0,0 +1,467 @@
+# file: tbcv/core/segmented_log.py
+"""
+Time-segmented, indexed JSONL logs.
+
+PerformanceTracker and AuditLogger used to append to a single JSONL file
+(opened once per event) and answer every query by parsing the whole file.
+A SegmentedLog keeps a directory of segments instead:
+
+- ``<bucket>.jsonl`` holds the entries whose timestamp falls in one
+  ``segment_seconds`` window (hourly by default). A segment that grows past
+  ``max_segment_bytes`` rolls over to ``<bucket>-1.jsonl`` and so on, and
+  only the newest ``max_segments`` are kept.
+- ``<bucket>.idx.json`` is a small sidecar: the segment's timestamp range,
+  entry count, size, and for each indexed field the byte offset of every
+  entry per value (e.g. all "validate_file" operations).
+- Writes are buffered and appended in one write per flush (every
+  ``flush_entries`` entries, ``flush_interval`` seconds after the first
+  buffered entry via a background timer, and at exit).
+  The active segment's index lives in memory and is written to its
+  sidecar when the log moves to another segment and on close/exit, so a
+  flush costs the same however large the segment has grown.
+
+Queries only open the segments whose range overlaps the request. When a
+segment lies entirely inside the range and every filter is on an indexed
+field, its matches are counted from the index without reading it, and
+pagination skips whole segments by count then seeks straight to the first
+entry of the page.
+
+A sidecar that is missing or behind its segment (a crash before the index
+was written, or another process appending) is caught up on first read by
+indexing only the entries past the sidecar's byte count; one that does
+not fit the segment is rebuilt from scratch. An existing single-file log is imported into
+segments the first time the log opens.
+"""
+
+from __future__ import annotations
+
+import atexit
+import heapq
+import json
+import os
+import threading
+import time
+import weakref
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_SEGMENT_SUFFIX = ".jsonl"
+_INDEX_SUFFIX = ".idx.json"
+
+
+def _parse_ts(value: str) -> float:
+    try:
+        ts = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return time.time()
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts.timestamp()
+
+
+def _filter_key(value: Any) -> str:
+    """Form in which field values are indexed and compared against filters."""
+    return str(value)
+
+
+def _new_index() -> Dict[str, Any]:
+    return {"start": None, "end": None, "count": 0, "bytes": 0, "fields": {}}
+
+
+class SegmentedLog:
+    """Append-only JSONL log split into time segments with sidecar indexes."""
+
+    def __init__(
+        self,
+        directory: str,
+        index_fields: Sequence[str] = ("operation",),
+        timestamp_field: str = "timestamp",
+        segment_seconds: int = 3600,
+        max_segment_bytes: int = 64 * 1024 * 1024,
+        max_segments: int = 24 * 30,
+        flush_entries: int = 100,
+        flush_interval: float = 1.0,
+        legacy_file: Optional[str] = None,
+    ):
+        """
+        Args:
+            directory: Directory holding the segments
+            index_fields: Entry fields whose per-value offsets are indexed
+            timestamp_field: ISO-8601 timestamp field of each entry
+            segment_seconds: Time window covered by one segment
+            max_segment_bytes: Size at which a segment rolls over early
+            max_segments: Segments kept; older ones are deleted on rotation
+            flush_entries: Buffered entries that trigger a flush
+            flush_interval: Max seconds an entry stays buffered before a timed flush
+            legacy_file: Single-file JSONL log to import on first open
+        """
+        self.directory = Path(directory)
+        self.index_fields = tuple(index_fields)
+        self.timestamp_field = timestamp_field
+        self.segment_seconds = max(1, int(segment_seconds))
+        self.max_segment_bytes = max_segment_bytes
+        self.max_segments = max_segments
+        self.flush_entries = max(1, flush_entries)
+        self.flush_interval = flush_interval
+
+        self._lock = threading.RLock()
+        self._buffer: List[Tuple[str, Dict[str, Any]]] = []
+        self._buffered_since = 0.0
+        self._flush_timer: Optional[threading.Timer] = None
+        self._active_name: Optional[str] = None
+        self._active_index: Optional[Dict[str, Any]] = None
+        self._active_dirty = False
+        self._index_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if legacy_file:
+            self._import_legacy(Path(legacy_file))
+        _open_logs.add(self)
+
+    # ---- Writing ----
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        """Buffer one entry; it is written on the next flush."""
+        with self._lock:
+            ts = entry.get(self.timestamp_field) or datetime.now(timezone.utc).isoformat()
+            if not self._buffer:
+                self._buffered_since = time.monotonic()
+            self._buffer.append((ts, entry))
+            if len(self._buffer) >= self.flush_entries or time.monotonic() - self._buffered_since >= self.flush_interval:
+                self.flush()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_interval, self._timed_flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def _timed_flush(self) -> None:
+        """Flush entries that have waited flush_interval without another append."""
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error(f"Timed flush of {self.directory} failed: {e}")
+
+    def flush(self) -> None:
+        """Write buffered entries and update the affected sidecar indexes."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            self._sync_active()
+            if not self._buffer:
+                return
+            pending, self._buffer = self._buffer, []
+            batch: List[bytes] = []
+            position = self._active_index["bytes"] if self._active_name else 0
+            for ts, entry in pending:
+                name = self._segment_for(ts)
+                if name != self._active_name:
+                    self._write_batch(batch)
+                    batch = []
+                    self._activate(name)
+                    position = self._active_index["bytes"]
+                line = (json.dumps(entry, default=str) + "\n").encode("utf-8")
+                self._note(self._active_index, entry, ts, position)
+                batch.append(line)
+                position += len(line)
+            self._write_batch(batch)
+
+    def _sync_active(self) -> None:
+        """Reload the active index if another process appended to the segment."""
+        if self._active_name is None:
+            return
+        try:
+            size = self._segment_path(self._active_name).stat().st_size
+        except FileNotFoundError:
+            size = 0
+        if size > self._active_index["bytes"]:
+            self._catch_up(self._active_name, self._active_index)
+        elif size < self._active_index["bytes"]:
+            name, self._active_name = self._active_name, None
+            self._activate(name)
+
+    def _write_batch(self, lines: List[bytes]) -> None:
+        if not lines or self._active_name is None:
+            return
+        data = b"".join(lines)
+        try:
+            with open(self._segment_path(self._active_name), "ab") as f:
+                f.write(data)
+            self._active_index["bytes"] += len(data)
+            self._active_dirty = True
+        except OSError as e:
+            logger.error(f"Failed to write log segment {self._active_name}: {e}")
+            # The sidecar is caught up from whatever reached the segment
+            self._active_name = None
+            self._active_dirty = False
+
+    def _segment_for(self, ts: str) -> str:
+        """Segment name for a timestamp; rolls over when the active one is full."""
+        bucket = int(_parse_ts(ts)) // self.segment_seconds * self.segment_seconds
+        base = datetime.fromtimestamp(bucket, tz=timezone.utc).strftime("%Y%m%dT%H%M%S")
+        if self._active_name and self._active_name.split("-")[0] == base:
+            if self._active_index["bytes"] < self.max_segment_bytes:
+                return self._active_name
+            seq = int(self._active_name.split("-")[1]) + 1 if "-" in self._active_name else 1
+            return f"{base}-{seq}"
+        # Latest existing segment of this window (e.g. after a restart)
+        existing = [n for n in self._segment_names() if n.split("-")[0] == base]
+        if not existing:
+            return base
+        latest = existing[-1]
+        if self._load_index(latest)["bytes"] < self.max_segment_bytes:
+            return latest
+        seq = int(latest.split("-")[1]) + 1 if "-" in latest else 1
+        return f"{base}-{seq}"
+
+    def _activate(self, name: str) -> None:
+        self._persist_active()
+        self._active_name = None
+        self._active_index = self._load_index(name)
+        self._active_name = name
+        if not self._segment_path(name).exists():
+            self._enforce_retention()
+
+    def _note(self, index: Dict[str, Any], entry: Dict[str, Any], ts: str, offset: int) -> None:
+        index["count"] += 1
+        if index["start"] is None or ts < index["start"]:
+            index["start"] = ts
+        if index["end"] is None or ts > index["end"]:
+            index["end"] = ts
+        for field_name in self.index_fields:
+            value = entry.get(field_name)
+            if value is not None:
+                index["fields"].setdefault(field_name, {}).setdefault(_filter_key(value), []).append(offset)
+
+    def _enforce_retention(self) -> None:
+        names = self._segment_names()
+        for name in names[:max(0, len(names) - self.max_segments + 1)]:
+            for path in (self._segment_path(name), self._index_path(name)):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+            self._index_cache.pop(name, None)
+
+    def _import_legacy(self, legacy: Path) -> None:
+        if not legacy.exists() or legacy.stat().st_size == 0 or self._segment_names():
+            return
+        imported = 0
+        with open(legacy, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                self.append(entry)
+                imported += 1
+        self.flush()
+        legacy.rename(legacy.with_name(legacy.name + ".imported"))
+        logger.info(f"Imported {imported} entries from {legacy} into {self.directory}")
+
+    # ---- Index management ----
+
+    def _segment_path(self, name: str) -> Path:
+        return self.directory / f"{name}{_SEGMENT_SUFFIX}"
+
+    def _index_path(self, name: str) -> Path:
+        return self.directory / f"{name}{_INDEX_SUFFIX}"
+
+    def _segment_names(self) -> List[str]:
+        names = [p.name[:-len(_SEGMENT_SUFFIX)] for p in self.directory.glob(f"*{_SEGMENT_SUFFIX}")]
+        return sorted(names, key=lambda n: (n.split("-")[0], int(n.split("-")[1]) if "-" in n else 0))
+
+    def _write_index(self, name: str, index: Dict[str, Any]) -> None:
+        tmp = self._index_path(name).with_suffix(".tmp")
+        tmp.write_text(json.dumps(index, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, self._index_path(name))
+
+    def _persist_active(self) -> None:
+        """Write the active segment's index to its sidecar if flushes changed it."""
+        if self._active_name is None or not self._active_dirty:
+            return
+        try:
+            self._write_index(self._active_name, self._active_index)
+        except OSError as e:
+            logger.error(f"Failed to write log index {self._active_name}: {e}")
+        self._active_dirty = False
+
+    def _load_index(self, name: str) -> Dict[str, Any]:
+        """Sidecar of a segment, caught up if it is missing or stale."""
+        if name == self._active_name and self._active_index is not None:
+            return self._active_index
+        segment = self._segment_path(name)
+        if not segment.exists():
+            return _new_index()
+        stat = segment.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self._index_cache.get(name)
+        if cached and cached[0] == stamp:
+            return cached[1]
+        index = None
+        try:
+            index = json.loads(self._index_path(name).read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            pass
+        if not isinstance(index, dict) or not 0 <= index.get("bytes", -1) <= stat.st_size:
+            index = _new_index()
+        if index["bytes"] < stat.st_size:
+            self._catch_up(name, index)
+            self._write_index(name, index)
+        self._index_cache[name] = (stamp, index)
+        return index
+
+    def _catch_up(self, name: str, index: Dict[str, Any]) -> None:
+        """Index the complete entries appended to a segment past index["bytes"]."""
+        offset = index["bytes"]
+        with open(self._segment_path(name), "rb") as f:
+            f.seek(offset)
+            for raw in f:
+                if raw.endswith(b"\n"):
+                    try:
+                        entry = json.loads(raw)
+                        self._note(index, entry, entry.get(self.timestamp_field) or "", offset)
+                    except json.JSONDecodeError:
+                        pass
+                    offset += len(raw)
+        index["bytes"] = offset
+
+    # ---- Querying ----
+
+    def _segments_in_range(self, start: Optional[str], end: Optional[str]) -> List[Tuple[str, Dict[str, Any]]]:
+        selected = []
+        for name in self._segment_names():
+            index = self._load_index(name)
+            if not index["count"]:
+                continue
+            if start and index["end"] < start:
+                continue
+            if end and index["start"] > end:
+                continue
+            selected.append((name, index))
+        return selected
+
+    def _candidates(self, index: Dict[str, Any], filters: Dict[str, Any]) -> Optional[List[int]]:
+        """Offsets of entries matching the indexed filters, or None if no filter is indexed."""
+        candidates: Optional[set] = None
+        for field_name, value in filters.items():
+            if field_name not in self.index_fields:
+                continue
+            offsets = set(index["fields"].get(field_name, {}).get(_filter_key(value), ()))
+            candidates = offsets if candidates is None else candidates & offsets
+        return None if candidates is None else sorted(candidates)
+
+    def _all_offsets(self, index: Dict[str, Any]) -> Optional[List[int]]:
+        """Every entry's offset, if some indexed field is present on all entries."""
+        for field_name in self.index_fields:
+            values = index["fields"].get(field_name, {})
+            if sum(len(v) for v in values.values()) == index["count"]:
+                return list(heapq.merge(*values.values()))
+        return None
+
+    def _matches(self, entry: Dict[str, Any], filters: Dict[str, Any], start: Optional[str], end: Optional[str]) -> bool:
+        ts = entry.get(self.timestamp_field, "")
+        if start and ts < start:
+            return False
+        if end and ts > end:
+            return False
+        return all(entry.get(k) is not None and _filter_key(entry[k]) == _filter_key(v) for k, v in filters.items())
+
+    def query(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        **filters: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Entries in [start, end] (ISO timestamps) whose fields equal ``filters``,
+        oldest segment first, after skipping ``offset`` matches.
+        """
+        filters = {k: v for k, v in filters.items() if v is not None}
+        self.flush()
+        skip = max(0, offset)
+        remaining = limit
+        for name, index in self._segments_in_range(start, end):
+            if remaining is not None and remaining <= 0:
+                return
+            inside = (not start or index["start"] >= start) and (not end or index["end"] <= end)
+            exact = inside and all(k in self.index_fields for k in filters)
+            if filters:
+                offsets = self._candidates(index, filters)
+            else:
+                offsets = self._all_offsets(index) if exact and skip else None
+            if exact and offsets is not None:
+                if skip >= len(offsets):
+                    skip -= len(offsets)
+                    continue
+                offsets, skip = offsets[skip:], 0
+            for entry in self._read(name, offsets):
+                if not exact and not self._matches(entry, filters, start, end):
+                    continue
+                if skip:
+                    skip -= 1
+                    continue
+                yield entry
+                if remaining is not None:
+                    remaining -= 1
+                    if remaining <= 0:
+                        return
+
+    def count(self, start: Optional[str] = None, end: Optional[str] = None, **filters: Any) -> int:
+        """Number of matching entries; fully covered segments are counted from their index."""
+        filters = {k: v for k, v in filters.items() if v is not None}
+        self.flush()
+        total = 0
+        for name, index in self._segments_in_range(start, end):
+            inside = (not start or index["start"] >= start) and (not end or index["end"] <= end)
+            if inside and all(k in self.index_fields for k in filters):
+                offsets = self._candidates(index, filters)
+                total += index["count"] if offsets is None else len(offsets)
+                continue
+            offsets = self._candidates(index, filters)
+            total += sum(1 for entry in self._read(name, offsets) if self._matches(entry, filters, start, end))
+        return total
+
+    def _read(self, name: str, offsets: Optional[List[int]]) -> Iterator[Dict[str, Any]]:
+        """Entries of a segment: all of them, or only those at the given offsets."""
+        try:
+            with open(self._segment_path(name), "rb") as f:
+                for raw in (f if offsets is None else _lines_at(f, offsets)):
+                    try:
+                        yield json.loads(raw)
+                    except json.JSONDecodeError:
+                        continue
+        except FileNotFoundError:
+            return
+
+    def close(self) -> None:
+        """Flush, write the active index and stop tracking this log for the exit flush."""
+        with self._lock:
+            self.flush()
+            self._persist_active()
+        _open_logs.discard(self)
+
+
+def _lines_at(f, offsets: List[int]) -> Iterator[bytes]:
+    for offset in offsets:
+        f.seek(offset)
+        yield f.readline()
+
+
+_open_logs: "weakref.WeakSet[SegmentedLog]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_logs() -> None:
+    for log in list(_open_logs):
+        try:
+            log.close()
+        except Exception:
+            pass
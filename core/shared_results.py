@@ -0,0 +1,164 @@
+# file: tbcv/core/shared_results.py
+"""
+Shared results of one validation, passed downstream on the context.
+
+validation_flow.yaml orders tier 3 as FuzzyLogic -> Truth -> llm, but each
+validator used to recompute what the one before it had already produced
+(Truth ran its own keyword "detection" for the LLM phase, the orchestrator
+and the FuzzyLogic validator each ran plugin detection). A SharedResults
+object travels with the validation context under the ``"shared_results"``
+key:
+
+- the routers record every completed validator result;
+- FuzzyLogic publishes its plugin detections (per family and threshold);
+- Truth publishes the truth context it loaded (aliases, API patterns, data);
+- downstream readers (Truth, llm) take these instead of recomputing them.
+
+Every producer counts its runs per stage, so ``profile()`` shows how often
+each stage actually ran for the document (plugin detection: once).
+``shared_results_from_context()`` returns the attached object (or attaches
+a new one); objects are bound to the content they describe.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from core.document_model import document_from_context
+
+CONTEXT_KEY = "shared_results"
+
+DETECTION_STAGE = "plugin_detection"
+TRUTH_STAGE = "truth_context"
+
+
+@dataclass(frozen=True)
+class PluginDetections:
+    """FuzzyDetector output (``handle_detect_plugins`` result) for one family."""
+    family: str
+    confidence_threshold: float
+    result: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def detections(self) -> List[Dict[str, Any]]:
+        return self.result.get("detections", [])
+
+
+@dataclass(frozen=True)
+class TruthContext:
+    """Truth data loaded for one family (``load_truth_data`` result)."""
+    family: str
+    plugin_aliases: List[Any] = field(default_factory=list)
+    api_patterns: List[Any] = field(default_factory=list)
+    truth_data: Dict[str, Any] = field(default_factory=dict)
+    version_hash: Optional[str] = None
+
+    @classmethod
+    def from_result(cls, family: str, result: Dict[str, Any]) -> "TruthContext":
+        return cls(
+            family=family,
+            plugin_aliases=result.get("plugin_aliases", []) or [],
+            api_patterns=result.get("api_patterns", []) or [],
+            truth_data=result.get("truth_data", {}) or {},
+            version_hash=result.get("version_hash"),
+        )
+
+
+class SharedResults:
+    """Completed validator results and typed upstream outputs for one document."""
+
+    def __init__(self, content_hash: str):
+        self.content_hash = content_hash
+        self._lock = threading.Lock()
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._detections: Dict[str, PluginDetections] = {}
+        self._truth: Dict[str, TruthContext] = {}
+        self._runs: Counter = Counter()
+        self._reuses: Counter = Counter()
+
+    # ------------------------------------------------------------------
+    # Completed validator results (recorded by the routers)
+    # ------------------------------------------------------------------
+    def record(self, validator_id: str, result: Dict[str, Any]) -> None:
+        with self._lock:
+            self._results[validator_id] = result
+
+    def result(self, validator_id: str) -> Optional[Dict[str, Any]]:
+        return self._results.get(validator_id)
+
+    @property
+    def completed(self) -> List[str]:
+        """Validator ids in completion order."""
+        return list(self._results)
+
+    # ------------------------------------------------------------------
+    # Typed upstream outputs
+    # ------------------------------------------------------------------
+    def publish_detections(self, detections: PluginDetections) -> None:
+        with self._lock:
+            self._detections[detections.family] = detections
+            self._runs[DETECTION_STAGE] += 1
+
+    def detections(self, family: str, confidence_threshold: Optional[float] = None) -> Optional[PluginDetections]:
+        """Published detections for family (at the given threshold, if one is given)."""
+        found = self._detections.get(family)
+        if found is None:
+            return None
+        if confidence_threshold is not None and found.confidence_threshold != confidence_threshold:
+            return None
+        self.count_reuse(DETECTION_STAGE)
+        return found
+
+    def publish_truth(self, truth: TruthContext) -> None:
+        with self._lock:
+            self._truth[truth.family] = truth
+            self._runs[TRUTH_STAGE] += 1
+
+    def truth(self, family: str) -> Optional[TruthContext]:
+        found = self._truth.get(family)
+        if found is not None:
+            self.count_reuse(TRUTH_STAGE)
+        return found
+
+    # ------------------------------------------------------------------
+    # Profile
+    # ------------------------------------------------------------------
+    def count_run(self, stage: str) -> None:
+        """Count a stage computed without publishing (e.g. a local fallback)."""
+        with self._lock:
+            self._runs[stage] += 1
+
+    def count_reuse(self, stage: str) -> None:
+        with self._lock:
+            self._reuses[stage] += 1
+
+    def runs(self, stage: str) -> int:
+        return self._runs[stage]
+
+    def profile(self) -> Dict[str, Any]:
+        """Per-validation profile: stage runs, stage reuses and completed validators."""
+        with self._lock:
+            return {
+                "runs": dict(self._runs),
+                "reuses": dict(self._reuses),
+                "completed": list(self._results),
+            }
+
+
+def shared_results_from_context(content: str, context: Optional[Dict[str, Any]]) -> SharedResults:
+    """
+    Return the shared results attached to a validation context, attaching new
+    ones when missing or when they belong to different content.
+    """
+    content_hash = document_from_context(content, context).content_hash
+    if context is not None:
+        shared = context.get(CONTEXT_KEY)
+        if isinstance(shared, SharedResults) and shared.content_hash == content_hash:
+            return shared
+    shared = SharedResults(content_hash)
+    if context is not None:
+        context[CONTEXT_KEY] = shared
+    return shared
@@ -0,0 +1,164 @@
+# file: tbcv/core/single_flight.py
+"""
+Single-flight coalescing of identical concurrent calls.
+
+A burst of CI jobs validating the same file used to run the whole pipeline
+once per request, and identical LLM prompts went to Ollama several times.
+A SingleFlight group keys in-flight calls (``ValidationCache``'s
+``validation_cache_key`` / ``llm_cache_key``): the first caller for a key
+runs the computation, concurrent callers with the same key await it and
+receive the same result (or the same exception). Nothing is remembered once
+the call finishes - caching stays the job of CacheManager.
+
+Cancellation safety: the computation runs in its own task and callers await
+it through ``asyncio.shield``, so cancelling one caller (the one that
+started it included) does not cancel the others. The computation is only
+cancelled when every caller waiting on it has been cancelled.
+
+Groups are named and shared process-wide (``group("llm")``);
+``single_flight_stats()`` reports executions and coalesced calls per group.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _AsyncCall:
+    __slots__ = ("loop", "task", "waiters")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, task: asyncio.Task):
+        self.loop = loop
+        self.task = task
+        self.waiters = 0
+
+
+class _SyncCall:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Deduplicates concurrent calls that share a key."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._async_calls: Dict[str, _AsyncCall] = {}
+        self._sync_calls: Dict[str, _SyncCall] = {}
+        self._lock = threading.Lock()
+        self._stats = {"calls": 0, "executions": 0, "coalesced": 0, "errors": 0, "cancelled": 0}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run ``fn()`` for key, or join the call already in flight for it."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._stats["calls"] += 1
+            call = self._async_calls.get(key)
+            if call is not None and call.loop is loop:
+                self._stats["coalesced"] += 1
+            else:
+                # Futures are bound to their loop: a call from another loop runs on its own
+                call = _AsyncCall(loop, loop.create_task(fn()))
+                self._stats["executions"] += 1
+                if key not in self._async_calls:
+                    self._async_calls[key] = call
+                    call.task.add_done_callback(lambda task, key=key, call=call: self._finish(key, call))
+            call.waiters += 1
+
+        try:
+            return await asyncio.shield(call.task)
+        except asyncio.CancelledError:
+            with self._lock:
+                abandoned = call.waiters == 1 and not call.task.done()
+                if abandoned:
+                    # Nobody is left to receive the result; later callers start afresh
+                    if self._async_calls.get(key) is call:
+                        del self._async_calls[key]
+                    self._stats["cancelled"] += 1
+            if abandoned:
+                call.task.cancel()
+            raise
+        finally:
+            with self._lock:
+                call.waiters -= 1
+
+    def _finish(self, key: str, call: _AsyncCall) -> None:
+        with self._lock:
+            if self._async_calls.get(key) is call:
+                del self._async_calls[key]
+        if not call.task.cancelled() and call.task.exception() is not None:
+            # Also marks the exception retrieved when every caller was cancelled
+            self._stats["errors"] += 1
+
+    def do_sync(self, key: str, fn: Callable[[], T]) -> T:
+        """Blocking counterpart of do() for calls made from threads."""
+        with self._lock:
+            self._stats["calls"] += 1
+            call = self._sync_calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._sync_calls[key] = _SyncCall()
+                self._stats["executions"] += 1
+            else:
+                self._stats["coalesced"] += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            self._stats["errors"] += 1
+            raise
+        finally:
+            with self._lock:
+                del self._sync_calls[key]
+            call.done.set()
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._async_calls) + len(self._sync_calls)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["in_flight"] = len(self._async_calls) + len(self._sync_calls)
+        stats["coalesce_rate"] = stats["coalesced"] / stats["calls"] if stats["calls"] else 0.0
+        return stats
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats = {name: 0 for name in self._stats}
+
+
+_groups: Dict[str, SingleFlight] = {}
+_groups_lock = threading.Lock()
+
+
+def group(name: str) -> SingleFlight:
+    """The process-wide SingleFlight group for name."""
+    with _groups_lock:
+        flight = _groups.get(name)
+        if flight is None:
+            flight = _groups[name] = SingleFlight(name)
+        return flight
+
+
+def single_flight_stats() -> Dict[str, Dict[str, Any]]:
+    """Stats of every group, by name."""
+    with _groups_lock:
+        groups = list(_groups.values())
+    return {flight.name: flight.stats() for flight in groups}
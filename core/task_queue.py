@@ -0,0 +1,228 @@
+# file: tbcv/core/task_queue.py
+"""
+Workers for the durable workflow task queue.
+
+Workflows running with ``workflow_executor: queue`` do not process their
+items in the API process. WorkflowManager writes one ``workflow_tasks`` row
+per item and aggregates the outcomes; ``tbcv worker`` processes, on any
+host that shares the database, lease the rows and run them:
+
+- A lease is a conditional UPDATE (DatabaseManager.lease_tasks), so two
+  workers never hold the same task. Leases are extended by a heartbeat
+  every lease/3 seconds; a worker that dies simply stops heartbeating and
+  its tasks become claimable again once the lease expires.
+- A handler that raises records a failed attempt: the task is retried
+  after ``task_retry_backoff_base * 2^(attempt-1)`` seconds, and
+  dead-lettered once it has used ``task_max_attempts``.
+- Completions are written in batches, after the worker's result buffer
+  has been flushed, so a task is never marked done before its results
+  are stored. Delivery is at-least-once.
+
+Handlers are ``async (task, writer) -> outcome`` callables keyed on the task
+kind; ``DEFAULT_HANDLERS`` covers the kinds WorkflowManager enqueues. They
+run in the task's priority lane (payload ``priority``, batch by default).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import socket
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from core.config import get_settings
+from core.database import DatabaseManager, ResultWriteBuffer, TaskState, WorkflowTask
+from core.logging import get_logger
+from core.priority import BATCH, priority_lane
+
+logger = get_logger(__name__)
+
+TaskHandler = Callable[[WorkflowTask, ResultWriteBuffer], Awaitable[str]]
+
+# Task kinds enqueued by WorkflowManager
+TASK_VALIDATE_FILE = "validate_file"
+TASK_ENHANCE_VALIDATION = "enhance_validation"
+
+
+async def _handle_validate_file(task: WorkflowTask, writer: ResultWriteBuffer) -> str:
+    from agents.base import agent_registry
+    from core.workflow_manager import ITEM_FAILED, ITEM_OK, ITEM_SKIPPED
+
+    orchestrator = agent_registry.get_agent("orchestrator")
+    if orchestrator is None:
+        raise RuntimeError("Orchestrator agent not available")
+    payload = task.payload or {}
+    result = await orchestrator.validate_and_store(
+        payload["file_path"], payload.get("family", "words"), payload.get("validation_types"),
+        run_id=task.workflow_id, writer=writer, workflow_id=task.workflow_id
+    )
+    if result.get("status") == "rejected":
+        return ITEM_SKIPPED
+    return ITEM_FAILED if "error" in result else ITEM_OK
+
+
+async def _handle_enhance_validation(task: WorkflowTask, writer: ResultWriteBuffer) -> str:
+    from agents.base import agent_registry
+    from core.workflow_manager import enhance_validation
+
+    enhancer = agent_registry.get_agent("enhancement_agent") or agent_registry.get_agent("content_enhancer")
+    if enhancer is None:
+        raise RuntimeError("Enhancement agent not available")
+    return await enhance_validation(writer.manager, enhancer, (task.payload or {})["validation_id"])
+
+
+DEFAULT_HANDLERS: Dict[str, TaskHandler] = {
+    TASK_VALIDATE_FILE: _handle_validate_file,
+    TASK_ENHANCE_VALIDATION: _handle_enhance_validation,
+}
+
+
+def default_worker_id() -> str:
+    """host:pid:random, unique across the processes sharing the queue."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+class TaskWorker:
+    """Leases tasks from the queue and runs them on a bounded set of coroutines."""
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        worker_id: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        handlers: Optional[Dict[str, TaskHandler]] = None,
+        lease_seconds: Optional[float] = None,
+        poll_interval: float = 1.0,
+    ):
+        """
+        Args:
+            db_manager: Database holding the queue
+            worker_id: Lease owner name (default: host:pid:random)
+            concurrency: Tasks run at once (default: orchestrator.max_file_workers)
+            handlers: Handler per task kind (default: DEFAULT_HANDLERS)
+            lease_seconds: Lease length (default: orchestrator.task_lease_seconds)
+            poll_interval: Idle wait between empty polls, in seconds
+        """
+        settings = get_settings().orchestrator
+        self.db_manager = db_manager
+        self.worker_id = worker_id or default_worker_id()
+        self.concurrency = max(1, int(concurrency or getattr(settings, "max_file_workers", 4)))
+        self.handlers = dict(handlers or DEFAULT_HANDLERS)
+        self.lease_seconds = float(lease_seconds or getattr(settings, "task_lease_seconds", 60))
+        self.batch_size = max(1, int(getattr(settings, "task_batch_size", 16)))
+        self.backoff_base = float(getattr(settings, "task_retry_backoff_base", 2.0))
+        self.poll_interval = poll_interval
+
+        self._running: Dict[str, asyncio.Task] = {}
+        self._completed: List[Dict[str, Any]] = []
+        self._stopping = False
+        self.stats = {"leased": 0, "completed": 0, "retried": 0, "dead": 0, "lost": 0}
+
+    def stop(self) -> None:
+        """Stop leasing; run() returns once the tasks in flight are finished."""
+        self._stopping = True
+
+    async def run(self, max_tasks: Optional[int] = None, exit_when_idle: bool = False) -> Dict[str, int]:
+        """
+        Work the queue until stop() is called.
+
+        Args:
+            max_tasks: Stop after leasing this many tasks
+            exit_when_idle: Return as soon as the queue has nothing runnable
+
+        Returns:
+            Worker statistics
+        """
+        logger.info(f"Task worker {self.worker_id} started (concurrency={self.concurrency})")
+        writer = self.db_manager.write_buffer()
+        heartbeat = asyncio.create_task(self._heartbeat())
+        last_flush = time.monotonic()
+        try:
+            while not self._stopping:
+                free = self.concurrency - len(self._running)
+                if max_tasks is not None:
+                    free = min(free, max_tasks - self.stats["leased"])
+                leased: List[WorkflowTask] = []
+                # A task finishing during the lease query may requeue itself too late for it
+                busy = bool(self._running)
+                if free > 0:
+                    leased = await asyncio.to_thread(
+                        self.db_manager.lease_tasks, self.worker_id, min(free, self.batch_size),
+                        self.lease_seconds, list(self.handlers)
+                    )
+                for task in leased:
+                    self.stats["leased"] += 1
+                    self._running[task.id] = asyncio.create_task(self._execute(task, writer))
+
+                if len(self._completed) >= self.batch_size or time.monotonic() - last_flush >= self.poll_interval:
+                    await self._flush_completions(writer)
+                    last_flush = time.monotonic()
+
+                if max_tasks is not None and self.stats["leased"] >= max_tasks and not self._running:
+                    break
+                if not leased:
+                    if not busy and not self._running and exit_when_idle:
+                        break
+                    await self._wait_for_capacity(self.poll_interval)
+                elif len(self._running) >= self.concurrency:
+                    await self._wait_for_capacity(None)
+
+            if self._running:
+                await asyncio.gather(*self._running.values(), return_exceptions=True)
+            await self._flush_completions(writer)
+        finally:
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+            await asyncio.to_thread(writer.close)
+        logger.info(f"Task worker {self.worker_id} stopped: {self.stats}")
+        return dict(self.stats)
+
+    async def _wait_for_capacity(self, timeout: Optional[float]) -> None:
+        if self._running:
+            await asyncio.wait(list(self._running.values()), timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        elif timeout:
+            await asyncio.sleep(timeout)
+
+    async def _execute(self, task: WorkflowTask, writer: ResultWriteBuffer) -> None:
+        try:
+            with priority_lane((task.payload or {}).get("priority"), BATCH):
+                outcome = await self.handlers[task.kind](task, writer)
+            self._completed.append({"id": task.id, "outcome": outcome, "result": {"worker": self.worker_id}})
+        except Exception as e:
+            logger.warning(f"Task {task.id} ({task.kind}) attempt {task.attempts} failed: {e}")
+            state = await asyncio.to_thread(
+                self.db_manager.fail_task, self.worker_id, task.id, str(e), self.backoff_base
+            )
+            if state == TaskState.DEAD:
+                self.stats["dead"] += 1
+                logger.error(f"Task {task.id} dead-lettered after {task.attempts} attempts: {e}")
+            elif state is None:
+                self.stats["lost"] += 1
+            else:
+                self.stats["retried"] += 1
+        finally:
+            self._running.pop(task.id, None)
+
+    async def _flush_completions(self, writer: ResultWriteBuffer) -> None:
+        """Store buffered results, then mark their tasks done (one transaction)."""
+        if not self._completed:
+            return
+        completions, self._completed = self._completed, []
+        await asyncio.to_thread(writer.flush)
+        done = await asyncio.to_thread(self.db_manager.complete_tasks, self.worker_id, completions)
+        self.stats["completed"] += done
+        self.stats["lost"] += len(completions) - done
+
+    async def _heartbeat(self) -> None:
+        interval = max(1.0, self.lease_seconds / 3)
+        while True:
+            await asyncio.sleep(interval)
+            task_ids = list(self._running) + [c["id"] for c in self._completed]
+            if not task_ids:
+                continue
+            try:
+                await asyncio.to_thread(self.db_manager.heartbeat_tasks, self.worker_id, task_ids, self.lease_seconds)
+            except Exception as e:
+                logger.warning(f"Task worker {self.worker_id} heartbeat failed: {e}")
@@ -0,0 +1,230 @@
+# file: tbcv/core/validation_manifest.py
+"""
+Validation manifest for incremental directory validation.
+
+Records, per file, what the last directory run saw (mtime, size, content
+hash) together with the run fingerprint (truth version_hash, rule/config
+versions, pipeline settings) and the pipeline result. On the next run:
+
+- files whose stat matches the manifest are reused without being read;
+- files whose stat changed but whose content hash did not are reused and
+  their stat is refreshed;
+- everything else, and every file when the fingerprint changed, is
+  revalidated.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+_HASH_CHUNK = 1 << 20
+_LOOKUP_CHUNK = 500
+
+
+def file_content_hash(path: str) -> str:
+    """SHA-256 of a file's bytes, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def directory_fingerprint(directories: Iterable[str], patterns: Sequence[str] = ("*.yaml", "*.yml", "*.json")) -> str:
+    """
+    Cheap version stamp for configuration/rule directories.
+
+    Hashes (relative path, mtime, size) of every matching file, so editing,
+    adding or removing a rule file changes the stamp.
+    """
+    digest = hashlib.sha256()
+    for directory in directories:
+        root = Path(directory)
+        if not root.is_dir():
+            continue
+        files = sorted({p for pattern in patterns for p in root.rglob(pattern) if p.is_file()})
+        for p in files:
+            st = p.stat()
+            digest.update(f"{root.name}/{p.relative_to(root).as_posix()}:{st.st_mtime_ns}:{st.st_size}\n".encode())
+    return digest.hexdigest()[:16]
+
+
+def run_fingerprint(**parts: Any) -> str:
+    """Stable hash of everything (besides file content) that affects a validation result."""
+    blob = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(blob.encode()).hexdigest()[:16]
+
+
+@dataclass
+class ManifestEntry:
+    """What the manifest knows about one file."""
+    path: str
+    mtime_ns: int
+    size: int
+    content_hash: str
+    fingerprint: str
+    status: str  # validated | rejected
+    result: Optional[Dict[str, Any]] = None
+    reason: str = ""
+
+
+@dataclass
+class FileChange:
+    """A file that must be (re)validated."""
+    path: str
+    mtime_ns: int
+    size: int
+    content_hash: Optional[str] = None  # known when the stat changed but the manifest had a row
+
+
+class ValidationManifest:
+    """SQLite-backed manifest of the last validation of each file."""
+
+    def __init__(self, path: str = "./data/cache/validation_manifest.db"):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS validation_manifest (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                content_hash TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                status TEXT NOT NULL,
+                result TEXT,
+                reason TEXT,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+    def get_many(self, paths: Sequence[str]) -> Dict[str, ManifestEntry]:
+        """Bulk lookup of manifest rows by path."""
+        found: Dict[str, ManifestEntry] = {}
+        with self._lock:
+            for i in range(0, len(paths), _LOOKUP_CHUNK):
+                chunk = list(paths[i:i + _LOOKUP_CHUNK])
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    "SELECT path, mtime_ns, size, content_hash, fingerprint, status, result, reason "
+                    f"FROM validation_manifest WHERE path IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for path, mtime_ns, size, content_hash, fingerprint, status, result, reason in rows:
+                    found[path] = ManifestEntry(
+                        path=path,
+                        mtime_ns=mtime_ns,
+                        size=size,
+                        content_hash=content_hash,
+                        fingerprint=fingerprint,
+                        status=status,
+                        result=json.loads(result) if result else None,
+                        reason=reason or "",
+                    )
+        return found
+
+    def partition(self, paths: Sequence[str], fingerprint: str) -> Tuple[List[ManifestEntry], List[FileChange]]:
+        """
+        Split paths into reusable manifest entries and files to validate.
+
+        Only files whose stat changed are hashed; unchanged files are not read.
+        """
+        known = self.get_many(paths)
+        unchanged: List[ManifestEntry] = []
+        changed: List[FileChange] = []
+        refreshed: List[ManifestEntry] = []
+
+        for path in paths:
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entry = known.get(path)
+            if entry is None or entry.fingerprint != fingerprint:
+                changed.append(FileChange(path, st.st_mtime_ns, st.st_size))
+                continue
+            if entry.mtime_ns == st.st_mtime_ns and entry.size == st.st_size:
+                unchanged.append(entry)
+                continue
+            if entry.size != st.st_size:
+                changed.append(FileChange(path, st.st_mtime_ns, st.st_size))
+                continue
+            # Same size, new mtime (touch, checkout, copy): decide by content
+            try:
+                content_hash = file_content_hash(path)
+            except OSError:
+                continue
+            if content_hash == entry.content_hash:
+                entry.mtime_ns = st.st_mtime_ns
+                unchanged.append(entry)
+                refreshed.append(entry)
+            else:
+                changed.append(FileChange(path, st.st_mtime_ns, st.st_size, content_hash))
+
+        if refreshed:
+            with self._lock:
+                self._conn.executemany(
+                    "UPDATE validation_manifest SET mtime_ns = ?, updated_at = ? WHERE path = ?",
+                    [(e.mtime_ns, time.time(), e.path) for e in refreshed],
+                )
+                self._conn.commit()
+        return unchanged, changed
+
+    # ------------------------------------------------------------------
+    # Update
+    # ------------------------------------------------------------------
+    def record_many(self, entries: Sequence[ManifestEntry]) -> None:
+        """Insert or replace manifest rows in one transaction."""
+        if not entries:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO validation_manifest "
+                "(path, mtime_ns, size, content_hash, fingerprint, status, result, reason, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        e.path, e.mtime_ns, e.size, e.content_hash, e.fingerprint, e.status,
+                        json.dumps(e.result, default=str) if e.result is not None else None,
+                        e.reason, now,
+                    )
+                    for e in entries
+                ],
+            )
+            self._conn.commit()
+
+    def forget(self, paths: Sequence[str]) -> int:
+        """Drop manifest rows (forces revalidation of those files)."""
+        with self._lock:
+            cur = self._conn.executemany("DELETE FROM validation_manifest WHERE path = ?", [(p,) for p in paths])
+            self._conn.commit()
+            return cur.rowcount
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM validation_manifest").fetchone()[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM validation_manifest")
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
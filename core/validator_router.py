@@ -5,19 +5,30 @@ ValidatorRouter - Tiered validation flow with parallel execution and user contro
 Supports:
 - Tiered execution (Tier 1 -> Tier 2 -> Tier 3)
 - Parallel execution within tiers
-- Dependency resolution between validators
+- Dependency resolution between validators (downstream validators read
+  upstream results from the shared results channel on the context)
 - Early termination on critical errors
 - User-configurable validator enable/disable
+- Optional process-pool executor for CPU-bound validators
 """
 
 from __future__ import annotations
 
 import asyncio
+import importlib
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
-from typing import Dict, Any, List, Optional, Set, Callable, TYPE_CHECKING
+from functools import partial
+from typing import Dict, Any, List, Optional, Set, Callable, Tuple, TYPE_CHECKING
 from datetime import datetime
 
 from core.config_loader import get_config_loader, ConfigLoader
+from core.document_model import CONTEXT_KEY as DOCUMENT_KEY, document_from_context
+from core.shared_results import CONTEXT_KEY as SHARED_KEY, SharedResults, shared_results_from_context
 from core.logging import get_logger
 
 if TYPE_CHECKING:
@@ -53,6 +64,225 @@ class FlowResult:
     terminated_early: bool = False
     termination_reason: str = ""
     total_duration_ms: float = 0.0
+    profile: Dict[str, Any] = field(default_factory=dict)
+
+
+# ---------------------------------------------------------------------------
+# Process-pool executor
+# ---------------------------------------------------------------------------
+# Rule-based validators (yaml, markdown, structure, code, links, seo) are pure
+# CPU work: under the GIL they run one after another and block the event loop.
+# In "process" executor mode the router ships them to a warm process pool.
+# Each worker builds its own validator instances once (configs and compiled
+# patterns stay resident) and returns issues as compact dicts.
+
+EXECUTOR_INLINE = "inline"
+EXECUTOR_PROCESS = "process"
+
+DEFAULT_CPU_BOUND_VALIDATORS = ("yaml", "markdown", "structure", "code", "links", "seo", "heading_sizes")
+
+# (module, class qualname, agent_id) - enough to rebuild a validator in a worker
+ValidatorSpec = Tuple[str, str, str]
+
+_worker_validators: Dict[str, Any] = {}
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _worker_get_validator(spec: ValidatorSpec):
+    """Build (once per worker) the validator described by spec."""
+    module_name, qualname, agent_id = spec
+    agent = _worker_validators.get(agent_id)
+    if agent is None:
+        cls = getattr(importlib.import_module(module_name), qualname)
+        agent = cls(agent_id)
+        _worker_validators[agent_id] = agent
+    return agent
+
+
+def _worker_init(specs: List[ValidatorSpec]) -> None:
+    """Pool initializer: create the worker event loop and preload validators."""
+    global _worker_loop
+    _worker_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_worker_loop)
+    for spec in specs:
+        try:
+            agent = _worker_get_validator(spec)
+            # Warm-up run so lazily compiled patterns are built before real work arrives
+            _worker_loop.run_until_complete(agent.validate("", {}))
+        except Exception:
+            continue
+
+
+def _worker_validate(jobs: List[Tuple[str, ValidatorSpec]], content: str,
+                     context: Dict[str, Any]) -> Dict[str, Tuple[float, List[Dict[str, Any]], Dict[str, Any], Optional[str]]]:
+    """
+    Run several validators on one document inside a worker.
+
+    Returns validator_id -> (confidence, compact issues, metrics, error).
+    """
+    global _worker_loop
+    if _worker_loop is None:
+        _worker_init([])
+    out = {}
+    for validator_id, spec in jobs:
+        try:
+            agent = _worker_get_validator(spec)
+            result = _worker_loop.run_until_complete(
+                agent.validate(content, {**context, "validation_type": validator_id})
+            )
+            out[validator_id] = (
+                result.confidence,
+                [issue.to_compact_dict() for issue in result.issues],
+                result.metrics,
+                None,
+            )
+        except Exception as e:
+            out[validator_id] = (0.0, [], {}, str(e))
+    return out
+
+
+class ValidatorProcessPool:
+    """
+    Warm process pool for CPU-bound validators.
+
+    Workers are started on first use and preload the validators they were
+    created for; validators seen later are built lazily in each worker.
+    A broken pool (crashed worker) is replaced on the next submit.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, start_method: str = "spawn"):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.start_method = start_method
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._specs: List[ValidatorSpec] = []
+        self._lock = threading.Lock()
+
+    def _get_executor(self, specs: List[ValidatorSpec]) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._specs = list(dict.fromkeys(specs))
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context(self.start_method),
+                    initializer=_worker_init,
+                    initargs=(self._specs,),
+                )
+                logger.info(f"Validator process pool started with {self.max_workers} workers")
+            return self._executor
+
+    async def run(self, jobs: List[Tuple[str, ValidatorSpec]], content: str,
+                  context: Dict[str, Any]) -> Dict[str, Tuple[float, List[Dict[str, Any]], Dict[str, Any], Optional[str]]]:
+        """Validate content with the given validators in one worker round trip."""
+        executor = self._get_executor([spec for _, spec in jobs])
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(executor, partial(_worker_validate, jobs, content, context))
+        except BrokenProcessPool:
+            self.shutdown(wait=False)
+            raise
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_process_pool: Optional[ValidatorProcessPool] = None
+_process_pool_lock = threading.Lock()
+
+
+def get_validator_process_pool(max_workers: Optional[int] = None, start_method: str = "spawn") -> ValidatorProcessPool:
+    """Get the shared validator process pool (one per process)."""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = ValidatorProcessPool(max_workers=max_workers, start_method=start_method)
+        return _process_pool
+
+
+def shutdown_validator_process_pool() -> None:
+    """Stop the shared validator process pool, if it was started."""
+    global _process_pool
+    with _process_pool_lock:
+        pool, _process_pool = _process_pool, None
+    if pool is not None:
+        pool.shutdown()
+
+
+def _expand_compact_issue(compact: Dict[str, Any]) -> Dict[str, Any]:
+    """Rebuild the full issue dict from a compact one returned by a worker."""
+    from agents.validators.base_validator import ValidationIssue
+    return ValidationIssue.from_dict(compact).to_dict()
+
+
+def validator_spec(agent) -> Optional[ValidatorSpec]:
+    """Spec for running an agent in a worker, or None if it must run inline."""
+    from agents.validators.base_validator import BaseValidatorAgent
+
+    if not isinstance(agent, BaseValidatorAgent):
+        return None
+    cls = type(agent)
+    return (cls.__module__, cls.__qualname__, agent.agent_id)
+
+
+def executor_settings(config: Optional[Dict[str, Any]], mode: Optional[str] = None) -> Dict[str, Any]:
+    """Executor section of validation_flow (mode, max_workers, start_method, cpu_bound_validators)."""
+    executor = dict((config or {}).get("executor", {}) or {})
+    if mode:
+        executor["mode"] = mode
+    return executor
+
+
+def process_pool_for(executor: Dict[str, Any]) -> ValidatorProcessPool:
+    """The shared pool, sized from executor settings on first use."""
+    return get_validator_process_pool(
+        max_workers=int(executor.get("max_workers", 0) or 0) or None,
+        start_method=executor.get("start_method", "spawn"),
+    )
+
+
+async def run_in_pool(
+    pool: ValidatorProcessPool,
+    jobs: List[Tuple[str, ValidatorSpec]],
+    content: str,
+    context: Dict[str, Any],
+    timeout: Optional[float]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Validate one document with several validators in one worker round trip.
+
+    Returns validator_id -> result dict (confidence, issues, metrics, agent_id,
+    or an error entry). Timeouts and pool failures (unpicklable context,
+    crashed worker) propagate so the caller can fall back to inline execution.
+    """
+    # Workers rebuild the document model from their own memo; don't ship it twice.
+    # Pooled rule validators neither read nor publish shared results.
+    worker_context = {k: v for k, v in context.items() if k not in (DOCUMENT_KEY, SHARED_KEY)}
+    raw = await asyncio.wait_for(pool.run(jobs, content, worker_context), timeout=timeout)
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for val_id, spec in jobs:
+        confidence, issues, metrics, error = raw[val_id]
+        if error is not None:
+            logger.error(f"Error in validator {val_id}: {error}")
+            results[val_id] = {
+                "confidence": 0.0,
+                "issues": [{
+                    "level": "error",
+                    "category": "validator_error",
+                    "message": f"Error in validator {val_id}: {error}"
+                }],
+                "error": error
+            }
+        else:
+            results[val_id] = {
+                "confidence": confidence,
+                "issues": [_expand_compact_issue(issue) for issue in issues],
+                "metrics": metrics,
+                "agent_id": spec[2]
+            }
+    return results
 
 
 class ValidatorRouter:
@@ -66,7 +296,9 @@ class ValidatorRouter:
     def __init__(
         self,
         agent_registry,
-        config_loader: Optional[ConfigLoader] = None
+        config_loader: Optional[ConfigLoader] = None,
+        executor_mode: Optional[str] = None,
+        process_pool: Optional[ValidatorProcessPool] = None
     ):
         """
         Initialize the validator router.
@@ -74,12 +306,30 @@ class ValidatorRouter:
         Args:
             agent_registry: The agent registry to look up validators
             config_loader: Optional config loader (uses default if not provided)
+            executor_mode: "inline" or "process" (overrides executor.mode in config)
+            process_pool: Optional pool for process mode (uses the shared pool if not provided)
         """
         self.agent_registry = agent_registry
         self._config_loader = config_loader or get_config_loader()
         self._config = self._config_loader.load("validation_flow")
         self._dependency_graph: Dict[str, Set[str]] = {}
         self._build_dependency_graph()
+        self._executor_mode_override = executor_mode
+        self._process_pool = process_pool
+
+    def _get_executor_config(self) -> Dict[str, Any]:
+        """Executor settings: mode, max_workers, start_method, cpu_bound_validators."""
+        return executor_settings(self._config, self._executor_mode_override)
+
+    def _get_process_pool(self) -> ValidatorProcessPool:
+        if self._process_pool is None:
+            self._process_pool = process_pool_for(self._get_executor_config())
+        return self._process_pool
+
+    def _get_validator_spec(self, validator_id: str) -> Optional[ValidatorSpec]:
+        """Spec for running a validator in a worker, or None if it must run inline."""
+        agent_id = self._get_validator_agent_id(validator_id)
+        return validator_spec(self.agent_registry.get_agent(agent_id) if agent_id else None)
 
     def _build_dependency_graph(self):
         """Build the dependency graph from config."""
@@ -188,6 +438,13 @@ class ValidatorRouter:
 
         return counts
 
+    @staticmethod
+    def _share_result(context: Dict[str, Any], validator_id: str, result: Dict[str, Any]) -> None:
+        """Make a completed validator result visible to later validators."""
+        shared = context.get(SHARED_KEY)
+        if isinstance(shared, SharedResults):
+            shared.record(validator_id, result)
+
     async def _execute_validator(
         self,
         validator_id: str,
@@ -271,6 +528,76 @@ class ValidatorRouter:
                 "error": str(e)
             }
 
+    async def _execute_batch(
+        self,
+        validator_ids: List[str],
+        content: str,
+        context: Dict[str, Any],
+        timeout: float
+    ) -> List[Any]:
+        """
+        Run validators concurrently; results (or exceptions) come back in order.
+
+        In process executor mode, CPU-bound validators are sent to the process
+        pool together (one round trip per document and tier); the rest run on
+        the event loop as usual.
+        """
+        executor = self._get_executor_config()
+        pooled: List[Tuple[str, ValidatorSpec]] = []
+        if executor.get("mode", EXECUTOR_INLINE) == EXECUTOR_PROCESS:
+            cpu_bound = set(executor.get("cpu_bound_validators", DEFAULT_CPU_BOUND_VALIDATORS))
+            for val_id in validator_ids:
+                if val_id in cpu_bound:
+                    spec = self._get_validator_spec(val_id)
+                    if spec is not None:
+                        pooled.append((val_id, spec))
+
+        pooled_ids = {val_id for val_id, _ in pooled}
+        inline_ids = [v for v in validator_ids if v not in pooled_ids]
+        tasks = [self._execute_validator(v, content, context, timeout) for v in inline_ids]
+        if pooled:
+            tasks.append(self._execute_in_pool(pooled, content, context, timeout))
+
+        gathered = await asyncio.gather(*tasks, return_exceptions=True)
+        results: Dict[str, Any] = dict(zip(inline_ids, gathered))
+        if pooled:
+            pool_results = gathered[-1]
+            for val_id, _ in pooled:
+                results[val_id] = pool_results if isinstance(pool_results, Exception) else pool_results[val_id]
+        return [results[v] for v in validator_ids]
+
+    async def _execute_in_pool(
+        self,
+        jobs: List[Tuple[str, ValidatorSpec]],
+        content: str,
+        context: Dict[str, Any],
+        timeout: float
+    ) -> Dict[str, Dict[str, Any]]:
+        """Execute validators in the process pool; falls back to inline execution if the pool fails."""
+        try:
+            return await run_in_pool(self._get_process_pool(), jobs, content, context, timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Pooled validators {[v for v, _ in jobs]} timed out after {timeout}s")
+            return {
+                val_id: {
+                    "confidence": 0.0,
+                    "issues": [{
+                        "level": "warning",
+                        "category": "timeout",
+                        "message": f"Validator {val_id} timed out after {timeout}s"
+                    }],
+                    "timeout": True
+                }
+                for val_id, _ in jobs
+            }
+        except Exception as e:
+            # Unpicklable context, crashed worker, ...: keep validating in-process
+            logger.warning(f"Process pool unavailable, running validators inline: {e}")
+            inline = await asyncio.gather(*[
+                self._execute_validator(val_id, content, context, timeout) for val_id, _ in jobs
+            ])
+            return {val_id: result for (val_id, _), result in zip(jobs, inline)}
+
     async def _execute_tier(
         self,
         tier_key: str,
@@ -322,11 +649,7 @@ class ValidatorRouter:
 
         if parallel and not respect_deps:
             # Run all validators in parallel
-            tasks = []
-            for val_id in validators_to_run:
-                tasks.append(self._execute_validator(val_id, content, context, effective_timeout))
-
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            results = await self._execute_batch(validators_to_run, content, context, effective_timeout)
 
             for val_id, result in zip(validators_to_run, results):
                 if isinstance(result, Exception):
@@ -341,6 +664,7 @@ class ValidatorRouter:
                     }
                 else:
                     tier_result.results[val_id] = result
+                    self._share_result(context, val_id, result)
                     counts = self._count_issues_by_level(result)
                     tier_result.critical_count += counts["critical"]
                     tier_result.error_count += counts["error"]
@@ -372,11 +696,7 @@ class ValidatorRouter:
 
                 if parallel:
                     # Run ready validators in parallel
-                    tasks = []
-                    for val_id in ready:
-                        tasks.append(self._execute_validator(val_id, content, context, effective_timeout))
-
-                    results = await asyncio.gather(*tasks, return_exceptions=True)
+                    results = await self._execute_batch(ready, content, context, effective_timeout)
 
                     for val_id, result in zip(ready, results):
                         pending.discard(val_id)
@@ -392,6 +712,7 @@ class ValidatorRouter:
                             }
                         else:
                             tier_result.results[val_id] = result
+                            self._share_result(context, val_id, result)
                             counts = self._count_issues_by_level(result)
                             tier_result.critical_count += counts["critical"]
                             tier_result.error_count += counts["error"]
@@ -405,6 +726,7 @@ class ValidatorRouter:
                         result = await self._execute_validator(val_id, content, context, effective_timeout)
                         pending.discard(val_id)
                         tier_result.results[val_id] = result
+                        self._share_result(context, val_id, result)
                         tier_result.validators_run.append(val_id)
                         completed_validators.add(val_id)
 
@@ -448,9 +770,14 @@ class ValidatorRouter:
             FlowResult with complete validation results
         """
         start_time = datetime.now()
-        context = context or {}
+        context = dict(context or {})
         family = context.get("family")
 
+        # Parse the document once; every validator reads the shared model, and
+        # downstream tiers read upstream results from the shared channel
+        document_from_context(content, context)
+        shared = shared_results_from_context(content, context)
+
         # Determine profile
         effective_profile = profile or self._config.get("profile", "default")
 
@@ -518,6 +845,8 @@ class ValidatorRouter:
                     flow_result.termination_reason = f"Total critical errors ({flow_result.total_critical}) exceeded max ({max_critical})"
                     break
 
+        flow_result.profile = shared.profile()
+
         # Calculate total duration
         flow_result.total_duration_ms = (datetime.now() - start_time).total_seconds() * 1000
 
@@ -10,12 +10,18 @@ from __future__ import annotations
 
 import os
 import json
+import heapq
 import hashlib
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from core.logging import get_logger
 from core.config_loader import get_config_loader
 from core.embeddings import get_embedding_service, EmbeddingService
@@ -42,16 +48,114 @@ class IndexStats:
     embedding_dimension: Optional[int]
 
 
+class _FamilyMatrix:
+    """
+    Contiguous embedding matrix for one family.
+
+    Rows are L2-normalized float32 vectors, so cosine similarity against a
+    normalized query is a single matrix-vector product. Capacity grows by
+    doubling, which keeps incremental adds amortized O(dim).
+    """
+
+    _INITIAL_CAPACITY = 64
+
+    def __init__(self, dimension: int):
+        self.dimension = dimension
+        self.ids: List[str] = []
+        self.rows: Dict[str, int] = {}
+        if np is not None:
+            self._matrix = np.zeros((self._INITIAL_CAPACITY, dimension), dtype=np.float32)
+        else:
+            self._vectors: List[List[float]] = []
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @staticmethod
+    def normalize(vector: List[float]):
+        """Return a unit-length copy of vector (zero vectors stay zero)."""
+        if np is not None:
+            arr = np.asarray(vector, dtype=np.float32)
+            norm = float(np.linalg.norm(arr))
+            return arr / norm if norm else arr
+        norm = sum(x * x for x in vector) ** 0.5
+        return [x / norm for x in vector] if norm else list(vector)
+
+    def upsert(self, doc_id: str, vector) -> None:
+        """Insert or replace the (already normalized) row for doc_id."""
+        row = self.rows.get(doc_id)
+        if np is not None:
+            if row is None:
+                row = len(self.ids)
+                if row == self._matrix.shape[0]:
+                    grown = np.zeros((row * 2, self.dimension), dtype=np.float32)
+                    grown[:row] = self._matrix
+                    self._matrix = grown
+                self.ids.append(doc_id)
+                self.rows[doc_id] = row
+            self._matrix[row] = vector
+        else:
+            if row is None:
+                self.rows[doc_id] = len(self.ids)
+                self.ids.append(doc_id)
+                self._vectors.append(vector)
+            else:
+                self._vectors[row] = vector
+
+    def remove(self, doc_id: str) -> None:
+        """Remove doc_id by moving the last row into its slot."""
+        row = self.rows.pop(doc_id, None)
+        if row is None:
+            return
+        last = len(self.ids) - 1
+        if row != last:
+            moved = self.ids[last]
+            self.ids[row] = moved
+            self.rows[moved] = row
+            if np is not None:
+                self._matrix[row] = self._matrix[last]
+            else:
+                self._vectors[row] = self._vectors[last]
+        self.ids.pop()
+        if np is None:
+            self._vectors.pop()
+
+    def top_k(self, query, k: int) -> List[Tuple[str, float]]:
+        """Return (doc_id, cosine) for the k best rows, best first (ties by insertion row)."""
+        n = len(self.ids)
+        if n == 0 or k <= 0:
+            return []
+        k = min(k, n)
+        if np is not None:
+            scores = self._matrix[:n] @ query
+            if k < n:
+                candidates = np.argpartition(-scores, k - 1)[:k]
+            else:
+                candidates = np.arange(n)
+            order = candidates[np.lexsort((candidates, -scores[candidates]))]
+            return [(self.ids[i], float(scores[i])) for i in order]
+        scored = (
+            (sum(a * b for a, b in zip(vec, query)), i)
+            for i, vec in enumerate(self._vectors)
+        )
+        best = heapq.nsmallest(k, scored, key=lambda item: (-item[0], item[1]))
+        return [(self.ids[i], score) for score, i in best]
+
+
 class InMemoryVectorStore:
     """
     Simple in-memory vector store for testing and fallback.
 
-    Uses cosine similarity for search.
+    Uses cosine similarity for search. Each family keeps a contiguous,
+    pre-normalized float32 matrix (pure-Python lists when NumPy is not
+    installed), so a search is one matrix-vector product plus a top-k
+    partial sort.
     """
 
     def __init__(self):
-        self._documents: Dict[str, Dict] = {}  # id -> {text, embedding, metadata}
+        self._documents: Dict[str, Dict] = {}  # id -> {text, metadata, family}
         self._families: Dict[str, List[str]] = {}  # family -> [doc_ids]
+        self._matrices: Dict[str, _FamilyMatrix] = {}  # family -> embedding matrix
 
     def add(
         self,
@@ -62,17 +166,40 @@ class InMemoryVectorStore:
         family: str
     ):
         """Add a document to the store."""
+        previous = self._documents.get(doc_id)
+        if previous is not None and previous["family"] != family:
+            self._remove(doc_id, previous["family"])
+            previous = None
+
         self._documents[doc_id] = {
             "text": text,
-            "embedding": embedding,
             "metadata": metadata,
             "family": family
         }
         if family not in self._families:
             self._families[family] = []
-        if doc_id not in self._families[family]:
+        if previous is None:
             self._families[family].append(doc_id)
 
+        matrix = self._matrices.get(family)
+        if matrix is None:
+            matrix = self._matrices[family] = _FamilyMatrix(len(embedding))
+        if len(embedding) != matrix.dimension:
+            # Cosine similarity is 0.0 for mismatched dimensions; keep the
+            # document listed but out of the matrix.
+            matrix.remove(doc_id)
+            return
+        matrix.upsert(doc_id, _FamilyMatrix.normalize(embedding))
+
+    def add_batch(
+        self,
+        documents: List[Tuple[str, str, List[float], Dict[str, Any]]],
+        family: str
+    ):
+        """Add (doc_id, text, embedding, metadata) tuples to a family."""
+        for doc_id, text, embedding, metadata in documents:
+            self.add(doc_id, text, embedding, metadata, family)
+
     def search(
         self,
         query_embedding: List[float],
@@ -80,18 +207,25 @@ class InMemoryVectorStore:
         top_k: int = 5
     ) -> List[SearchResult]:
         """Search for similar documents."""
-        results = []
-
-        # Get documents for this family
         doc_ids = self._families.get(family, [])
+        if not doc_ids or top_k <= 0:
+            return []
 
-        for doc_id in doc_ids:
-            doc = self._documents.get(doc_id)
-            if not doc:
-                continue
+        matrix = self._matrices.get(family)
+        comparable = matrix is not None and len(query_embedding) == matrix.dimension
+        ranked: List[Tuple[str, float]] = []
+        if comparable:
+            ranked = matrix.top_k(_FamilyMatrix.normalize(query_embedding), top_k)
+
+        if not comparable or len(matrix) < len(doc_ids):
+            # Documents that cannot be compared (dimension mismatch) score 0.0
+            in_matrix = matrix.rows if comparable else {}
+            unranked = [(doc_id, 0.0) for doc_id in doc_ids if doc_id not in in_matrix][:top_k]
+            ranked = sorted(ranked + unranked, key=lambda item: item[1], reverse=True)[:top_k]
 
-            # Calculate cosine similarity
-            score = self._cosine_similarity(query_embedding, doc["embedding"])
+        results = []
+        for doc_id, score in ranked:
+            doc = self._documents[doc_id]
             results.append(SearchResult(
                 id=doc_id,
                 text=doc["text"],
@@ -99,24 +233,16 @@ class InMemoryVectorStore:
                 metadata=doc["metadata"],
                 family=family
             ))
+        return results
 
-        # Sort by score descending
-        results.sort(key=lambda x: x.score, reverse=True)
-        return results[:top_k]
-
-    def _cosine_similarity(self, a: List[float], b: List[float]) -> float:
-        """Calculate cosine similarity between two vectors."""
-        if len(a) != len(b):
-            return 0.0
-
-        dot_product = sum(x * y for x, y in zip(a, b))
-        norm_a = sum(x * x for x in a) ** 0.5
-        norm_b = sum(x * x for x in b) ** 0.5
-
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
-
-        return dot_product / (norm_a * norm_b)
+    def _remove(self, doc_id: str, family: str):
+        """Remove a single document from a family."""
+        members = self._families.get(family)
+        if members and doc_id in members:
+            members.remove(doc_id)
+        matrix = self._matrices.get(family)
+        if matrix is not None:
+            matrix.remove(doc_id)
 
     def clear(self, family: Optional[str] = None):
         """Clear documents, optionally for specific family."""
@@ -125,9 +251,11 @@ class InMemoryVectorStore:
             for doc_id in doc_ids:
                 self._documents.pop(doc_id, None)
             self._families.pop(family, None)
+            self._matrices.pop(family, None)
         else:
             self._documents.clear()
             self._families.clear()
+            self._matrices.clear()
 
     def count(self, family: Optional[str] = None) -> int:
         """Count documents, optionally for specific family."""
@@ -304,8 +432,7 @@ class TruthVectorStore:
 
         # Add to store
         if isinstance(self._store, InMemoryVectorStore):
-            for doc_id, text, embedding, metadata in valid_docs:
-                self._store.add(doc_id, text, embedding, metadata, family)
+            self._store.add_batch(valid_docs, family)
         else:
             collection = self._get_collection(family)
             if collection:
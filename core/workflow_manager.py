@@ -3,19 +3,96 @@ Workflow manager for orchestrating complex validation and enhancement workflows.
 
 This module provides thread-safe workflow execution, progress tracking, and
 control operations (pause/resume/cancel) for long-running operations.
+
+validate_directory and batch_enhance run their items through the real agents
+on a bounded pool of async workers. Pause/cancel are honoured between items,
+progress is checkpointed to the workflow row every
+orchestrator.workflow_checkpoint_interval items, and a restarted job resumes
+after the last contiguous completed item.
+
+With the "queue" executor the items become rows of the durable task queue
+instead (see core.task_queue) and `tbcv worker` processes run them; the
+manager only enqueues, relays pause/cancel and aggregates the outcomes.
 """
 
+import asyncio
 import threading
 import time
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable, Awaitable, Sequence
 from pathlib import Path
 
+from core.config import get_settings
 from core.logging import get_logger
 from core.database import DatabaseManager, WorkflowState
+from core.priority import BACKGROUND, BATCH, normalize_lane, priority_lane
 
 logger = get_logger(__name__)
 
+# Workflow types driven by the item engine (resumable after a restart)
+RESUMABLE_WORKFLOW_TYPES = ("validate_directory", "batch_enhance", "full_audit")
+
+# Item outcomes reported by the per-item handlers
+ITEM_OK = "ok"
+ITEM_FAILED = "failed"
+ITEM_SKIPPED = "skipped"
+
+# Pause/cancel requests made through the database (another process, the REST
+# control endpoint) are picked up at most this often
+_CONTROL_SYNC_INTERVAL_S = 1.0
+_PAUSE_POLL_S = 0.1
+
+# How often a queued workflow re-counts its tasks
+_QUEUE_POLL_S = 2.0
+
+
+async def enhance_validation(db_manager: DatabaseManager, enhancer, validation_id: str) -> str:
+    """
+    Apply the approved recommendations of one validation to its file.
+
+    Item handler of batch_enhance, shared by the local engine and the task
+    queue workers.
+
+    Returns:
+        ITEM_OK, or ITEM_SKIPPED when nothing was applied
+    """
+    from core.io_win import read_text, write_text_crlf
+    from core.path_validator import is_safe_path, validate_write_path
+
+    validation = await asyncio.to_thread(db_manager.get_validation_result, validation_id)
+    if validation is None:
+        raise ValueError(f"Validation {validation_id} not found")
+
+    file_path = Path(validation.file_path or "")
+    if not is_safe_path(file_path) or not file_path.is_file() or not validate_write_path(file_path):
+        raise ValueError(f"Cannot enhance {validation_id}: invalid file path '{validation.file_path}'")
+
+    recommendations = await asyncio.to_thread(
+        db_manager.list_recommendations, validation_id=validation_id, status="approved"
+    )
+    if not recommendations:
+        return ITEM_SKIPPED
+
+    content = await asyncio.to_thread(read_text, file_path)
+    result = await enhancer.process_request("enhance_with_recommendations", {
+        "content": content,
+        "file_path": str(file_path),
+        "validation_id": validation_id,
+        "recommendation_ids": [r.id for r in recommendations]
+    })
+    applied = result.get("applied_recommendations") or []
+    if not applied:
+        return ITEM_SKIPPED
+
+    def persist() -> None:
+        write_text_crlf(file_path, result["enhanced_content"], atomic=True)
+        for recommendation_id in applied:
+            db_manager.mark_recommendation_applied(recommendation_id, applied_by=f"workflow:{enhancer.agent_id}")
+        db_manager.update_validation_status(validation_id, "enhanced")
+
+    await asyncio.to_thread(persist)
+    return ITEM_OK
+
 
 class WorkflowManager:
     """
@@ -28,16 +105,25 @@ class WorkflowManager:
     - Workflow status monitoring
     """
 
-    def __init__(self, db_manager: DatabaseManager, agent_registry=None):
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        agent_registry=None,
+        loop: Optional[asyncio.AbstractEventLoop] = None
+    ):
         """
         Initialize workflow manager.
 
         Args:
             db_manager: Database manager instance
             agent_registry: Optional agent registry for validation/enhancement
+                (defaults to the global registry)
+            loop: Event loop the agents live on. Workflow threads submit their
+                items to it; without one each workflow runs its own loop.
         """
         self.db_manager = db_manager
         self.agent_registry = agent_registry
+        self.loop = loop
         self.logger = get_logger(__name__)
 
         # Thread-safe workflow tracking
@@ -61,16 +147,23 @@ class WorkflowManager:
                 self.logger.error(f"Workflow {workflow_id} not found")
                 return
 
-            # Initialize control state
+            if workflow.state in [WorkflowState.COMPLETED, WorkflowState.FAILED, WorkflowState.CANCELLED]:
+                self.logger.info(f"Workflow {workflow_id} is already finished (state={workflow.state.value})")
+                return
+
+            # Initialize control state; a paused workflow starts paused
+            paused = workflow.state == WorkflowState.PAUSED
             with self._lock:
                 self._workflow_control[workflow_id] = {
-                    "should_pause": False,
+                    "should_pause": paused,
                     "should_cancel": False,
-                    "is_running": True
+                    "is_running": True,
+                    "synced_at": time.monotonic()
                 }
 
             # Update workflow state to running
-            self.db_manager.update_workflow(workflow_id, state=WorkflowState.RUNNING)
+            if not paused:
+                self.db_manager.update_workflow(workflow_id, state=WorkflowState.RUNNING)
 
             self.logger.info(f"Starting workflow {workflow_id} (type={workflow.type})")
 
@@ -113,6 +206,57 @@ class WorkflowManager:
                 if workflow_id in self._running_workflows:
                     del self._running_workflows[workflow_id]
 
+    def start_workflow(self, workflow_id: str) -> threading.Thread:
+        """
+        Execute a workflow on a background thread.
+
+        Args:
+            workflow_id: ID of workflow to execute
+
+        Returns:
+            The started thread (an already running one is returned as is)
+        """
+        with self._lock:
+            thread = self._running_workflows.get(workflow_id)
+            if thread is not None and thread.is_alive():
+                return thread
+            thread = threading.Thread(
+                target=self.execute_workflow,
+                args=(workflow_id,),
+                name=f"workflow-{workflow_id}",
+                daemon=True
+            )
+            self._running_workflows[workflow_id] = thread
+        thread.start()
+        return thread
+
+    def resume_interrupted_workflows(self) -> List[str]:
+        """
+        Restart workflows left running or pending by a previous process.
+
+        Their last checkpoint tells the engine where to pick up; paused
+        workflows stay paused until resume_workflow() starts them. Call once
+        at startup, before new work is queued.
+
+        Returns:
+            IDs of the workflows that were restarted
+        """
+        restarted = []
+        for state in (WorkflowState.RUNNING, WorkflowState.PENDING):
+            for workflow in self.db_manager.list_workflows(state=state.value, limit=1000):
+                if workflow.type not in RESUMABLE_WORKFLOW_TYPES:
+                    continue
+                with self._lock:
+                    if workflow.id in self._running_workflows:
+                        continue
+                self.logger.info(
+                    f"Resuming interrupted workflow {workflow.id} "
+                    f"(type={workflow.type}, step={workflow.current_step or 0}/{workflow.total_steps or 0})"
+                )
+                self.start_workflow(workflow.id)
+                restarted.append(workflow.id)
+        return restarted
+
     def pause_workflow(self, workflow_id: str) -> WorkflowState:
         """
         Pause a running or pending workflow.
@@ -151,6 +295,10 @@ class WorkflowManager:
         """
         Resume a paused workflow.
 
+        A workflow with no live thread in this process (paused before a
+        restart, which startup recovery leaves paused) is started again and
+        picks up from its last checkpoint.
+
         Args:
             workflow_id: ID of workflow to resume
 
@@ -173,8 +321,18 @@ class WorkflowManager:
 
             self.db_manager.update_workflow(workflow_id, state=WorkflowState.RUNNING)
 
+            thread = self._running_workflows.get(workflow_id)
+            restart = (thread is None or not thread.is_alive()) and workflow.type in RESUMABLE_WORKFLOW_TYPES
+
+        if restart:
+            self.logger.info(
+                f"Restarting paused workflow {workflow_id} "
+                f"(type={workflow.type}, step={workflow.current_step or 0}/{workflow.total_steps or 0})"
+            )
+            self.start_workflow(workflow_id)
+        else:
             self.logger.info(f"Workflow {workflow_id} resumed")
-            return WorkflowState.RUNNING
+        return WorkflowState.RUNNING
 
     def cancel_workflow(self, workflow_id: str) -> WorkflowState:
         """
@@ -202,6 +360,8 @@ class WorkflowManager:
                 state=WorkflowState.CANCELLED,
                 completed_at=datetime.now(timezone.utc)
             )
+            # Queued items must not be picked up by workers any more
+            self.db_manager.cancel_tasks(workflow_id)
 
             self.logger.info(f"Workflow {workflow_id} cancelled")
             return WorkflowState.CANCELLED
@@ -243,10 +403,12 @@ class WorkflowManager:
             estimated_total = elapsed / (workflow.progress_percent / 100.0)
             eta_seconds = max(0, estimated_total - elapsed)
 
+        execution = (workflow.workflow_metadata or {}).get("execution") or {}
+
         # Count errors
-        errors_count = 0
+        errors_count = execution.get("items_failed", 0)
         if workflow.error_message:
-            errors_count = 1
+            errors_count += 1
 
         return {
             "progress_percent": workflow.progress_percent or 0,
@@ -254,7 +416,8 @@ class WorkflowManager:
             "files_total": workflow.total_steps or 0,
             "errors_count": errors_count,
             "duration_seconds": duration_seconds,
-            "eta_seconds": eta_seconds
+            "eta_seconds": eta_seconds,
+            "items_per_second": execution.get("items_per_second", 0.0)
         }
 
     def generate_workflow_report(
@@ -295,7 +458,8 @@ class WorkflowManager:
                 "duration_seconds": summary["duration_seconds"],
                 "files_processed": summary["files_processed"],
                 "files_total": summary["files_total"],
-                "errors_count": summary["errors_count"]
+                "errors_count": summary["errors_count"],
+                "items_per_second": summary["items_per_second"]
             }
 
             # Add metadata
@@ -360,6 +524,269 @@ class WorkflowManager:
             progress_percent=progress_percent
         )
 
+    def _sync_control_state(self, workflow_id: str) -> None:
+        """
+        Mirror pause/cancel requests recorded only in the database.
+
+        Covers the REST control endpoint and other processes; throttled to one
+        read per _CONTROL_SYNC_INTERVAL_S.
+        """
+        with self._lock:
+            control = self._workflow_control.get(workflow_id)
+            if control is None or time.monotonic() - control["synced_at"] < _CONTROL_SYNC_INTERVAL_S:
+                return
+            control["synced_at"] = time.monotonic()
+
+        workflow = self.db_manager.get_workflow(workflow_id)
+        if workflow is None:
+            return
+        with self._lock:
+            if workflow.state == WorkflowState.CANCELLED:
+                control["should_cancel"] = True
+            elif workflow.state == WorkflowState.PAUSED:
+                control["should_pause"] = True
+            elif workflow.state == WorkflowState.RUNNING:
+                control["should_pause"] = False
+
+    async def _await_control_signals(self, workflow_id: str) -> bool:
+        """
+        Async counterpart of _check_control_signals used between items.
+
+        Returns:
+            True if the next item should run, False once cancelled
+        """
+        while True:
+            with self._lock:
+                control = self._workflow_control.get(workflow_id)
+                due = control is not None and time.monotonic() - control["synced_at"] >= _CONTROL_SYNC_INTERVAL_S
+            if due:
+                await asyncio.to_thread(self._sync_control_state, workflow_id)
+            with self._lock:
+                if control is None:
+                    return True
+                if control["should_cancel"]:
+                    return False
+                if not control["should_pause"]:
+                    return True
+            await asyncio.sleep(_PAUSE_POLL_S)
+
+    def _run_coroutine(self, coro: Awaitable[Any]) -> Any:
+        """Run a coroutine from a workflow thread, on the agents' loop when one is set."""
+        if self.loop is not None and self.loop.is_running():
+            return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+        return asyncio.run(coro)
+
+    def _get_agent(self, agent_id: str):
+        registry = self.agent_registry
+        if registry is None:
+            from agents.base import agent_registry as registry
+        return registry.get_agent(agent_id)
+
+    def _executor(self, params: Dict[str, Any]) -> str:
+        executor = params.get("executor") or getattr(get_settings().orchestrator, "workflow_executor", "local")
+        if executor not in ("local", "queue"):
+            raise ValueError(f"Unknown workflow executor: {executor}")
+        return executor
+
+    def _lane(self, params: Dict[str, Any]) -> str:
+        """Priority lane of a workflow's agent calls ({"priority": ...}, batch by default)."""
+        return normalize_lane(params.get("priority"), BATCH)
+
+    def _worker_count(self, params: Dict[str, Any]) -> int:
+        settings = get_settings()
+        default = getattr(settings.orchestrator, "max_file_workers", 4)
+        return max(1, int(params.get("max_workers") or default))
+
+    async def _run_items(
+        self,
+        workflow_id: str,
+        items: Sequence[Any],
+        process_item: Callable[[Any], Awaitable[str]],
+        workers: int,
+        on_checkpoint: Optional[Callable[[], Any]] = None,
+        lane: str = BATCH
+    ) -> Dict[str, Any]:
+        """
+        Drive items through process_item on a bounded pool of async workers.
+
+        Items are claimed in order. Pause/cancel are checked before each item.
+        Every checkpoint_interval completed items (and at the end) on_checkpoint
+        runs (e.g. to flush buffered results) and the workflow row records the
+        resume point: the number of leading items that are all done. A restart
+        skips those; items finished out of order past it run again.
+
+        Args:
+            workflow_id: ID of workflow
+            items: Work items, in a stable order
+            process_item: Coroutine returning ITEM_OK, ITEM_FAILED or ITEM_SKIPPED
+            workers: Number of concurrent workers
+            on_checkpoint: Optional blocking callable run before each checkpoint
+            lane: Priority lane the workers' agent calls are admitted in
+
+        Returns:
+            Execution statistics (also stored in metadata["execution"])
+        """
+        workflow = await asyncio.to_thread(self.db_manager.get_workflow, workflow_id)
+        metadata = dict(workflow.workflow_metadata or {})
+        previous = metadata.get("execution") or {}
+
+        total = len(items)
+        resume_from = min(int(previous.get("resume_from", 0)), total)
+        if previous.get("items_total") not in (None, total):
+            # The inputs changed since the last run (e.g. files were added); start over
+            resume_from = 0
+            previous = {}
+        if resume_from:
+            self.logger.info(f"Workflow {workflow_id} resuming at item {resume_from}/{total}")
+
+        interval = max(1, int(getattr(get_settings().orchestrator, "workflow_checkpoint_interval", 50)))
+        stats = {
+            "items_total": total,
+            "resume_from": resume_from,
+            "items_ok": int(previous.get("items_ok", 0)),
+            "items_failed": int(previous.get("items_failed", 0)),
+            "items_skipped": int(previous.get("items_skipped", 0)),
+            "workers": workers,
+            "items_per_second": 0.0,
+            "elapsed_seconds": float(previous.get("elapsed_seconds", 0.0)),
+        }
+        done_ahead: set = set()
+        since_checkpoint = 0
+        processed_this_run = 0
+        started = time.monotonic()
+        elapsed_before = stats["elapsed_seconds"]
+        checkpoint_lock = asyncio.Lock()
+
+        async def checkpoint() -> None:
+            async with checkpoint_lock:
+                if on_checkpoint is not None:
+                    await asyncio.to_thread(on_checkpoint)
+                run_seconds = time.monotonic() - started
+                stats["elapsed_seconds"] = round(elapsed_before + run_seconds, 3)
+                stats["items_per_second"] = round(processed_this_run / run_seconds, 3) if run_seconds > 0 else 0.0
+                metadata["execution"] = dict(stats)
+                await asyncio.to_thread(
+                    self.db_manager.update_workflow,
+                    workflow_id,
+                    current_step=stats["resume_from"],
+                    total_steps=total,
+                    progress_percent=int((stats["resume_from"] / total) * 100) if total > 0 else 100,
+                    metadata=dict(metadata)
+                )
+
+        pending = iter(range(resume_from, total))
+
+        async def work() -> None:
+            nonlocal since_checkpoint, processed_this_run
+            for index in pending:
+                if not await self._await_control_signals(workflow_id):
+                    return
+                try:
+                    outcome = await process_item(items[index])
+                except Exception as e:
+                    self.logger.warning(f"Workflow {workflow_id} item {items[index]} failed: {e}")
+                    outcome = ITEM_FAILED
+                stats[f"items_{outcome}"] += 1
+                processed_this_run += 1
+
+                # Advance the resume point over every leading item that is done
+                done_ahead.add(index)
+                while stats["resume_from"] in done_ahead:
+                    done_ahead.remove(stats["resume_from"])
+                    stats["resume_from"] += 1
+
+                since_checkpoint += 1
+                if since_checkpoint >= interval:
+                    since_checkpoint = 0
+                    await checkpoint()
+
+        await checkpoint()
+        with priority_lane(lane):
+            await asyncio.gather(*(work() for _ in range(max(1, min(workers, total - resume_from)))))
+        await checkpoint()
+
+        self.logger.info(
+            f"Workflow {workflow_id} processed {processed_this_run} items "
+            f"({stats['items_ok']} ok, {stats['items_failed']} failed, {stats['items_skipped']} skipped) "
+            f"at {stats['items_per_second']} items/s with {workers} workers"
+        )
+        return stats
+
+    def _run_queued(self, workflow_id: str, kind: str, payloads: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Run items through the durable task queue and aggregate their outcomes.
+
+        The tasks are enqueued once; a restarted manager finds them and only
+        resumes monitoring. Workers lease tasks of running workflows only,
+        so a pause takes effect at the next lease; a cancel cancels the tasks
+        that have not finished. Progress is written when it changes, at most
+        every _QUEUE_POLL_S.
+
+        Returns:
+            Execution statistics (also stored in metadata["execution"])
+        """
+        settings = get_settings().orchestrator
+        counts = self.db_manager.count_tasks(workflow_id)
+        if not any(counts.values()):
+            self.db_manager.enqueue_tasks(
+                workflow_id, kind, payloads, max_attempts=getattr(settings, "task_max_attempts", 3)
+            )
+            self.logger.info(f"Workflow {workflow_id} queued {len(payloads)} {kind} tasks")
+
+        workflow = self.db_manager.get_workflow(workflow_id)
+        metadata = dict(workflow.workflow_metadata or {})
+        total = len(payloads)
+        started = time.monotonic()
+        finished_before: Optional[int] = None
+        last_finished = -1
+        stats: Dict[str, Any] = {}
+
+        while True:
+            self._sync_control_state(workflow_id)
+            with self._lock:
+                control = self._workflow_control.get(workflow_id) or {}
+                cancelled = control.get("should_cancel", False)
+            if cancelled:
+                self.db_manager.cancel_tasks(workflow_id)
+
+            counts = self.db_manager.count_tasks(workflow_id)
+            finished = counts["ok"] + counts["skipped"] + counts["failed"] + counts["dead"]
+            if finished_before is None:
+                finished_before = finished
+            run_seconds = time.monotonic() - started
+            stats = {
+                "executor": "queue",
+                "items_total": total,
+                "items_ok": counts["ok"],
+                "items_failed": counts["failed"] + counts["dead"],
+                "items_skipped": counts["skipped"],
+                "items_dead": counts["dead"],
+                "items_pending": counts["pending"],
+                "items_leased": counts["leased"],
+                "items_per_second": round((finished - finished_before) / run_seconds, 3) if run_seconds > 0 else 0.0,
+                "elapsed_seconds": round(run_seconds, 3),
+            }
+            outstanding = counts["pending"] + counts["leased"]
+            if finished != last_finished or not outstanding:
+                last_finished = finished
+                metadata["execution"] = dict(stats)
+                self.db_manager.update_workflow(
+                    workflow_id,
+                    current_step=finished,
+                    total_steps=total,
+                    progress_percent=int((finished / total) * 100) if total > 0 else 100,
+                    metadata=dict(metadata)
+                )
+            if cancelled or not outstanding:
+                break
+            time.sleep(_QUEUE_POLL_S)
+
+        self.logger.info(
+            f"Workflow {workflow_id} queue run: {stats['items_ok']} ok, {stats['items_failed']} failed "
+            f"({stats['items_dead']} dead-lettered), {stats['items_skipped']} skipped"
+        )
+        return stats
+
     def _execute_validate_directory(
         self,
         workflow_id: str,
@@ -368,9 +795,15 @@ class WorkflowManager:
         """
         Execute validate_directory workflow.
 
+        Each file goes through the orchestrator's validation pipeline; results
+        are stored with run_id = workflow_id through a write-behind buffer that
+        is flushed at every checkpoint.
+
         Args:
             workflow_id: ID of workflow
             params: Workflow parameters with directory_path and recursive
+                (optional: file_pattern, family, validation_types, max_workers,
+                executor, priority)
         """
         directory_path = params.get("directory_path")
         recursive = params.get("recursive", True)
@@ -383,24 +816,42 @@ class WorkflowManager:
         if not path.exists():
             raise ValueError(f"Directory not found: {directory_path}")
 
-        pattern = "**/*.md" if recursive else "*.md"
-        files = list(path.glob(pattern))
-
-        total_steps = len(files)
-        self._update_progress(workflow_id, 0, total_steps)
-
-        # Process each file
-        for i, file_path in enumerate(files):
-            # Check control signals
-            if not self._check_control_signals(workflow_id):
-                break
-
-            # TODO: Perform actual validation when agent_registry is available
-            # For now, just simulate
-            time.sleep(0.01)
+        pattern = params.get("file_pattern") or params.get("pattern") or ("**/*.md" if recursive else "*.md")
+        files = sorted(str(f) for f in path.glob(pattern) if f.is_file())
+
+        family = params.get("family", "words")
+        validation_types = params.get("validation_types")
+
+        if self._executor(params) == "queue":
+            from core.task_queue import TASK_VALIDATE_FILE
+            self._run_queued(workflow_id, TASK_VALIDATE_FILE, [
+                {"file_path": file_path, "family": family, "validation_types": validation_types,
+                 "priority": self._lane(params)}
+                for file_path in files
+            ])
+            return
+
+        orchestrator = self._get_agent("orchestrator")
+        if orchestrator is None:
+            raise RuntimeError("Orchestrator agent not available")
+        writer = self.db_manager.write_buffer()
+
+        async def validate(file_path: str) -> str:
+            result = await orchestrator.validate_and_store(
+                file_path, family, validation_types,
+                run_id=workflow_id, writer=writer, workflow_id=workflow_id
+            )
+            if result.get("status") == "rejected":
+                return ITEM_SKIPPED
+            return ITEM_FAILED if "error" in result else ITEM_OK
 
-            # Update progress
-            self._update_progress(workflow_id, i + 1, total_steps)
+        try:
+            self._run_coroutine(self._run_items(
+                workflow_id, files, validate, self._worker_count(params), on_checkpoint=writer.flush,
+                lane=self._lane(params)
+            ))
+        finally:
+            writer.close()
 
     def _execute_batch_enhance(
         self,
@@ -410,30 +861,37 @@ class WorkflowManager:
         """
         Execute batch_enhance workflow.
 
+        Each validation gets its approved recommendations applied by the
+        enhancement agent; the enhanced file is written back and the
+        validation marked enhanced. Validations without approved
+        recommendations are skipped.
+
         Args:
             workflow_id: ID of workflow
-            params: Workflow parameters with validation_ids
+            params: Workflow parameters with validation_ids (optional: max_workers, executor, priority)
         """
         validation_ids = params.get("validation_ids", [])
 
         if not validation_ids:
             raise ValueError("validation_ids is required")
 
-        total_steps = len(validation_ids)
-        self._update_progress(workflow_id, 0, total_steps)
+        if self._executor(params) == "queue":
+            from core.task_queue import TASK_ENHANCE_VALIDATION
+            self._run_queued(workflow_id, TASK_ENHANCE_VALIDATION, [
+                {"validation_id": validation_id, "priority": self._lane(params)} for validation_id in validation_ids
+            ])
+            return
 
-        # Process each validation
-        for i, validation_id in enumerate(validation_ids):
-            # Check control signals
-            if not self._check_control_signals(workflow_id):
-                break
+        enhancer = self._get_agent("enhancement_agent") or self._get_agent("content_enhancer")
+        if enhancer is None:
+            raise RuntimeError("Enhancement agent not available")
 
-            # TODO: Perform actual enhancement when agent_registry is available
-            # For now, just simulate
-            time.sleep(0.01)
+        async def enhance(validation_id: str) -> str:
+            return await enhance_validation(self.db_manager, enhancer, validation_id)
 
-            # Update progress
-            self._update_progress(workflow_id, i + 1, total_steps)
+        self._run_coroutine(self._run_items(
+            workflow_id, list(validation_ids), enhance, self._worker_count(params), lane=self._lane(params)
+        ))
 
     def _execute_full_audit(
         self,
@@ -453,8 +911,8 @@ class WorkflowManager:
         if not directory_path:
             raise ValueError("directory_path is required")
 
-        # Step 1: Validate directory
-        self._execute_validate_directory(workflow_id, params)
+        # Step 1: Validate directory (nobody waits on an audit: background lane unless asked)
+        self._execute_validate_directory(workflow_id, {**params, "priority": params.get("priority") or BACKGROUND})
 
         # Step 2: Enhance all validated files
         # TODO: Implement when agent_registry is available
@@ -0,0 +1,59 @@
+"""Durable workflow task queue
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-16 21:00:00.000000
+
+Adds the workflow_tasks table: one row per unit of workflow work, claimed by
+`tbcv worker` processes with a lease, retried with backoff and dead-lettered
+after max_attempts.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the workflow_tasks table."""
+    from sqlalchemy import inspect
+
+    conn = op.get_bind()
+    if 'workflow_tasks' in set(inspect(conn).get_table_names()):
+        return
+
+    op.create_table(
+        'workflow_tasks',
+        sa.Column('id', sa.String(36), primary_key=True),
+        sa.Column('workflow_id', sa.String(36), sa.ForeignKey('workflows.id'), nullable=False),
+        sa.Column('kind', sa.String(50), nullable=False),
+        sa.Column('payload', sa.Text, nullable=True),
+        sa.Column('state', sa.String(20), nullable=False),
+        sa.Column('outcome', sa.String(20), nullable=True),
+        sa.Column('result', sa.Text, nullable=True),
+        sa.Column('attempts', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('max_attempts', sa.Integer, nullable=False, server_default='3'),
+        sa.Column('available_at', sa.DateTime, nullable=True),
+        sa.Column('lease_owner', sa.String(100), nullable=True),
+        sa.Column('lease_token', sa.String(32), nullable=True),
+        sa.Column('lease_expires_at', sa.DateTime, nullable=True),
+        sa.Column('last_error', sa.Text, nullable=True),
+        sa.Column('created_at', sa.DateTime, nullable=True),
+        sa.Column('updated_at', sa.DateTime, nullable=True),
+    )
+    op.create_index('idx_workflow_tasks_state_available', 'workflow_tasks', ['state', 'available_at'])
+    op.create_index('idx_workflow_tasks_workflow_state', 'workflow_tasks', ['workflow_id', 'state'])
+    op.create_index('ix_workflow_tasks_workflow_id', 'workflow_tasks', ['workflow_id'])
+    op.create_index('ix_workflow_tasks_lease_token', 'workflow_tasks', ['lease_token'])
+
+
+def downgrade() -> None:
+    """Drop the workflow_tasks table."""
+    op.drop_table('workflow_tasks')
@@ -1,6 +1,5 @@
 """Workflow-related MCP methods."""
 
-import threading
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone
 
@@ -87,12 +86,7 @@ class WorkflowMethods(BaseMCPMethod):
         )
 
         # Start workflow execution in background
-        thread = threading.Thread(
-            target=self.workflow_manager.execute_workflow,
-            args=(workflow.id,),
-            daemon=True
-        )
-        thread.start()
+        self.workflow_manager.start_workflow(workflow.id)
 
         return {
             "success": True,
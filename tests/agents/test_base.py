@@ -3,6 +3,8 @@
 Unit tests for agents/base.py - BaseAgent and MCP message handling.
 Target coverage: 100%
 """
+import asyncio
+
 import pytest
 from datetime import datetime
 from agents.base import (
@@ -11,6 +13,8 @@ from agents.base import (
     MCPMessage,
     AgentCapability,
     AgentContract,
+    AgentBusyError,
+    AgentRequestQueue,
     BaseAgent
 )
 
@@ -343,3 +347,104 @@ class TestBaseAgentEdgeCases:
 
         # Should have meaningful error message
         assert "Agent error" in str(exc_info.value) or "Intentional error" in str(exc_info.value)
+
+
+@pytest.mark.unit
+class TestAgentRequestQueue:
+    """FIFO admission, backpressure and queue metrics."""
+
+    class SlowAgent(BaseAgent):
+        max_concurrency = 1
+
+        def _register_message_handlers(self):
+            self.register_handler("work", self.handle_work)
+
+        def get_contract(self) -> AgentContract:
+            return AgentContract(
+                agent_id=self.agent_id, name="SlowAgent", version="1.0.0", capabilities=[],
+                checkpoints=[], max_runtime_s=300, confidence_threshold=0.8, side_effects=[]
+            )
+
+        async def handle_work(self, params: dict) -> dict:
+            self.order.append(params["n"])
+            await asyncio.sleep(params.get("delay", 0.01))
+            return {"n": params["n"]}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_are_queued_not_rejected(self):
+        agent = self.SlowAgent("slow_agent")
+        agent.order = []
+
+        results = await asyncio.gather(*(agent.process_request("work", {"n": n}) for n in range(5)))
+
+        assert [r["n"] for r in results] == list(range(5))
+        assert agent.order == list(range(5))
+        queue = agent.get_status()["request_queue"]
+        assert queue["queued"] == 4
+        assert queue["max_queue_depth"] == 4
+        assert queue["in_flight"] == 0
+        assert agent.status == AgentStatus.READY
+
+    @pytest.mark.asyncio
+    async def test_status_reports_saturation(self):
+        agent = self.SlowAgent("slow_agent")
+        agent.order = []
+
+        task = asyncio.create_task(agent.process_request("work", {"n": 1, "delay": 0.05}))
+        await asyncio.sleep(0.01)
+        assert agent.status == AgentStatus.BUSY
+        await task
+        assert agent.status == AgentStatus.READY
+
+    @pytest.mark.asyncio
+    async def test_unbounded_agent_runs_requests_together(self):
+        agent = self.SlowAgent("fast_agent")
+        agent.order = []
+        agent.request_queue = AgentRequestQueue(capacity=None)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await asyncio.gather(*(agent.process_request("work", {"n": n, "delay": 0.1}) for n in range(5)))
+        assert loop.time() - start < 0.3
+        assert agent.request_queue.stats["queued"] == 0
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects(self):
+        queue = AgentRequestQueue(capacity=1, max_depth=1)
+        await queue.acquire()
+        waiter = asyncio.create_task(queue.acquire())
+        await asyncio.sleep(0)
+
+        with pytest.raises(AgentBusyError):
+            await queue.acquire()
+        assert queue.stats["rejected"] == 1
+
+        queue.release()
+        await waiter
+        assert queue.in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_admission_timeout_keeps_queue_consistent(self):
+        queue = AgentRequestQueue(capacity=1, timeout_s=0.02)
+        await queue.acquire()
+
+        with pytest.raises(AgentBusyError):
+            await queue.acquire()
+        assert queue.depth == 0
+        assert queue.stats["timed_out"] == 1
+
+        queue.release()
+        await queue.acquire()
+        assert queue.in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_busy_rejection_surfaces_as_agent_busy_error(self):
+        agent = self.SlowAgent("slow_agent")
+        agent.order = []
+        agent.request_queue = AgentRequestQueue(capacity=1, timeout_s=0.01)
+
+        first = asyncio.create_task(agent.process_request("work", {"n": 1, "delay": 0.1}))
+        await asyncio.sleep(0)
+        with pytest.raises(AgentBusyError, match="Agent busy"):
+            await agent.process_request("work", {"n": 2})
+        await first
@@ -22,6 +22,25 @@ from typing import Dict, Any
 # Import after environment
 from agents.orchestrator import OrchestratorAgent, WorkflowResult
 from agents.base import AgentContract, AgentCapability, AgentStatus
+from core.priority import FairQueue
+
+
+ENGLISH = "This guide explains how to convert a document to PDF with the library. " * 5
+
+
+@pytest.fixture
+def write_docs(tmp_path):
+    """Write English pages into a docs tree and return its directory."""
+    # Directory validation only accepts paths with an /en/ segment
+    docs = tmp_path / "docs" / "en"
+    docs.mkdir(parents=True)
+
+    def write(*names):
+        for name in names:
+            (docs / name).write_text(f"# {name}\n\n{ENGLISH}", encoding="utf-8")
+        return docs
+
+    return write
 
 
 # =============================================================================
@@ -114,7 +133,9 @@ class TestOrchestratorAgentInit:
         for agent_name in expected_agents:
             assert agent_name in agent._agent_semaphores
             sem = agent._agent_semaphores[agent_name]
-            assert isinstance(sem, asyncio.Semaphore)
+            assert isinstance(sem, FairQueue)
+        assert agent._agent_semaphores["llm_validator"].capacity == 1
+        assert "agent_gates" in agent.get_status()
 
 
 # =============================================================================
@@ -382,6 +403,155 @@ class TestOrchestratorValidateDirectory:
         assert "job_id" in response or "success" in response or "status" in response or "message" in response
 
 
+@pytest.mark.asyncio
+class TestOrchestratorIncrementalValidation:
+    """Test incremental (manifest-based) validate_directory."""
+
+    @pytest.fixture
+    def agent(self, tmp_path):
+        from core.validation_manifest import ValidationManifest
+
+        agent = OrchestratorAgent()
+        agent._validation_manifest = ValidationManifest(str(tmp_path / "manifest.db"))
+        agent._validation_fingerprint = AsyncMock(return_value="fp-1")
+
+        async def pipeline(content, file_path, family, validation_types=None):
+            return {"file_path": file_path, "family": family, "overall_confidence": 0.9, "length": len(content)}
+
+        agent._run_validation_pipeline = AsyncMock(side_effect=pipeline)
+        yield agent
+        agent._validation_manifest.close()
+
+    @pytest.fixture
+    def docs(self, write_docs):
+        return write_docs("a.md", "b.md", "c.md")
+
+    async def _run(self, agent, docs):
+        return await agent.handle_validate_directory({"directory_path": str(docs), "incremental": True})
+
+    async def test_second_run_reuses_unchanged_files(self, agent, docs):
+        first = await self._run(agent, docs)
+        assert first["files_validated"] == 3
+        assert first["files_reused"] == 0
+
+        second = await self._run(agent, docs)
+        assert second["files_validated"] == 0
+        assert second["files_reused"] == 3
+        assert second["files_total"] == 3
+        assert agent._run_validation_pipeline.await_count == 3
+        assert all(r["reused"] for r in second["results"])
+
+    async def test_only_changed_file_is_revalidated(self, agent, docs):
+        await self._run(agent, docs)
+        (docs / "b.md").write_text(f"# b changed\n\n{ENGLISH}", encoding="utf-8")
+
+        response = await self._run(agent, docs)
+        assert response["files_validated"] == 1
+        assert response["files_reused"] == 2
+        assert agent._run_validation_pipeline.await_args.args[1] == str(docs / "b.md")
+
+    async def test_fingerprint_change_revalidates_all(self, agent, docs):
+        await self._run(agent, docs)
+        agent._validation_fingerprint.return_value = "fp-2"
+
+        response = await self._run(agent, docs)
+        assert response["files_validated"] == 3
+        assert response["files_reused"] == 0
+
+    async def test_failed_results_are_not_recorded(self, agent, docs):
+        agent._run_validation_pipeline.side_effect = None
+        agent._run_validation_pipeline.return_value = {"error": "boom"}
+        await self._run(agent, docs)
+
+        response = await self._run(agent, docs)
+        assert response["files_reused"] == 0
+
+    async def test_non_incremental_run_ignores_manifest(self, agent, docs):
+        await self._run(agent, docs)
+        response = await agent.handle_validate_directory({"directory_path": str(docs), "incremental": False})
+        assert response["incremental"] is False
+        assert response["files_validated"] == 3
+
+
+@pytest.mark.asyncio
+class TestOrchestratorStreamingValidation:
+    """Test streaming (bounded queue + worker pool) validate_directory."""
+
+    @pytest.fixture
+    def agent(self):
+        agent = OrchestratorAgent()
+        agent.in_flight = 0
+        agent.peak_in_flight = 0
+
+        async def pipeline(content, file_path, family, validation_types=None):
+            agent.in_flight += 1
+            agent.peak_in_flight = max(agent.peak_in_flight, agent.in_flight)
+            await asyncio.sleep(0.001)
+            agent.in_flight -= 1
+            if file_path.endswith("broken.md"):
+                raise RuntimeError("boom")
+            return {"file_path": file_path, "family": family, "overall_confidence": 0.9, "final_issues": []}
+
+        agent._run_validation_pipeline = AsyncMock(side_effect=pipeline)
+        return agent
+
+    @pytest.fixture
+    def docs(self, write_docs):
+        return write_docs(*(f"page{i:02d}.md" for i in range(12)))
+
+    async def test_summary_without_results(self, agent, docs):
+        emitted = []
+        agent._emit_file_result = AsyncMock(side_effect=lambda job_id, result, types, persist: emitted.append(result))
+
+        response = await agent.handle_validate_directory(
+            {"directory_path": str(docs), "streaming": True, "persist": False}
+        )
+
+        assert response["status"] == "success"
+        assert response["streaming"] is True
+        assert response["files_total"] == 12
+        assert response["files_validated"] == 12
+        assert "results" not in response
+        assert response["cursor"] is None
+        assert len(emitted) == 12
+        assert agent.active_workflows[response["job_id"]].results == []
+
+    async def test_worker_pool_bounds_concurrency(self, agent, docs, monkeypatch):
+        agent._emit_file_result = AsyncMock()
+        monkeypatch.setattr(agent.settings.orchestrator, "max_file_workers", 3)
+        await agent.handle_validate_directory({"directory_path": str(docs), "streaming": True})
+        assert agent.peak_in_flight <= 3
+
+    async def test_failures_are_counted(self, agent, docs):
+        agent._emit_file_result = AsyncMock()
+        (docs / "broken.md").write_text(f"# Broken\n\n{ENGLISH}", encoding="utf-8")
+
+        response = await agent.handle_validate_directory({"directory_path": str(docs), "streaming": True})
+
+        assert response["files_validated"] == 12
+        assert response["files_failed"] == 1
+        assert any("broken.md" in e for e in response["errors"])
+
+    async def test_results_are_paged_with_cursor(self, agent, docs, db_manager):
+        response = await agent.handle_validate_directory({"directory_path": str(docs), "streaming": True})
+        assert response["cursor"]
+
+        seen = []
+        cursor = response["cursor"]
+        while cursor:
+            page = await agent.handle_get_directory_results({"cursor": cursor, "limit": 5})
+            assert page["status"] == "success"
+            seen.extend(r["file_path"] for r in page["results"])
+            cursor = page["next_cursor"]
+
+        assert len(seen) == 12
+        assert sorted(Path(p).name for p in seen) == [f"page{i:02d}.md" for i in range(12)]
+
+    async def test_invalid_cursor(self, agent):
+        response = await agent.handle_get_directory_results({"cursor": "not-a-cursor"})
+        assert response["status"] == "error"
+
+
 # =============================================================================
 # Integration Tests
 # =============================================================================
@@ -24,7 +24,8 @@ from agents.truth_manager import (
     PluginInfo,
     CombinationRule,
     TruthDataIndex,
-    TruthDataAdapter
+    TruthDataAdapter,
+    TruthIndexRegistry,
 )
 
 
@@ -621,6 +622,144 @@ class TestTruthManagerHandlers:
             assert "rules" in response
 
 
+# =============================================================================
+# Resident Index Registry Tests
+# =============================================================================
+
+def _empty_index(version_hash: str) -> TruthDataIndex:
+    return TruthDataIndex(
+        by_id={}, by_slug={}, by_name={}, by_alias={}, by_family={}, by_pattern={},
+        combination_rules=[], combination_index={}, dependencies={},
+        version_hash=version_hash, last_updated=datetime.now()
+    )
+
+
+@pytest.mark.unit
+class TestTruthIndexRegistry:
+    """Per-family snapshots rebuilt only when their source files change."""
+
+    @pytest.fixture
+    def sources(self, tmp_path):
+        files = {family: tmp_path / f"{family}.json" for family in ("words", "cells")}
+        for path in files.values():
+            path.write_text('{"plugins": []}')
+        return files
+
+    @pytest.fixture
+    def builds(self):
+        return []
+
+    @pytest.fixture
+    def registry(self, sources, builds, tmp_path):
+        def builder(family, rebuild):
+            builds.append((family, rebuild))
+            return _empty_index(f"{family}-{len(builds)}")
+
+        def source_paths(family):
+            return [str(sources[family]), str(tmp_path / f"{family}_combinations.json")]
+
+        return TruthIndexRegistry(builder, source_paths, check_interval_seconds=0)
+
+    def test_unchanged_sources_reuse_snapshot(self, registry, builds):
+        first = registry.get("words")
+        assert registry.get("words") is first
+        assert builds == [("words", False)]
+
+    def test_touched_file_with_same_content_keeps_index(self, registry, sources, builds):
+        first = registry.get("words")
+        st = sources["words"].stat()
+        os.utime(sources["words"], ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000))
+        assert registry.get("words") is first
+        assert len(builds) == 1
+
+    def test_content_change_rebuilds(self, registry, sources, builds):
+        first = registry.get("words")
+        sources["words"].write_text('{"plugins": [{"name": "Changed"}]}')
+        second = registry.get("words")
+        assert second is not first
+        assert builds == [("words", False), ("words", True)]
+
+    def test_new_candidate_file_rebuilds(self, registry, tmp_path, builds):
+        registry.get("words")
+        (tmp_path / "words_combinations.json").write_text('{"combinations": []}')
+        registry.get("words")
+        assert len(builds) == 2
+
+    def test_families_are_independent(self, registry, sources):
+        words = registry.get("words")
+        cells = registry.get("cells")
+        sources["cells"].write_text('{"plugins": [{"name": "Changed"}]}')
+        assert registry.get("cells") is not cells
+        assert registry.get("words") is words
+        assert set(registry.families()) == {"words", "cells"}
+
+    def test_check_interval_skips_stat(self, sources, builds):
+        registry = TruthIndexRegistry(
+            lambda family, rebuild: builds.append(family) or _empty_index(family),
+            lambda family: [str(sources[family])],
+            check_interval_seconds=3600,
+        )
+        first = registry.get("words")
+        sources["words"].write_text('{"plugins": [{"name": "Changed"}]}')
+        assert registry.get("words") is first
+        assert registry.get("words", force=True) is not first
+
+    def test_concurrent_first_access_builds_once(self, registry, builds):
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            indexes = list(pool.map(lambda _: registry.get("words"), range(32)))
+        assert len({id(i) for i in indexes}) == 1
+        assert builds == [("words", False)]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestTruthManagerResidentFamilies:
+    """Family-aware handlers read that family's snapshot."""
+
+    async def test_loading_another_family_does_not_replace_index(self, tmp_path):
+        agent = TruthManagerAgent()
+        truth_files = {}
+        for family, name in (("words", "Document Builder"), ("cells", "Workbook Converter")):
+            truth_files[family] = tmp_path / f"{family}.json"
+            truth_files[family].write_text(json.dumps({"plugins": [{"name": name}]}))
+
+        with patch.object(agent, "_truth_file_candidates", lambda family: [str(truth_files[family])]), \
+                patch.object(agent, "_combination_file_candidates", lambda family: []):
+            agent.truth_registry.invalidate()
+            builds_before = agent.truth_registry.stats["builds"]
+            words = await agent.handle_load_truth_data({"family": "words"})
+            cells = await agent.handle_load_truth_data({"family": "cells"})
+
+            search = await agent.handle_search_plugins({"query": "", "family": "words"})
+            assert [p["name"] for p in search["results"]] == ["Document Builder"]
+            assert words["version_hash"] != cells["version_hash"]
+
+            again = await agent.handle_load_truth_data({"family": "words"})
+            assert again["version_hash"] == words["version_hash"]
+            assert agent.truth_registry.stats["builds"] - builds_before == 2
+
+    async def test_unloaded_family_is_not_answered_from_another(self, tmp_path):
+        agent = TruthManagerAgent()
+        truth_files = {}
+        for family, name in (("words", "Document Builder"), ("cells", "Workbook Converter")):
+            truth_files[family] = tmp_path / f"{family}.json"
+            truth_files[family].write_text(json.dumps({"plugins": [{"id": "shared", "name": name}]}))
+
+        with patch.object(agent, "_truth_file_candidates", lambda family: [str(truth_files[family])]), \
+                patch.object(agent, "_combination_file_candidates", lambda family: []):
+            agent.truth_registry.invalidate()
+            await agent.handle_load_truth_data({"family": "words"})
+
+            info = await agent.handle_get_plugin_info({"plugin_id": "shared", "family": "cells"})
+            assert info["plugin"]["name"] == "Workbook Converter"
+            assert "cells" in agent.truth_registry.families()
+            # No family: the most recently loaded index
+            info = await agent.handle_get_plugin_info({"plugin_id": "shared"})
+            assert info["plugin"]["name"] == "Document Builder"
+
+
 # =============================================================================
 # Integration Tests with Real Truth Data
 # =============================================================================
@@ -0,0 +1,129 @@
+# file: tests/core/test_alias_matcher.py
+"""Tests for the compiled alias matcher used by FuzzyDetectorAgent."""
+
+import pytest
+
+from core.alias_matcher import (
+    AliasMatcher,
+    normalize_alias,
+    similarity_scores,
+    similarity_upper_bound,
+)
+
+
+ALGORITHMS = ["levenshtein", "jaro_winkler"]
+
+ALIAS_MAP = {
+    "document_builder": {"name": "DocumentBuilder", "aliases": ["builder", "documentbuilder"]},
+    "pdf_converter": {"name": "PdfSaveOptions", "aliases": ["pdfsaveoptions", "save"]},
+    "word_processor": {"name": "Document", "aliases": ["document", "save"]},
+}
+
+
+def _matcher(**overrides) -> AliasMatcher:
+    settings = dict(algorithms=ALGORITHMS, similarity_threshold=0.85, weight_exact=1.0, weight_fuzzy=0.8)
+    settings.update(overrides)
+    return AliasMatcher(ALIAS_MAP, **settings)
+
+
+def _exhaustive(token: str, **overrides):
+    """Reference result: score every alias of every plugin."""
+    m = _matcher(**overrides)
+    token_norm = normalize_alias(token)
+    hits = []
+    for plugin_id, info in ALIAS_MAP.items():
+        best = None
+        for alias in info["aliases"]:
+            if alias == token_norm:
+                conf, kind = m.weight_exact, "exact"
+            else:
+                scores = similarity_scores(alias, token_norm, m.algorithms)
+                if not scores or max(scores) < m.similarity_threshold:
+                    continue
+                conf, kind = max(scores) * m.weight_fuzzy, "fuzzy"
+            if best is None or conf > best[1]:
+                best = (plugin_id, conf, kind)
+        if best:
+            hits.append(best)
+    return tuple(hits)
+
+
+@pytest.mark.unit
+class TestSimilarityUpperBound:
+    """The bound must never be below the real score."""
+
+    @pytest.mark.parametrize("alias,token", [
+        ("documentbuilder", "documentbulder"),
+        ("save", "saev"),
+        ("pdfsaveoptions", "saveoptions"),
+        ("document", "docment"),
+        ("builder", "rebuild"),
+    ])
+    @pytest.mark.parametrize("algorithms", [["levenshtein"], ["jaro_winkler"], ["fuzzy"], ["sequence"]])
+    def test_bound_dominates_scores(self, alias, token, algorithms):
+        from collections import Counter
+
+        common = sum((Counter(alias) & Counter(token)).values())
+        prefix = 0
+        while prefix < min(len(alias), len(token), 4) and alias[prefix] == token[prefix]:
+            prefix += 1
+        m = AliasMatcher({}, algorithms, 0.85, 1.0, 0.8)
+        bound = similarity_upper_bound(len(alias), len(token), common, prefix, m._scorers)
+        assert max(similarity_scores(alias, token, algorithms)) <= bound
+
+    def test_no_common_characters(self):
+        assert similarity_upper_bound(4, 4, 0, 0, ("levenshtein",)) == 0.0
+
+
+@pytest.mark.unit
+class TestAliasMatcher:
+    """Tests for AliasMatcher.match_token and iter_token_hits."""
+
+    def test_exact_hit_shared_by_plugins(self):
+        hits = _matcher().match_token("Save")
+        assert hits == (("pdf_converter", 1.0, "exact"), ("word_processor", 1.0, "exact"))
+
+    def test_fuzzy_hit(self):
+        hits = _matcher().match_token("DocumentBulder")
+        assert hits
+        plugin_id, conf, kind = hits[0]
+        assert plugin_id == "document_builder"
+        assert kind == "fuzzy"
+        assert 0.8 * 0.85 <= conf < 0.8
+
+    def test_no_hit(self):
+        assert _matcher().match_token("paragraph") == ()
+        assert _matcher().match_token("___") == ()
+
+    @pytest.mark.parametrize("token", [
+        "Save", "saev", "Document", "Docment", "documents", "Builder", "builders",
+        "PdfSaveOption", "pdf", "DocumentBuilder", "documentbuild", "table",
+    ])
+    @pytest.mark.parametrize("threshold", [0.6, 0.85, 0.95])
+    def test_matches_exhaustive_scan(self, token, threshold):
+        assert _matcher(similarity_threshold=threshold).match_token(token) == _exhaustive(
+            token, similarity_threshold=threshold
+        )
+
+    def test_token_results_are_memoized(self):
+        m = _matcher()
+        first = m.match_token("Docment")
+        assert m.match_token("Docment") is first
+        assert m.stats["memo_hits"] == 1
+
+    def test_memo_is_bounded(self):
+        m = _matcher(memo_size=2)
+        for token in ("alpha", "beta", "gamma"):
+            m.match_token(token)
+        assert len(m._memo) <= 2
+
+    def test_iter_token_hits_positions(self):
+        text = "Call doc.Save() then DocumentBuilder"
+        found = [(token, start) for token, start, _, _ in _matcher().iter_token_hits(text)]
+        assert ("Save", text.index("Save")) in found
+        assert ("DocumentBuilder", text.index("DocumentBuilder")) in found
+
+    def test_matches_settings(self):
+        m = _matcher()
+        assert m.matches_settings(ALGORITHMS, 0.85, 1.0, 0.8)
+        assert not m.matches_settings(ALGORITHMS, 0.9, 1.0, 0.8)
@@ -0,0 +1,129 @@
+# file: tests/core/test_benchmark.py
+"""Tests for the benchmark corpus generator and report comparison."""
+
+import os
+
+os.environ.setdefault("TBCV_ENV", "test")
+
+import json
+import re
+
+import pytest
+
+from core.benchmark import (
+    BenchmarkResult,
+    CorpusSpec,
+    compare_reports,
+    generate_corpus,
+    load_corpus,
+    percentile,
+)
+
+
+def _report(digest="abc", **benchmarks):
+    return {
+        "corpus": {"digest": digest},
+        "benchmarks": {name: {"p95_ms": p95, "throughput_per_s": tput} for name, (p95, tput) in benchmarks.items()},
+    }
+
+
+@pytest.mark.unit
+class TestCorpus:
+
+    def test_same_spec_gives_identical_corpus(self, tmp_path):
+        spec = CorpusSpec(files=5, words_per_file=300, seed=7)
+        generate_corpus(spec, str(tmp_path / "a"))
+        generate_corpus(spec, str(tmp_path / "b"))
+
+        a, b = load_corpus(str(tmp_path / "a")), load_corpus(str(tmp_path / "b"))
+
+        assert a["digest"] == b["digest"]
+        assert len(a["paths"]) == 5
+        assert json.loads((tmp_path / "a" / "corpus.json").read_text())["spec"]["seed"] == 7
+
+    def test_seed_changes_content(self, tmp_path):
+        generate_corpus(CorpusSpec(files=3, seed=1), str(tmp_path / "a"))
+        generate_corpus(CorpusSpec(files=3, seed=2), str(tmp_path / "b"))
+
+        assert load_corpus(str(tmp_path / "a"))["digest"] != load_corpus(str(tmp_path / "b"))["digest"]
+
+    def test_documents_have_frontmatter_links_and_code(self, tmp_path):
+        spec = CorpusSpec(files=4, words_per_file=1200, links_per_file=6, code_block_ratio=1.0)
+        paths = generate_corpus(spec, str(tmp_path))
+
+        for path in paths:
+            text = path.read_text(encoding="utf-8")
+            assert text.startswith("---\ntitle:")
+            assert len(re.findall(r"\]\(", text)) == 6
+            assert "```" in text
+
+    def test_plugin_density_controls_mentions(self, tmp_path):
+        sparse = generate_corpus(CorpusSpec(files=3, plugin_density=0.0), str(tmp_path / "sparse"))
+        dense = generate_corpus(CorpusSpec(files=3, plugin_density=10.0), str(tmp_path / "dense"))
+
+        def mentions(paths):
+            return sum(p.read_text(encoding="utf-8").count(" using ") for p in paths)
+
+        assert mentions(sparse) == 0
+        assert mentions(dense) > 10
+
+    def test_plain_directory_is_loaded_without_manifest(self, tmp_path):
+        (tmp_path / "x.md").write_text("# x")
+
+        corpus = load_corpus(str(tmp_path))
+
+        assert corpus["spec"] is None
+        assert corpus["files"] == ["x.md"]
+
+
+@pytest.mark.unit
+class TestMeasurement:
+
+    def test_percentile_is_nearest_rank(self):
+        samples = [float(i) for i in range(1, 101)]
+
+        assert percentile(samples, 0.50) == 50
+        assert percentile(samples, 0.95) == 95
+        assert percentile(samples, 1.0) == 100
+        assert percentile([], 0.5) == 0.0
+
+    def test_result_summary(self):
+        result = BenchmarkResult("x", samples_ms=[1.0, 2.0, 3.0, 4.0], wall_seconds=2.0, errors=1)
+
+        summary = result.to_dict()
+
+        assert summary["count"] == 4
+        assert summary["errors"] == 1
+        assert summary["throughput_per_s"] == 2.0
+        assert summary["p50_ms"] == 2.0
+
+
+@pytest.mark.unit
+class TestCompareReports:
+
+    def test_latency_and_throughput_regressions(self):
+        baseline = _report(a=(10.0, 100.0), b=(10.0, 100.0))
+        current = _report(a=(12.0, 100.0), b=(10.0, 85.0))
+
+        comparison = compare_reports(current, baseline, threshold=0.10)
+
+        assert [(r["benchmark"], r["metric"]) for r in comparison["regressions"]] == [
+            ("a", "p95_ms"), ("b", "throughput_per_s"),
+        ]
+        assert comparison["corpus_matches"]
+
+    def test_changes_within_threshold_are_ignored(self):
+        comparison = compare_reports(_report(a=(10.5, 95.0)), _report(a=(10.0, 100.0)), threshold=0.10)
+
+        assert comparison["regressions"] == []
+        assert comparison["improvements"] == []
+
+    def test_improvements_missing_and_corpus_mismatch(self):
+        baseline = _report(digest="old", a=(10.0, 100.0), gone=(1.0, 1.0))
+        current = _report(digest="new", a=(5.0, 200.0))
+
+        comparison = compare_reports(current, baseline)
+
+        assert len(comparison["improvements"]) == 2
+        assert comparison["missing"] == ["gone"]
+        assert not comparison["corpus_matches"]
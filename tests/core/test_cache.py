@@ -401,3 +401,47 @@ class TestCacheInvalidation:
         """Should invalidate LLM cache."""
         result = validation_cache.invalidate_llm_cache()
         assert result == 0  # Returns 0 currently
+
+
+# --- Canonical Hashing Tests ---
+
+class TestCanonicalHash:
+    """Tests for canonical cache-key hashing."""
+
+    def test_dict_order_does_not_matter(self):
+        from core.cache import canonical_hash
+        first = {"a": 1, "b": {"x": [1, 2], "y": None}}
+        second = {"b": {"y": None, "x": [1, 2]}, "a": 1}
+        assert canonical_hash(first) == canonical_hash(second)
+
+    def test_types_are_distinguished(self):
+        from core.cache import canonical_hash
+        assert canonical_hash("1") != canonical_hash(1)
+        assert canonical_hash(1) != canonical_hash(True)
+        assert canonical_hash([1, 2]) != canonical_hash([[1], 2])
+        assert canonical_hash({"a": "b"}) != canonical_hash({"ab": ""})
+
+    def test_sets_and_mixed_keys(self):
+        from core.cache import canonical_hash
+        assert canonical_hash({3, 1, 2}) == canonical_hash({2, 3, 1})
+        assert canonical_hash({1: "a", "1": "b"}) == canonical_hash({"1": "b", 1: "a"})
+
+    def test_large_content_digest_matches_and_is_reused(self):
+        from core import cache
+        content = "x" * (cache._DIGEST_MEMO_MIN_CHARS + 1)
+        import hashlib
+        assert cache.content_digest(content) == hashlib.sha256(content.encode()).digest()
+        assert content in cache._digest_memo
+        assert cache.canonical_hash({"content": content}) == cache.canonical_hash({"content": "x" + content[1:]})
+
+    def test_cache_key_format(self):
+        from core.cache import cache_manager
+        key = cache_manager._generate_cache_key("agent", "method", {"b": 2, "a": 1})
+        assert key.startswith("agent:method:")
+        assert key == cache_manager._generate_cache_key("agent", "method", {"a": 1, "b": 2})
+        assert len(key.rsplit(":", 1)[1]) == 16
+
+    def test_content_hash_unchanged(self, validation_cache):
+        import hashlib
+        content = "y" * 10000
+        assert validation_cache.content_hash(content) == hashlib.sha256(content.encode()).hexdigest()[:16]
@@ -0,0 +1,98 @@
+# file: tests/core/test_cache_store.py
+"""Tests for the write-behind SQLite key-value store behind the L2 cache."""
+
+import time
+
+import pytest
+
+from core.cache_store import CODEC_GZIP_PICKLE, CODEC_PICKLE, KVStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    kv = KVStore(str(tmp_path / "cache.db"), flush_interval_ms=10_000, max_pending=100)
+    yield kv
+    kv.close()
+
+
+@pytest.mark.unit
+class TestKVStoreReadsAndWrites:
+    """Pending rows, flushing and persistence."""
+
+    def test_pending_rows_are_readable_before_flush(self, store):
+        store.put("a:m:1", "a", "m", CODEC_PICKLE, b"value", 60)
+        assert store.pending == 1
+        assert store.get("a:m:1") == (CODEC_PICKLE, b"value")
+
+    def test_flush_writes_one_batch(self, store):
+        for i in range(5):
+            store.put(f"a:m:{i}", "a", "m", CODEC_PICKLE, b"v%d" % i, 60)
+        assert store.flush() == 5
+        assert store.pending == 0
+        assert store.stats["flushes"] == 1
+        assert store.get("a:m:3") == (CODEC_PICKLE, b"v3")
+
+    def test_rows_survive_reopen(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        first = KVStore(path)
+        first.put("k", "a", "m", CODEC_GZIP_PICKLE, b"\x00\x01", 60)
+        first.close()
+        second = KVStore(path)
+        assert second.get("k") == (CODEC_GZIP_PICKLE, b"\x00\x01")
+        second.close()
+
+    def test_writer_thread_flushes_after_interval(self, tmp_path):
+        kv = KVStore(str(tmp_path / "cache.db"), flush_interval_ms=20)
+        kv.put("k", "a", "m", CODEC_PICKLE, b"v", 60)
+        deadline = time.monotonic() + 5
+        while not kv.stats["flushes"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert kv.stats["rows_written"] == 1
+        kv.close()
+
+    def test_expired_rows_miss(self, store):
+        store.put("k", "a", "m", CODEC_PICKLE, b"v", 0)
+        assert store.get("k") is None
+        store.flush()
+        assert store.get("k") is None
+        assert store.cleanup_expired() == 1
+
+    def test_closed_store_rejects_puts(self, store):
+        store.close()
+        with pytest.raises(RuntimeError):
+            store.put("k", "a", "m", CODEC_PICKLE, b"v", 60)
+
+
+@pytest.mark.unit
+class TestKVStoreDeletes:
+    """Deletes reach both pending and stored rows."""
+
+    def test_delete_pending_and_stored(self, store):
+        store.put("stored", "a", "m", CODEC_PICKLE, b"v", 60)
+        store.flush()
+        store.put("pending", "a", "m", CODEC_PICKLE, b"v", 60)
+        assert store.delete("stored") and store.delete("pending")
+        assert not store.delete("missing")
+        store.flush()
+        assert store.get("stored") is None and store.get("pending") is None
+
+    def test_delete_agent(self, store):
+        store.put("a:m:1", "a", "m", CODEC_PICKLE, b"v", 60)
+        store.flush()
+        store.put("a:m:2", "a", "m", CODEC_PICKLE, b"v", 60)
+        store.put("b:m:1", "b", "m", CODEC_PICKLE, b"v", 60)
+        assert store.delete_agent("a") == 2
+        assert store.summary()["total_entries"] == 1
+
+    def test_clear_and_summary(self, store):
+        store.put("k1", "a", "m", CODEC_PICKLE, b"1234", 60)
+        store.put("k2", "a", "m", CODEC_PICKLE, b"56", 60)
+        assert store.summary() == {"total_entries": 2, "total_size_bytes": 6}
+        assert store.clear() == 2
+        assert store.summary() == {"total_entries": 0, "total_size_bytes": 0}
+
+    def test_cleanup_older_than(self, store):
+        store.put("old", "a", "m", CODEC_PICKLE, b"v", 60)
+        store.flush()
+        cutoff = time.time() + 1
+        assert store.cleanup_older_than(cutoff) == 1
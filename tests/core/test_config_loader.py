@@ -19,6 +19,7 @@ from pathlib import Path
 
 from core.config_loader import (
     ConfigLoader,
+    ResolvedRuleset,
     Rule,
     ProfileConfig,
     ValidatorConfig,
@@ -61,6 +62,8 @@ seo:
       enabled: true
       level: warning
       message: "Empty heading detected"
+      params:
+        ignore: ["TODO", "TBD"]
     heading_too_short:
       enabled: true
       level: warning
@@ -299,6 +302,106 @@ class TestReload:
         assert len(loader._cache) == 0
 
 
+class TestResolvedRulesets:
+    """Memoized, frozen rulesets and their invalidation."""
+
+    def test_ruleset_is_memoized(self, loader):
+        """Test repeated lookups return the same resolved ruleset."""
+        first = loader.get_ruleset("seo", profile="strict", family="words")
+        second = loader.get_ruleset("seo", profile="strict", family="words")
+
+        assert first is second
+        assert loader.stats == {"ruleset_hits": 1, "ruleset_builds": 1, "file_changes": 0}
+        assert loader.get_ruleset("seo", profile="strict") is not first
+
+    def test_ruleset_maps(self, loader):
+        """Test the derived id/level/params maps match the rules."""
+        ruleset = loader.get_ruleset("seo", profile="strict", family="words")
+
+        assert isinstance(ruleset, ResolvedRuleset)
+        assert ruleset.active_rule_ids == {r.id for r in ruleset.rules}
+        assert ruleset.rule_levels["heading_too_short"] == "error"
+        assert ruleset.rule_levels["hierarchy_skip"] == "warning"
+        assert ruleset.rule_params["heading_too_short"] == {"min_length": 10}
+
+    def test_ruleset_is_read_only(self, loader):
+        """Test shared rulesets cannot be mutated by a validator."""
+        ruleset = loader.get_ruleset("seo", profile="strict")
+        rule = ruleset.rules[0]
+
+        with pytest.raises(AttributeError):
+            rule.level = "info"
+        with pytest.raises(TypeError):
+            ruleset.rule_levels["h1_required"] = "info"
+        with pytest.raises(TypeError):
+            ruleset.rule_params["heading_too_short"]["min_length"] = 1
+        assert loader.get_ruleset("seo", profile="strict").rule_params["empty_heading"]["ignore"] == ("TODO", "TBD")
+        assert loader.get_rules("seo", profile="strict") is not loader.get_rules("seo", profile="strict")
+
+    def test_get_rules_does_not_stat(self, loader, monkeypatch):
+        """Test cached lookups never touch the filesystem."""
+        loader.get_rules("seo")
+        monkeypatch.setattr(loader, "_mtime", lambda name: pytest.fail("stat() on a cached lookup"))
+
+        for _ in range(3):
+            loader.get_rules("seo")
+
+    def test_reload_moves_generation(self, loader):
+        """Test reload() invalidates resolved rulesets."""
+        first = loader.get_ruleset("seo")
+        loader.reload("seo")
+        second = loader.get_ruleset("seo")
+
+        assert second is not first
+        assert second.generation == first.generation + 1
+
+    def test_reload_during_build_is_not_memoized(self, loader, monkeypatch):
+        """Test a ruleset built from a config that changed mid-lookup is not cached under the new generation."""
+        load = loader.load
+
+        def load_then_reload(name, force_reload=False):
+            config = load(name, force_reload)
+            loader._bump_generation(name)
+            return config
+
+        monkeypatch.setattr(loader, "load", load_then_reload)
+        stale = loader.get_ruleset("seo")
+        monkeypatch.setattr(loader, "load", load)
+
+        assert loader.get_ruleset("seo") is not stale
+        assert loader.stats["ruleset_builds"] == 2
+
+    def test_file_change_is_picked_up(self, loader, sample_config):
+        """Test the watcher check reloads a changed config file."""
+        assert loader.get_ruleset("seo", profile="relaxed").active_rule_ids == {"h1_required"}
+
+        config_path = Path(sample_config) / "seo.yaml"
+        config_path.write_text(
+            config_path.read_text(encoding="utf-8").replace("rules: [h1_required]", "rules: [h1_required, h1_unique]"),
+            encoding="utf-8",
+        )
+        os.utime(config_path, (0, 0))
+
+        assert loader.check_for_changes() == ["seo"]
+        assert loader.get_ruleset("seo", profile="relaxed").active_rule_ids == {"h1_required", "h1_unique"}
+        assert loader.check_for_changes() == []
+
+    def test_background_watcher(self, sample_config):
+        """Test the watcher thread reloads changed files on its own."""
+        import time
+
+        loader = ConfigLoader(config_dir=sample_config, watch_interval_seconds=0.01)
+        try:
+            generation = loader.get_ruleset("seo").generation
+            os.utime(Path(sample_config) / "seo.yaml", (0, 0))
+            deadline = time.monotonic() + 5
+            while loader.generation("seo") == generation and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert loader.generation("seo") > generation
+        finally:
+            loader.stop_watching()
+
+
 class TestValidatorConfig:
     """Test ValidatorConfig dataclass."""
 
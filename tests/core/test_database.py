@@ -12,6 +12,7 @@ os.environ.setdefault("TBCV_ENV", "test")
 os.environ.setdefault("OLLAMA_ENABLED", "false")
 os.environ.setdefault("OLLAMA_MODEL", "mistral")
 
+import asyncio
 import pytest
 import tempfile
 from pathlib import Path
@@ -501,3 +502,127 @@ class TestModelSerialization:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--cov=core.database", "--cov-report=term-missing"])
+
+
+# =============================================================================
+# Batched Persistence Tests
+# =============================================================================
+
+@pytest.fixture
+def file_db(tmp_path, monkeypatch):
+    """DatabaseManager on its own SQLite file."""
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'tbcv.db'}")
+    return DatabaseManager()
+
+
+def _validation_kwargs(i: int = 0) -> dict:
+    return dict(
+        file_path=f"/docs/en/page{i}.md",
+        rules_applied=["markdown"],
+        validation_results={"overall_confidence": 0.9},
+        notes="batched",
+        severity="info",
+        status="pass",
+        run_id="run-1",
+    )
+
+
+@pytest.mark.unit
+class TestBatchedPersistence:
+    """Test bulk_insert and ResultWriteBuffer."""
+
+    def test_sqlite_runs_in_wal_mode(self, file_db):
+        with file_db.engine.connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+            assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1  # NORMAL
+
+    def test_buffer_links_validations_recommendations_and_audit(self, file_db):
+        with file_db.write_buffer(flush_interval_ms=0) as buffer:
+            val_id = buffer.add_validation(**_validation_kwargs())
+            rec_id = buffer.add_recommendation(
+                validation_id=val_id, type="format", title="Fix heading", description="d",
+                metadata={"source": "test"},
+            )
+            assert buffer.pending == 3
+            assert file_db.get_validation_result(val_id) is None
+
+        val = file_db.get_validation_result(val_id)
+        assert val.status == ValidationStatus.PASS
+        assert val.run_id == "run-1"
+        rec = file_db.get_recommendation(rec_id)
+        assert rec.validation_id == val_id
+        assert rec.status == RecommendationStatus.PENDING
+        assert rec.recommendation_metadata == {"source": "test"}
+        audit = file_db.list_audit_logs(recommendation_id=rec_id)
+        assert [a.action for a in audit] == ["created"]
+        assert audit[0].after_state["id"] == rec_id
+
+    def test_buffer_flushes_every_max_rows(self, file_db):
+        buffer = file_db.write_buffer(max_rows=3, flush_interval_ms=0)
+        for i in range(7):
+            buffer.add_validation(**_validation_kwargs(i))
+        assert buffer.stats["flushes"] == 2
+        assert buffer.pending == 1
+        assert buffer.close() == 1
+        assert len(file_db.list_validation_results_page(run_id="run-1", limit=100)) == 7
+
+    def test_buffer_flushes_after_interval(self, file_db):
+        import time
+
+        buffer = file_db.write_buffer(max_rows=1000, flush_interval_ms=20)
+        val_id = buffer.add_validation(**_validation_kwargs())
+        deadline = time.monotonic() + 5
+        # stats["flushes"] moves once the batch is committed (pending drops before that)
+        while not buffer.stats["flushes"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert file_db.get_validation_result(val_id) is not None
+        buffer.close()
+
+    def test_bulk_insert_is_one_transaction(self, file_db):
+        first = file_db._validation_values(**_validation_kwargs(1))
+        first["id"] = "dup"
+        second = file_db._validation_values(**_validation_kwargs(2))
+        second["id"] = "dup"
+        with pytest.raises(Exception):
+            file_db.bulk_insert(validations=[first, second])
+        assert file_db.get_validation_result("dup") is None
+
+    def test_failed_flush_keeps_rows_for_retry(self, file_db):
+        buffer = file_db.write_buffer(flush_interval_ms=0, max_attempts=3)
+        first = buffer.add_validation(**_validation_kwargs(1))
+        with patch.object(file_db, "bulk_insert", side_effect=RuntimeError("database is locked")):
+            with pytest.raises(RuntimeError):
+                buffer.flush()
+        second = buffer.add_validation(**_validation_kwargs(2))
+
+        assert buffer.pending == 2
+        assert buffer.flush() == 2
+        assert file_db.get_validation_result(first) is not None
+        assert file_db.get_validation_result(second) is not None
+
+    def test_batch_is_dropped_after_max_attempts(self, file_db):
+        buffer = file_db.write_buffer(flush_interval_ms=0, max_attempts=2)
+        buffer.add_validation(**_validation_kwargs())
+        with patch.object(file_db, "bulk_insert", side_effect=RuntimeError("database is locked")):
+            for _ in range(2):
+                with pytest.raises(RuntimeError):
+                    buffer.flush()
+
+        assert buffer.pending == 0
+        assert buffer.stats["rows_dropped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_event_loop_callers_never_flush_inline(self, file_db):
+        buffer = file_db.write_buffer(max_rows=2, flush_interval_ms=0)
+        for i in range(3):
+            buffer.add_validation(**_validation_kwargs(i))
+
+        assert buffer.stats["flushes"] == 0
+        assert buffer.backlogged
+        assert await asyncio.to_thread(buffer.flush) == 3
+
+    def test_closed_buffer_rejects_rows(self, file_db):
+        buffer = file_db.write_buffer()
+        buffer.close()
+        with pytest.raises(RuntimeError):
+            buffer.add_validation(**_validation_kwargs())
@@ -0,0 +1,179 @@
+# file: tests/core/test_document_model.py
+"""Tests for the shared single-pass markdown document model."""
+
+import pickle
+
+import pytest
+
+from core.document_model import (
+    CONTEXT_KEY,
+    DocumentModel,
+    DocumentModelCache,
+    document_from_context,
+    get_document_model,
+)
+
+
+SAMPLE = """---
+title: Sample
+tags: [a, b]
+---
+# Title
+
+Intro with [a link](https://example.com) and ![logo](img/logo.png).
+
+## Section `inline`
+
+```python
+# not a heading
+print("x")
+```
+
+### Sub [x![y](z)
+"""
+
+
+@pytest.mark.unit
+class TestDocumentModelViews:
+    """Views computed by the single line pass."""
+
+    def test_headings_skip_nothing_but_non_matching_lines(self):
+        doc = DocumentModel(SAMPLE)
+        assert [(h.level, h.text, h.line) for h in doc.headings] == [
+            (1, "Title", 5),
+            (2, "Section `inline`", 9),
+            (1, "not a heading", 12),
+            (3, "Sub [x![y](z)", 16),
+        ]
+        assert doc.heading_line_indexes == [4, 8, 11, 15]
+
+    def test_links_and_images(self):
+        doc = DocumentModel(SAMPLE)
+        assert [(l.text, l.url, l.is_image) for l in doc.links] == [
+            ("a link", "https://example.com", False),
+            ("logo", "img/logo.png", True),
+            ("x![y", "z", False),
+        ]
+        assert [(line, alt, url) for line, alt, url in doc.images] == [
+            (7, "logo", "img/logo.png"),
+            (16, "y", "z"),
+        ]
+
+    def test_link_offsets_point_into_content(self):
+        doc = DocumentModel(SAMPLE)
+        for link in doc.links:
+            assert SAMPLE[link.start:link.end].endswith(f"({link.url})")
+            assert doc.line_of(link.start) == link.line
+
+    def test_inline_code_skips_fence_lines(self):
+        doc = DocumentModel("```py `x`\ncode\n```\nuse `y` here")
+        assert doc.inline_code == [(4, "y")]
+
+    def test_fences(self):
+        doc = DocumentModel(SAMPLE)
+        assert len(doc.code_blocks) == 1
+        block = doc.code_blocks[0]
+        assert (block.start_line, block.end_line, block.language) == (11, 14, "python")
+        assert block.lines == ["# not a heading", 'print("x")']
+        assert doc.unclosed_fence is None
+
+    def test_unclosed_fence(self):
+        doc = DocumentModel("text\n```bash\nls\n")
+        assert doc.code_blocks == []
+        assert doc.unclosed_fence.start_line == 2
+
+    def test_fenced_blocks_regex_view(self):
+        doc = DocumentModel(SAMPLE)
+        assert [(b.language, b.body) for b in doc.fenced_blocks] == [("python", '# not a heading\nprint("x")')]
+
+
+@pytest.mark.unit
+class TestDocumentModelFrontmatter:
+    """Frontmatter and the ingestion YAML split."""
+
+    def test_frontmatter(self):
+        doc = DocumentModel(SAMPLE)
+        assert doc.frontmatter == {"title": "Sample", "tags": ["a", "b"]}
+        assert doc.body.startswith("# Title")
+        assert doc.frontmatter_error is None
+
+    def test_frontmatter_error(self):
+        doc = DocumentModel("---\ntitle: [bad\n---\n# T")
+        assert doc.frontmatter == {}
+        assert doc.frontmatter_error is not None
+
+    def test_yaml_split(self):
+        data, body = DocumentModel(SAMPLE).yaml_split
+        assert data["title"] == "Sample"
+        assert body.startswith("# Title")
+
+    def test_yaml_split_keeps_content_on_invalid_yaml(self):
+        content = "---\ntitle: [bad\n---\n# T"
+        assert DocumentModel(content).yaml_split == (None, content)
+
+
+@pytest.mark.unit
+class TestDocumentModelSharing:
+    """Memoization and attachment to validation contexts."""
+
+    def test_cache_hits(self):
+        cache = DocumentModelCache(max_entries=2)
+        first = cache.get("# a")
+        assert cache.get("# a") is first
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_cache_is_bounded(self):
+        cache = DocumentModelCache(max_entries=2)
+        for text in ("a", "b", "c"):
+            cache.get(text)
+        assert len(cache._entries) == 2
+
+    def test_context_attach_and_reuse(self):
+        context = {}
+        model = document_from_context(SAMPLE, context)
+        assert context[CONTEXT_KEY] is model
+        assert document_from_context(SAMPLE, context) is model
+
+    def test_context_model_for_other_content_is_replaced(self):
+        context = {CONTEXT_KEY: get_document_model("# other")}
+        model = document_from_context(SAMPLE, context)
+        assert model.content == SAMPLE
+        assert context[CONTEXT_KEY] is model
+
+    def test_pickle_ships_content_only(self):
+        doc = DocumentModel(SAMPLE)
+        doc.headings
+        clone = pickle.loads(pickle.dumps(doc))
+        assert clone.content == SAMPLE
+        assert clone.content_hash == doc.content_hash
+        assert [h.text for h in clone.headings] == [h.text for h in doc.headings]
+
+    @pytest.mark.asyncio
+    async def test_router_shares_one_model(self):
+        from agents.validators.markdown_validator import MarkdownValidatorAgent
+        from agents.validators.structure_validator import StructureValidatorAgent
+        from agents.validators.router import ValidatorRouter
+
+        seen = []
+
+        class Recorder:
+            def __init__(self, agent):
+                self.agent = agent
+
+            async def validate(self, content, context):
+                seen.append(context[CONTEXT_KEY])
+                return await self.agent.validate(content, context)
+
+        agents = {
+            "markdown_validator": Recorder(MarkdownValidatorAgent()),
+            "structure_validator": Recorder(StructureValidatorAgent()),
+        }
+
+        class Registry:
+            def get_agent(self, agent_id):
+                return agents.get(agent_id)
+
+        context = {"file_path": "doc.md"}
+        await ValidatorRouter(Registry()).execute(["markdown", "structure"], SAMPLE, context)
+        assert len(seen) == 2 and seen[0] is seen[1]
+        assert CONTEXT_KEY not in context
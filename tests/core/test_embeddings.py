@@ -1,6 +1,9 @@
 # file: tests/core/test_embeddings.py
 """Tests for EmbeddingService - RAG embedding generation."""
 
+import asyncio
+import time
+
 import pytest
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from typing import Dict, Any
@@ -9,6 +12,7 @@ from core.embeddings import (
     EmbeddingService,
     EmbeddingResult,
     EmbeddingCache,
+    PersistentEmbeddingCache,
     get_embedding_service
 )
 
@@ -85,6 +89,131 @@ class TestEmbeddingCache:
         assert cache.get_stats()["entries"] <= 5
 
 
+    def test_cache_eviction_is_lru(self):
+        """Recently read entries should survive eviction."""
+        cache = EmbeddingCache(max_entries=2)
+        cache.put("a", "model", [1.0])
+        cache.put("b", "model", [2.0])
+        cache.get("a", "model")
+        cache.put("c", "model", [3.0])
+
+        assert cache.get("a", "model") == [1.0]
+        assert cache.get("b", "model") is None
+
+    def test_get_many_preserves_order(self):
+        """Bulk lookup should return results in input order."""
+        cache = EmbeddingCache()
+        cache.put_many([("a", [1.0]), ("c", [3.0])], "model")
+
+        assert cache.get_many(["a", "b", "c"], "model") == [[1.0], None, [3.0]]
+        stats = cache.get_stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+
+
+class TestPersistentEmbeddingCache:
+    """Tests for the on-disk embedding tier."""
+
+    @pytest.fixture
+    def disk(self, tmp_path):
+        cache = PersistentEmbeddingCache(str(tmp_path / "embeddings"), max_entries=3)
+        yield cache
+        cache.close()
+
+    def test_put_get_roundtrip(self, disk):
+        """Vectors are stored as float32 and read back."""
+        disk.put("k1", "model", [0.5, 1.5, -2.0])
+        assert disk.get("k1") == [0.5, 1.5, -2.0]
+        assert disk.get("missing") is None
+
+    def test_survives_reopen(self, tmp_path):
+        """Entries are still there after the process reopens the cache."""
+        path = str(tmp_path / "embeddings")
+        first = PersistentEmbeddingCache(path)
+        first.put_many([("k1", "model", [1.0, 2.0]), ("k2", "model", [3.0, 4.0, 5.0])])
+        first.close()
+
+        second = PersistentEmbeddingCache(path)
+        try:
+            assert second.get_many(["k1", "k2", "k3"]) == {"k1": [1.0, 2.0], "k2": [3.0, 4.0, 5.0]}
+            assert second.count() == 2
+        finally:
+            second.close()
+
+    def test_lru_eviction_recycles_slots(self, disk):
+        """The least recently used entry is evicted and its slot reused."""
+        disk.put_many([("k1", "m", [1.0]), ("k2", "m", [2.0]), ("k3", "m", [3.0])])
+        disk.get("k1")
+        disk.put("k4", "m", [4.0])
+
+        assert disk.get("k2") is None
+        assert disk.get_many(["k1", "k3", "k4"]) == {"k1": [1.0], "k3": [3.0], "k4": [4.0]}
+        assert disk.count() == 3
+        assert disk._allocate_slot(1) == 3
+
+    def test_processes_sharing_a_directory_never_share_slots(self, tmp_path):
+        """Each writer allocates from the index, not from a stale counter of its own."""
+        path = str(tmp_path / "embeddings")
+        first, second = PersistentEmbeddingCache(path), PersistentEmbeddingCache(path)
+        try:
+            first.put("k1", "m", [1.0])
+            second.put("k2", "m", [2.0])
+            first.put("k3", "m", [3.0])
+
+            assert second.get_many(["k1", "k2", "k3"]) == {"k1": [1.0], "k2": [2.0], "k3": [3.0]}
+            assert first.count() == 3
+        finally:
+            first.close()
+            second.close()
+
+    def test_slot_reused_after_index_read_is_a_miss(self, tmp_path):
+        """A slot rewritten by another process is never returned under the old key."""
+        path = str(tmp_path / "embeddings")
+        first, second = PersistentEmbeddingCache(path), PersistentEmbeddingCache(path)
+        try:
+            first.put("k1", "m", [1.0])
+            # The index still maps k1 to slot 0, as it would between our
+            # select and the vector read while another process reuses it.
+            second._write(1, 0, "k2", [9.0])
+
+            assert first.get("k1") is None
+            assert first.get_stats()["misses"] == 1
+        finally:
+            first.close()
+            second.close()
+
+    def test_ttl_expiry(self, tmp_path):
+        """Expired entries are treated as misses."""
+        cache = PersistentEmbeddingCache(str(tmp_path / "embeddings"), ttl_seconds=1)
+        try:
+            cache.put("k1", "m", [1.0])
+            with patch("core.embeddings.time.time", return_value=time.time() + 5):
+                assert cache.get("k1") is None
+            assert cache.count() == 0
+        finally:
+            cache.close()
+
+    def test_clear(self, disk):
+        """Clearing removes all entries."""
+        disk.put("k1", "m", [1.0])
+        disk.clear()
+        assert disk.get("k1") is None
+        assert disk.count() == 0
+
+    def test_memory_tier_falls_through_to_disk(self, tmp_path):
+        """Memory misses are served from disk and promoted."""
+        disk = PersistentEmbeddingCache(str(tmp_path / "embeddings"))
+        try:
+            disk.put(EmbeddingCache()._hash_text("text", "model"), "model", [1.0, 2.0])
+            cache = EmbeddingCache(persistent=disk)
+
+            assert cache.get("text", "model") == [1.0, 2.0]
+            assert len(cache._cache) == 1
+            assert disk.get_stats()["hits"] == 1
+        finally:
+            disk.close()
+
+
 # --- EmbeddingResult Tests ---
 
 class TestEmbeddingResult:
@@ -255,6 +384,119 @@ class TestEmbeddingService:
         assert service._cache.get("text", service.model) is None
 
 
+# --- Batched embedding Tests ---
+
+class TestBatchedEmbeddings:
+    """Tests for get_embeddings_batch against a local stub Ollama server."""
+
+    @pytest.fixture
+    async def ollama_stub(self):
+        """Minimal /api/embed + /api/embeddings server that records requests."""
+        from aiohttp import web
+
+        state = {"embed_calls": [], "single_calls": [], "in_flight": 0, "max_in_flight": 0,
+                 "embed_status": 200, "drop": set()}
+
+        def vector(text):
+            return [float(len(text)), 1.0]
+
+        async def embed(request):
+            body = await request.json()
+            state["embed_calls"].append(body["input"])
+            state["in_flight"] += 1
+            state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+            await asyncio.sleep(0.01)
+            state["in_flight"] -= 1
+            if state["embed_status"] != 200:
+                return web.Response(status=state["embed_status"], text="not found")
+            return web.json_response({"embeddings": [
+                [] if text in state["drop"] else vector(text) for text in body["input"]
+            ]})
+
+        async def embeddings(request):
+            body = await request.json()
+            state["single_calls"].append(body["prompt"])
+            state["in_flight"] += 1
+            state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+            await asyncio.sleep(0.01)
+            state["in_flight"] -= 1
+            return web.json_response({"embedding": vector(body["prompt"])})
+
+        app = web.Application()
+        app.router.add_post("/api/embed", embed)
+        app.router.add_post("/api/embeddings", embeddings)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        state["base_url"] = f"http://127.0.0.1:{port}"
+        yield state
+        await runner.cleanup()
+
+    @pytest.fixture
+    async def service(self, ollama_stub):
+        config = {"rag": {"embedding": {"batch_size": 2, "max_concurrent_batches": 1}, "cache": {"enabled": True}}}
+        with patch('core.embeddings.get_config_loader') as mock_loader:
+            mock_loader.return_value.load.return_value = config
+            svc = EmbeddingService(base_url=ollama_stub["base_url"])
+        svc._available = True
+        yield svc
+        await svc.close()
+
+    @pytest.mark.asyncio
+    async def test_one_request_per_batch(self, service, ollama_stub):
+        """Each batch_size chunk is sent as a single /api/embed request."""
+        texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+        results = await service.get_embeddings_batch(texts)
+
+        assert [r.embedding for r in results] == [[float(len(t)), 1.0] for t in texts]
+        assert ollama_stub["embed_calls"] == [["a", "bb"], ["ccc", "dddd"], ["eeeee"]]
+        assert ollama_stub["single_calls"] == []
+
+    @pytest.mark.asyncio
+    async def test_batches_in_flight_are_limited(self, service, ollama_stub):
+        """No more than max_concurrent_batches requests run at once."""
+        await service.get_embeddings_batch([f"text{i}" for i in range(10)])
+        assert len(ollama_stub["embed_calls"]) == 5
+        assert ollama_stub["max_in_flight"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_items_fall_back_to_single_requests(self, service, ollama_stub):
+        """Items missing from a batch response are embedded one by one."""
+        ollama_stub["drop"].add("bb")
+        results = await service.get_embeddings_batch(["a", "bb", "ccc"])
+
+        assert all(r.embedding for r in results)
+        assert ollama_stub["single_calls"] == ["bb"]
+
+    @pytest.mark.asyncio
+    async def test_batch_endpoint_error_falls_back(self, service, ollama_stub):
+        """Servers without /api/embed still work through per-text requests."""
+        ollama_stub["embed_status"] = 404
+        results = await service.get_embeddings_batch(["a", "bb", "ccc"])
+
+        assert [r.embedding for r in results] == [[1.0, 1.0], [2.0, 1.0], [3.0, 1.0]]
+        assert ollama_stub["max_in_flight"] == 1  # per-text retries share the batch bound
+        assert sorted(ollama_stub["single_calls"]) == ["a", "bb", "ccc"]
+
+    @pytest.mark.asyncio
+    async def test_batch_results_are_cached(self, service, ollama_stub):
+        """A second batch for the same texts is served from cache."""
+        await service.get_embeddings_batch(["a", "bb"])
+        results = await service.get_embeddings_batch(["a", "bb"])
+
+        assert all(r.cached for r in results)
+        assert len(ollama_stub["embed_calls"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_service_unavailable(self, service):
+        """When Ollama is down every uncached text gets an error result."""
+        service._available = False
+        results = await service.get_embeddings_batch(["a", "bb"])
+        assert all(r.embedding is None and "not available" in r.error for r in results)
+
+
 # --- Module-level singleton Tests ---
 
 class TestGetEmbeddingService:
@@ -0,0 +1,153 @@
+# file: tests/core/test_metrics.py
+"""Tests for the in-process metrics registry."""
+
+import os
+
+os.environ.setdefault("TBCV_ENV", "test")
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from core.metrics import Counter, Histogram, MetricsRegistry, OPERATION_DURATION
+
+
+@pytest.mark.unit
+class TestHistogram:
+
+    def test_quantiles_are_interpolated_within_buckets(self):
+        histogram = Histogram(buckets=(10, 20, 30, 40, 50, 60, 70, 80, 90, 100))
+        for value in range(1, 101):
+            histogram.observe(value)
+
+        assert histogram.snapshot()["count"] == 100
+        assert histogram.quantile(0.50) == pytest.approx(50, abs=1)
+        assert histogram.quantile(0.95) == pytest.approx(95, abs=1)
+        assert histogram.quantile(0.99) == pytest.approx(99, abs=1)
+
+    def test_quantile_never_exceeds_observed_max(self):
+        histogram = Histogram()
+        histogram.observe(12.0)
+
+        assert histogram.quantile(0.99) <= 12.0
+
+    def test_empty_histogram(self):
+        assert Histogram().quantile(0.5) == 0.0
+
+    def test_concurrent_observations_are_not_lost(self):
+        histogram = Histogram()
+
+        def observe():
+            for _ in range(5000):
+                histogram.observe(1.0)
+
+        threads = [threading.Thread(target=observe) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        snap = histogram.snapshot()
+        assert snap["count"] == 40000
+        assert snap["sum"] == 40000.0
+
+    def test_shards_of_exited_threads_are_folded(self):
+        histogram = Histogram()
+        counter = Counter()
+
+        def record(value):
+            histogram.observe(value)
+            counter.inc()
+
+        for value in range(1, 51):
+            t = threading.Thread(target=record, args=(float(value),))
+            t.start()
+            t.join()
+
+        snap = histogram.snapshot()
+        assert snap["count"] == 50
+        assert snap["sum"] == sum(range(1, 51))
+        assert snap["max"] == 50.0
+        assert counter.value == 50
+        assert len(histogram._shards) == len(counter._shards) == 0
+
+
+@pytest.mark.unit
+class TestMetricsRegistry:
+
+    def test_summary_per_operation(self):
+        registry = MetricsRegistry()
+        for value in (1, 2, 3, 4):
+            registry.observe_operation("cache_get", value)
+        registry.observe_operation("cache_get", 5, error=True)
+        registry.observe_operation("validate", 100)
+
+        summary = registry.summary()
+
+        assert set(summary) == {"cache_get", "validate"}
+        assert summary["cache_get"]["count"] == 5
+        assert summary["cache_get"]["errors"] == 1
+        assert summary["cache_get"]["avg_ms"] == 3
+        assert summary["cache_get"]["max_ms"] == 5
+        assert summary["validate"]["p50_ms"] <= 100
+
+    def test_same_labels_return_same_metric(self):
+        registry = MetricsRegistry()
+
+        assert registry.histogram(OPERATION_DURATION, operation="a") is registry.histogram(OPERATION_DURATION, operation="a")
+        assert registry.counter("hits", kind="x") is not registry.counter("hits", kind="y")
+
+    def test_prometheus_exposition(self):
+        registry = MetricsRegistry()
+        registry.observe_operation('quote"op', 3)
+        registry.counter("tasks_total").inc(2)
+
+        text = registry.render_prometheus()
+
+        assert "# TYPE tbcv_tasks_total counter" in text
+        assert "tbcv_tasks_total 2" in text
+        assert "# TYPE tbcv_operation_duration_ms histogram" in text
+        assert 'tbcv_operation_duration_ms_bucket{operation="quote\\"op",le="+Inf"} 1' in text
+        assert 'tbcv_operation_duration_ms_count{operation="quote\\"op"} 1' in text
+        assert text.endswith("\n")
+
+    def test_reset(self):
+        registry = MetricsRegistry()
+        registry.observe_operation("op", 1)
+
+        registry.reset()
+
+        assert registry.summary() == {}
+
+
+@pytest.mark.unit
+class TestPerformanceLoggerRecording:
+
+    def test_records_without_logging_by_default(self):
+        from core.logging import PerformanceLogger
+        from core.metrics import metrics_registry
+
+        logger = Mock()
+        before = metrics_registry.summary().get("metrics_test_op", {}).get("count", 0)
+
+        with PerformanceLogger(logger, "metrics_test_op", sample_rate=0.0):
+            pass
+
+        assert metrics_registry.summary()["metrics_test_op"]["count"] == before + 1
+        logger.info.assert_not_called()
+
+    def test_sampled_calls_log_and_failures_always_log(self):
+        from core.logging import PerformanceLogger
+        from core.metrics import metrics_registry
+
+        logger = Mock()
+        with PerformanceLogger(logger, "metrics_sampled_op", sample_rate=1.0):
+            pass
+        assert logger.info.call_count == 2
+
+        with pytest.raises(ValueError):
+            with PerformanceLogger(logger, "metrics_failing_op", sample_rate=0.0):
+                raise ValueError("boom")
+        logger.error.assert_called_once()
+        assert metrics_registry.summary()["metrics_failing_op"]["errors"] >= 1
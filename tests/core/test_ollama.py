@@ -7,6 +7,7 @@ Target coverage: 95% (Currently 0%)
 """
 import pytest
 import json
+import asyncio
 from unittest.mock import Mock, MagicMock, patch, mock_open
 from urllib.error import URLError, HTTPError
 
@@ -430,3 +431,142 @@ class TestOllamaIntegration:
 # All HTTP requests are mocked using patch('core.ollama.urlopen').
 # All LLM methods use patch.object(client, '_make_request').
 # This ensures tests are deterministic, fast, and offline.
+
+
+@pytest.mark.unit
+class TestOllamaAsyncTransport:
+    """Tests for the pooled async transport (local stub server, no real LLM)."""
+
+    @pytest.fixture
+    async def ollama_stub(self):
+        """Minimal Ollama API server that records connections and concurrency."""
+        from aiohttp import web
+
+        state = {"peers": set(), "in_flight": 0, "max_in_flight": 0, "status": 200}
+
+        async def track(request):
+            state["peers"].add(request.transport.get_extra_info("peername"))
+            state["in_flight"] += 1
+            state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+            await asyncio.sleep(0.01)
+            state["in_flight"] -= 1
+
+        async def generate(request):
+            body = await request.json()
+            await track(request)
+            if state["status"] != 200:
+                return web.Response(status=state["status"], text="boom")
+            if not body.get("stream"):
+                return web.json_response({"response": f"echo:{body['prompt']}", "done": True})
+            response = web.StreamResponse(headers={"Content-Type": "application/x-ndjson"})
+            await response.prepare(request)
+            for word in ("Hello", " ", "world"):
+                await response.write((json.dumps({"response": word, "done": False}) + "\n").encode())
+            await response.write((json.dumps({"response": "", "done": True, "eval_count": 3}) + "\n").encode())
+            await response.write_eof()
+            return response
+
+        async def chat(request):
+            body = await request.json()
+            await track(request)
+            if not body.get("stream"):
+                return web.json_response({"message": {"role": "assistant", "content": "hi"}, "done": True})
+            response = web.StreamResponse(headers={"Content-Type": "application/x-ndjson"})
+            await response.prepare(request)
+            for word in ("a", "b"):
+                chunk = {"message": {"role": "assistant", "content": word}, "done": False}
+                await response.write((json.dumps(chunk) + "\n").encode())
+            await response.write((json.dumps({"message": {"role": "assistant", "content": ""}, "done": True}) + "\n").encode())
+            await response.write_eof()
+            return response
+
+        async def tags(request):
+            await track(request)
+            return web.json_response({"models": [{"name": "mistral"}]})
+
+        app = web.Application()
+        app.router.add_post("/api/generate", generate)
+        app.router.add_post("/api/chat", chat)
+        app.router.add_get("/api/tags", tags)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        state["base_url"] = f"http://127.0.0.1:{port}"
+        yield state
+        await runner.cleanup()
+
+    @pytest.fixture
+    async def client(self, ollama_stub):
+        client = Ollama(base_url=ollama_stub["base_url"], model="mistral", timeout=5,
+                        enabled=True, max_connections=4, max_concurrent=2)
+        yield client
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_async_generate(self, client):
+        result = await client.async_generate(prompt="ping")
+        assert result["response"] == "echo:ping"
+
+    @pytest.mark.asyncio
+    async def test_async_generate_stream(self, client):
+        chunks = [chunk async for chunk in client.async_generate_stream(prompt="ping")]
+        assert "".join(c["response"] for c in chunks) == "Hello world"
+        assert chunks[-1]["done"] is True
+
+    @pytest.mark.asyncio
+    async def test_stream_flag_reassembles_response(self, client):
+        result = await client.async_generate(prompt="ping", stream=True)
+        assert result["response"] == "Hello world"
+        assert result["eval_count"] == 3
+
+        chat = await client.async_chat(messages=[{"role": "user", "content": "x"}], stream=True)
+        assert chat["message"] == {"role": "assistant", "content": "ab"}
+
+    @pytest.mark.asyncio
+    async def test_connections_are_reused(self, client, ollama_stub):
+        for _ in range(5):
+            await client.async_generate(prompt="ping")
+        assert len(ollama_stub["peers"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_limited(self, client, ollama_stub):
+        await asyncio.gather(*(client.async_generate(prompt=str(i)) for i in range(8)))
+        assert ollama_stub["max_in_flight"] == 2
+
+    @pytest.mark.asyncio
+    async def test_http_error_maps_to_api_error(self, client, ollama_stub):
+        ollama_stub["status"] = 500
+        with pytest.raises(OllamaAPIError):
+            await client.async_generate(prompt="ping")
+
+    @pytest.mark.asyncio
+    async def test_connection_refused_maps_to_connection_error(self):
+        client = Ollama(base_url="http://127.0.0.1:1", timeout=2, enabled=True)
+        try:
+            with pytest.raises(OllamaConnectionError):
+                await client.async_list_models()
+            assert await client.async_is_available() is False
+        finally:
+            await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_disabled_client_raises(self):
+        client = Ollama(enabled=False)
+        with pytest.raises(OllamaError, match="disabled"):
+            await client.async_generate(prompt="Test")
+        assert await client.async_is_available() is False
+
+    @pytest.mark.asyncio
+    async def test_metrics(self, client):
+        await client.async_list_models()
+        await client.async_generate(prompt="ping", stream=True)
+        metrics = client.get_transport_metrics()
+
+        assert metrics["in_flight"] == 0
+        assert metrics["endpoints"]["api/tags"]["requests"] == 1
+        generate = metrics["endpoints"]["api/generate"]
+        assert generate["requests"] == 1
+        assert generate["errors"] == 0
+        assert generate["first_chunk_ms"] > 0
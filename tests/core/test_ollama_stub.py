@@ -0,0 +1,153 @@
+# file: tests/core/test_ollama_stub.py
+"""Tests for the stub Ollama server used by the llm benchmark suite."""
+
+import os
+
+os.environ.setdefault("TBCV_ENV", "test")
+
+import json
+import math
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from core.ollama_stub import (
+    OllamaStubServer,
+    StubProfile,
+    StubResponder,
+    example_from_schema,
+    json_example_response,
+)
+
+FAST = StubProfile(ttft_ms=0, prompt_tokens_per_sec=0, tokens_per_sec=0)
+
+
+def _post(url, payload):
+    request = urllib.request.Request(url, data=json.dumps(payload).encode("utf-8"), method="POST",
+                                     headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(request, timeout=10) as response:
+        return response.read().decode("utf-8")
+
+
+@pytest.fixture
+def stub():
+    with OllamaStubServer(FAST) as server:
+        yield server
+
+
+@pytest.mark.unit
+class TestResponder:
+
+    def test_fills_in_critique_prompt_example(self):
+        with open("prompts/recommendation_critique.json", encoding="utf-8") as f:
+            template = json.load(f)["critique"]["template"]
+
+        data = json.loads(json_example_response(template))
+
+        assert data["actionable"] is True
+        assert data["should_discard"] is False
+        assert data["needs_refinement"] is False
+        assert data["quality_score"] == 1.0
+        assert isinstance(data["side_effects"], list)
+
+    def test_enumerations_and_choices(self):
+        prompt = 'Respond with JSON: {"items": [{"severity": "high|medium|low", "prefer": 1 or 2 (better one)}]}'
+
+        assert json.loads(json_example_response(prompt)) == {"items": [{"severity": "high", "prefer": 1}]}
+
+    def test_no_example(self):
+        assert json_example_response("Summarize this article.") is None
+        assert StubResponder().respond("Summarize this article.")
+
+    def test_section_edit_appends_suggestion(self):
+        prompt = ("Target Section:\n## Prerequisites\n- Word Processor\n\nContext After:\nmore\n\n"
+                  "Recommendation:\n- Suggested addition: Document Converter plugin")
+
+        assert StubResponder().respond(prompt) == "## Prerequisites\n- Word Processor\nDocument Converter plugin"
+
+    def test_canned_responses_take_precedence(self):
+        responder = StubResponder([(r"contradictions", '{"contradictions": []}')])
+
+        assert responder.respond('Respond with JSON: {"contradictions": [{"issue": "x"}]}') == '{"contradictions": []}'
+
+    def test_schema_format(self):
+        schema = {"type": "object", "properties": {"ok": {"type": "boolean"}, "level": {"enum": ["error", "info"]},
+                                                   "n": {"type": "integer", "minimum": 2}}}
+
+        assert example_from_schema(schema) == {"ok": False, "level": "error", "n": 2}
+        assert json.loads(StubResponder().respond("hello", fmt=schema)) == {"ok": False, "level": "error", "n": 2}
+        assert StubResponder().respond("hello", fmt="json") == "{}"
+
+
+@pytest.mark.unit
+class TestStubServer:
+
+    def test_generate(self, stub):
+        body = json.loads(_post(f"{stub.url}/api/generate", {"prompt": "hi", "stream": False}))
+
+        assert body["done"] is True
+        assert body["response"]
+        assert body["eval_count"] >= 1
+        assert stub.stats()["requests"] == {"/api/generate": 1}
+
+    def test_streamed_chunks_reassemble_to_full_response(self, stub):
+        whole = json.loads(_post(f"{stub.url}/api/generate", {"prompt": "hi", "stream": False}))["response"]
+
+        chunks = [json.loads(line) for line in _post(f"{stub.url}/api/generate", {"prompt": "hi"}).splitlines()]
+
+        assert "".join(c["response"] for c in chunks) == whole
+        assert [c["done"] for c in chunks][-2:] == [False, True]
+
+    def test_chat_and_embed(self, stub):
+        chat = json.loads(_post(f"{stub.url}/api/chat", {
+            "messages": [{"role": "user", "content": 'Respond with JSON: {"ok": true/false}'}], "stream": False,
+        }))
+        first = json.loads(_post(f"{stub.url}/api/embed", {"input": ["a", "b"]}))["embeddings"]
+        again = json.loads(_post(f"{stub.url}/api/embed", {"input": "a"}))["embeddings"]
+
+        assert json.loads(chat["message"]["content"]) == {"ok": True}
+        assert first[0] == again[0] != first[1]
+        assert math.isclose(sum(v * v for v in first[0]), 1.0, rel_tol=1e-3)
+
+    def test_latency_model(self):
+        profile = StubProfile(ttft_ms=100, prompt_tokens_per_sec=0, tokens_per_sec=200)
+        with OllamaStubServer(profile) as server:
+            start = time.perf_counter()
+            body = json.loads(_post(f"{server.url}/api/generate", {"prompt": "hi", "stream": False}))
+            elapsed = time.perf_counter() - start
+
+        expected = 0.1 + (body["eval_count"] - 1) / 200
+        assert elapsed >= expected * 0.9
+        assert body["prompt_eval_duration"] >= 0.09e9
+
+    def test_num_predict_truncates(self, stub):
+        body = json.loads(_post(f"{stub.url}/api/generate",
+                                {"prompt": "hi", "stream": False, "options": {"num_predict": 2}}))
+
+        assert body["done_reason"] == "length"
+        assert len(body["response"]) == 8
+
+    def test_full_queue_is_refused(self):
+        profile = StubProfile(ttft_ms=300, prompt_tokens_per_sec=0, tokens_per_sec=0, max_concurrent=1, max_queue=0)
+        with OllamaStubServer(profile) as server:
+            slow = threading.Thread(target=_post, args=(f"{server.url}/api/generate", {"prompt": "a", "stream": False}))
+            slow.start()
+            time.sleep(0.1)
+            with pytest.raises(urllib.error.HTTPError) as refused:
+                _post(f"{server.url}/api/generate", {"prompt": "b", "stream": False})
+            slow.join()
+
+            assert refused.value.code == 503
+            assert server.stats()["rejected"] == 1
+
+    def test_tags_and_client_compatibility(self, stub):
+        from core.ollama import Ollama
+
+        client = Ollama(base_url=stub.url, enabled=True)
+
+        assert client.list_models()["models"][0]["name"] == "mistral:latest"
+        assert client.is_available()
+        assert client.generate(prompt='Respond with JSON: {"omissions": []}')["response"].startswith("{")
@@ -0,0 +1,139 @@
+# file: tests/core/test_pattern_set.py
+"""Tests for the single-pass pattern set scanner."""
+
+import random
+import re
+
+import pytest
+
+from core.pattern_set import (
+    PatternSet,
+    PatternSetCache,
+    compile_pattern_set,
+    literal_pattern_set,
+    literal_prefix,
+)
+
+
+PATTERNS = [
+    ("create", r"new Document\("),
+    ("assign", r"Document\s+\w+\s*="),
+    ("save", r"\.Save\s*\("),
+    ("save_format", r"SaveFormat\."),
+    ("word", r"doc\w*"),
+    ("overlap", r"ument"),
+]
+
+
+def _per_pattern(patterns, text, flags=0):
+    """Reference result: one finditer per pattern."""
+    return [
+        (pattern_id, m.start(), m.end())
+        for pattern_id, pattern in patterns
+        for m in re.compile(pattern, flags).finditer(text)
+    ]
+
+
+@pytest.mark.unit
+class TestPatternSetScan:
+    """Hits must equal per-pattern finditer, in the same order."""
+
+    def test_scan_matches_per_pattern_finditer(self):
+        text = 'Document doc = new Document();\ndoc.Save("out.pdf", SaveFormat.Pdf);'
+        hits = [tuple(h) for h in PatternSet(PATTERNS, re.IGNORECASE).scan(text)]
+        assert hits == _per_pattern(PATTERNS, text, re.IGNORECASE)
+
+    def test_overlapping_patterns_at_same_position(self):
+        patterns = [("short", "ab"), ("long", "aba"), ("tail", "b")]
+        hits = [tuple(h) for h in PatternSet(patterns).scan("ababa")]
+        assert hits == [("short", 0, 2), ("short", 2, 4), ("long", 0, 3), ("tail", 1, 2), ("tail", 3, 4)]
+
+    def test_patterns_without_literal_prefix_are_scanned_alone(self):
+        patterns = [("backref", r"(a)\1"), ("empty", r"\b"), ("class", r"[ab]+"), ("plain", "ab"),
+                    ("anchored", r"\bab"), ("inline_flags", r"(?i)AB")]
+        pattern_set = PatternSet(patterns)
+        assert [pattern_set.ids[i] for i in pattern_set._residual] == ["backref", "empty", "class", "inline_flags"]
+        text = "aab ab AB"
+        assert [tuple(h) for h in pattern_set.scan(text)] == _per_pattern(patterns, text)
+
+    def test_shared_prefixes(self):
+        patterns = [("doc", "doc"), ("document", r"document\w*"), ("docs", "docs?")]
+        text = "docs document documentation doc"
+        assert [tuple(h) for h in PatternSet(patterns).scan(text)] == _per_pattern(patterns, text)
+
+    def test_non_ascii_case_folding(self):
+        # U+017F (long s) matches "s" case-insensitively but does not lower() to it
+        patterns = [("save", r"save\("), ("set", "set")]
+        text = "\u017fave( SAVE( \u017fet"
+        hits = [tuple(h) for h in PatternSet(patterns, re.IGNORECASE).scan(text)]
+        assert hits == _per_pattern(patterns, text, re.IGNORECASE)
+
+    def test_invalid_patterns_are_reported(self):
+        pattern_set = PatternSet([("bad", "(unclosed"), ("good", "x")])
+        assert pattern_set.ids == ["good"]
+        assert pattern_set.invalid[0][0] == "bad"
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_random_texts(self, seed):
+        rng = random.Random(seed)
+        patterns = PATTERNS + [("short", "ab"), ("long", "aba"), ("tail", "b")]
+        pattern_set = PatternSet(patterns, re.IGNORECASE)
+        alphabet = "ab Document.Save(new =x\n"
+        for _ in range(200):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 60)))
+            assert [tuple(h) for h in pattern_set.scan(text)] == _per_pattern(patterns, text, re.IGNORECASE)
+
+
+@pytest.mark.unit
+class TestLiteralPrefix:
+    """Prefix extraction used to build the trie prefilter."""
+
+    @pytest.mark.parametrize("pattern,flags,expected", [
+        (r"new Document\(", 0, "new Document("),
+        (r"\.Save\s*\(", re.IGNORECASE, ".save"),
+        (r"\bfoo", 0, "foo"),
+        (r"ab*", 0, "a"),
+        (r"a|b", 0, ""),
+        (r"\w+", 0, ""),
+        ("caf\u00e9", 0, "caf"),
+    ])
+    def test_prefix(self, pattern, flags, expected):
+        assert literal_prefix(pattern, flags) == expected
+
+
+@pytest.mark.unit
+class TestPatternSetPresence:
+    """matched_ids reports which patterns occur at all."""
+
+    def test_matched_ids_in_pattern_order(self):
+        pattern_set = literal_pattern_set(["insecure_method", "deprecated_api", "api"], re.IGNORECASE)
+        assert pattern_set.matched_ids("Calls Deprecated_API here") == ["deprecated_api", "api"]
+
+    def test_literals_are_escaped(self):
+        assert literal_pattern_set(["a.b"]).matched_ids("axb") == []
+        assert literal_pattern_set(["a.b"]).matched_ids("a.b") == ["a.b"]
+
+    def test_empty_text(self):
+        assert PatternSet(PATTERNS).matched_ids("") == []
+        assert PatternSet(PATTERNS).scan("") == []
+
+
+@pytest.mark.unit
+class TestPatternSetCache:
+    """Compiled sets are shared per ruleset version."""
+
+    def test_same_ruleset_is_shared(self):
+        assert compile_pattern_set(PATTERNS, re.IGNORECASE) is compile_pattern_set(list(PATTERNS), re.IGNORECASE)
+
+    def test_changed_ruleset_compiles_new_set(self):
+        cache = PatternSetCache()
+        first = cache.get(PATTERNS)
+        assert cache.get(PATTERNS + [("extra", "x")]) is not first
+        assert cache.get(PATTERNS, re.IGNORECASE) is not first
+        assert (cache.hits, cache.misses) == (0, 3)
+
+    def test_cache_is_bounded(self):
+        cache = PatternSetCache(max_entries=2)
+        for n in range(3):
+            cache.get([("p", str(n))])
+        assert len(cache._entries) == 2
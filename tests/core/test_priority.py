@@ -0,0 +1,157 @@
+# file: tests/core/test_priority.py
+"""Tests for priority lanes and weighted fair admission."""
+
+import os
+
+os.environ.setdefault("TBCV_ENV", "test")
+
+import asyncio
+
+import pytest
+
+from core.metrics import metrics_registry
+from core.priority import (
+    BACKGROUND,
+    BATCH,
+    INTERACTIVE,
+    QUEUE_WAIT,
+    FairQueue,
+    QueueBusyError,
+    current_lane,
+    normalize_lane,
+    priority_lane,
+)
+
+WEIGHTS = {INTERACTIVE: 16.0, BATCH: 4.0, BACKGROUND: 1.0}
+
+
+async def _hold(queue, lane, served, delay=0.0):
+    await queue.acquire(lane)
+    served.append(lane)
+    await asyncio.sleep(delay)
+    queue.release()
+
+
+@pytest.mark.unit
+class TestLanes:
+
+    def test_normalize(self):
+        assert normalize_lane(" Interactive ") == INTERACTIVE
+        assert normalize_lane(None) == BATCH
+        assert normalize_lane("", default=BACKGROUND) == BACKGROUND
+        with pytest.raises(ValueError):
+            normalize_lane("urgent")
+
+    @pytest.mark.asyncio
+    async def test_lane_follows_context_into_tasks(self):
+        assert current_lane() == BATCH
+        assert current_lane(INTERACTIVE) == INTERACTIVE
+
+        async def lane_in_task():
+            await asyncio.sleep(0)
+            return current_lane()
+
+        with priority_lane(INTERACTIVE):
+            assert await asyncio.create_task(lane_in_task()) == INTERACTIVE
+            with priority_lane(None, default=current_lane()):
+                assert current_lane() == INTERACTIVE
+        assert current_lane() == BATCH
+
+
+@pytest.mark.unit
+class TestFairQueue:
+
+    @pytest.mark.asyncio
+    async def test_interactive_waiter_goes_ahead_of_batch_backlog(self):
+        queue = FairQueue(1, weights=WEIGHTS)
+        served = []
+        batch = [asyncio.create_task(_hold(queue, BATCH, served, 0.005)) for _ in range(10)]
+        await asyncio.sleep(0.001)
+        interactive = asyncio.create_task(_hold(queue, INTERACTIVE, served))
+
+        await asyncio.gather(*batch, interactive)
+
+        assert served.index(INTERACTIVE) == 1
+        assert queue.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_lanes_share_slots_by_weight(self):
+        queue = FairQueue(1, weights=WEIGHTS)
+        served = []
+        await queue.acquire(BATCH)
+        tasks = [asyncio.create_task(_hold(queue, lane, served))
+                 for lane in [BATCH] * 40 + [BACKGROUND] * 40 + [INTERACTIVE] * 40]
+        await asyncio.sleep(0)
+        queue.release()
+        await asyncio.gather(*tasks)
+
+        first = served[:42]  # 16:4:1 is 32:8:2 of 42 slots
+        assert 31 <= first.count(INTERACTIVE) <= 33
+        assert 7 <= first.count(BATCH) <= 9
+        assert 1 <= first.count(BACKGROUND) <= 3
+        assert served.count(BACKGROUND) == 40  # nothing starves
+
+    @pytest.mark.asyncio
+    async def test_fifo_within_a_lane(self):
+        queue = FairQueue(1)
+        order = []
+
+        async def job(n):
+            async with queue:
+                order.append(n)
+                await asyncio.sleep(0)
+
+        await asyncio.gather(*(job(n) for n in range(5)))
+
+        assert order == list(range(5))
+        assert queue.stats["queued"] == 4
+
+    @pytest.mark.asyncio
+    async def test_depth_limit_is_per_lane(self):
+        queue = FairQueue(1, max_depth=1)
+        await queue.acquire(BATCH)
+        batch = asyncio.create_task(queue.acquire(BATCH))
+        await asyncio.sleep(0)
+
+        with pytest.raises(QueueBusyError):
+            await queue.acquire(BATCH)
+        interactive = asyncio.create_task(queue.acquire(INTERACTIVE))
+        await asyncio.sleep(0)
+
+        assert queue.depth == 2
+        queue.release()
+        await interactive
+        assert not batch.done()
+        queue.release()
+        await batch
+        assert queue.snapshot()["lanes"][BATCH]["rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_timeout_and_cancellation_leave_queue_consistent(self):
+        queue = FairQueue(1, timeout_s=0.02)
+        await queue.acquire()
+
+        with pytest.raises(QueueBusyError):
+            await queue.acquire(INTERACTIVE)
+        cancelled = asyncio.create_task(queue.acquire())
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+
+        assert queue.depth == 0
+        assert queue.lane_counts[INTERACTIVE]["timed_out"] == 1
+        queue.release()
+        assert queue.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_wait_is_recorded_per_lane(self):
+        queue = FairQueue(1, name="test_priority.metrics")
+        served = []
+
+        await asyncio.gather(_hold(queue, BATCH, served, 0.01), _hold(queue, INTERACTIVE, served))
+
+        batch = metrics_registry.histogram(QUEUE_WAIT, queue="test_priority.metrics", lane=BATCH).snapshot()
+        interactive = metrics_registry.histogram(QUEUE_WAIT, queue="test_priority.metrics", lane=INTERACTIVE).snapshot()
+        assert batch["count"] == 1 and batch["max"] == 0.0
+        assert interactive["count"] == 1 and interactive["max"] >= 5.0
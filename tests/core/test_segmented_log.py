@@ -0,0 +1,181 @@
+# file: tests/core/test_segmented_log.py
+"""Tests for time-segmented, indexed JSONL logs."""
+
+import os
+
+os.environ.setdefault("TBCV_ENV", "test")
+
+import json
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from core.segmented_log import SegmentedLog
+
+BASE = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _ts(minutes: int) -> str:
+    return (BASE + timedelta(minutes=minutes)).isoformat()
+
+
+@pytest.fixture
+def log(tmp_path):
+    """Ten entries, two per hourly segment, alternating op0/op1."""
+    log = SegmentedLog(str(tmp_path / "log"), index_fields=("operation", "status"), flush_entries=3)
+    for i in range(10):
+        log.append({"timestamp": _ts(30 * i), "operation": f"op{i % 2}", "status": "ok", "i": i})
+    log.flush()
+    return log
+
+
+def _ids(entries):
+    return [e["i"] for e in entries]
+
+
+@pytest.mark.unit
+class TestSegmentedLog:
+
+    def test_entries_are_split_into_time_segments(self, log, tmp_path):
+        segments = sorted(p.name for p in (tmp_path / "log").glob("*.jsonl"))
+        assert segments == [f"20260101T0{h}0000.jsonl" for h in range(5)]
+        assert _ids(log.query()) == list(range(10))
+
+    def test_filters_and_pagination(self, log):
+        assert _ids(log.query(operation="op1")) == [1, 3, 5, 7, 9]
+        assert _ids(log.query(operation="op1", offset=2, limit=2)) == [5, 7]
+        assert _ids(log.query(offset=7)) == [7, 8, 9]
+        assert _ids(log.query(operation="missing")) == []
+
+    def test_time_range_only_matching_entries(self, log):
+        start, end = _ts(60), _ts(181)
+
+        assert _ids(log.query(start=start, end=end)) == [2, 3, 4, 5, 6]
+        assert _ids(log.query(start=start, end=end, operation="op0", offset=1)) == [4, 6]
+        assert log.count(start=start, end=end) == 5
+
+    def test_count_from_index(self, log):
+        assert log.count() == 10
+        assert log.count(operation="op0", status="ok") == 5
+        assert log.count(i=3) == 1  # unindexed field falls back to scanning
+
+    def test_buffered_entries_are_visible_to_queries(self, tmp_path):
+        log = SegmentedLog(str(tmp_path / "log"), flush_entries=100, flush_interval=60)
+        log.append({"timestamp": _ts(0), "operation": "op", "i": 0})
+
+        assert not list((tmp_path / "log").glob("*.jsonl"))
+        assert _ids(log.query()) == [0]
+
+    def test_buffered_entries_are_flushed_after_interval(self, tmp_path):
+        log = SegmentedLog(str(tmp_path / "log"), flush_entries=100, flush_interval=0.05)
+        log.append({"timestamp": _ts(0), "operation": "op", "i": 0})
+
+        deadline = time.monotonic() + 5
+        while not list((tmp_path / "log").glob("*.jsonl")) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert not log._buffer
+        assert list((tmp_path / "log").glob("*.jsonl"))
+        log.close()
+
+    def test_non_string_filters_match_with_and_without_index(self, tmp_path):
+        log = SegmentedLog(str(tmp_path / "log"), index_fields=("code",))
+        for i in range(4):
+            log.append({"timestamp": _ts(i), "code": 200 if i % 2 else 500, "i": i})
+
+        assert log.count(code=200) == 2  # segment fully covered: answered from the index
+        assert log.count(code=200, start=_ts(1)) == 2  # partially covered: entries are scanned
+        assert _ids(log.query(code=200, start=_ts(1))) == [1, 3]
+        assert _ids(log.query(code="200", end=_ts(2))) == [1]
+        log.close()
+
+    def test_sees_appends_from_another_writer(self, log, tmp_path):
+        other = SegmentedLog(str(tmp_path / "log"), index_fields=("operation", "status"))
+        other.append({"timestamp": _ts(280), "operation": "op1", "status": "ok", "i": 99})
+        other.flush()
+        log.append({"timestamp": _ts(290), "operation": "op1", "status": "ok", "i": 100})
+
+        assert _ids(log.query(operation="op1")) == [1, 3, 5, 7, 9, 99, 100]
+
+    def test_stale_index_is_rebuilt(self, log, tmp_path):
+        log.close()
+        (tmp_path / "log" / "20260101T040000.idx.json").unlink()
+
+        reopened = SegmentedLog(str(tmp_path / "log"), index_fields=("operation", "status"))
+
+        assert _ids(reopened.query(operation="op1", start=_ts(240))) == [9]
+
+    def test_active_index_is_written_on_rollover_and_close(self, tmp_path):
+        log = SegmentedLog(str(tmp_path / "log"), flush_entries=1)
+        log.append({"timestamp": _ts(0), "operation": "op", "i": 0})
+        log.append({"timestamp": _ts(1), "operation": "op", "i": 1})
+        sidecar = tmp_path / "log" / "20260101T000000.idx.json"
+        assert not sidecar.exists()  # flushes only append to the segment
+
+        log.append({"timestamp": _ts(60), "operation": "op", "i": 2})
+        assert json.loads(sidecar.read_text())["count"] == 2
+        log.close()
+        assert json.loads((tmp_path / "log" / "20260101T010000.idx.json").read_text())["count"] == 1
+
+    def test_lagging_index_is_caught_up(self, log, tmp_path):
+        log.close()
+        log.append({"timestamp": _ts(250), "operation": "op1", "status": "ok", "i": 98})
+        log.append({"timestamp": _ts(260), "operation": "op0", "status": "ok", "i": 99})
+        log.flush()  # a crash now leaves the sidecar two entries behind
+
+        reopened = SegmentedLog(str(tmp_path / "log"), index_fields=("operation", "status"))
+
+        assert reopened.count(start=_ts(240)) == 4
+        assert _ids(reopened.query(operation="op1", start=_ts(240))) == [9, 98]
+
+    def test_size_rollover_and_retention(self, tmp_path):
+        log = SegmentedLog(str(tmp_path / "log"), max_segment_bytes=1, max_segments=3, flush_entries=1)
+        for i in range(5):
+            log.append({"timestamp": _ts(i), "operation": "op", "i": i})
+
+        segments = sorted(p.name for p in (tmp_path / "log").glob("*.jsonl"))
+        assert segments == ["20260101T000000-2.jsonl", "20260101T000000-3.jsonl", "20260101T000000-4.jsonl"]
+        assert _ids(log.query()) == [2, 3, 4]
+
+    def test_imports_legacy_file(self, tmp_path):
+        legacy = tmp_path / "old.jsonl"
+        legacy.write_text("".join(
+            json.dumps({"timestamp": _ts(90 * i), "operation": "op", "i": i}) + "\n" for i in range(3)
+        ) + "not json\n")
+
+        log = SegmentedLog(str(tmp_path / "old"), legacy_file=str(legacy))
+
+        assert _ids(log.query()) == [0, 1, 2]
+        assert not legacy.exists()
+        assert (tmp_path / "old.jsonl.imported").exists()
+
+
+@pytest.mark.unit
+class TestLogConsumers:
+
+    def test_audit_logger_paginates_and_counts(self, tmp_path):
+        from core.audit_logger import AuditLogger
+
+        audit = AuditLogger(str(tmp_path / "audit.jsonl"))
+        for i in range(5):
+            audit.log_operation("validate_file", status="failure" if i % 2 else "success", details={"i": i})
+
+        assert audit.count_logs() == 5
+        assert audit.count_logs(status="failure") == 2
+        page = audit.get_logs(limit=2, offset=1, status="success")
+        assert [e["details"]["i"] for e in page] == [2, 4]
+
+    def test_performance_tracker_report(self, tmp_path):
+        from core.performance_tracker import PerformanceTracker
+
+        tracker = PerformanceTracker(str(tmp_path / "metrics.jsonl"))
+        for duration in (10, 20, 30):
+            tracker.record_operation("validate", duration)
+        tracker.record_operation("enhance", 5, success=False)
+
+        report = tracker.get_report(time_range="1h")
+
+        assert report["total_operations"] == 4
+        assert report["failed_operations"] == 1
+        assert report["operations"]["validate"]["avg_duration_ms"] == 20
+        assert tracker.get_metrics("enhance")["total_operations"] == 1
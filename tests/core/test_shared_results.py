@@ -0,0 +1,171 @@
+# file: tests/core/test_shared_results.py
+"""Tests for the shared-results channel between upstream and downstream validators."""
+
+import os
+
+os.environ.setdefault("TBCV_ENV", "test")
+os.environ.setdefault("OLLAMA_ENABLED", "false")
+
+import pytest
+
+from core.shared_results import (
+    CONTEXT_KEY,
+    DETECTION_STAGE,
+    TRUTH_STAGE,
+    PluginDetections,
+    SharedResults,
+    TruthContext,
+    shared_results_from_context,
+)
+
+
+CONTENT = """---
+title: Convert documents
+---
+# Converting documents
+
+Use the Document class to load a DOCX file and save it as PDF. The Document
+Converter handles the conversion, and the Watermark feature can be applied
+before saving.
+"""
+
+DETECTION_RESULT = {
+    "detections": [{"plugin_id": "document_converter", "plugin_name": "Document Converter",
+                    "confidence": 0.9, "detection_type": "exact", "matched_text": "Document Converter",
+                    "context": "", "position": 10, "family": "words"}],
+    "detection_count": 1,
+    "confidence": 0.9,
+    "plugin_confidences": {"document_converter": 0.9},
+}
+
+
+@pytest.mark.unit
+class TestSharedResults:
+    """Typed channel semantics."""
+
+    def test_detections_by_family_and_threshold(self):
+        shared = SharedResults("h")
+        shared.publish_detections(PluginDetections("words", 0.6, DETECTION_RESULT))
+        assert shared.detections("words").detections == DETECTION_RESULT["detections"]
+        assert shared.detections("words", 0.6) is not None
+        assert shared.detections("words", 0.8) is None
+        assert shared.detections("pdf") is None
+        assert shared.runs(DETECTION_STAGE) == 1
+
+    def test_truth_context(self):
+        shared = SharedResults("h")
+        shared.publish_truth(TruthContext.from_result("words", {"version_hash": "v1", "plugin_aliases": None}))
+        truth = shared.truth("words")
+        assert truth.version_hash == "v1" and truth.plugin_aliases == []
+        assert shared.truth("pdf") is None
+        assert shared.profile()["runs"] == {TRUTH_STAGE: 1}
+        assert shared.profile()["reuses"] == {TRUTH_STAGE: 1}
+
+    def test_records_completed_results_in_order(self):
+        shared = SharedResults("h")
+        shared.record("FuzzyLogic", {"confidence": 0.9})
+        shared.record("Truth", {"confidence": 0.7})
+        assert shared.completed == ["FuzzyLogic", "Truth"]
+        assert shared.result("Truth") == {"confidence": 0.7}
+        assert shared.result("llm") is None
+
+    def test_context_attach_and_reuse(self):
+        context = {}
+        shared = shared_results_from_context(CONTENT, context)
+        assert context[CONTEXT_KEY] is shared
+        assert shared_results_from_context(CONTENT, {**context}) is shared
+
+    def test_context_results_for_other_content_are_replaced(self):
+        context = {}
+        other = shared_results_from_context("# other", context)
+        shared = shared_results_from_context(CONTENT, context)
+        assert shared is not other
+        assert context[CONTEXT_KEY] is shared
+
+
+@pytest.mark.unit
+class TestDetectionRunsOncePerDocument:
+    """FuzzyLogic -> Truth -> llm share one detection pass."""
+
+    @pytest.fixture
+    def agents(self, monkeypatch):
+        from agents.fuzzy_detector import FuzzyDetectorAgent
+        from agents.validators import truth_validator
+        from agents.validators.truth_validator import TruthValidatorAgent
+
+        calls = {"detect": 0, "load_truth": 0, "llm": []}
+
+        class TruthManager:
+            async def handle_load_truth_data(self, params):
+                calls["load_truth"] += 1
+                return {"success": True, "family": params["family"], "version_hash": "v1"}
+
+        class LLMValidator:
+            async def handle_validate_plugins(self, params):
+                calls["llm"].append(params)
+                return {"issues": [], "confidence": 0.9}
+
+        downstream = {"truth_manager": TruthManager(), "llm_validator": LLMValidator()}
+
+        class DownstreamRegistry:
+            def get_agent(self, agent_id):
+                return downstream.get(agent_id)
+
+        monkeypatch.setattr(truth_validator, "agent_registry", DownstreamRegistry())
+
+        fuzzy = FuzzyDetectorAgent("fuzzy_detector_shared_test")
+        detect = fuzzy.handle_detect_plugins
+
+        async def counted_detect(params):
+            calls["detect"] += 1
+            return await detect(params)
+
+        monkeypatch.setattr(fuzzy, "handle_detect_plugins", counted_detect)
+        monkeypatch.setattr(
+            TruthValidatorAgent, "_extract_fuzzy_detections",
+            lambda self, content: pytest.fail("Truth re-ran plugin detection"),
+        )
+        registered = {"fuzzy_detector": fuzzy, "truth_validator": TruthValidatorAgent("truth_validator_shared_test")}
+
+        class Registry:
+            def get_agent(self, agent_id):
+                return registered.get(agent_id)
+
+        return Registry(), calls
+
+    @pytest.mark.asyncio
+    async def test_router_profile(self, agents):
+        from agents.validators.router import ValidatorRouter
+
+        registry, calls = agents
+        result = await ValidatorRouter(registry).execute(
+            ["FuzzyLogic", "Truth"], CONTENT, {"file_path": "doc.md", "family": "words"}
+        )
+
+        assert calls["detect"] == 1
+        assert calls["load_truth"] == 1
+        assert len(calls["llm"]) == 1
+        profile = result["profile"]
+        assert profile["runs"][DETECTION_STAGE] == 1
+        assert profile["reuses"][DETECTION_STAGE] == 1
+        assert profile["completed"] == ["FuzzyLogic", "Truth"]
+
+    @pytest.mark.asyncio
+    async def test_upstream_detections_reach_llm(self, agents):
+        from agents.validators.router import ValidatorRouter
+
+        registry, calls = agents
+        context = {"file_path": "doc.md", "family": "words"}
+        shared = shared_results_from_context(CONTENT, context)
+        shared.publish_detections(PluginDetections("words", 0.6, DETECTION_RESULT))
+        shared.publish_truth(TruthContext("words", truth_data={"plugins": [], "core_rules": ["r"]}))
+
+        result = await ValidatorRouter(registry).execute(["FuzzyLogic", "Truth"], CONTENT, context)
+
+        # Published upstream (e.g. by the orchestrator): nothing is recomputed
+        assert calls["detect"] == 0
+        assert calls["load_truth"] == 0
+        assert calls["llm"][0]["fuzzy_detections"] == DETECTION_RESULT["detections"]
+        assert calls["llm"][0]["truth_data"] == {"plugins": [], "core_rules": ["r"]}
+        assert result["validation_results"]["FuzzyLogic_validation"]["metrics"]["detection_count"] == 1
+        assert result["profile"]["runs"][DETECTION_STAGE] == 1
@@ -0,0 +1,216 @@
+# file: tests/core/test_single_flight.py
+"""Tests for single-flight coalescing of identical concurrent calls."""
+
+import os
+
+os.environ.setdefault("TBCV_ENV", "test")
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from core.single_flight import SingleFlight, group, single_flight_stats
+
+
+@pytest.mark.unit
+class TestSingleFlight:
+    """Coalescing, errors and cancellation."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_execution(self):
+        flight = SingleFlight("t")
+        runs = []
+
+        async def compute():
+            runs.append(1)
+            await asyncio.sleep(0.02)
+            return {"value": 42}
+
+        results = await asyncio.gather(*(flight.do("k", compute) for _ in range(5)))
+        assert len(runs) == 1
+        assert all(r is results[0] for r in results)
+        stats = flight.stats()
+        assert stats["executions"] == 1 and stats["coalesced"] == 4
+        assert stats["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_different_keys_and_finished_calls_run_again(self):
+        flight = SingleFlight("t")
+        runs = []
+
+        async def compute(key):
+            runs.append(key)
+            await asyncio.sleep(0)
+            return key
+
+        assert await asyncio.gather(flight.do("a", lambda: compute("a")), flight.do("b", lambda: compute("b"))) == ["a", "b"]
+        assert await flight.do("a", lambda: compute("a")) == "a"
+        assert runs == ["a", "b", "a"]
+
+    @pytest.mark.asyncio
+    async def test_error_reaches_every_caller(self):
+        flight = SingleFlight("t")
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(*(flight.do("k", fail) for _ in range(3)), return_exceptions=True)
+        assert all(isinstance(r, ValueError) for r in results)
+        assert flight.stats()["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_followers(self):
+        flight = SingleFlight("t")
+        release = asyncio.Event()
+
+        async def compute():
+            await release.wait()
+            return "done"
+
+        leader = asyncio.create_task(flight.do("k", compute))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("k", compute))
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        assert await follower == "done"
+        assert leader.cancelled()
+        assert flight.stats()["cancelled"] == 0
+
+    @pytest.mark.asyncio
+    async def test_computation_cancelled_when_every_caller_is(self):
+        flight = SingleFlight("t")
+        started, cancelled = asyncio.Event(), asyncio.Event()
+
+        async def compute():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        callers = [asyncio.create_task(flight.do("k", compute)) for _ in range(2)]
+        await started.wait()
+        for caller in callers:
+            caller.cancel()
+        await asyncio.wait_for(cancelled.wait(), 1)
+        assert flight.stats()["cancelled"] == 1
+        assert flight.in_flight() == 0
+
+    def test_sync_callers_share_one_execution(self):
+        flight = SingleFlight("t")
+        runs = []
+        gate = threading.Event()
+
+        def compute():
+            runs.append(1)
+            gate.wait(1)
+            return "v"
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(flight.do_sync("k", compute))) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        while flight.stats()["calls"] < 4:
+            time.sleep(0.001)
+        gate.set()
+        for thread in threads:
+            thread.join()
+        assert results == ["v"] * 4
+        assert len(runs) == 1
+        assert flight.stats()["coalesced"] == 3
+
+    def test_named_groups_are_shared(self):
+        assert group("test_group") is group("test_group")
+        assert "test_group" in single_flight_stats()
+
+
+@pytest.mark.unit
+class TestCoalescedCallSites:
+    """Pipeline runs and LLM calls go through their groups."""
+
+    @pytest.mark.asyncio
+    async def test_identical_pipeline_runs_coalesce(self):
+        from agents.orchestrator import OrchestratorAgent, pipeline_flights
+
+        agent = OrchestratorAgent("orchestrator_single_flight_test")
+        runs = []
+
+        async def pipeline(content, file_path, family, validation_types=None):
+            runs.append(file_path)
+            await asyncio.sleep(0.01)
+            return {"file_path": file_path, "family": family}
+
+        before = pipeline_flights.stats()["coalesced"]
+        with patch.object(agent, "_execute_validation_pipeline", side_effect=pipeline):
+            same = [agent._run_validation_pipeline("# Doc", "a.md", "words", ["yaml"]) for _ in range(3)]
+            results = await asyncio.gather(*same, agent._run_validation_pipeline("# Doc", "b.md", "words", ["yaml"]))
+
+        assert sorted(runs) == ["a.md", "b.md"]
+        assert pipeline_flights.stats()["coalesced"] - before == 2
+        # Every caller gets its own copy
+        assert results[0] == results[1] and results[0] is not results[1]
+
+    @pytest.mark.asyncio
+    async def test_identical_llm_prompts_coalesce(self):
+        from core.ollama import Ollama
+
+        client = Ollama(base_url="http://127.0.0.1:1", enabled=True)
+        requests = []
+
+        async def request(endpoint, data, method="POST"):
+            requests.append(data)
+            await asyncio.sleep(0.01)
+            return {"response": "ok"}
+
+        with patch.object(client, "_make_async_request", side_effect=request):
+            results = await asyncio.gather(
+                client.async_generate(prompt="same", options={"temperature": 0.1}),
+                client.async_generate(prompt="same", options={"temperature": 0.1}),
+                client.async_generate(prompt="same", options={"temperature": 0.7}),
+                client.async_chat(messages=[{"role": "user", "content": "same"}]),
+            )
+
+        assert len(requests) == 3
+        assert all(r is not None for r in results)
+
+    @pytest.mark.asyncio
+    async def test_runs_in_different_lanes_do_not_coalesce(self):
+        from agents.orchestrator import OrchestratorAgent
+        from core.ollama import Ollama
+        from core.priority import INTERACTIVE, priority_lane
+
+        agent = OrchestratorAgent("orchestrator_single_flight_lane_test")
+        client = Ollama(base_url="http://127.0.0.1:1", enabled=True)
+        runs = []
+
+        async def pipeline(content, file_path, family, validation_types=None):
+            runs.append(file_path)
+            await asyncio.sleep(0.01)
+            return {"file_path": file_path}
+
+        async def request(endpoint, data, method="POST"):
+            runs.append(data["prompt"])
+            await asyncio.sleep(0.01)
+            return {"response": "ok"}
+
+        async def interactive(call):
+            with priority_lane(INTERACTIVE):
+                return await call
+
+        with patch.object(agent, "_execute_validation_pipeline", side_effect=pipeline), \
+                patch.object(client, "_make_async_request", side_effect=request):
+            await asyncio.gather(
+                agent._run_validation_pipeline("# Doc", "a.md", "words", ["yaml"]),
+                interactive(agent._run_validation_pipeline("# Doc", "a.md", "words", ["yaml"])),
+                client.async_generate(prompt="same"),
+                interactive(client.async_generate(prompt="same")),
+            )
+
+        assert sorted(runs) == ["a.md", "a.md", "same", "same"]
@@ -0,0 +1,174 @@
+"""Tests for the durable workflow task queue and its workers."""
+
+import asyncio
+import os
+import time
+
+import pytest
+
+os.environ.setdefault("TBCV_ENV", "test")
+os.environ.setdefault("OLLAMA_ENABLED", "false")
+
+from core.config import get_settings
+from core.database import DatabaseManager, TaskState, WorkflowState, WorkflowTask
+from core.task_queue import TaskWorker
+from core.workflow_manager import ITEM_OK, ITEM_SKIPPED, WorkflowManager
+
+
+@pytest.fixture
+def db_manager(tmp_path, monkeypatch):
+    """DatabaseManager on its own SQLite file, so no test leases another's tasks."""
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'tbcv.db'}")
+    manager = DatabaseManager()
+    manager.init_database()
+    return manager
+
+
+@pytest.fixture
+def running_workflow(db_manager):
+    workflow = db_manager.create_workflow(workflow_type="validate_directory", input_params={})
+    db_manager.update_workflow(workflow.id, state=WorkflowState.RUNNING)
+    return workflow.id
+
+
+def _task_state(db_manager, task_id):
+    with db_manager.get_session() as session:
+        return session.query(WorkflowTask).filter(WorkflowTask.id == task_id).first().state
+
+
+class TestQueueOperations:
+
+    def test_leases_are_exclusive(self, db_manager, running_workflow):
+        db_manager.enqueue_tasks(running_workflow, "noop", [{"n": i} for i in range(3)])
+
+        first = db_manager.lease_tasks("w1", limit=2, kinds=["noop"])
+        second = db_manager.lease_tasks("w2", limit=5, kinds=["noop"])
+
+        assert len(first) == 2
+        assert len(second) == 1
+        assert not {t.id for t in first} & {t.id for t in second}
+        assert all(t.attempts == 1 and t.lease_owner == "w1" for t in first)
+        assert db_manager.lease_tasks("w3", limit=5, kinds=["noop"]) == []
+
+    def test_paused_workflow_is_not_leased(self, db_manager, running_workflow):
+        db_manager.enqueue_tasks(running_workflow, "noop", [{}])
+        db_manager.update_workflow(running_workflow, state=WorkflowState.PAUSED)
+
+        assert db_manager.lease_tasks("w1", kinds=["noop"]) == []
+
+    def test_complete_counts_by_outcome(self, db_manager, running_workflow):
+        db_manager.enqueue_tasks(running_workflow, "noop", [{}, {}])
+        tasks = db_manager.lease_tasks("w1", limit=2, kinds=["noop"])
+
+        # Only the lease owner can complete
+        assert db_manager.complete_tasks("w2", [{"id": tasks[0].id, "outcome": ITEM_OK}]) == 0
+        done = db_manager.complete_tasks("w1", [
+            {"id": tasks[0].id, "outcome": ITEM_OK},
+            {"id": tasks[1].id, "outcome": ITEM_SKIPPED},
+        ])
+
+        assert done == 2
+        counts = db_manager.count_tasks(running_workflow)
+        assert counts["ok"] == 1
+        assert counts["skipped"] == 1
+        assert counts["pending"] == counts["leased"] == 0
+
+    def test_failure_backs_off_then_dead_letters(self, db_manager, running_workflow):
+        db_manager.enqueue_tasks(running_workflow, "noop", [{}], max_attempts=2)
+        task = db_manager.lease_tasks("w1", kinds=["noop"])[0]
+
+        assert db_manager.fail_task("w1", task.id, "boom", backoff_base=60) == TaskState.PENDING
+        # Still backing off
+        assert db_manager.lease_tasks("w1", kinds=["noop"]) == []
+
+        # The failed attempt released the lease
+        assert db_manager.fail_task("w1", task.id, "boom") is None
+        with db_manager.get_session() as session:
+            session.query(WorkflowTask).filter(WorkflowTask.id == task.id).update(
+                {WorkflowTask.available_at: WorkflowTask.created_at}, synchronize_session=False
+            )
+            session.commit()
+
+        task = db_manager.lease_tasks("w1", kinds=["noop"])[0]
+        assert task.attempts == 2
+        assert db_manager.fail_task("w1", task.id, "boom again") == TaskState.DEAD
+        assert [t.id for t in db_manager.list_dead_tasks(running_workflow)] == [task.id]
+
+        assert db_manager.requeue_dead_tasks(running_workflow) == 1
+        assert _task_state(db_manager, task.id) == TaskState.PENDING
+
+    def test_expired_lease_is_reclaimed(self, db_manager, running_workflow):
+        db_manager.enqueue_tasks(running_workflow, "noop", [{}])
+        task = db_manager.lease_tasks("dead-worker", kinds=["noop"], lease_seconds=-1)[0]
+
+        reclaimed = db_manager.lease_tasks("w2", kinds=["noop"])
+
+        assert [t.id for t in reclaimed] == [task.id]
+        assert reclaimed[0].attempts == 2
+        assert db_manager.heartbeat_tasks("dead-worker", [task.id]) == 0
+        assert db_manager.heartbeat_tasks("w2", [task.id]) == 1
+
+    def test_cancel_tasks(self, db_manager, running_workflow):
+        db_manager.enqueue_tasks(running_workflow, "noop", [{}, {}])
+
+        assert db_manager.cancel_tasks(running_workflow) == 2
+        assert db_manager.count_tasks(running_workflow)["cancelled"] == 2
+
+
+class TestTaskWorker:
+
+    def test_runs_tasks_and_dead_letters_failures(self, db_manager, running_workflow, monkeypatch):
+        monkeypatch.setattr(get_settings().orchestrator, "task_retry_backoff_base", 0)
+        db_manager.enqueue_tasks(running_workflow, "noop", [{"fail": False}] * 3)
+        db_manager.enqueue_tasks(running_workflow, "noop", [{"fail": True}], max_attempts=2)
+        seen = []
+
+        async def handler(task, writer):
+            seen.append(task.id)
+            if task.payload.get("fail"):
+                raise RuntimeError("handler failed")
+            return ITEM_OK
+
+        worker = TaskWorker(db_manager, worker_id="w1", concurrency=2, handlers={"noop": handler}, poll_interval=0.01)
+        stats = asyncio.run(worker.run(exit_when_idle=True))
+
+        assert stats["completed"] == 3
+        assert stats["retried"] == 1
+        assert stats["dead"] == 1
+        assert len(seen) == 5
+        counts = db_manager.count_tasks(running_workflow)
+        assert counts["ok"] == 3
+        assert counts["dead"] == 1
+
+
+def test_queue_executor_aggregates_worker_results(db_manager, tmp_path, monkeypatch):
+    import core.workflow_manager as workflow_manager_module
+
+    monkeypatch.setattr(workflow_manager_module, "_QUEUE_POLL_S", 0.05)
+    for i in range(4):
+        (tmp_path / f"doc{i}.md").write_text(f"# Doc {i}\n")
+    workflow_id = db_manager.create_workflow(
+        workflow_type="validate_directory",
+        input_params={"directory_path": str(tmp_path), "recursive": False, "executor": "queue"}
+    ).id
+    manager = WorkflowManager(db_manager)
+    thread = manager.start_workflow(workflow_id)
+
+    deadline = time.monotonic() + 10
+    while not any(db_manager.count_tasks(workflow_id).values()) and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    async def validate(task, writer):
+        assert task.payload["file_path"].endswith(".md")
+        return ITEM_OK
+
+    worker = TaskWorker(db_manager, handlers={"validate_file": validate}, poll_interval=0.01)
+    asyncio.run(worker.run(exit_when_idle=True))
+    thread.join(10)
+
+    workflow = db_manager.get_workflow(workflow_id)
+    assert workflow.state == WorkflowState.COMPLETED
+    assert workflow.current_step == 4
+    execution = workflow.workflow_metadata["execution"]
+    assert execution["executor"] == "queue"
+    assert execution["items_ok"] == 4
@@ -0,0 +1,127 @@
+# file: tests/core/test_validation_manifest.py
+"""Tests for the incremental validation manifest."""
+
+import os
+
+import pytest
+
+from core.validation_manifest import (
+    ManifestEntry,
+    ValidationManifest,
+    directory_fingerprint,
+    file_content_hash,
+    run_fingerprint,
+)
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    m = ValidationManifest(str(tmp_path / "manifest.db"))
+    yield m
+    m.close()
+
+
+def _write(path, text):
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def _record(manifest, path, fingerprint="fp", status="validated", result=None):
+    st = os.stat(path)
+    manifest.record_many([ManifestEntry(
+        path=path, mtime_ns=st.st_mtime_ns, size=st.st_size, content_hash=file_content_hash(path),
+        fingerprint=fingerprint, status=status, result=result if result is not None else {"file_path": path},
+    )])
+
+
+@pytest.mark.unit
+class TestValidationManifest:
+
+    def test_unknown_files_are_changed(self, manifest, tmp_path):
+        path = _write(tmp_path / "a.md", "hello")
+        unchanged, changed = manifest.partition([path], "fp")
+        assert unchanged == []
+        assert [c.path for c in changed] == [path]
+
+    def test_unchanged_file_is_reused(self, manifest, tmp_path):
+        path = _write(tmp_path / "a.md", "hello")
+        _record(manifest, path, result={"overall_confidence": 0.5})
+
+        unchanged, changed = manifest.partition([path], "fp")
+        assert changed == []
+        assert unchanged[0].result == {"overall_confidence": 0.5}
+
+    def test_modified_file_is_changed(self, manifest, tmp_path):
+        path = _write(tmp_path / "a.md", "hello")
+        _record(manifest, path)
+        _write(tmp_path / "a.md", "hello world")
+
+        unchanged, changed = manifest.partition([path], "fp")
+        assert unchanged == []
+        assert changed[0].path == path
+
+    def test_touched_file_with_same_content_is_reused(self, manifest, tmp_path):
+        path = _write(tmp_path / "a.md", "hello")
+        _record(manifest, path)
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+
+        unchanged, changed = manifest.partition([path], "fp")
+        assert changed == []
+        # Stat is refreshed so the next run does not hash again
+        assert manifest.get_many([path])[path].mtime_ns == st.st_mtime_ns + 5_000_000_000
+
+    def test_same_size_edit_is_detected_by_hash(self, manifest, tmp_path):
+        path = _write(tmp_path / "a.md", "hello")
+        _record(manifest, path)
+        st = os.stat(path)
+        _write(tmp_path / "a.md", "jello")
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        _, changed = manifest.partition([path], "fp")
+        assert changed[0].content_hash == file_content_hash(path)
+
+    def test_fingerprint_change_invalidates_everything(self, manifest, tmp_path):
+        path = _write(tmp_path / "a.md", "hello")
+        _record(manifest, path, fingerprint="fp-old")
+
+        unchanged, changed = manifest.partition([path], "fp-new")
+        assert unchanged == []
+        assert len(changed) == 1
+
+    def test_missing_files_are_ignored(self, manifest, tmp_path):
+        unchanged, changed = manifest.partition([str(tmp_path / "gone.md")], "fp")
+        assert unchanged == [] and changed == []
+
+    def test_rejected_status_round_trips(self, manifest, tmp_path):
+        path = _write(tmp_path / "a.md", "hello")
+        st = os.stat(path)
+        manifest.record_many([ManifestEntry(
+            path=path, mtime_ns=st.st_mtime_ns, size=st.st_size, content_hash="x",
+            fingerprint="fp", status="rejected", reason="not English",
+        )])
+        entry = manifest.get_many([path])[path]
+        assert entry.status == "rejected"
+        assert entry.result is None
+        assert entry.reason == "not English"
+
+
+@pytest.mark.unit
+class TestFingerprints:
+
+    def test_directory_fingerprint_tracks_edits(self, tmp_path):
+        rules = tmp_path / "rules"
+        rules.mkdir()
+        (rules / "a.yaml").write_text("x: 1")
+        before = directory_fingerprint([str(rules)])
+        assert directory_fingerprint([str(rules)]) == before
+
+        (rules / "b.yaml").write_text("y: 2")
+        assert directory_fingerprint([str(rules)]) != before
+
+    def test_missing_directory_is_ignored(self, tmp_path):
+        assert directory_fingerprint([str(tmp_path / "none")]) == directory_fingerprint([])
+
+    def test_run_fingerprint_is_order_independent(self):
+        assert run_fingerprint(a=1, b=[1, 2]) == run_fingerprint(b=[1, 2], a=1)
+        assert run_fingerprint(a=1) != run_fingerprint(a=2)
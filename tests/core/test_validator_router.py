@@ -644,3 +644,119 @@ class TestRoutingInfo:
         )
 
         assert result.routing_info.get("llm") == "skipped"
+
+
+class _Registry:
+    """Minimal registry holding real validator agents."""
+
+    def __init__(self, agents):
+        self.agents = {agent.agent_id: agent for agent in agents}
+
+    def get_agent(self, agent_id):
+        return self.agents.get(agent_id)
+
+
+def _real_validators():
+    from agents.validators.yaml_validator import YamlValidatorAgent
+    from agents.validators.markdown_validator import MarkdownValidatorAgent
+    from agents.validators.structure_validator import StructureValidatorAgent
+    from agents.validators.code_validator import CodeValidatorAgent
+
+    return _Registry([
+        YamlValidatorAgent("yaml_validator"),
+        MarkdownValidatorAgent("markdown_validator"),
+        StructureValidatorAgent("structure_validator"),
+        CodeValidatorAgent("code_validator"),
+    ])
+
+
+def _without_ids(results):
+    return {
+        key: {**value, "issues": [{k: v for k, v in issue.items() if k != "id"} for issue in value.get("issues", [])]}
+        for key, value in results.items()
+    }
+
+
+@pytest.fixture(scope="module")
+def pool():
+    """Warm two-worker validator pool shared by the process-mode tests."""
+    from core.validator_router import ValidatorProcessPool
+
+    pool = ValidatorProcessPool(max_workers=2)
+    yield pool
+    pool.shutdown()
+
+
+class TestProcessExecutor:
+    """Tests for the process-pool executor mode."""
+
+    SAMPLE = (
+        "---\ntitle: Sample\n---\n\n# Heading\n\n### Skipped level\n\n"
+        "Some text with a [link](http://example.com).\n\n```python\nprint('x')\n```\n\n```\nno language\n```\n"
+    )
+
+    @pytest.mark.asyncio
+    async def test_process_mode_matches_inline(self, pool):
+        registry = _real_validators()
+        selection = ["yaml", "markdown", "structure", "code"]
+        inline = await ValidatorRouter(registry, executor_mode="inline").execute(
+            content=self.SAMPLE, context={"file_path": "sample.md"}, user_selection=selection
+        )
+        pooled = await ValidatorRouter(registry, executor_mode="process", process_pool=pool).execute(
+            content=self.SAMPLE, context={"file_path": "sample.md"}, user_selection=selection
+        )
+
+        assert set(pooled.validation_results) == set(inline.validation_results)
+        assert _without_ids(pooled.validation_results) == _without_ids(inline.validation_results)
+
+    @pytest.mark.asyncio
+    async def test_non_validator_agents_stay_inline(self, mock_registry, mock_config_loader):
+        pool = Mock()
+        router = ValidatorRouter(mock_registry, mock_config_loader, executor_mode="process", process_pool=pool)
+        result = await router.execute(content="x", user_selection=["yaml", "markdown"])
+
+        assert not pool.run.called
+        assert result.validation_results["yaml_validation"]["metrics"]["validator"] == "yaml"
+
+    @pytest.mark.asyncio
+    async def test_pool_failure_falls_back_to_inline(self):
+        from core.validator_router import ValidatorProcessPool
+
+        pool = Mock(spec=ValidatorProcessPool)
+        pool.run = AsyncMock(side_effect=RuntimeError("pool down"))
+        router = ValidatorRouter(_real_validators(), executor_mode="process", process_pool=pool)
+        result = await router.execute(content=self.SAMPLE, user_selection=["yaml", "markdown"])
+
+        assert pool.run.called
+        assert "error" not in result.validation_results["yaml_validation"]
+        assert result.validation_results["markdown_validation"]["agent_id"] == "markdown_validator"
+
+    @pytest.mark.asyncio
+    async def test_agent_router_uses_the_pool(self, pool):
+        """The router behind the orchestrator and /api/validate honours process mode."""
+        from agents.validators.router import ValidatorRouter as AgentValidatorRouter
+
+        registry = _real_validators()
+        selection = ["yaml", "markdown", "structure", "code"]
+        inline = await AgentValidatorRouter(registry, executor_mode="inline").execute(
+            selection, self.SAMPLE, {"file_path": "sample.md"}
+        )
+        pooled = await AgentValidatorRouter(registry, executor_mode="process", process_pool=pool).execute(
+            selection, self.SAMPLE, {"file_path": "sample.md"}
+        )
+
+        assert set(pooled["routing_info"].values()) == {"process_pool"}
+        assert _without_ids(pooled["validation_results"]) == _without_ids(inline["validation_results"])
+
+    @pytest.mark.asyncio
+    async def test_agent_router_falls_back_to_inline(self):
+        from agents.validators.router import ValidatorRouter as AgentValidatorRouter
+        from core.validator_router import ValidatorProcessPool
+
+        pool = Mock(spec=ValidatorProcessPool)
+        pool.run = AsyncMock(side_effect=RuntimeError("pool down"))
+        router = AgentValidatorRouter(_real_validators(), executor_mode="process", process_pool=pool)
+        result = await router.execute(["yaml", "markdown"], self.SAMPLE, {})
+
+        assert pool.run.called
+        assert result["routing_info"] == {"yaml": "new_validator", "markdown": "new_validator"}
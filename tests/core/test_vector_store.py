@@ -14,6 +14,12 @@ from core.vector_store import (
 )
 
 
+def _cosine(a: List[float], b: List[float]) -> float:
+    """Reference cosine similarity for checking search scores."""
+    dot = sum(x * y for x, y in zip(a, b))
+    return dot / ((sum(x * x for x in a) ** 0.5) * (sum(y * y for y in b) ** 0.5))
+
+
 # --- SearchResult Tests ---
 
 class TestSearchResult:
@@ -124,20 +130,104 @@ class TestInMemoryVectorStore:
         assert store.count("words") == 0
         assert store.count("pdf") == 1
 
-    def test_cosine_similarity_identical(self, store):
-        """Identical vectors should have similarity 1.0."""
-        similarity = store._cosine_similarity([1.0, 0.0], [1.0, 0.0])
-        assert abs(similarity - 1.0) < 0.001
+    def test_cosine_similarity_scores(self, store):
+        """Identical vectors score 1.0 and orthogonal ones 0.0."""
+        store.add("same", "same", [1.0, 0.0], {}, "words")
+        store.add("orthogonal", "orthogonal", [0.0, 1.0], {}, "words")
+
+        scores = {r.id: r.score for r in store.search([1.0, 0.0], "words", top_k=2)}
+        assert abs(scores["same"] - 1.0) < 0.001
+        assert abs(scores["orthogonal"]) < 0.001
+
+    def test_zero_query_scores_zero(self, store):
+        """A zero-norm query should score 0.0 rather than divide by zero."""
+        store.add("doc1", "doc", [1.0, 0.0], {}, "words")
+
+        assert [r.score for r in store.search([0.0, 0.0], "words", top_k=1)] == [0.0]
+
+
+class TestInMemoryVectorStoreMatrix:
+    """Tests for the per-family embedding matrix behind InMemoryVectorStore."""
 
-    def test_cosine_similarity_orthogonal(self, store):
-        """Orthogonal vectors should have similarity 0.0."""
-        similarity = store._cosine_similarity([1.0, 0.0], [0.0, 1.0])
-        assert abs(similarity) < 0.001
+    @pytest.fixture(params=["numpy", "pure_python"])
+    def store(self, request, monkeypatch):
+        """Run every test with and without NumPy."""
+        import core.vector_store as vector_store_module
+        if request.param == "pure_python":
+            monkeypatch.setattr(vector_store_module, "np", None)
+        elif vector_store_module.np is None:
+            pytest.skip("NumPy not installed")
+        return InMemoryVectorStore()
+
+    def test_search_matches_bruteforce_ranking(self, store):
+        """Top-k should match a full cosine sort."""
+        import random
+        rng = random.Random(7)
+        vectors = {f"doc{i}": [rng.uniform(-1, 1) for _ in range(16)] for i in range(200)}
+        for doc_id, vec in vectors.items():
+            store.add(doc_id, doc_id, vec, {}, "words")
+        query = [rng.uniform(-1, 1) for _ in range(16)]
+
+        expected = sorted(vectors, key=lambda d: _cosine(query, vectors[d]), reverse=True)[:10]
+        results = store.search(query, "words", top_k=10)
+
+        assert [r.id for r in results] == expected
+        for r in results:
+            assert r.score == pytest.approx(_cosine(query, vectors[r.id]), abs=1e-5)
+
+    def test_readd_replaces_embedding(self, store):
+        """Re-adding a document should update its vector, not duplicate it."""
+        store.add("doc1", "old", [1.0, 0.0], {}, "words")
+        store.add("doc2", "other", [0.0, 1.0], {}, "words")
+        store.add("doc1", "new", [0.0, 1.0], {}, "words")
+
+        assert store.count("words") == 2
+        results = store.search([0.0, 1.0], "words", top_k=2)
+        assert {r.id for r in results} == {"doc1", "doc2"}
+        assert all(r.score == pytest.approx(1.0, abs=1e-5) for r in results)
+        assert store._documents["doc1"]["text"] == "new"
+
+    def test_readd_in_other_family_moves_document(self, store):
+        """A document belongs to one family at a time."""
+        store.add("doc1", "Text", [1.0, 0.0], {}, "words")
+        store.add("doc2", "Text", [0.5, 0.5], {}, "words")
+        store.add("doc1", "Text", [1.0, 0.0], {}, "pdf")
+
+        assert store.count("words") == 1
+        assert store.count("pdf") == 1
+        assert [r.id for r in store.search([1.0, 0.0], "words", top_k=5)] == ["doc2"]
+
+    def test_dimension_mismatch_scores_zero(self, store):
+        """Documents with a different dimension are returned with score 0.0."""
+        store.add("doc1", "Text", [1.0, 0.0], {}, "words")
+        store.add("doc2", "Text", [1.0, 0.0, 0.0], {}, "words")
+
+        results = store.search([1.0, 0.0], "words", top_k=5)
+        assert [(r.id, round(r.score, 3)) for r in results] == [("doc1", 1.0), ("doc2", 0.0)]
+
+    def test_zero_vectors(self, store):
+        """Zero vectors never divide by zero."""
+        store.add("doc1", "Text", [0.0, 0.0], {}, "words")
+        assert store.search([1.0, 0.0], "words", top_k=1)[0].score == 0.0
+        assert store.search([0.0, 0.0], "words", top_k=1)[0].score == 0.0
+
+    def test_add_batch_and_growth(self, store):
+        """Batch adds beyond the initial capacity keep every row searchable."""
+        docs = [(f"doc{i}", f"Text {i}", [float(i), 1.0], {"i": i}) for i in range(300)]
+        store.add_batch(docs, "words")
+
+        assert store.count("words") == 300
+        top = store.search([1.0, 0.0], "words", top_k=1)[0]
+        assert top.id == "doc299"
+        assert top.metadata == {"i": 299}
+
+    def test_clear_family_resets_matrix(self, store):
+        """After clearing, a family can be re-indexed with another dimension."""
+        store.add("doc1", "Text", [1.0, 0.0], {}, "words")
+        store.clear("words")
+        store.add("doc1", "Text", [1.0, 0.0, 0.0], {}, "words")
 
-    def test_cosine_similarity_empty(self, store):
-        """Empty vectors should return 0.0."""
-        similarity = store._cosine_similarity([], [])
-        assert similarity == 0.0
+        assert store.search([1.0, 0.0, 0.0], "words", top_k=1)[0].score == pytest.approx(1.0, abs=1e-5)
 
 
 # --- TruthVectorStore Tests ---
@@ -0,0 +1,83 @@
+"""
+Benchmark: @guarded_operation overhead, unguarded vs guarded calls.
+
+Calls a trivial function in a tight loop from "agent" code (compiled with an
+agents/ filename, so the guard walks past neutral frames before it finds an
+allowed caller):
+- unguarded
+- guarded, DISABLED mode
+- guarded, WARN mode (raw-frame walk + per-call-site decision cache)
+- the previous inspect.stack() check, for reference
+
+Reports nanoseconds per call and checks the new guard is far cheaper than
+the inspect.stack() walk.
+
+Run:
+    pytest tests/performance/test_access_guard_overhead.py -v -s
+"""
+
+import inspect
+import time
+from pathlib import Path
+
+import pytest
+
+from core.access_guard import EnforcementMode, guarded_operation, set_enforcement_mode
+
+
+CALLS = 20_000
+
+
+def _agent_loop(fn):
+    """A loop calling fn, compiled as if it lived in agents/."""
+    namespace = {"fn": fn}
+    source = "def run(n):\n    for _ in range(n):\n        fn()\n"
+    exec(compile(source, "/bench/agents/hot_agent.py", "exec"), namespace)
+    return namespace["run"]
+
+
+def _inspect_stack_check(frame_depth: int = 5):
+    """The previous check_caller_allowed: FrameInfo for the whole stack."""
+    for frame_info in inspect.stack()[1:frame_depth + 1]:
+        filename = Path(frame_info.filename).as_posix()
+        if "/tests/" in filename or "/svc/mcp_server.py" in filename:
+            return True, f"{filename}:{frame_info.lineno} ({frame_info.function})"
+    return True, "Internal call"
+
+
+def _ns_per_call(run, calls: int = CALLS) -> float:
+    run(100)  # warm up (fills the decision cache)
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        run(calls)
+        best = min(best, time.perf_counter() - start)
+    return best / calls * 1e9
+
+
+@pytest.mark.performance
+def test_guard_overhead():
+    def target():
+        return None
+
+    def old_guarded():
+        _inspect_stack_check()
+        return target()
+
+    guarded = guarded_operation(target)
+    try:
+        base_ns = _ns_per_call(_agent_loop(target))
+        set_enforcement_mode(EnforcementMode.DISABLED)
+        disabled_ns = _ns_per_call(_agent_loop(guarded))
+        set_enforcement_mode(EnforcementMode.WARN)
+        warn_ns = _ns_per_call(_agent_loop(guarded))
+        old_ns = _ns_per_call(_agent_loop(old_guarded), calls=500)
+    finally:
+        set_enforcement_mode(EnforcementMode.DISABLED)
+
+    print(
+        f"\nper call: unguarded={base_ns:.0f}ns disabled={disabled_ns:.0f}ns "
+        f"warn={warn_ns:.0f}ns inspect.stack()={old_ns / 1000:.1f}us"
+    )
+    assert disabled_ns < base_ns + 1_000  # one global lookup and identity check
+    assert warn_ns * 20 < old_ns
@@ -0,0 +1,106 @@
+"""
+Benchmark: L2 cache hit latency, ORM CacheEntry vs the key-value store.
+
+Stores N validation-sized results, then reads every key back through:
+- the previous L2 path (DatabaseManager.get_cache_entry on the SQLAlchemy
+  CacheEntry table, then try-gunzip / unpickle)
+- KVStore.get (one prepared statement, raw bytes, codec flag)
+
+Also compares key generation for a large document: the old
+str(sorted(items)) + sha256 against canonical_hash with the memoized
+content digest.
+
+Reports per-hit latency in microseconds and checks the store is faster.
+
+Run:
+    pytest tests/performance/test_cache_l2_latency.py -v -s
+"""
+
+import os
+
+os.environ.setdefault("TBCV_ENV", "test")
+
+import gzip
+import hashlib
+import pickle
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from core.cache import canonical_hash
+from core.cache_store import CODEC_PICKLE, KVStore
+from core.database import DatabaseManager
+
+
+ENTRIES = 500
+RESULT = {
+    "confidence": 0.82,
+    "issues": [{"level": "warning", "category": "seo", "message": f"Heading {n} too long", "line": n} for n in range(8)],
+}
+
+
+def _orm_get(db: DatabaseManager, key: str):
+    entry = db.get_cache_entry(key)
+    try:
+        return pickle.loads(gzip.decompress(entry.result_data))
+    except gzip.BadGzipFile:
+        return pickle.loads(entry.result_data)
+
+
+@pytest.mark.performance
+def test_l2_hit_latency(tmp_path):
+    payload = pickle.dumps(RESULT)
+    keys = [f"validation_cache:get_result:{i:016x}" for i in range(ENTRIES)]
+
+    with patch.dict(os.environ, {"DATABASE_URL": f"sqlite:///{tmp_path / 'orm.db'}"}):
+        db = DatabaseManager()
+    expires = datetime.now(timezone.utc) + timedelta(hours=1)
+    for key in keys:
+        db.store_cache_entry(cache_key=key, agent_id="validation_cache", method_name="get_result",
+                             input_hash=key, result_data=payload, expires_at=expires, size_bytes=len(payload))
+
+    store = KVStore(str(tmp_path / "kv.db"))
+    for key in keys:
+        store.put(key, "validation_cache", "get_result", CODEC_PICKLE, payload, 3600)
+    store.flush()
+
+    start = time.perf_counter()
+    for key in keys:
+        assert _orm_get(db, key) == RESULT
+    orm_us = (time.perf_counter() - start) / ENTRIES * 1e6
+
+    start = time.perf_counter()
+    for key in keys:
+        codec, value = store.get(key)
+        assert pickle.loads(value) == RESULT
+    kv_us = (time.perf_counter() - start) / ENTRIES * 1e6
+
+    store.close()
+    db.engine.dispose()
+    print(f"\nL2 hit: ORM={orm_us:.0f}us key-value store={kv_us:.1f}us speedup={orm_us / kv_us:.0f}x")
+    assert kv_us < orm_us
+    assert kv_us < 1000  # microseconds, not milliseconds
+
+
+@pytest.mark.performance
+def test_cache_key_hashing_large_content():
+    content = "Lorem ipsum dolor sit amet. " * 20_000  # ~560 KB
+    key_input = {"args": ({"content": content, "family": "words"},), "kwargs": {}}
+    rounds = 20
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        normalized = str(sorted(key_input.items()))
+        hashlib.sha256(normalized.encode()).hexdigest()
+        hashlib.sha256(str(key_input).encode()).hexdigest()  # put() hashed the input a second time
+    old_ms = (time.perf_counter() - start) / rounds * 1000
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        canonical_hash(key_input)
+    new_ms = (time.perf_counter() - start) / rounds * 1000
+
+    print(f"\nkey generation (560 KB content): str()+sha256 x2={old_ms:.2f}ms canonical+memo={new_ms:.3f}ms")
+    assert new_ms < old_ms
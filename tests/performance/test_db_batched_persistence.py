@@ -0,0 +1,123 @@
+"""
+Benchmark: per-row commits vs batched write-behind persistence.
+
+Stores N validation results, each with two recommendations (and their
+'created' audit entries), through:
+- the per-row path (create_validation_result / create_recommendation, one
+  commit per row), with the default rollback journal and with WAL pragmas
+- ResultWriteBuffer (executemany in one transaction per flush)
+
+Reports rows/sec for each and checks that the batched path is faster.
+
+Run:
+    pytest tests/performance/test_db_batched_persistence.py -v -s
+"""
+
+import os
+
+os.environ.setdefault("TBCV_ENV", "test")
+
+import time
+from contextlib import nullcontext
+from unittest.mock import patch
+
+import pytest
+
+import core.database as database
+from core.database import DatabaseManager
+
+
+VALIDATIONS = 300
+# The rollback journal fsyncs every commit; keep that run short
+JOURNAL_VALIDATIONS = 30
+RECOMMENDATIONS_PER_VALIDATION = 2
+# validation + recommendations + one audit entry per recommendation
+ROWS_PER_VALIDATION = 1 + 2 * RECOMMENDATIONS_PER_VALIDATION
+
+
+def _result(i: int) -> dict:
+    return {
+        "file_path": f"/docs/en/page{i}.md",
+        "overall_confidence": 0.8,
+        "final_issues": [
+            {"level": "warning", "category": "seo", "message": f"Heading {n} too long", "line": n}
+            for n in range(5)
+        ],
+    }
+
+
+def _recommendation(validation_id: str, n: int) -> dict:
+    return dict(
+        validation_id=validation_id,
+        type="format",
+        title=f"Shorten heading {n}",
+        description="Heading exceeds the configured length",
+        proposed_content="Shorter heading",
+        confidence=0.7,
+        metadata={"source": {"validator": "seo"}},
+    )
+
+
+def _validation(i: int) -> dict:
+    return dict(
+        file_path=f"/docs/en/page{i}.md",
+        rules_applied=["seo"],
+        validation_results=_result(i),
+        notes="benchmark",
+        severity="medium",
+        status="warning",
+        run_id="bench",
+    )
+
+
+def _per_row(db: DatabaseManager, validations: int) -> None:
+    for i in range(validations):
+        val = db.create_validation_result(**_validation(i))
+        for n in range(RECOMMENDATIONS_PER_VALIDATION):
+            db.create_recommendation(**_recommendation(val.id, n))
+
+
+def _batched(db: DatabaseManager, validations: int) -> None:
+    with db.write_buffer(max_rows=500) as buffer:
+        for i in range(validations):
+            val_id = buffer.add_validation(**_validation(i))
+            for n in range(RECOMMENDATIONS_PER_VALIDATION):
+                buffer.add_recommendation(**_recommendation(val_id, n))
+
+
+def _rows_per_sec(tmp_path, name: str, run, validations: int = VALIDATIONS, wal: bool = True) -> float:
+    pragmas = nullcontext() if wal else patch.object(database, "_apply_sqlite_pragmas", lambda *args: None)
+    with patch.dict(os.environ, {"DATABASE_URL": f"sqlite:///{tmp_path / (name + '.db')}"}), pragmas:
+        db = DatabaseManager()
+
+    start = time.perf_counter()
+    run(db, validations)
+    elapsed = time.perf_counter() - start
+
+    with db.get_session() as session:
+        stored = (
+            session.query(database.ValidationResult).count()
+            + session.query(database.Recommendation).count()
+            + session.query(database.AuditLog).count()
+        )
+    assert stored == validations * ROWS_PER_VALIDATION
+    db.engine.dispose()
+    return stored / elapsed
+
+
+@pytest.mark.performance
+def test_batched_persistence_throughput(tmp_path, monkeypatch):
+    # Recommendations are written explicitly by both paths
+    monkeypatch.setattr(
+        "api.services.recommendation_consolidator.consolidate_recommendations", lambda validation_id: []
+    )
+    per_row_journal = _rows_per_sec(tmp_path, "per_row_journal", _per_row, JOURNAL_VALIDATIONS, wal=False)
+    per_row_wal = _rows_per_sec(tmp_path, "per_row_wal", _per_row)
+    batched = _rows_per_sec(tmp_path, "batched", _batched)
+
+    print(
+        f"\nrows={VALIDATIONS * ROWS_PER_VALIDATION} per-row (rollback journal)={per_row_journal:.0f} rows/s "
+        f"per-row (WAL)={per_row_wal:.0f} rows/s batched={batched:.0f} rows/s "
+        f"speedup={batched / per_row_wal:.1f}x"
+    )
+    assert batched > per_row_wal
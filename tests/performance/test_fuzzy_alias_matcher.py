@@ -0,0 +1,88 @@
+"""
+Benchmark: compiled alias matcher vs exhaustive alias scan.
+
+Runs FuzzyDetectorAgent alias detection over synthetic pages built from each
+truth/ family and compares the two paths:
+- detections must be identical
+- the compiled path must be faster
+
+Run:
+    pytest tests/performance/test_fuzzy_alias_matcher.py -v -s
+"""
+
+import os
+
+os.environ.setdefault("TBCV_ENV", "test")
+
+import asyncio
+import random
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from agents.fuzzy_detector import FuzzyDetectorAgent
+
+
+TRUTH_DIR = Path(__file__).resolve().parents[2] / "truth"
+FAMILIES = sorted(p.stem for p in TRUTH_DIR.glob("*.json") if "combinations" not in p.stem and "_" not in p.stem)
+PAGE_WORDS = 3000
+
+FILLER = (
+    "the document is loaded and saved with options before the page layout is "
+    "updated so that every paragraph table and image keeps its formatting when "
+    "converted to another format in the output folder"
+).split()
+
+
+def _family_vocabulary(agent: FuzzyDetectorAgent, family: str) -> List[str]:
+    """Plugin names and aliases for a family, plus a misspelled copy of each."""
+    words: List[str] = []
+    for plugin in agent._get_truth_plugins(family):
+        for key in ("name", "slug", "short_name"):
+            if plugin.get(key):
+                words.extend(str(plugin[key]).split())
+    typos = [w[:-2] + w[-1] + w[-2] for w in words if len(w) > 4]
+    return words + typos
+
+
+def _synthetic_page(vocabulary: List[str], seed: int) -> str:
+    rng = random.Random(seed)
+    tokens = []
+    for _ in range(PAGE_WORDS):
+        tokens.append(rng.choice(vocabulary) if vocabulary and rng.random() < 0.15 else rng.choice(FILLER))
+    return " ".join(tokens)
+
+
+def _run(agent: FuzzyDetectorAgent, text: str, family: str, compiled: bool) -> Dict[str, Any]:
+    agent.use_alias_matcher = compiled
+    start = time.perf_counter()
+    result = asyncio.run(agent.handle_detect_plugins({"text": text, "family": family, "confidence_threshold": 0.0}))
+    result["_elapsed"] = time.perf_counter() - start
+    return result
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("family", FAMILIES)
+def test_compiled_matcher_matches_exhaustive_scan(family):
+    """Both alias paths must report identical detections on every family."""
+    agent = FuzzyDetectorAgent()
+    vocabulary = _family_vocabulary(agent, family)
+
+    exhaustive_total = 0.0
+    compiled_total = 0.0
+    for seed in range(3):
+        text = _synthetic_page(vocabulary, seed)
+        exhaustive = _run(agent, text, family, compiled=False)
+        compiled = _run(agent, text, family, compiled=True)
+        exhaustive_total += exhaustive.pop("_elapsed")
+        compiled_total += compiled.pop("_elapsed")
+        assert compiled == exhaustive
+
+    print(
+        f"\n{family}: exhaustive={exhaustive_total * 1000:.1f}ms "
+        f"compiled={compiled_total * 1000:.1f}ms "
+        f"speedup={exhaustive_total / max(compiled_total, 1e-9):.1f}x"
+    )
+    assert compiled_total < exhaustive_total
@@ -0,0 +1,114 @@
+"""
+Benchmark: tier-1/tier-2 validators inline vs in the validator process pool.
+
+Validates a batch of synthetic documents through the ValidatorRouter the
+orchestrator and /api/validate use (agents.validators.router), with
+several documents in flight, once per executor mode:
+- results must be identical (issue ids aside)
+- on machines with 4+ cores the process pool must be clearly faster
+
+Run:
+    pytest tests/performance/test_validator_process_pool.py -v -s
+"""
+
+import os
+
+os.environ.setdefault("TBCV_ENV", "test")
+
+import asyncio
+import time
+
+import pytest
+
+from agents.validators.router import ValidatorRouter
+from core.validator_router import ValidatorProcessPool
+
+
+DOCS = 48
+CONCURRENCY = 8
+SELECTION = ["yaml", "markdown", "structure", "code", "links", "seo"]
+
+
+class _Registry:
+    def __init__(self, agents):
+        self.agents = {agent.agent_id: agent for agent in agents}
+
+    def get_agent(self, agent_id):
+        return self.agents.get(agent_id)
+
+
+def _registry() -> _Registry:
+    from agents.validators.yaml_validator import YamlValidatorAgent
+    from agents.validators.markdown_validator import MarkdownValidatorAgent
+    from agents.validators.structure_validator import StructureValidatorAgent
+    from agents.validators.code_validator import CodeValidatorAgent
+    from agents.validators.link_validator import LinkValidatorAgent
+    from agents.validators.seo_validator import SeoValidatorAgent
+
+    return _Registry([
+        YamlValidatorAgent("yaml_validator"),
+        MarkdownValidatorAgent("markdown_validator"),
+        StructureValidatorAgent("structure_validator"),
+        CodeValidatorAgent("code_validator"),
+        LinkValidatorAgent("link_validator"),
+        SeoValidatorAgent("seo_validator"),
+    ])
+
+
+def _document(seed: int) -> str:
+    sections = []
+    for i in range(40):
+        sections.append(
+            f"## Section {seed}-{i}\n\n"
+            f"Convert the document with [options](https://example.com/{seed}/{i}) and "
+            f"save it as PDF. See ![image](img{i}.png) for details.\n\n"
+            f"```csharp\nvar doc = new Document(\"in{i}.docx\");\ndoc.Save(\"out{i}.pdf\");\n```\n"
+        )
+    return f"---\ntitle: Document {seed}\ndescription: Synthetic page {seed}\n---\n\n# Document {seed}\n\n" + "\n".join(sections)
+
+
+async def _run(router: ValidatorRouter, docs):
+    sem = asyncio.Semaphore(CONCURRENCY)
+
+    async def one(i, doc):
+        async with sem:
+            result = await router.execute(SELECTION, doc, {"file_path": f"doc{i}.md"})
+            return result["validation_results"]
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(one(i, d) for i, d in enumerate(docs)))
+    return results, time.perf_counter() - start
+
+
+def _without_ids(results):
+    return [
+        {key: [{k: v for k, v in issue.items() if k != "id"} for issue in value.get("issues", [])]
+         for key, value in doc.items()}
+        for doc in results
+    ]
+
+
+@pytest.mark.performance
+def test_process_pool_throughput():
+    registry = _registry()
+    docs = [_document(i) for i in range(DOCS)]
+    workers = os.cpu_count() or 1
+    pool = ValidatorProcessPool(max_workers=workers)
+    try:
+        # Warm the pool (worker start-up and validator preload are not measured)
+        asyncio.run(_run(ValidatorRouter(registry, executor_mode="process", process_pool=pool), docs[:workers]))
+
+        inline, inline_s = asyncio.run(_run(ValidatorRouter(registry, executor_mode="inline"), docs))
+        pooled, pooled_s = asyncio.run(
+            _run(ValidatorRouter(registry, executor_mode="process", process_pool=pool), docs)
+        )
+    finally:
+        pool.shutdown()
+
+    print(
+        f"\nworkers={workers} inline={DOCS / inline_s:.1f} docs/s "
+        f"process={DOCS / pooled_s:.1f} docs/s speedup={inline_s / pooled_s:.2f}x"
+    )
+    assert _without_ids(pooled) == _without_ids(inline)
+    if workers >= 4:
+        assert inline_s / pooled_s >= workers * 0.5
@@ -32,8 +32,10 @@ logger = get_logger(__name__)
 
 @pytest.fixture
 def workflow_manager(db_manager):
-    """Create a fresh workflow manager for each test."""
-    return WorkflowManager(db_manager)
+    """Create a fresh workflow manager for each test (state changes only, no execution)."""
+    manager = WorkflowManager(db_manager)
+    manager.start_workflow = Mock()
+    return manager
 
 
 @pytest.fixture
@@ -0,0 +1,194 @@
+"""Tests for the WorkflowManager item engine.
+
+Covers:
+- validate_directory driving the orchestrator for every file
+- Batched progress checkpoints and throughput reporting
+- Resuming from the last checkpointed item
+- Cancellation between items
+"""
+
+import os
+import time
+
+import pytest
+
+os.environ.setdefault("TBCV_ENV", "test")
+os.environ.setdefault("OLLAMA_ENABLED", "false")
+
+from core.config import get_settings
+from core.database import WorkflowState
+from core.workflow_manager import WorkflowManager
+
+
+class FakeOrchestrator:
+    """Records the files it is asked to validate."""
+
+    agent_id = "orchestrator"
+
+    def __init__(self, on_item=None):
+        self.seen = []
+        self.on_item = on_item
+
+    async def validate_and_store(self, file_path, family, validation_types, run_id, writer, workflow_id=None):
+        self.seen.append(file_path)
+        if self.on_item is not None:
+            self.on_item(file_path)
+        if file_path.endswith("bad.md"):
+            raise RuntimeError("pipeline failed")
+        return {"status": "success", "file_path": file_path}
+
+
+class FakeRegistry:
+    def __init__(self, **agents):
+        self.agents = agents
+
+    def get_agent(self, agent_id):
+        return self.agents.get(agent_id)
+
+
+@pytest.fixture
+def docs_dir(tmp_path):
+    for i in range(6):
+        (tmp_path / f"doc{i}.md").write_text(f"# Doc {i}\n\nContent")
+    return tmp_path
+
+
+@pytest.fixture
+def checkpoint_every_two(monkeypatch):
+    monkeypatch.setattr(get_settings().orchestrator, "workflow_checkpoint_interval", 2)
+
+
+def _create(db_manager, directory, **params):
+    return db_manager.create_workflow(
+        workflow_type="validate_directory",
+        input_params={"directory_path": str(directory), "recursive": False, "max_workers": 2, **params}
+    ).id
+
+
+def test_validate_directory_runs_every_file(db_manager, docs_dir, checkpoint_every_two):
+    orchestrator = FakeOrchestrator()
+    manager = WorkflowManager(db_manager, FakeRegistry(orchestrator=orchestrator))
+    workflow_id = _create(db_manager, docs_dir)
+
+    manager.execute_workflow(workflow_id)
+
+    workflow = db_manager.get_workflow(workflow_id)
+    assert workflow.state == WorkflowState.COMPLETED
+    assert sorted(orchestrator.seen) == sorted(str(p) for p in docs_dir.glob("*.md"))
+    assert workflow.current_step == 6
+    assert workflow.progress_percent == 100
+
+    execution = workflow.workflow_metadata["execution"]
+    assert execution["items_ok"] == 6
+    assert execution["resume_from"] == 6
+    assert execution["workers"] == 2
+    assert manager.get_workflow_summary(workflow_id)["items_per_second"] >= 0
+
+
+def test_item_failures_are_counted_not_fatal(db_manager, docs_dir):
+    (docs_dir / "bad.md").write_text("# Bad\n")
+    manager = WorkflowManager(db_manager, FakeRegistry(orchestrator=FakeOrchestrator()))
+    workflow_id = _create(db_manager, docs_dir)
+
+    manager.execute_workflow(workflow_id)
+
+    workflow = db_manager.get_workflow(workflow_id)
+    assert workflow.state == WorkflowState.COMPLETED
+    assert workflow.workflow_metadata["execution"]["items_failed"] == 1
+    assert manager.get_workflow_summary(workflow_id)["errors_count"] == 1
+
+
+def test_progress_is_checkpointed_in_batches(db_manager, docs_dir, checkpoint_every_two):
+    manager = WorkflowManager(db_manager, FakeRegistry(orchestrator=FakeOrchestrator()))
+    workflow_id = _create(db_manager, docs_dir)
+
+    updates = []
+    original = db_manager.update_workflow
+
+    def record(wf_id, **kwargs):
+        if "current_step" in kwargs:
+            updates.append(kwargs["current_step"])
+        return original(wf_id, **kwargs)
+
+    db_manager.update_workflow = record
+    try:
+        manager.execute_workflow(workflow_id)
+    finally:
+        del db_manager.update_workflow
+
+    # Initial + one per two items + final, not one per item
+    assert len(updates) == 1 + 3 + 1
+    assert updates[-1] == 6
+
+
+def test_resumes_after_last_checkpoint(db_manager, docs_dir):
+    files = sorted(str(p) for p in docs_dir.glob("*.md"))
+    workflow_id = _create(db_manager, docs_dir)
+    db_manager.update_workflow(
+        workflow_id,
+        state=WorkflowState.RUNNING,
+        metadata={"execution": {"items_total": 6, "resume_from": 4, "items_ok": 4}}
+    )
+
+    orchestrator = FakeOrchestrator()
+    manager = WorkflowManager(db_manager, FakeRegistry(orchestrator=orchestrator))
+    manager.execute_workflow(workflow_id)
+
+    workflow = db_manager.get_workflow(workflow_id)
+    assert workflow.state == WorkflowState.COMPLETED
+    assert sorted(orchestrator.seen) == files[4:]
+    assert workflow.workflow_metadata["execution"]["items_ok"] == 6
+
+
+def test_resume_after_restart_restarts_paused_workflow(db_manager, docs_dir):
+    files = sorted(str(p) for p in docs_dir.glob("*.md"))
+    workflow_id = _create(db_manager, docs_dir)
+    db_manager.update_workflow(
+        workflow_id,
+        state=WorkflowState.PAUSED,
+        metadata={"execution": {"items_total": 6, "resume_from": 3, "items_ok": 3}}
+    )
+
+    # A new process: startup recovery leaves the paused workflow alone
+    orchestrator = FakeOrchestrator()
+    manager = WorkflowManager(db_manager, FakeRegistry(orchestrator=orchestrator))
+    assert workflow_id not in manager.resume_interrupted_workflows()
+
+    assert manager.resume_workflow(workflow_id) == WorkflowState.RUNNING
+    deadline = time.monotonic() + 10
+    while db_manager.get_workflow(workflow_id).state == WorkflowState.RUNNING and time.monotonic() < deadline:
+        time.sleep(0.02)
+
+    workflow = db_manager.get_workflow(workflow_id)
+    assert workflow.state == WorkflowState.COMPLETED
+    assert sorted(orchestrator.seen) == files[3:]
+
+
+def test_cancel_is_honored_between_items(db_manager, docs_dir):
+    workflow_id = _create(db_manager, docs_dir, max_workers=1)
+    orchestrator = FakeOrchestrator()
+    manager = WorkflowManager(db_manager, FakeRegistry(orchestrator=orchestrator))
+
+    def cancel_after_second(_):
+        if len(orchestrator.seen) == 2:
+            manager.cancel_workflow(workflow_id)
+
+    orchestrator.on_item = cancel_after_second
+
+    manager.execute_workflow(workflow_id)
+
+    workflow = db_manager.get_workflow(workflow_id)
+    assert workflow.state == WorkflowState.CANCELLED
+    assert len(orchestrator.seen) == 2
+    assert workflow.workflow_metadata["execution"]["resume_from"] == 2
+
+
+def test_validate_directory_requires_orchestrator(db_manager, docs_dir):
+    manager = WorkflowManager(db_manager, FakeRegistry())
+    workflow_id = _create(db_manager, docs_dir)
+
+    manager.execute_workflow(workflow_id)
+
+    workflow = db_manager.get_workflow(workflow_id)
+    assert workflow.state == WorkflowState.FAILED
+    assert "Orchestrator agent not available" in workflow.error_message